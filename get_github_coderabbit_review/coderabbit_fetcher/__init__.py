@@ -49,15 +49,20 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2025 CodeRabbit Fetcher Team"
 
 from .exceptions import CodeRabbitFetcherError
-from .models import (
-    AnalyzedComments,
-    SummaryComment,
-    ReviewComment,
-    ActionableComment,
-    AIAgentPrompt,
-    ThreadContext,
-    CommentMetadata,
-)
+
+if TYPE_CHECKING:
+    from .models import (
+        AnalyzedComments,
+        SummaryComment,
+        ReviewComment,
+        ActionableComment,
+        AIAgentPrompt,
+        ThreadContext,
+        CommentMetadata,
+    )
+    from .orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+    from .github_client import GitHubClient
+    from .comment_analyzer import CommentAnalyzer
 
 # Package metadata
 __all__ = [
@@ -131,16 +136,34 @@ DEFAULT_CONFIG = {
     "supported_output_formats": ["markdown", "json", "plain"],
 }
 
-# Export key components for programmatic usage
-from .orchestrator import CodeRabbitOrchestrator, ExecutionConfig
-from .github_client import GitHubClient
-from .comment_analyzer import CommentAnalyzer
+# Key components for programmatic usage, imported on first access so that
+# light entry points (such as the CLI forwarding to a running server) do not
+# load pydantic and the analysis stack.
+_LAZY_EXPORTS = {
+    "AnalyzedComments": ".models",
+    "SummaryComment": ".models",
+    "ReviewComment": ".models",
+    "ActionableComment": ".models",
+    "AIAgentPrompt": ".models",
+    "ThreadContext": ".models",
+    "CommentMetadata": ".models",
+    "CodeRabbitOrchestrator": ".orchestrator",
+    "ExecutionConfig": ".orchestrator",
+    "GitHubClient": ".github_client",
+    "CommentAnalyzer": ".comment_analyzer",
+}
+
 
-# Lazily expose CLI entry to avoid import-time side effects.
+# Lazily expose CLI entry and components to avoid import-time side effects.
 def __getattr__(name: str):
     if name == "main":
         from .cli.main import main as _main
         return _main
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 # Version check
@@ -0,0 +1,151 @@
+"""
+Bookkeeping for incremental updates of an analysis.
+
+``CommentAnalyzer.analyze_comments`` attaches an ``AnalysisState`` to the
+``AnalyzedComments`` it returns. The state records where each result came
+from: the position of every comment in the pull request data, the category
+of each CodeRabbit comment, the thread each inline comment belongs to and
+the replies of each comment. ``CommentAnalyzer.apply_delta`` uses it to
+process again only the comments and threads a change touches, and to
+splice the new results into the result lists where a full analysis would
+put them.
+"""
+
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+def comment_key(comment: Dict[str, Any]) -> str:
+    """Get the key of a comment (issue comments, review comments and reviews have their own IDs)."""
+    return f"{comment.get('comment_type', 'review_comment')}:{comment.get('id')}"
+
+
+class AnalysisState:
+    """Origin of the results of an analysis.
+
+    Attributes:
+        positions: Position of every comment in the pull request data, by key
+        comments: CodeRabbit comments by key
+        categories: Category of each CodeRabbit comment
+        counts: Number of CodeRabbit comments of each category
+        results: Processed summary and review comments by key (None if they failed)
+        inline_map: Inline comments by ID, to find thread roots
+        roots: Thread root ID of each inline comment, by key
+        children: Keys of the inline comments replying to each ID
+        groups: Keys of the comments of each thread, by root ID
+        threads: Processed threads by root ID (None if they failed)
+        order: Sort keys of the entries of each result list, parallel to the list
+        thread_keys: Sort key of each unresolved thread, by root ID
+        resolved_threads: Number of resolved threads
+        actionable_comments: Number of actionable comments of all reviews
+    """
+
+    def __init__(self) -> None:
+        self.positions: Dict[str, int] = {}
+        self.comments: Dict[str, Dict[str, Any]] = {}
+        self.categories: Dict[str, str] = {}
+        self.counts: Counter = Counter()
+        self.results: Dict[str, Any] = {}
+        self.inline_map: Dict[str, Dict[str, Any]] = {}
+        self.roots: Dict[str, str] = {}
+        self.children: Dict[str, Set[str]] = defaultdict(set)
+        self.groups: Dict[str, Set[str]] = defaultdict(set)
+        self.threads: Dict[str, Any] = {}
+        self.order: Dict[str, List[int]] = {"summary": [], "review": [], "thread": []}
+        self.thread_keys: Dict[str, int] = {}
+        self.resolved_threads = 0
+        self.actionable_comments = 0
+        self._next_position = 0
+
+    def place(self, comment: Dict[str, Any]) -> str:
+        """Give a comment a position (after all others if it is new).
+
+        Returns:
+            Key of the comment
+        """
+        key = comment_key(comment) if comment.get("id") is not None else f"#{self._next_position}"
+        if key not in self.positions:
+            self.positions[key] = self._next_position
+            self._next_position += 1
+        return key
+
+    def add(self, key: str, comment: Dict[str, Any], category: str) -> None:
+        """Record a CodeRabbit comment."""
+        self.comments[key] = comment
+        self.categories[key] = category
+        self.counts[category] += 1
+        if category != "inline":
+            return
+        comment_id = comment.get("id")
+        if comment_id:
+            self.inline_map[str(comment_id)] = comment
+        reply_to_id = comment.get("in_reply_to_id")
+        if reply_to_id is not None:
+            self.children[str(reply_to_id)].add(key)
+
+    def remove(self, key: str) -> Optional[Dict[str, Any]]:
+        """Forget a CodeRabbit comment, and the thread it was in.
+
+        Returns:
+            The comment, or None if it was not recorded
+        """
+        comment = self.comments.pop(key, None)
+        if comment is None:
+            return None
+        category = self.categories.pop(key)
+        self.counts[category] -= 1
+        if category == "inline":
+            comment_id = str(comment.get("id"))
+            if self.inline_map.get(comment_id) is comment:
+                del self.inline_map[comment_id]
+            reply_to_id = comment.get("in_reply_to_id")
+            if reply_to_id is not None:
+                self.children[str(reply_to_id)].discard(key)
+        return comment
+
+    def attach(self, key: str, root: str) -> None:
+        """Put an inline comment in the thread of a root ID."""
+        self.roots[key] = root
+        self.groups[root].add(key)
+
+    def detach(self, key: str) -> Optional[str]:
+        """Take an inline comment out of its thread.
+
+        Returns:
+            Root ID of the thread, or None if the comment was in none
+        """
+        root = self.roots.pop(key, None)
+        if root is not None:
+            self.groups[root].discard(key)
+        return root
+
+    def descendants(self, comment_ids: Iterable[str]) -> List[str]:
+        """Get the keys of all inline comments replying, directly or not, to comment IDs."""
+        found: Dict[str, None] = {}
+        pending = list(comment_ids)
+        while pending:
+            for key in self.children.get(pending.pop(), ()):
+                if key not in found:
+                    found[key] = None
+                    pending.append(str(self.comments[key].get("id")))
+        return list(found)
+
+    def members(self, root: str) -> List[Dict[str, Any]]:
+        """Get the comments of a thread in pull request order."""
+        return [self.comments[key] for key in sorted(self.groups.get(root, ()), key=self.positions.__getitem__)]
+
+    def insert(self, items: List[Any], kind: str, sort_key: int, item: Any) -> None:
+        """Insert a result into a result list at its sorted position."""
+        order = self.order[kind]
+        index = bisect_left(order, sort_key)
+        order.insert(index, sort_key)
+        items.insert(index, item)
+
+    def delete(self, items: List[Any], kind: str, sort_key: int) -> None:
+        """Delete the result with a sort key from a result list."""
+        order = self.order[kind]
+        index = bisect_left(order, sort_key)
+        if index < len(order) and order[index] == sort_key:
+            del order[index]
+            del items[index]
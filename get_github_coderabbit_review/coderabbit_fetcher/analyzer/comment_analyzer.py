@@ -6,7 +6,9 @@ from datetime import datetime
 
 from ..models import AnalyzedComments, SummaryComment, ReviewComment, ActionableComment, ThreadContext, CommentMetadata
 from ..exceptions import CommentParsingError
+from ..keywords import COMMENT_KEYWORDS
 from ..processors import SummaryProcessor, ReviewProcessor
+from ..thread_index import ThreadIndex
 
 
 class CommentAnalyzer:
@@ -172,29 +174,9 @@ class CommentAnalyzer:
         Returns:
             List of comment threads (each thread is a list of comments)
         """
-        threads = {}
-
-        for comment in comments:
-            # Use file path and line number as thread identifier for inline comments
-            path = comment.get("path", "")
-            line = comment.get("line") or comment.get("original_line") or 0
-            position = comment.get("position", 0)
-
-            # For review-level comments, use PR number as identifier
-            if not path:
-                thread_id = "review"
-            else:
-                thread_id = f"{path}:{line}:{position}"
-
-            if thread_id not in threads:
-                threads[thread_id] = []
-            threads[thread_id].append(comment)
-
-        # Sort each thread by creation time
-        for thread_id in threads:
-            threads[thread_id].sort(key=lambda c: c.get("created_at", ""))
-
-        return list(threads.values())
+        # Comments on the same file location (or reply chain) form a thread
+        index = ThreadIndex(comments, group_by_location=True)
+        return [index.chronological(key) for key in index]
 
     def _filter_unresolved_threads(self, threads: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
         """Filter out resolved comment threads.
@@ -296,42 +278,7 @@ class CommentAnalyzer:
         Returns:
             Priority level: "critical", "high", "medium", "low", "info"
         """
-        body_lower = body.lower()
-
-        # Critical priority patterns
-        critical_patterns = [
-            "security", "vulnerability", "critical", "urgent", "breaking",
-            "セキュリティ", "脆弱性", "重要", "緊急", "致命的"
-        ]
-
-        # High priority patterns
-        high_patterns = [
-            "error", "bug", "issue", "problem", "failure", "fix",
-            "エラー", "バグ", "問題", "不具合", "修正"
-        ]
-
-        # Medium priority patterns
-        medium_patterns = [
-            "improvement", "optimize", "refactor", "performance",
-            "改善", "最適化", "リファクタリング", "性能"
-        ]
-
-        # Low priority patterns
-        low_patterns = [
-            "style", "formatting", "convention", "documentation",
-            "スタイル", "フォーマット", "規約", "ドキュメント"
-        ]
-
-        if any(pattern in body_lower for pattern in critical_patterns):
-            return "critical"
-        elif any(pattern in body_lower for pattern in high_patterns):
-            return "high"
-        elif any(pattern in body_lower for pattern in medium_patterns):
-            return "medium"
-        elif any(pattern in body_lower for pattern in low_patterns):
-            return "low"
-        else:
-            return "info"
+        return COMMENT_KEYWORDS.first(body, "analysis_priority", "info")
 
     def _extract_action_items(self, body: str) -> List[str]:
         """Extract specific action items from comment body.
@@ -370,20 +317,13 @@ class CommentAnalyzer:
         Returns:
             Comment category: "refactor", "security", "performance", "style", "documentation", "general"
         """
-        body_lower = body.lower()
-
-        if any(word in body_lower for word in ["refactor", "リファクタリング", "restructure"]):
-            return "refactor"
-        elif any(word in body_lower for word in ["security", "セキュリティ", "vulnerability", "脆弱性"]):
-            return "security"
-        elif any(word in body_lower for word in ["performance", "性能", "optimize", "最適化"]):
-            return "performance"
-        elif any(word in body_lower for word in ["style", "format", "スタイル", "フォーマット"]):
-            return "style"
-        elif any(word in body_lower for word in ["documentation", "ドキュメント"]) and not any(word in body_lower for word in ["comment", "コメント"]):
-            return "documentation"
-        else:
+        category = COMMENT_KEYWORDS.first(body, "category", "general")
+        # Documentation mentions in a comment about comments are not documentation issues
+        if category == "comment" or (
+            category == "documentation" and "comment" in COMMENT_KEYWORDS.labels(body, "category")
+        ):
             return "general"
+        return category
 
     def _extract_issue_description(self, body: str) -> str:
         """Extract a concise issue description from comment body.
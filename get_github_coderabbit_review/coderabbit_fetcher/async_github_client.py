@@ -0,0 +1,467 @@
+"""Asyncio GitHub API client."""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from .exceptions import (
+    GitHubAuthenticationError,
+    InvalidPRUrlError,
+    APIRateLimitError,
+    CircuitBreakerError,
+    TransportError,
+    TransportTimeoutError
+)
+from .github.async_transport import (
+    AsyncTransport,
+    AsyncTransportAdapter,
+    check_gh_authentication,
+    create_async_transport,
+)
+from .github.auth import AuthCache, env_token, gh_login_fingerprint
+from .github.cache import CacheStats, CachingTransport, ResponseCache
+from .github.circuit_breaker import AsyncCircuitBreakerTransport, CircuitBreakerRegistry
+from .github.coordination import FetchCoordinator
+from .github.graphql import GraphQLPullRequestFetcher
+from .github.pagination import DEFAULT_MAX_WORKERS, page_urls
+from .github.rate_limit import AsyncRateLimitedTransport, RateLimitScheduler
+from .github.single_flight import (
+    DEFAULT_ASYNC_SINGLE_FLIGHT,
+    AsyncSingleFlight,
+    AsyncSingleFlightTransport,
+    credential_fingerprint,
+)
+from .github.transport import DEFAULT_MAX_CONNECTIONS, GitHubResponse, create_transport
+from .github_client import (
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_FETCH_MODE,
+    DEFAULT_RETRY_DELAY,
+    FETCH_MODES,
+    PER_PAGE,
+    GitHubAPIError,
+    GitHubServerError,
+    PullRequestDataMixin,
+    RestEndpoint,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGitHubClient(PullRequestDataMixin):
+    """Asyncio client for the GitHub API.
+
+    Exposes the pull request surface of ``GitHubClient`` as coroutines
+    (``fetch_pr_comments``, ``post_comment``, ``get_comment``,
+    ``check_rate_limit``) with the same result layouts and exceptions, so
+    many pull requests can be processed on one event loop. One client (and
+    its connection pool) is meant to be shared by all of them.
+    """
+
+    def __init__(self, transport: Optional[AsyncTransport] = None, backend: str = "http",
+                 fetch_mode: str = DEFAULT_FETCH_MODE, cache: Optional[ResponseCache] = None,
+                 refresh_cache: bool = False, retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+                 retry_delay: float = DEFAULT_RETRY_DELAY,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 scheduler: Optional[RateLimitScheduler] = None,
+                 auth_cache: Optional[AuthCache] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 single_flight: Optional[AsyncSingleFlight] = None,
+                 coordinator: Optional[FetchCoordinator] = None):
+        """Initialize the client.
+
+        Nothing is sent before the first call; authentication is checked then.
+
+        Args:
+            transport: Preconfigured asyncio transport (overrides ``backend``)
+            backend: Transport backend to create when no transport is given
+                ("http" or "gh")
+            fetch_mode: How ``fetch_pr_comments`` queries the API ("graphql" or "rest")
+            cache: Optional response cache used for conditional GET requests
+                (``http`` backend only)
+            refresh_cache: Ignore cached responses (fresh responses are still stored)
+            retry_attempts: Retries of an endpoint request that failed with an
+                API or transport error
+            retry_delay: Base delay in seconds between retries (doubled per retry)
+            max_connections: Connection pool size of the ``http`` backend
+            scheduler: Rate limit scheduler pacing all requests (pass one
+                instance to clients sharing a token)
+            auth_cache: Optional store of verified logins; a fresh entry
+                replaces the ``gh auth status`` check
+            circuit_breakers: Circuit breakers failing requests fast during
+                outages (pass one registry to clients that should share them)
+            single_flight: Group coalescing identical concurrent requests and
+                PR fetches (by default shared by all clients of the process)
+            coordinator: Optional lock-file coordination sharing PR fetches
+                with other processes started at the same time
+        """
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode} (expected one of {', '.join(FETCH_MODES)})")
+
+        self.auth_cache = auth_cache
+        # User reported by the authentication check, if known
+        self.auth_user: Optional[str] = None
+
+        self.scheduler = scheduler if scheduler is not None else RateLimitScheduler()
+        self.circuit_breakers = (
+            circuit_breakers if circuit_breakers is not None else CircuitBreakerRegistry()
+        )
+        self.single_flight = single_flight if single_flight is not None else DEFAULT_ASYNC_SINGLE_FLIGHT
+        self.coordinator = coordinator
+        self._transport = self._wrap_transport(transport) if transport is not None else None
+        self._authenticated: Optional[bool] = None
+        self._auth_lock = asyncio.Lock()
+        self.backend = transport.name if transport is not None else backend
+        self.fetch_mode = fetch_mode
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.max_connections = max_connections
+        # Concurrent page requests per list endpoint
+        self.max_page_workers = DEFAULT_MAX_WORKERS
+        # Seconds spent per endpoint (retries included) during the last PR fetch
+        self.last_fetch_timings: Dict[str, float] = {}
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Response cache counters, or None when caching is disabled."""
+        return self.cache.stats if self.cache is not None else None
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Remaining rate limit budget per resource and time spent throttled."""
+        return self.scheduler.stats()
+
+    @property
+    def circuit_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """State and counters of each circuit breaker used so far."""
+        return self.circuit_breakers.stats()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def check_authentication(self) -> bool:
+        """Check that the client can authenticate, creating the transport if needed.
+
+        Returns:
+            True if authenticated
+
+        Raises:
+            GitHubAuthenticationError: If authentication is not possible
+        """
+        async with self._auth_lock:
+            if self._authenticated:
+                return True
+
+            if self._transport is None:
+                # Token lookup runs ``gh auth token`` once; keep it off the loop
+                self._transport = await asyncio.to_thread(self._create_transport)
+
+            if self._transport.has_credentials or (self.backend == "gh" and env_token()):
+                self._authenticated = True
+            elif self.backend == "gh":
+                fingerprint = gh_login_fingerprint()
+                state = self.auth_cache.get("gh", fingerprint) if self.auth_cache is not None else None
+                if state is not None:
+                    self.auth_user = state.user
+                else:
+                    self.auth_user = await check_gh_authentication()
+                    if self.auth_cache is not None:
+                        self.auth_cache.put("gh", fingerprint, self.auth_user)
+                self._authenticated = True
+            else:
+                raise GitHubAuthenticationError("No GitHub token available for API access")
+
+            return True
+
+    async def fetch_pr_comments(self, pr_url: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch pull request data, comments and reviews.
+
+        See ``GitHubClient.fetch_pr_comments``; the REST endpoints are
+        requested concurrently and each one is retried on its own.
+
+        Args:
+            pr_url: GitHub pull request URL
+            timeout: Timeout in seconds for each API request
+
+        Returns:
+            Dictionary containing PR data and comments
+
+        Raises:
+            GitHubAPIError: If fetching fails
+            InvalidPRUrlError: If PR URL is invalid
+        """
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
+        await self.check_authentication()
+
+        # Concurrent fetches of the same PR (with the same credentials) share one,
+        # across processes as well when a coordinator is configured
+        key = ("fetch_pr_comments", credential_fingerprint(self._transport), self.fetch_mode,
+               owner.lower(), repo.lower(), pr_number)
+
+        def fetch() -> Awaitable[Dict[str, Any]]:
+            if self.coordinator is None:
+                return self._fetch_pr_comments(pr_url, owner, repo, pr_number, timeout)
+            return self.coordinator.fetch_async(
+                json.dumps(key), lambda: self._fetch_pr_comments(pr_url, owner, repo, pr_number, timeout),
+                refresh=self.refresh_cache
+            )
+
+        return await self.single_flight.do(key, fetch, copy=copy.deepcopy)
+
+    async def _fetch_pr_comments(self, pr_url: str, owner: str, repo: str, pr_number: str,
+                                 timeout: Optional[int]) -> Dict[str, Any]:
+        """Fetch pull request data without coalescing. See ``fetch_pr_comments``."""
+        actual_timeout = timeout if timeout is not None else 60
+        timings: Dict[str, float] = {}
+
+        with self._api_errors("Unexpected error fetching PR data", f"GitHub API request timed out for {pr_url}"):
+            try:
+                if self.fetch_mode == "graphql":
+                    fetcher = GraphQLPullRequestFetcher(
+                        lambda query, variables: self._graphql(
+                            query, variables, "Failed to fetch PR data",
+                            timeout=actual_timeout, pr_url=pr_url
+                        )
+                    )
+                    try:
+                        pr_data = await self._fetch_endpoint(
+                            "graphql", lambda: fetcher.fetch_async(owner, repo, int(pr_number)), timings
+                        )
+                    except LookupError:
+                        raise InvalidPRUrlError(f"Pull request not found: {pr_url}")
+                    return self._enhance_pr_data(pr_data, owner, repo, pr_number)
+
+                endpoints = self._rest_endpoints(owner, repo, pr_number)
+                results = await asyncio.gather(*(
+                    self._fetch_endpoint(
+                        name, self._endpoint_fetcher(endpoint, actual_timeout, pr_url), timings
+                    )
+                    for name, endpoint in endpoints.items()
+                ))
+                updates = self._build_updates(dict(zip(endpoints, results, strict=True)))
+                return self.assemble_pr_data(updates, owner, repo, pr_number)
+            finally:
+                self.last_fetch_timings = timings
+
+    async def post_comment(self, pr_url: str, comment: str) -> Dict[str, Any]:
+        """Post a comment to a pull request.
+
+        Args:
+            pr_url: GitHub pull request URL
+            comment: Comment text to post
+
+        Returns:
+            Dictionary with comment metadata including id, html_url, created_at
+
+        Raises:
+            GitHubAPIError: If posting fails
+        """
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
+        await self.check_authentication()
+
+        with self._api_errors("Unexpected error posting comment", "GitHub API comment posting timed out"):
+            comment_data = await self._request_json(
+                "POST",
+                f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
+                "Failed to post comment via API",
+                body={"body": comment},
+                timeout=30
+            )
+            return self._normalize_comment(comment_data)
+
+    async def get_comment(self, pr_url: str, comment_id: int) -> Dict[str, Any]:
+        """Get a specific issue comment by ID.
+
+        Args:
+            pr_url: GitHub pull request URL
+            comment_id: Comment ID to retrieve
+
+        Returns:
+            Dictionary with comment data
+
+        Raises:
+            GitHubAPIError: If fetching fails
+        """
+        owner, repo, _ = self.parse_pr_url(pr_url)
+        await self.check_authentication()
+
+        with self._api_errors("Unexpected error getting comment", "GitHub API comment retrieval timed out"):
+            comment_data = await self._request_json(
+                "GET",
+                f"/repos/{owner}/{repo}/issues/comments/{comment_id}",
+                f"Failed to get comment {comment_id}",
+                timeout=30
+            )
+            return self._normalize_comment(comment_data)
+
+    async def check_rate_limit(self) -> Dict[str, Any]:
+        """Check GitHub API rate limit status.
+
+        Returns:
+            Dictionary with rate limit information
+
+        Raises:
+            GitHubAPIError: If rate limit check fails
+        """
+        await self.check_authentication()
+
+        with self._api_errors("Unexpected error checking rate limit", "Rate limit check timed out"):
+            return await self._request_json("GET", "/rate_limit", "Failed to check rate limit", timeout=10)
+
+    async def aclose(self) -> None:
+        """Release transport resources (pooled connections)."""
+        if self._transport is not None:
+            await self._transport.aclose()
+
+    def _create_transport(self) -> AsyncTransport:
+        """Create the transport for ``backend`` (blocking: may run ``gh auth token``)."""
+        if self.backend == "gh" or self.cache is None:
+            transport = create_async_transport(self.backend, max_connections=self.max_connections)
+        else:
+            inner = create_transport(self.backend, max_connections=self.max_connections)
+            transport = AsyncTransportAdapter(CachingTransport(inner, self.cache, refresh=self.refresh_cache))
+        return self._wrap_transport(transport)
+
+    def _wrap_transport(self, transport: AsyncTransport) -> AsyncTransport:
+        """Put coalescing, the circuit breakers and the rate limit scheduler in front of a transport."""
+        return AsyncSingleFlightTransport(
+            AsyncCircuitBreakerTransport(
+                AsyncRateLimitedTransport(transport, self.scheduler), self.circuit_breakers
+            ),
+            self.single_flight,
+        )
+
+    @contextmanager
+    def _api_errors(self, context: str, timeout_message: str) -> Iterator[None]:
+        """Map unexpected failures to ``GitHubAPIError`` like ``GitHubClient`` does."""
+        try:
+            yield
+        except TransportTimeoutError:
+            raise GitHubAPIError(timeout_message)
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
+        except (GitHubAPIError, InvalidPRUrlError, APIRateLimitError, GitHubAuthenticationError,
+                CircuitBreakerError):
+            raise
+        except Exception as e:
+            raise GitHubAPIError(f"{context}: {e}")
+
+    def _endpoint_fetcher(self, endpoint: RestEndpoint, timeout: float,
+                          pr_url: str) -> Callable[[], Awaitable[Any]]:
+        """Build the coroutine function fetching one REST endpoint."""
+        if endpoint.paginated:
+            return lambda: self._get_paginated(
+                endpoint.path, endpoint.context, timeout=timeout, pr_url=pr_url, params=endpoint.params
+            )
+        return lambda: self._request_json(
+            "GET", endpoint.path, endpoint.context, timeout=timeout, pr_url=pr_url
+        )
+
+    async def _fetch_endpoint(self, name: str, fetch: Callable[[], Awaitable[Any]],
+                              timings: Dict[str, float]) -> Any:
+        """Fetch one endpoint, retrying only this endpoint on transient errors.
+
+        Transport failures and server errors are retried, other API errors
+        are raised at once.
+
+        Args:
+            name: Endpoint name used for timings and log messages
+            fetch: Coroutine function performing the request(s)
+            timings: Receives the elapsed seconds under ``name``
+
+        Returns:
+            Result of ``fetch``
+        """
+        start = time.monotonic()
+        attempts = max(1, self.retry_attempts + 1)
+        try:
+            for attempt in range(attempts):
+                try:
+                    return await fetch()
+                except (GitHubServerError, TransportError) as e:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = self.retry_delay * (2 ** attempt)
+                    logger.warning("Fetching %s failed (attempt %d/%d): %s; retrying in %.2fs",
+                                   name, attempt + 1, attempts, e, delay)
+                    await asyncio.sleep(delay)
+        finally:
+            timings[name] = time.monotonic() - start
+
+    async def _request_json(
+        self,
+        method: str,
+        path: str,
+        context: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        timeout: float = 30,
+        pr_url: Optional[str] = None
+    ) -> Any:
+        """Send a request and decode the JSON response. See ``GitHubClient._request_json``."""
+        response = await self._transport.request(
+            method, path, params=params, body=body, timeout=timeout
+        )
+        self._raise_for_status(response, context, pr_url)
+        return response.json()
+
+    async def _graphql(self, query: str, variables: Dict[str, Any], context: str,
+                       timeout: float = 30, pr_url: Optional[str] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its ``data`` member."""
+        response = await self._transport.graphql(query, variables, timeout=timeout)
+        return self._graphql_data(response, context, pr_url)
+
+    async def _get_paginated(self, path: str, context: str, timeout: float = 30,
+                             pr_url: Optional[str] = None,
+                             params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """GET every page of a list endpoint.
+
+        Pages named by the first page's ``Link`` header are requested
+        concurrently (at most ``max_page_workers`` at a time); without
+        ``Link`` headers pages are requested until a short page is returned.
+        """
+        base_params = dict(params or {}, per_page=PER_PAGE)
+        response = await self._transport.request("GET", path, params=base_params, timeout=timeout)
+        items = self._page_items(response, context, pr_url)
+
+        if "link" not in response.headers:
+            page_items = items
+            page = 1
+            while len(page_items) >= PER_PAGE:
+                page += 1
+                response = await self._transport.request(
+                    "GET", path, params=dict(base_params, page=page), timeout=timeout
+                )
+                page_items = self._page_items(response, context, pr_url)
+                items = items + page_items
+            return items
+
+        slots = asyncio.Semaphore(max(1, self.max_page_workers))
+
+        async def fetch_page(url: str) -> GitHubResponse:
+            async with slots:
+                return await self._transport.request("GET", url, timeout=timeout)
+
+        urls = page_urls(response.links) or []
+        if urls:
+            # Results come back in page order
+            responses = await asyncio.gather(*(fetch_page(url) for url in urls))
+            for response in responses:
+                items.extend(self._page_items(response, context, pr_url))
+
+        # Follow cursors serially (also covers pages added while fetching)
+        next_url = response.links.get("next")
+        while next_url:
+            response = await self._transport.request("GET", next_url, timeout=timeout)
+            items.extend(self._page_items(response, context, pr_url))
+            next_url = response.links.get("next")
+
+        return items
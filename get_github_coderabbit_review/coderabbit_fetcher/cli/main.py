@@ -1,14 +1,20 @@
 """Main CLI interface for CodeRabbit Comment Fetcher."""
 
+import os
 import sys
 import argparse
+import asyncio
+import contextlib
+import io
 import logging
+import signal
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any, TextIO
 import json
 
 from ..exceptions import CodeRabbitFetcherError, GitHubAuthenticationError, InvalidPRUrlError
-from ..github_client import GitHubClient, GitHubAPIError
+from ..github_client import DEFAULT_FETCH_MODE, FETCH_MODES, GitHubClient, GitHubAPIError, PullRequestDataMixin
 from ..comment_analyzer import CommentAnalyzer, CommentAnalysisError
 from ..persona_manager import PersonaManager
 from ..formatters import MarkdownFormatter, JSONFormatter, PlainTextFormatter
@@ -16,6 +22,7 @@ from ..resolved_marker import ResolvedMarkerManager, ResolvedMarkerConfig
 from ..comment_poster import ResolutionRequestManager, ResolutionRequestConfig
 from ..models import CommentMetadata
 from ..orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+from ..thread_index import parse_since
 
 
 # Configure logging
@@ -25,6 +32,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+#: File extension of per-PR output files in batch mode
+OUTPUT_EXTENSIONS = {'markdown': 'md', 'json': 'json', 'plain': 'txt'}
+
+#: Name of the aggregate summary written to the batch output directory
+BATCH_SUMMARY_FILE = 'summary.json'
+
 
 class CLIError(CodeRabbitFetcherError):
     """CLI-specific errors."""
@@ -34,6 +47,14 @@ class CLIError(CodeRabbitFetcherError):
 # Use orchestrator pattern - old CLI class removed and replaced with new architecture
 
 
+def _since_argument(value: str):
+    """Parse the value of ``--since``."""
+    try:
+        return parse_since(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -61,15 +82,52 @@ Examples:
       --post-resolution-request \\
       --show-stats \\
       --debug
+
+  # Batch mode: many PRs, one output file per PR plus summary.json
+  python -m coderabbit_fetcher --urls-file prs.txt --output-dir ./reviews --workers 8
+
+  # Fetch once, then re-format offline without API calls
+  python -m coderabbit_fetcher https://github.com/owner/repo/pull/123 --save-snapshot pr123.json
+  python -m coderabbit_fetcher --from-snapshot pr123.json --output-format json
+
+  # Watch a PR: rewrite the output only when the analysis changes, print thread events
+  python -m coderabbit_fetcher https://github.com/owner/repo/pull/123 \\
+      --watch 60 --output-file pr123.md --watch-events
+
+  # Keep a warm analysis server; later calls are forwarded to it (see server --help)
+  python -m coderabbit_fetcher server
+
+  # Keep reports current from GitHub webhooks (see serve-webhooks --help)
+  python -m coderabbit_fetcher serve-webhooks --port 8080 --report-dir ./reports
         """
     )
 
-    # Optional positional argument (required only for fetch command)
+    # Optional positional arguments (required only for fetch command)
+    parser.add_argument(
+        'pr_urls',
+        nargs='*',
+        metavar='pr_url',
+        help='GitHub pull request URL(s) (omit for --validate/--version/--examples/--validate-marker, '
+             'optional with --from-snapshot)'
+    )
+
     parser.add_argument(
-        'pr_url',
-        nargs='?',
-        default=None,
-        help='GitHub pull request URL (omit for --validate/--version/--examples/--validate-marker)'
+        '--urls-file',
+        type=str,
+        help='Read additional PR URLs from a file, one per line ("-" reads stdin)'
+    )
+
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        help='Batch mode: directory for one output file per PR and summary.json (default: current directory)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='Batch mode: number of PRs processed concurrently (default: 4)'
     )
 
     # Optional arguments
@@ -117,6 +175,122 @@ Examples:
         help='Enable debug logging'
     )
 
+    parser.add_argument(
+        '--backend',
+        choices=['http', 'gh'],
+        default='http',
+        help='GitHub API transport: pooled HTTPS connections or one gh CLI call per request (default: http)'
+    )
+
+    parser.add_argument(
+        '--fetch-mode',
+        choices=FETCH_MODES,
+        default=DEFAULT_FETCH_MODE,
+        help='Fetch PR data with a single paged GraphQL query or per-endpoint REST calls (default: %(default)s)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the on-disk GitHub API response cache and parsed comment cache'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached GitHub API responses and incremental snapshots and refetch everything'
+    )
+
+    parser.add_argument(
+        '--coordination-wait',
+        type=float,
+        default=30.0,
+        metavar='SECONDS',
+        help='Seconds to wait for another process already fetching the same PR and reuse its '
+             'result instead of calling GitHub (0 disables; default: 30)'
+    )
+
+    parser.add_argument(
+        '--coordination-ttl',
+        type=float,
+        default=0.0,
+        metavar='SECONDS',
+        help='Also reuse the result of another process\'s fetch that finished up to SECONDS '
+             'before this run started (default: 0, only fetches still in progress are shared)'
+    )
+
+    parser.add_argument(
+        '--from-snapshot',
+        type=str,
+        metavar='PATH',
+        help='Analyze PR data saved with --save-snapshot instead of fetching it (no authentication or API calls)'
+    )
+
+    parser.add_argument(
+        '--save-snapshot',
+        type=str,
+        metavar='PATH',
+        help='Save the fetched PR data to PATH for later --from-snapshot runs'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only fetch comments updated since the last run and merge them into a local snapshot'
+    )
+
+    parser.add_argument(
+        '--watch',
+        type=float,
+        metavar='SECONDS',
+        help='Keep polling the PR every SECONDS (stretched while it is quiet) and rewrite the output '
+             'only when the analysis changes; stop with Ctrl-C'
+    )
+
+    parser.add_argument(
+        '--watch-events',
+        action='store_true',
+        help='With --watch, print one JSON line per new, updated or resolved thread to stdout'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Parse the comments of large PRs in N worker processes; smaller PRs are analyzed serially '
+             '(default: 1)'
+    )
+
+    parser.add_argument(
+        '--path',
+        dest='thread_path',
+        metavar='GLOB',
+        help="Only report threads on files matching GLOB (e.g. 'src/**')"
+    )
+
+    parser.add_argument(
+        '--since',
+        dest='thread_since',
+        type=_since_argument,
+        metavar='WHEN',
+        help='Only report threads created or updated since WHEN: an ISO date or time (UTC unless a zone '
+             'is given) or a duration such as 12h, 7d or 2w'
+    )
+
+    parser.add_argument(
+        '--status',
+        dest='thread_status',
+        choices=['unresolved', 'pending', 'dismissed'],
+        help='Only report threads with this resolution status (resolved threads are never reported)'
+    )
+
+    parser.add_argument(
+        '--no-server',
+        action='store_true',
+        help='Run locally even when an analysis server (coderabbit-fetch server) is running'
+    )
+
     parser.add_argument(
         '--validate',
         action='store_true',
@@ -146,21 +320,14 @@ Examples:
 
 def run_fetch_command(args) -> int:
     """Run the main fetch command using orchestrator."""
+    # Watch events own stdout; status messages go to stderr
+    status = sys.stderr if args.watch_events and args.watch is not None else sys.stdout
     try:
         # Create execution configuration
-        config = ExecutionConfig(
-            pr_url=args.pr_url,
-            persona_file=args.persona_file,
-            output_format=args.output_format,
-            output_file=args.output_file,
-            resolved_marker=args.resolved_marker,
-            post_resolution_request=args.post_resolution_request,
-            show_stats=args.show_stats,
-            debug=args.debug
-        )
+        config = _create_execution_config(args, args.pr_url, args.output_file)
 
         # Validate configuration
-        print("🔍 Validating configuration...")
+        print("🔍 Validating configuration...", file=status)
         orchestrator = CodeRabbitOrchestrator(config)
         validation_result = orchestrator.validate_configuration()
 
@@ -171,16 +338,26 @@ def run_fetch_command(args) -> int:
             return 1
 
         if validation_result["warnings"]:
-            print("⚠️  Configuration warnings:")
+            print("⚠️  Configuration warnings:", file=status)
             for warning in validation_result["warnings"]:
-                print(f"   • {warning}")
+                print(f"   • {warning}", file=status)
 
         # Execute main workflow
-        print("🚀 Starting CodeRabbit Comment Fetcher...")
-        results = orchestrator.execute()
+        if args.watch is not None:
+            print(f"👀 Watching {args.pr_url} every {args.watch:g}s (Ctrl-C to stop)...", file=status)
+            results = orchestrator.watch()
+        else:
+            print("🚀 Starting CodeRabbit Comment Fetcher...")
+            results = orchestrator.execute()
 
         if results["success"]:
-            print(f"\n✅ Processing completed successfully in {results['execution_time']:.2f}s!")
+            if "watch" in results:
+                watch_stats = results["watch"]
+                print(f"\n✅ Watch stopped after {watch_stats['polls']} polls: "
+                      f"{watch_stats['data_changes']} changes, {watch_stats['writes']} writes, "
+                      f"{watch_stats['events']} events", file=status)
+            else:
+                print(f"\n✅ Processing completed successfully in {results['execution_time']:.2f}s!")
 
             # Show statistics if requested
             if args.show_stats:
@@ -207,18 +384,249 @@ def run_fetch_command(args) -> int:
         return 1
 
 
+def _create_execution_config(args, pr_url: str, output_file: Optional[str]) -> ExecutionConfig:
+    """Build the execution configuration of one PR from parsed arguments."""
+    return ExecutionConfig(
+        pr_url=pr_url,
+        persona_file=args.persona_file,
+        output_format=args.output_format,
+        output_file=output_file,
+        resolved_marker=args.resolved_marker,
+        post_resolution_request=args.post_resolution_request,
+        show_stats=args.show_stats,
+        debug=args.debug,
+        backend=args.backend,
+        fetch_mode=args.fetch_mode,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        incremental=args.incremental,
+        coordination_wait=args.coordination_wait,
+        coordination_ttl=args.coordination_ttl,
+        snapshot_input=args.from_snapshot,
+        snapshot_output=args.save_snapshot,
+        watch_interval=args.watch,
+        watch_events=args.watch_events,
+        jobs=args.jobs,
+        thread_path=args.thread_path,
+        thread_since=args.thread_since,
+        thread_status=args.thread_status
+    )
+
+
+def build_forwarded_config(argv: List[str], cwd: str) -> Optional[ExecutionConfig]:
+    """Build the configuration of a CLI invocation forwarded to the analysis server.
+
+    Args:
+        argv: Command line arguments of the invocation
+        cwd: Working directory of the invocation; relative paths are resolved against it
+
+    Returns:
+        The configuration, or None if the invocation has to run locally
+        (invalid arguments, utility commands, batch mode, snapshots,
+        incremental sync, watch mode, resolution requests, statistics or
+        debug output)
+    """
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            args = create_argument_parser().parse_args(argv)
+    except SystemExit:
+        return None
+
+    local_only = (
+        args.version or args.examples or args.validate or args.validate_marker or args.no_server
+        or args.urls_file or args.output_dir or args.from_snapshot or args.save_snapshot
+        or args.incremental or args.post_resolution_request or args.show_stats or args.debug
+        or args.watch is not None
+    )
+    if local_only or len(args.pr_urls) != 1:
+        return None
+
+    base = Path(cwd)
+    if args.persona_file:
+        args.persona_file = str(base / args.persona_file)
+    output_file = str(base / args.output_file) if args.output_file else None
+    return _create_execution_config(args, args.pr_urls[0], output_file)
+
+
+def collect_pr_urls(args, stdin: Optional[TextIO] = None) -> List[str]:
+    """Collect PR URLs from positional arguments and ``--urls-file``.
+
+    Blank lines and lines starting with ``#`` are ignored; duplicates are
+    dropped keeping the first occurrence.
+
+    Args:
+        args: Parsed command line arguments
+        stdin: Stream read for ``--urls-file -`` (defaults to ``sys.stdin``)
+
+    Returns:
+        PR URLs in the order given
+
+    Raises:
+        CLIError: If the URLs file cannot be read
+    """
+    urls = list(args.pr_urls or [])
+
+    if args.urls_file:
+        try:
+            if args.urls_file == '-':
+                lines = (stdin or sys.stdin).read().splitlines()
+            else:
+                lines = Path(args.urls_file).read_text(encoding='utf-8').splitlines()
+        except OSError as e:
+            raise CLIError(f"Cannot read URLs file: {args.urls_file}", details=str(e)) from e
+
+        urls.extend(
+            line.strip() for line in lines
+            if line.strip() and not line.strip().startswith('#')
+        )
+
+    return list(dict.fromkeys(urls))
+
+
+def batch_output_path(output_dir: Path, pr_url: str, output_format: str) -> Path:
+    """Return the output file of one PR in batch mode.
+
+    Args:
+        output_dir: Batch output directory
+        pr_url: GitHub pull request URL
+        output_format: Output format name
+
+    Returns:
+        Path named ``<owner>_<repo>_pr<number>.<ext>``
+
+    Raises:
+        InvalidPRUrlError: If the URL is not a pull request URL
+    """
+    owner, repo, pr_number = PullRequestDataMixin().parse_pr_url(pr_url)
+    return output_dir / f"{owner}_{repo}_pr{pr_number}.{OUTPUT_EXTENSIONS[output_format]}"
+
+
+def run_batch_command(args, pr_urls: List[str]) -> int:
+    """Process several PRs with one shared client, persona and formatter set.
+
+    Each PR is written to its own file in ``--output-dir`` and an aggregate
+    ``summary.json`` is written next to them. A failing PR is reported in the
+    summary without affecting the others.
+
+    Args:
+        args: Parsed command line arguments
+        pr_urls: PR URLs to process
+
+    Returns:
+        0 if every PR succeeded, 1 otherwise
+    """
+    if args.output_file:
+        print("❌ --output-file cannot be used with several PRs; use --output-dir", file=sys.stderr)
+        return 1
+    if args.from_snapshot or args.save_snapshot:
+        print("❌ --from-snapshot and --save-snapshot take a single PR", file=sys.stderr)
+        return 1
+    if args.watch is not None:
+        print("❌ --watch takes a single PR", file=sys.stderr)
+        return 1
+    if args.incremental:
+        # The batch fetches every PR in full; never drop the flag silently
+        print("❌ --incremental takes a single PR without --output-dir", file=sys.stderr)
+        return 1
+    if args.workers < 1:
+        print("❌ --workers must be at least 1", file=sys.stderr)
+        return 1
+
+    output_dir = Path(args.output_dir or '.')
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"❌ Cannot create output directory: {e}", file=sys.stderr)
+        return 1
+
+    entries: List[Dict[str, Any]] = []
+    configs: List[ExecutionConfig] = []
+    for pr_url in pr_urls:
+        entry: Dict[str, Any] = {"pr_url": pr_url, "success": False, "output_file": None}
+        entries.append(entry)
+        try:
+            output_file = str(batch_output_path(output_dir, pr_url, args.output_format))
+        except InvalidPRUrlError as e:
+            entry.update(error=e.message, error_type=type(e).__name__)
+            continue
+
+        config = _create_execution_config(args, pr_url, output_file)
+        validation_result = CodeRabbitOrchestrator(config).validate_configuration()
+        if not validation_result["valid"]:
+            entry.update(error="; ".join(validation_result["issues"]), error_type="ConfigurationError")
+            continue
+
+        entry["output_file"] = output_file
+        configs.append(config)
+
+    print(f"🚀 Processing {len(configs)} of {len(pr_urls)} PRs with {args.workers} workers...")
+    results = asyncio.run(
+        CodeRabbitOrchestrator.execute_many_async(configs, max_concurrency=args.workers)
+    ) if configs else []
+
+    pending = iter(results)
+    for entry in entries:
+        if entry["output_file"] is None:
+            continue
+        result = next(pending)
+        entry["success"] = result["success"]
+        entry["execution_time"] = round(result["execution_time"], 3)
+        if not result["success"]:
+            entry.update(output_file=None, error=result["error"], error_type=result["error_type"])
+
+    succeeded = sum(1 for entry in entries if entry["success"])
+    summary = {
+        "total": len(entries),
+        "succeeded": succeeded,
+        "failed": len(entries) - succeeded,
+        "results": entries,
+    }
+    summary_path = output_dir / BATCH_SUMMARY_FILE
+    summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    _display_batch_summary(entries)
+    print(f"\n📄 Summary written to {summary_path}")
+    return 0 if succeeded == len(entries) else 1
+
+
+def _display_batch_summary(entries: List[Dict[str, Any]]) -> None:
+    """Display one line per PR of a batch run."""
+    succeeded = sum(1 for entry in entries if entry["success"])
+    print(f"\n📊 Batch Summary: {succeeded}/{len(entries)} PRs succeeded")
+    for entry in entries:
+        if entry["success"]:
+            print(f"   ✅ {entry['pr_url']} -> {entry['output_file']} ({entry['execution_time']:.2f}s)")
+        else:
+            print(f"   ❌ {entry['pr_url']}: {entry['error']}")
+
+
 def _display_execution_statistics(metrics: Dict[str, Any]) -> None:
     """Display detailed execution statistics."""
     print("\n📊 Execution Statistics:")
     print(f"   Total execution time: {metrics['execution_time']:.2f}s")
     print(f"   GitHub API calls: {metrics['github_api_calls']}")
     print(f"   GitHub API time: {metrics['github_api_time']:.2f}s")
+    for endpoint, seconds in (metrics.get("github_endpoint_times") or {}).items():
+        print(f"     {endpoint}: {seconds:.2f}s")
     print(f"   Analysis time: {metrics['analysis_time']:.2f}s")
     print(f"   Formatting time: {metrics['formatting_time']:.2f}s")
     print(f"   Total comments processed: {metrics['total_comments_processed']}")
     print(f"   CodeRabbit comments found: {metrics['coderabbit_comments_found']}")
     print(f"   Resolved comments filtered: {metrics['resolved_comments_filtered']}")
     print(f"   Output size: {metrics['output_size_bytes']} bytes")
+    if metrics.get("cache_hits") or metrics.get("cache_misses"):
+        print(f"   API cache hits/misses: {metrics['cache_hits']}/{metrics['cache_misses']}")
+    rate_limit = metrics.get("rate_limit") or {}
+    for resource, state in rate_limit.get("resources", {}).items():
+        reset = time.strftime('%H:%M:%S', time.localtime(state['reset']))
+        print(f"   Rate limit ({resource}): {state['remaining']}/{state['limit']} remaining, resets at {reset}")
+    if rate_limit.get("throttled_requests"):
+        print(f"   Throttled requests: {rate_limit['throttled_requests']} "
+              f"({rate_limit['throttled_seconds']:.1f}s waiting)")
+    for circuit, state in (metrics.get("circuit_breakers") or {}).items():
+        if state["state"] != "closed" or state["times_opened"]:
+            print(f"   Circuit {circuit}: {state['state']} (opened {state['times_opened']}x, "
+                  f"{state['rejected_requests']} requests failed fast)")
     print(f"   Success rate: {metrics['success_rate']*100:.1f}%")
 
     if metrics["errors_count"] > 0:
@@ -374,6 +782,12 @@ def run_examples_command() -> int:
        --show-stats \\
        --debug
 
+7. Batch mode (one file per PR plus summary.json):
+   python -m coderabbit_fetcher https://github.com/owner/repo/pull/1 \\
+       https://github.com/owner/repo/pull/2 --output-dir ./reviews
+
+   cat prs.txt | python -m coderabbit_fetcher --urls-file - --workers 8
+
 🔧 Setup Commands:
 
 1. Validate GitHub CLI setup:
@@ -398,6 +812,217 @@ def run_examples_command() -> int:
     return 0
 
 
+def create_server_argument_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the ``server`` command."""
+    parser = argparse.ArgumentParser(
+        prog="coderabbit-fetch server",
+        description="Keep one warm process serving analyses over a local JSON API; "
+                    "coderabbit-fetch forwards to it while it runs",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on the default Unix socket
+  coderabbit-fetch server
+
+  # Serve on a localhost port
+  coderabbit-fetch server --port 8765
+  curl -H "Authorization: Bearer $(cat ~/.cache/coderabbit-fetcher/server/token)" \\
+      'http://127.0.0.1:8765/analyze?pr=https://github.com/owner/repo/pull/123&format=json'
+
+Every request needs the access token the server writes to server/token in the
+cache directory on start (the launcher sends it automatically).
+        """
+    )
+
+    parser.add_argument('--socket', type=Path, help='Unix socket to listen on (default: in the cache directory)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address of the TCP listener (default: 127.0.0.1; other addresses are reachable '
+                             'from the network, protected by the access token only)')
+    parser.add_argument('--port', type=int, help='Listen on this localhost TCP port instead of a Unix socket')
+    parser.add_argument(
+        '--backend',
+        choices=['http', 'gh'],
+        default='http',
+        help='GitHub API transport of the shared client (default: http)'
+    )
+    parser.add_argument(
+        '--fetch-mode',
+        choices=FETCH_MODES,
+        default=DEFAULT_FETCH_MODE,
+        help='Fetch mode of the shared client (default: %(default)s)'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Disable the on-disk GitHub API response cache')
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of analyses running at once (default: 8)'
+    )
+    parser.add_argument('--timeout', type=int, default=300, help='Default API timeout in seconds (default: 300)')
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+
+    return parser
+
+
+def run_server_command(argv: List[str]) -> int:
+    """Run the persistent analysis server until interrupted."""
+    from ..server import AnalysisServer
+
+    args = create_server_argument_parser().parse_args(argv)
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    server = AnalysisServer(
+        backend=args.backend,
+        fetch_mode=args.fetch_mode,
+        use_cache=not args.no_cache,
+        timeout_seconds=args.timeout,
+        max_concurrency=args.max_concurrency,
+    )
+
+    async def serve() -> None:
+        ready = asyncio.Event()
+        task = asyncio.ensure_future(server.serve(args.socket, args.host, args.port, ready))
+        with contextlib.suppress(NotImplementedError):
+            # Clean up the socket and published address on termination too
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+        await asyncio.wait([task, asyncio.ensure_future(ready.wait())], return_when=asyncio.FIRST_COMPLETED)
+        if ready.is_set():
+            print(f"🚀 Analysis server listening on {server.address}")
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n⚠️  Analysis server stopped", file=sys.stderr)
+    except OSError as e:
+        print(f"❌ Failed to start analysis server: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def create_webhook_argument_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the ``serve-webhooks`` command."""
+    parser = argparse.ArgumentParser(
+        prog="coderabbit-fetch serve-webhooks",
+        description="Receive GitHub webhooks and keep CodeRabbit reports of the affected PRs up to date",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve webhooks on port 8080, reports in ./reports
+  CODERABBIT_WEBHOOK_SECRET=... coderabbit-fetch serve-webhooks --port 8080 --report-dir ./reports
+
+  # Replay recorded deliveries without starting a server
+  coderabbit-fetch serve-webhooks --replay deliveries.ndjson --no-fetch
+        """
+    )
+
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    parser.add_argument(
+        '--secret',
+        default=os.environ.get('CODERABBIT_WEBHOOK_SECRET') or os.environ.get('GITHUB_WEBHOOK_SECRET'),
+        help='Webhook secret used to verify X-Hub-Signature-256 '
+             '(default: $CODERABBIT_WEBHOOK_SECRET or $GITHUB_WEBHOOK_SECRET)'
+    )
+    parser.add_argument(
+        '--report-dir',
+        type=Path,
+        default=Path('coderabbit-reports'),
+        help='Directory receiving one report per PR (default: ./coderabbit-reports)'
+    )
+    parser.add_argument('--persona-file', '-p', type=str, help='Path to persona file for AI context')
+    parser.add_argument(
+        '--output-format', '-f',
+        choices=['markdown', 'json', 'plain'],
+        default='markdown',
+        help='Report format (default: markdown)'
+    )
+    parser.add_argument(
+        '--resolved-marker', '-m',
+        type=str,
+        default='🔒 CODERABBIT_RESOLVED 🔒',
+        help='Resolved marker string (default: 🔒 CODERABBIT_RESOLVED 🔒)'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=['http', 'gh'],
+        default='http',
+        help='GitHub API transport used to fetch PRs seen for the first time (default: http)'
+    )
+    parser.add_argument(
+        '--no-fetch',
+        action='store_true',
+        help='Never call the GitHub API; PRs seen for the first time start from the event alone'
+    )
+    parser.add_argument(
+        '--replay',
+        nargs='+',
+        metavar='FILE',
+        help='Process recorded deliveries ({"event": ..., "payload": ...} objects, JSON or NDJSON) and exit'
+    )
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+
+    return parser
+
+
+def run_serve_webhooks_command(argv: List[str]) -> int:
+    """Run the webhook daemon, or replay recorded deliveries."""
+    from ..webhook_daemon import WebhookDaemon, WebhookServer, replay_payloads
+
+    args = create_webhook_argument_parser().parse_args(argv)
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if not args.replay and not args.secret:
+        print("❌ A webhook secret is required (--secret or $CODERABBIT_WEBHOOK_SECRET)", file=sys.stderr)
+        return 1
+
+    client = None
+    if not args.no_fetch:
+        try:
+            client = GitHubClient(backend=args.backend)
+        except CodeRabbitFetcherError as e:
+            print(f"⚠️  GitHub API unavailable, new PRs start from their first event: {e}", file=sys.stderr)
+
+    try:
+        daemon = WebhookDaemon(
+            report_dir=args.report_dir,
+            output_format=args.output_format,
+            persona_file=args.persona_file,
+            resolved_marker=args.resolved_marker,
+            client=client,
+        )
+    except (CodeRabbitFetcherError, OSError) as e:
+        print(f"❌ Failed to start webhook daemon: {e}", file=sys.stderr)
+        return 1
+
+    if args.replay:
+        try:
+            outcomes = replay_payloads(daemon, args.replay)
+        except (OSError, ValueError) as e:
+            print(f"❌ Failed to replay deliveries: {e}", file=sys.stderr)
+            return 1
+        for outcome in outcomes:
+            print(json.dumps(outcome, ensure_ascii=False))
+        return 1 if any(outcome["status"] == "failed" for outcome in outcomes) else 0
+
+    try:
+        server = WebhookServer((args.host, args.port), daemon, args.secret)
+    except OSError as e:
+        print(f"❌ Cannot listen on {args.host}:{args.port}: {e}", file=sys.stderr)
+        return 1
+
+    print(f"🚀 Receiving webhooks on {server.url}/webhook, reports in {args.report_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️  Webhook daemon stopped", file=sys.stderr)
+    finally:
+        server.server_close()
+    return 0
+
+
 def main():
     """Main entry point for the CLI."""
     try:
@@ -408,6 +1033,12 @@ def main():
             parser.print_help()
             return 0
 
+        if sys.argv[1] == 'serve-webhooks':
+            return run_serve_webhooks_command(sys.argv[2:])
+
+        if sys.argv[1] == 'server':
+            return run_server_command(sys.argv[2:])
+
         args = parser.parse_args()
 
         # Handle utility commands first
@@ -423,12 +1054,21 @@ def main():
         if args.validate_marker:
             return run_validate_marker_command(args.validate_marker)
 
-        # Main fetch command (requires pr_url)
-        if not args.pr_url:
+        # Main fetch command (requires at least one PR URL)
+        pr_urls = collect_pr_urls(args)
+        if not pr_urls and args.from_snapshot and not args.output_dir:
+            # The snapshot records the PR URL
+            args.pr_url = ""
+            return run_fetch_command(args)
+        if not pr_urls:
             print("❌ PR URL is required for fetch command", file=sys.stderr)
             parser.print_help()
             return 1
 
+        if len(pr_urls) > 1 or args.output_dir:
+            return run_batch_command(args, pr_urls)
+
+        args.pr_url = pr_urls[0]
         return run_fetch_command(args)
 
     except KeyboardInterrupt:
@@ -2,7 +2,8 @@
 
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Any, Union
 from dataclasses import dataclass
 
 # Module-level logger
@@ -18,7 +19,12 @@ from .models import (
 )
 from .processors import SummaryProcessor, ReviewProcessor, ThreadProcessor
 from .resolved_marker import ResolvedMarkerConfig, ResolvedMarkerDetector
+from .analysis_delta import AnalysisState, comment_key
 from .exceptions import CodeRabbitFetcherError
+from .parallel_analysis import (
+    PARALLEL_THRESHOLD, PROCESSING_ERRORS, compact_model, compact_thread, process_in_pool, restore_model, restore_thread
+)
+from .parse_cache import ParseCache, parse_key
 
 
 class CommentAnalysisError(CodeRabbitFetcherError):
@@ -38,18 +44,32 @@ class CommentStats:
     actionable_comments: int = 0
     threads_processed: int = 0
     processing_time_seconds: float = 0.0
+    # Worker processes used by the last analysis (1 when serial)
+    workers: int = 1
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
 
 
 class CommentAnalyzer:
     """Analyzes and categorizes CodeRabbit comments from GitHub PR data."""
 
-    def __init__(self, resolved_marker_config: Optional[ResolvedMarkerConfig] = None):
+    def __init__(self, resolved_marker_config: Optional[ResolvedMarkerConfig] = None,
+                 jobs: int = 1, parallel_threshold: int = PARALLEL_THRESHOLD,
+                 parse_cache: Optional[ParseCache] = None):
         """Initialize comment analyzer.
 
         Args:
             resolved_marker_config: Configuration for resolved marker detection
+            jobs: Worker processes parsing the comments of large pull requests
+            parallel_threshold: Minimum number of CodeRabbit comments parsed
+                in worker processes; smaller pull requests are analyzed serially
+            parse_cache: Persistent cache of parsed comments; only comments
+                missing from it are parsed
         """
         self.resolved_marker_config = resolved_marker_config or ResolvedMarkerConfig()
+        self.jobs = jobs
+        self.parallel_threshold = parallel_threshold
+        self.parse_cache = parse_cache
         self.resolved_marker_detector = ResolvedMarkerDetector(self.resolved_marker_config)
 
         # Initialize processors
@@ -84,6 +104,8 @@ class CommentAnalyzer:
             # Get all comments (issues + reviews)
             all_comments = self._collect_all_comments(pr_data)
             self.stats.total_comments = len(all_comments)
+            state = AnalysisState()
+            keys = {id(comment): state.place(comment) for comment in all_comments}
 
             # Filter CodeRabbit comments
             coderabbit_comments = self._filter_coderabbit_comments(all_comments)
@@ -92,18 +114,50 @@ class CommentAnalyzer:
             if not coderabbit_comments:
                 # Return empty result with metadata
                 self.stats.processing_time_seconds = time.time() - start_time
-                return self._create_empty_result(pr_info)
+                result = self._create_empty_result(pr_info)
+                result._analysis_state = state
+                return result
 
             # Categorize comments
             summary_comments, review_comments, inline_comments = self._categorize_comments(coderabbit_comments)
+            for category, comments in (
+                ("summary", summary_comments), ("review", review_comments), ("inline", inline_comments)
+            ):
+                for comment in comments:
+                    state.add(keys[id(comment)], comment, category)
 
             # Process each category
-            processed_summary = self._process_summary_comments(summary_comments)
-            processed_review = self._process_review_comments(review_comments)
-            processed_threads = self._process_thread_comments(inline_comments)
+            thread_groups = self._group_thread_comments(inline_comments)
+            results = self._process_work({
+                "summary": summary_comments,
+                "review": review_comments,
+                "thread": list(thread_groups.values()),
+            })
+            for kind, comments in (("summary", summary_comments), ("review", review_comments)):
+                for comment, result in zip(comments, results[kind], strict=True):
+                    state.results[keys[id(comment)]] = result
+                    if result is not None:
+                        state.order[kind].append(state.positions[keys[id(comment)]])
+            for (root, group), thread in zip(thread_groups.items(), results["thread"], strict=True):
+                for comment in group:
+                    state.attach(keys[id(comment)], root)
+                state.threads[root] = thread
+
+            processed_summary, processed_review, processed_threads = (
+                [result for result in results[kind] if result is not None] for kind in ("summary", "review", "thread")
+            )
+            self.stats.actionable_comments += sum(review.actionable_count for review in processed_review)
+            self.stats.threads_processed = len(processed_threads)
 
             # Apply resolved marker filtering
             filtered_threads = self._filter_resolved_threads(processed_threads)
+            for root, group in thread_groups.items():
+                thread = state.threads[root]
+                if thread is not None and thread.resolution_status != ResolutionStatus.RESOLVED:
+                    state.thread_keys[root] = state.positions[keys[id(group[0])]]
+                    state.order["thread"].append(state.thread_keys[root])
+            state.resolved_threads = self.stats.resolved_comments
+            state.actionable_comments = self.stats.actionable_comments
 
             # Create metadata
             metadata = self._create_metadata(pr_info)
@@ -111,17 +165,177 @@ class CommentAnalyzer:
             # Final statistics
             self.stats.processing_time_seconds = time.time() - start_time
 
-            return AnalyzedComments(
+            result = AnalyzedComments(
                 summary_comments=processed_summary,
                 review_comments=processed_review,
                 unresolved_threads=filtered_threads,
                 metadata=metadata
             )
+            result._analysis_state = state
+            return result
 
         except Exception as e:
             logger.exception("Failed to analyze comments")
             raise CommentAnalysisError("Failed to analyze comments") from e
 
+    def apply_delta(self, analyzed: AnalyzedComments,
+                    added: Iterable[Dict[str, Any]] = (),
+                    edited: Iterable[Dict[str, Any]] = (),
+                    deleted: Iterable[Union[Dict[str, Any], int, str]] = ()) -> AnalyzedComments:
+        """Update an analysis with added, edited and deleted comments.
+
+        Only the changed summary and review comments and the threads whose
+        comments changed are processed again (through the parse cache and
+        worker processes like in a full analysis), and resolution is
+        detected again only for those threads. Results are replaced in
+        place, where a full analysis of the changed pull request would put
+        them, and the metadata counters are adjusted, so the cost of an
+        update follows the size of the change rather than of the pull request.
+
+        Comments are given as in the pull request data, with
+        ``comment_type`` ``"review_comment"`` (the default), ``"issue"`` or
+        ``"review"`` (review bodies). Added comments come after all others.
+
+        Args:
+            analyzed: Result of ``analyze_comments`` or of a previous update,
+                not modified otherwise; it cannot be used anymore if the
+                update fails
+            added: New comments
+            edited: New versions of changed comments
+            deleted: Deleted comments, or IDs of deleted review comments
+
+        Returns:
+            The updated analysis
+
+        Raises:
+            CommentAnalysisError: If the analysis was not made by this
+                analyzer's ``analyze_comments`` or the update fails
+        """
+        state = analyzed._analysis_state
+        if not isinstance(state, AnalysisState):
+            raise CommentAnalysisError("Analysis has no state to apply changes to; analyze the comments first")
+
+        start_time = time.time()
+        try:
+            self.stats.parse_cache_hits = self.stats.parse_cache_misses = 0
+
+            changes: Dict[str, Optional[Dict[str, Any]]] = {}
+            for comment in deleted:
+                changes[comment_key(comment if isinstance(comment, dict) else {"id": comment})] = None
+            for comment in (*added, *edited):
+                # Annotate a copy: the caller's comments are left as they are
+                comment = dict(comment)
+                comment.setdefault("comment_type", "review_comment")
+                changes[comment_key(comment)] = comment
+
+            pending: Dict[str, List[str]] = {"summary": [], "review": []}
+            dirty_roots = set()
+            moved_keys: List[str] = []
+            moved_ids = set()
+            for key, comment in changes.items():
+                old = state.remove(key)
+                if old is not None:
+                    if key in state.roots:
+                        dirty_roots.add(state.detach(key))
+                        moved_ids.add(str(old.get("id")))
+                    else:
+                        self._discard_result(analyzed, state, key)
+                if comment is None:
+                    state.positions.pop(key, None)
+                    continue
+
+                state.place(comment)
+                if not self.is_coderabbit_comment(comment):
+                    continue
+                category = self.categorize_comment(comment)
+                state.add(key, comment, category)
+                if category == "inline":
+                    moved_keys.append(key)
+                    moved_ids.add(str(comment.get("id")))
+                else:
+                    pending[category].append(key)
+
+            # Replies to changed comments may belong to another thread now
+            for key in dict.fromkeys([*moved_keys, *state.descendants(moved_ids)]):
+                dirty_roots.add(state.detach(key))
+                root = self.thread_processor.thread_root_id(state.comments[key], state.inline_map)
+                state.attach(key, root)
+                dirty_roots.add(root)
+            dirty_roots.discard(None)
+
+            for root in dirty_roots:
+                self._discard_thread(analyzed, state, root)
+                if not state.groups.get(root):
+                    state.groups.pop(root, None)
+            roots = [root for root in dirty_roots if root in state.groups]
+            results = self._process_work({
+                "summary": [state.comments[key] for key in pending["summary"]],
+                "review": [state.comments[key] for key in pending["review"]],
+                "thread": [state.members(root) for root in roots],
+            })
+
+            for kind, items in (("summary", analyzed.summary_comments), ("review", analyzed.review_comments)):
+                for key, result in zip(pending[kind], results[kind], strict=True):
+                    state.results[key] = result
+                    if result is None:
+                        continue
+                    state.insert(items, kind, state.positions[key], result)
+                    if kind == "review":
+                        state.actionable_comments += result.actionable_count
+
+            for root, thread in zip(roots, results["thread"], strict=True):
+                state.threads[root] = thread
+                if thread is None:
+                    continue
+                thread.resolution_status = self.resolved_marker_detector.detect_resolution_status(thread)
+                if thread.resolution_status == ResolutionStatus.RESOLVED:
+                    state.resolved_threads += 1
+                else:
+                    state.thread_keys[root] = min(state.positions[key] for key in state.groups[root])
+                    state.insert(analyzed.unresolved_threads, "thread", state.thread_keys[root], thread)
+
+            self.stats.total_comments = len(state.positions)
+            self.stats.coderabbit_comments = len(state.comments)
+            self.stats.summary_comments = state.counts["summary"]
+            self.stats.review_comments = state.counts["review"]
+            self.stats.inline_comments = state.counts["inline"]
+            self.stats.resolved_comments = state.resolved_threads
+            self.stats.actionable_comments = state.actionable_comments
+            self.stats.threads_processed = sum(1 for thread in state.threads.values() if thread is not None)
+            self.stats.processing_time_seconds = time.time() - start_time
+
+            metadata = analyzed.metadata
+            metadata.total_comments = self.stats.total_comments
+            metadata.coderabbit_comments = self.stats.coderabbit_comments
+            metadata.resolved_comments = self.stats.resolved_comments
+            metadata.actionable_comments = self.stats.actionable_comments
+            return analyzed
+
+        except Exception as e:
+            logger.exception("Failed to apply comment changes")
+            raise CommentAnalysisError("Failed to apply comment changes") from e
+
+    def _discard_result(self, analyzed: AnalyzedComments, state: AnalysisState, key: str) -> None:
+        """Remove the result of a summary or review comment from an analysis."""
+        result = state.results.pop(key, None)
+        if result is None:
+            return
+        if isinstance(result, ReviewComment):
+            state.delete(analyzed.review_comments, "review", state.positions[key])
+            state.actionable_comments -= result.actionable_count
+        else:
+            state.delete(analyzed.summary_comments, "summary", state.positions[key])
+
+    def _discard_thread(self, analyzed: AnalyzedComments, state: AnalysisState, root: str) -> None:
+        """Remove a thread from an analysis."""
+        thread = state.threads.pop(root, None)
+        if thread is None:
+            return
+        if root in state.thread_keys:
+            state.delete(analyzed.unresolved_threads, "thread", state.thread_keys.pop(root))
+        else:
+            state.resolved_threads -= 1
+
     def _extract_pr_info(self, pr_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract basic pull request information."""
         return {
@@ -187,75 +401,165 @@ class CommentAnalyzer:
         inline_comments = []
 
         for comment in comments:
-            body = comment.get("body", "")
-            comment_type = comment.get("comment_type", "")
+            category = self.categorize_comment(comment)
 
-            # Check if it's a summary comment
-            if "Summary by CodeRabbit" in body or "## Summary" in body:
+            if category == "summary":
                 summary_comments.append(comment)
                 self.stats.summary_comments += 1
-
-            # Check if it's a review comment (actionable comments posted)
-            elif "Actionable comments posted:" in body or comment_type == "review":
+            elif category == "review":
                 review_comments.append(comment)
                 self.stats.review_comments += 1
-
-            # Otherwise treat as inline comment
             else:
                 inline_comments.append(comment)
                 self.stats.inline_comments += 1
 
         return summary_comments, review_comments, inline_comments
 
-    def _process_summary_comments(self, comments: List[Dict[str, Any]]) -> List[SummaryComment]:
-        """Process summary comments using SummaryProcessor."""
-        processed = []
+    def categorize_comment(self, comment: Dict[str, Any]) -> str:
+        """Get the category of a CodeRabbit comment.
 
-        for comment in comments:
-            try:
-                summary = self.summary_processor.process_summary_comment(comment)
-                processed.append(summary)
-            except (ValueError, KeyError, TypeError) as e:
-                # Log error but continue processing
-                logger.warning("Failed to process summary comment %s: %s", comment.get('id'), e, exc_info=True)
-            except (KeyboardInterrupt, SystemExit):
-                # Re-raise critical exceptions
-                raise
-
-        return processed
-
-    def _process_review_comments(self, comments: List[Dict[str, Any]]) -> List[ReviewComment]:
-        """Process review comments using ReviewProcessor."""
-        processed = []
+        Args:
+            comment: Comment object to categorize
 
-        for comment in comments:
-            try:
-                review = self.review_processor.process_review_comment(comment)
-                processed.append(review)
-                self.stats.actionable_comments += review.actionable_count
-            except (ValueError, KeyError, TypeError, AttributeError) as e:
-                # Log error but continue processing
-                logger.warning("Failed to process review comment %s: %s", comment.get('id'), e, exc_info=True)
-            except (KeyboardInterrupt, SystemExit):
-                # Re-raise critical exceptions
-                raise
-
-        return processed
-
-    def _process_thread_comments(self, comments: List[Dict[str, Any]]) -> List[ThreadContext]:
-        """Process inline comments into thread contexts."""
+        Returns:
+            ``"summary"``, ``"review"`` (actionable comments posted) or ``"inline"``
+        """
+        body = comment.get("body") or ""
+
+        if "Summary by CodeRabbit" in body or "## Summary" in body:
+            return "summary"
+        if "Actionable comments posted:" in body or comment.get("comment_type") == "review":
+            return "review"
+        return "inline"
+
+    def _process_work(self, work: Dict[str, list]) -> Dict[str, list]:
+        """Process summary comments, review comments and inline comment threads.
+
+        Cached results are reused; the rest is parsed, in worker processes
+        for large pull requests, and added to the cache.
+
+        Args:
+            work: Summary comments, review comments and threads, by kind
+
+        Returns:
+            Processed items by kind, in input order (None for items failing
+            to process)
+        """
+        results: Dict[str, List[Any]] = {kind: [None] * len(items) for kind, items in work.items()}
+        keys: Dict[str, List[str]] = {}
+
+        if self.parse_cache is not None:
+            keys = {kind: [self._parse_key(kind, item) for item in items] for kind, items in work.items()}
+            cached = self.parse_cache.get_many(key for kind_keys in keys.values() for key in kind_keys)
+            for kind, items in work.items():
+                for index, key in enumerate(keys[kind]):
+                    if key in cached:
+                        results[kind][index] = self._restore(kind, items[index], cached[key])
+                self.stats.parse_cache_hits += sum(result is not None for result in results[kind])
+                self.stats.parse_cache_misses += sum(result is None for result in results[kind])
+
+        pending = {kind: [i for i, result in enumerate(results[kind]) if result is None] for kind in work}
+        compacts = self._process_in_parallel({kind: [work[kind][i] for i in pending[kind]] for kind in work})
+
+        store: Dict[str, Any] = {}
+        for kind, items in work.items():
+            for position, index in enumerate(pending[kind]):
+                item = items[index]
+                if compacts is None:
+                    result = self._process_item(kind, item)
+                    data = self._compact(kind, item, result) if result is not None and keys else None
+                else:
+                    data, error = compacts[kind][position]
+                    if data is None:
+                        logger.warning("Failed to process %s %s: %s", kind, self._item_id(kind, item), error)
+                        continue
+                    result = self._restore(kind, item, data)
+                results[kind][index] = result
+                if data is not None and keys:
+                    store[keys[kind][index]] = data
+
+        if self.parse_cache is not None:
+            self.parse_cache.put_many(store)
+        return results
+
+    def _group_thread_comments(self, comments: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group inline comments into threads by root comment ID."""
         try:
-            threads = self.thread_processor.process_comments_to_threads(comments)
-            self.stats.threads_processed = len(threads)
-            return threads
+            return self.thread_processor.group_comments_by_root(comments)
         except (ValueError, KeyError, TypeError) as e:
-            # Log error and return empty list
+            # Log error and process no threads
             logger.warning("Failed to process thread comments: %s", e, exc_info=True)
-            return []
+            return {}
+
+    def _process_item(self, kind: str, item: Any) -> Any:
+        """Process a summary comment, review comment or thread, or return None if it fails."""
+        try:
+            if kind == "summary":
+                return self.summary_processor.process_summary_comment(item)
+            if kind == "review":
+                return self.review_processor.process_review_comment(item)
+            return self.thread_processor.process_thread(item)
+        except PROCESSING_ERRORS as e:
+            # Log error but continue processing
+            logger.warning("Failed to process %s %s: %s", kind, self._item_id(kind, item), e, exc_info=True)
+            return None
         except (KeyboardInterrupt, SystemExit):
             # Re-raise critical exceptions
             raise
 
+    def _process_in_parallel(self, pending: Dict[str, list]) -> Optional[Dict[str, list]]:
+        """Process items in worker processes.
+
+        Args:
+            pending: Summary comments, review comments and threads to process, by kind
+
+        Returns:
+            Compact results by kind, in input order, or None if the items
+            are to be processed serially
+        """
+        self.stats.workers = 1
+        total = len(pending["summary"]) + len(pending["review"]) + sum(map(len, pending["thread"]))
+        if self.jobs <= 1 or total < self.parallel_threshold:
+            return None
+
+        try:
+            summaries, reviews, threads = process_in_pool(
+                self.jobs,
+                (self.summary_processor, self.review_processor, self.thread_processor),
+                pending["summary"], pending["review"], pending["thread"],
+            )
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel analysis unavailable, analyzing serially: %s", e)
+            return None
+        self.stats.workers = self.jobs
+        return {"summary": summaries, "review": reviews, "thread": threads}
+
+    def _parse_key(self, kind: str, item: Any) -> str:
+        processor = {
+            "summary": self.summary_processor, "review": self.review_processor, "thread": self.thread_processor
+        }[kind]
+        return parse_key(kind, processor, self.resolved_marker_config, item)
+
+    def _compact(self, kind: str, item: Any, result: Any) -> Dict[str, Any]:
+        if kind == "thread":
+            return compact_thread(self.thread_processor, item, result)
+        return compact_model(result, item.get("body"))
+
+    def _restore(self, kind: str, item: Any, data: Dict[str, Any]) -> Any:
+        """Rebuild a compact result, or return None if it does not fit the item."""
+        try:
+            if kind == "thread":
+                return restore_thread(item, data)
+            model_class = SummaryComment if kind == "summary" else ReviewComment
+            return restore_model(model_class, data, item.get("body"))
+        except (ValueError, KeyError, TypeError, IndexError) as e:
+            logger.debug("Discarding cached %s result: %s", kind, e)
+            return None
+
+    @staticmethod
+    def _item_id(kind: str, item: Any) -> Any:
+        return (item[0] if item else {}).get("id") if kind == "thread" else item.get("id")
+
     def _filter_resolved_threads(self, threads: List[ThreadContext]) -> List[ThreadContext]:
         """Filter out resolved threads using resolved marker detection."""
         if not threads:
@@ -284,7 +588,6 @@ class CommentAnalyzer:
             pr_title=pr_info["title"],
             owner=pr_info["owner"],
             repo=pr_info["repo"],
-            processed_at=None,  # Will be set by processor if needed
             total_comments=self.stats.total_comments,
             coderabbit_comments=self.stats.coderabbit_comments,
             resolved_comments=self.stats.resolved_comments,
@@ -319,6 +622,13 @@ class CommentAnalyzer:
             "actionable_comments": self.stats.actionable_comments,
             "threads_processed": self.stats.threads_processed,
             "processing_time_seconds": self.stats.processing_time_seconds,
+            "workers": self.stats.workers,
+            "parse_cache_hits": self.stats.parse_cache_hits,
+            "parse_cache_misses": self.stats.parse_cache_misses,
+            "parse_cache_hit_rate": (
+                0.0 if self.stats.parse_cache_hits + self.stats.parse_cache_misses == 0
+                else self.stats.parse_cache_hits / (self.stats.parse_cache_hits + self.stats.parse_cache_misses)
+            ),
             "resolution_rate": (
                 0.0 if self.stats.coderabbit_comments == 0
                 else self.stats.resolved_comments / self.stats.coderabbit_comments
@@ -7,8 +7,8 @@ for proper error handling and user feedback.
 
 from .base import CodeRabbitFetcherError
 from .auth import GitHubAuthenticationError
-from .network import NetworkError, APIRateLimitError
-from .parsing import CommentParsingError, InvalidPRUrlError
+from .network import NetworkError, APIRateLimitError, TransportError, TransportTimeoutError
+from .parsing import CommentParsingError, InvalidPRUrlError, SnapshotError
 from .persona import PersonaFileError, PersonaLoadError, PersonaValidationError
 from .validation import (
     ValidationError,
@@ -54,10 +54,13 @@ __all__ = [
     # Network exceptions
     "NetworkError",
     "APIRateLimitError",
+    "TransportError",
+    "TransportTimeoutError",
 
     # Parsing exceptions
     "CommentParsingError",
     "InvalidPRUrlError",
+    "SnapshotError",
 
     # Persona exceptions
     "PersonaFileError",
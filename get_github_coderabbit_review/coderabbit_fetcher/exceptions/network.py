@@ -35,3 +35,21 @@ class APIRateLimitError(NetworkError):
             details = f"Rate limit resets at {reset_datetime.isoformat()}"
 
         super().__init__(message, details)
+
+
+class TransportError(NetworkError):
+    """Low-level transport failure.
+
+    Raised when a request could not be delivered to the GitHub API at all
+    (connection refused, TLS failure, missing GitHub CLI, ...), as opposed
+    to the API answering with an error status.
+    """
+    pass
+
+
+class TransportTimeoutError(TransportError):
+    """Transport request timed out.
+
+    Raised when the GitHub API did not answer within the configured timeout.
+    """
+    pass
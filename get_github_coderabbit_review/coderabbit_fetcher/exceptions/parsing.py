@@ -43,3 +43,24 @@ class CommentParsingError(CodeRabbitFetcherError):
             details = f"Failed to parse comment ID: {comment_id}"
 
         super().__init__(message, details)
+
+
+class SnapshotError(CodeRabbitFetcherError):
+    """PR snapshot file issues.
+
+    Raised when a snapshot given with ``--from-snapshot`` cannot be read or
+    does not contain pull request data, or when ``--save-snapshot`` fails.
+    """
+
+    def __init__(self, message: str, path: str | None = None) -> None:
+        """Initialize the snapshot error.
+
+        Args:
+            message: Error message describing the problem
+            path: Optional path of the snapshot file
+        """
+        details = None
+        if path is not None:
+            details = f"Snapshot file: {path}"
+
+        super().__init__(message, details)
@@ -142,32 +142,34 @@ class TimeoutError(RetryableError):
 
 
 class CircuitBreakerError(CodeRabbitFetcherError):
-    """Exception raised when circuit breaker is open."""
+    """Exception raised when circuit breaker is open.
+
+    Requests guarded by an open circuit fail at once instead of waiting for
+    a service that recently failed.
+    """
 
     def __init__(
         self,
         message: str,
         failure_count: int,
         threshold: int,
-        **kwargs
-    ):
-        details = kwargs.pop('details', {})
-        details.update({
-            'failure_count': failure_count,
-            'threshold': threshold,
-            'failure_rate': failure_count / threshold if threshold > 0 else 0
-        })
-
-        suggestions = kwargs.pop('suggestions', [
-            "Wait for circuit breaker to reset",
-            "Check underlying service health",
-            "Review recent error patterns"
-        ])
+        retry_after: Optional[float] = None
+    ) -> None:
+        """Initialize the circuit breaker error.
+
+        Args:
+            message: Error message
+            failure_count: Failed requests in the breaker's window
+            threshold: Requests in the breaker's window
+            retry_after: Seconds until the circuit lets a probe request through
+        """
+        failure_rate = failure_count / threshold if threshold > 0 else 0
+        details = f"{failure_count} of {threshold} recent requests failed ({failure_rate:.0%})"
+        if retry_after is not None:
+            details += f"; circuit half-opens in {retry_after:.0f}s"
 
-        super().__init__(
-            message,
-            details=details,
-            suggestions=suggestions,
-            recoverable=True,
-            **kwargs
-        )
+        super().__init__(message, details)
+        self.failure_count = failure_count
+        self.threshold = threshold
+        self.failure_rate = failure_rate
+        self.retry_after = retry_after
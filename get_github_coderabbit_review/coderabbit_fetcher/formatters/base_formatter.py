@@ -14,6 +14,7 @@ from ..models import (
     NitpickComment,
     OutsideDiffComment
 )
+from ..keywords import COMMENT_KEYWORDS
 
 
 class BaseFormatter(ABC):
@@ -278,27 +279,5 @@ class BaseFormatter(ABC):
         Returns:
             Priority level string (High, Medium, Low)
         """
-        content_lower = comment_content.lower()
-
-        # High priority indicators
-        high_priority_keywords = [
-            'critical', 'security', 'vulnerability', 'error', 'exception',
-            'breaking', 'urgent', 'important', 'must fix', 'required'
-        ]
-
-        # Medium priority indicators
-        medium_priority_keywords = [
-            'should', 'recommend', 'suggest', 'improve', 'optimize',
-            'performance', 'consider', 'enhancement'
-        ]
-
-        # Check for high priority
-        if any(keyword in content_lower for keyword in high_priority_keywords):
-            return "High"
-
-        # Check for medium priority
-        if any(keyword in content_lower for keyword in medium_priority_keywords):
-            return "Medium"
-
-        # Default to low priority
-        return "Low"
+        # High, then medium priority indicators
+        return COMMENT_KEYWORDS.first(comment_content, "priority", "Low")
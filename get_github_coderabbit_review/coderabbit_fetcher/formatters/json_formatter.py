@@ -15,6 +15,7 @@ from ..models import (
     NitpickComment,
     OutsideDiffComment
 )
+from ..keywords import COMMENT_KEYWORDS
 
 
 class JSONFormatter(BaseFormatter):
@@ -403,14 +404,7 @@ class JSONFormatter(BaseFormatter):
         Returns:
             Severity level string
         """
-        content = f"{issue} {description or ''}".lower()
-
-        if any(keyword in content for keyword in ['critical', 'security', 'vulnerability', 'error']):
-            return "high"
-        elif any(keyword in content for keyword in ['warning', 'important', 'should']):
-            return "medium"
-        else:
-            return "low"
+        return COMMENT_KEYWORDS.first(f"{issue} {description or ''}", "severity", "low")
 
     def _extract_comment_content(self, comment) -> str:
         """Extract content from comment object.
@@ -3,4 +3,52 @@
 from .client import GitHubClient
 from .comment_poster import CommentPoster
 
-__all__ = ["GitHubClient", "CommentPoster"]
+# Transports, caches, coordination and webhook helpers are imported on first
+# access, so importing the package does not load every submodule.
+_LAZY_EXPORTS = {
+    "Transport": ".transport",
+    "HTTPTransport": ".transport",
+    "GhCliTransport": ".transport",
+    "GitHubResponse": ".transport",
+    "StreamedResponse": ".transport",
+    "create_transport": ".transport",
+    "AsyncTransport": ".async_transport",
+    "AsyncTransportAdapter": ".async_transport",
+    "AsyncGhCliTransport": ".async_transport",
+    "create_async_transport": ".async_transport",
+    "ResponseCache": ".cache",
+    "CachingTransport": ".cache",
+    "CacheStats": ".cache",
+    "AuthCache": ".auth",
+    "RateLimitScheduler": ".rate_limit",
+    "RateLimitedTransport": ".rate_limit",
+    "AsyncRateLimitedTransport": ".rate_limit",
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitBreakerConfig": ".circuit_breaker",
+    "CircuitBreakerRegistry": ".circuit_breaker",
+    "CircuitBreakerTransport": ".circuit_breaker",
+    "AsyncCircuitBreakerTransport": ".circuit_breaker",
+    "SingleFlight": ".single_flight",
+    "SingleFlightTransport": ".single_flight",
+    "AsyncSingleFlight": ".single_flight",
+    "AsyncSingleFlightTransport": ".single_flight",
+    "FetchCoordinator": ".coordination",
+    "FileLock": ".coordination",
+    "JSONArrayStream": ".json_stream",
+    "iter_array_items": ".json_stream",
+    "WebhookEvent": ".webhooks",
+    "parse_event": ".webhooks",
+    "apply_event": ".webhooks",
+    "verify_signature": ".webhooks",
+}
+
+__all__ = ["GitHubClient", "CommentPoster", *_LAZY_EXPORTS]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
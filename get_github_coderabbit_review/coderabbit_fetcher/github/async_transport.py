@@ -0,0 +1,270 @@
+"""
+Asyncio transports for GitHub API access.
+
+Counterparts of the blocking transports in ``transport`` for callers running
+an event loop:
+
+- ``AsyncGhCliTransport`` runs ``gh api`` through
+  ``asyncio.create_subprocess_exec``; the event loop is never blocked while
+  the CLI is running.
+- ``AsyncTransportAdapter`` drives a blocking transport (normally the pooled
+  ``HTTPTransport``, optionally behind a ``CachingTransport``) from worker
+  threads. At most ``max_concurrency`` requests are handed to threads at a
+  time, matching the size of the connection pool.
+"""
+
+import asyncio
+import json
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from ..exceptions import GitHubAuthenticationError, TransportError, TransportTimeoutError
+from .auth import parse_auth_user
+from .transport import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_TIMEOUT,
+    GhCliTransport,
+    GitHubResponse,
+    Transport,
+    create_transport,
+)
+
+
+class AsyncTransport(ABC):
+    """Abstract asyncio request layer for the GitHub API."""
+
+    #: Backend identifier ("http" or "gh")
+    name: str = ""
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the transport carries its own credentials (see ``Transport``)."""
+        return False
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request to the GitHub API. See ``Transport.request``."""
+
+    async def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a GraphQL query. See ``Transport.graphql``."""
+        return await self.request(
+            "POST", "/graphql",
+            body={"query": query, "variables": variables or {}},
+            timeout=timeout,
+        )
+
+    # Not abstract: transports holding no resources need not override it
+    async def aclose(self) -> None:  # noqa: B027
+        """Release any resources held by the transport."""
+
+
+class AsyncTransportAdapter(AsyncTransport):
+    """Runs a blocking transport's requests in worker threads."""
+
+    def __init__(self, inner: Transport, max_concurrency: Optional[int] = None) -> None:
+        """Initialize the adapter.
+
+        Args:
+            inner: Blocking transport performing the requests
+            max_concurrency: Maximum number of requests in flight (defaults to
+                the inner transport's pool size)
+        """
+        self.inner = inner
+        self.name = inner.name
+        self.max_concurrency = max(
+            1, max_concurrency or getattr(inner, "max_connections", DEFAULT_MAX_CONNECTIONS)
+        )
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the inner transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request through the inner transport without blocking the loop."""
+        async with self._slots:
+            return await asyncio.to_thread(
+                self.inner.request, method, path,
+                params=params, body=body, headers=headers, timeout=timeout,
+            )
+
+    async def aclose(self) -> None:
+        """Close the inner transport's pooled connections."""
+        self.inner.close()
+
+
+class AsyncGhCliTransport(AsyncTransport):
+    """Runs one ``gh api`` subprocess per request without blocking the loop."""
+
+    name = "gh"
+
+    def __init__(self, gh_executable: str = "gh") -> None:
+        """Initialize GitHub CLI transport.
+
+        Args:
+            gh_executable: Name or path of the GitHub CLI executable
+        """
+        self.gh_executable = gh_executable
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request through ``gh api``."""
+        endpoint = GhCliTransport._build_endpoint(path, params)
+        args = ["api", endpoint]
+
+        for name, value in (headers or {}).items():
+            args.extend(["-H", f"{name}: {value}"])
+        if method.upper() != "GET":
+            args.extend(["--method", method.upper()])
+        stdin = None
+        if body is not None:
+            args.extend(["--input", "-"])
+            stdin = json.dumps(body).encode("utf-8")
+
+        returncode, stdout, stderr = await run_gh(
+            self.gh_executable, *args, input_data=stdin, timeout=timeout
+        )
+
+        if returncode == 0:
+            return GitHubResponse(status=200, text=stdout, url=endpoint)
+
+        stderr = stderr.strip()
+        return GitHubResponse(
+            status=GhCliTransport._status_from_stderr(stderr),
+            text=stdout,
+            url=endpoint,
+            error_text=stderr,
+        )
+
+
+async def run_gh(
+    gh_executable: str,
+    *args: str,
+    input_data: Optional[bytes] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Tuple[int, str, str]:
+    """Run the GitHub CLI as an asyncio subprocess.
+
+    Args:
+        gh_executable: Name or path of the GitHub CLI executable
+        *args: CLI arguments
+        input_data: Optional bytes written to stdin
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (return code, stdout, stderr)
+
+    Raises:
+        TransportTimeoutError: If the CLI did not finish in time (it is killed)
+        TransportError: If the CLI could not be started
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            gh_executable, *args,
+            stdin=subprocess.PIPE if input_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise TransportError("GitHub CLI (gh) is not installed or not in PATH") from e
+    except OSError as e:
+        raise TransportError(f"Failed to run GitHub CLI: {e}") from e
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input_data), timeout)
+    except asyncio.TimeoutError as e:
+        process.kill()
+        await process.wait()
+        raise TransportTimeoutError(
+            f"GitHub CLI request timed out after {timeout} seconds",
+            details=" ".join(args[:2])
+        ) from e
+
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+def create_async_transport(
+    backend: str = "http",
+    token: Optional[str] = None,
+    base_url: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> AsyncTransport:
+    """Create an asyncio transport for the given backend.
+
+    Args:
+        backend: "http" for the native pooled transport, "gh" for the CLI fallback
+        token: GitHub token (defaults to ``gh auth token``)
+        base_url: API root URL (defaults to ``$GITHUB_API_URL`` or api.github.com)
+        max_connections: Pool size and concurrency limit for the native transport
+
+    Returns:
+        Configured transport
+
+    Raises:
+        ValueError: If the backend is unknown
+        GitHubAuthenticationError: If no token could be obtained
+    """
+    if backend == "gh":
+        return AsyncGhCliTransport()
+    return AsyncTransportAdapter(
+        create_transport(backend, token=token, base_url=base_url, max_connections=max_connections)
+    )
+
+
+async def check_gh_authentication(gh_executable: str = "gh", timeout: float = 10.0) -> Optional[str]:
+    """Verify the GitHub CLI login (``gh auth status``) without blocking the loop.
+
+    Returns:
+        Authenticated user name, if reported by the CLI
+
+    Raises:
+        GitHubAuthenticationError: If the CLI is missing or not authenticated
+    """
+    try:
+        returncode, stdout, stderr = await run_gh(gh_executable, "auth", "status", timeout=timeout)
+    except TransportTimeoutError:
+        raise GitHubAuthenticationError("GitHub CLI authentication check timed out")
+    except TransportError as e:
+        raise GitHubAuthenticationError(e.message)
+
+    if returncode != 0:
+        error_msg = "GitHub CLI is not authenticated. Please run 'gh auth login'"
+        if stderr.strip():
+            error_msg += f". Error: {stderr.strip()}"
+        raise GitHubAuthenticationError(error_msg)
+
+    return parse_auth_user(f"{stdout}\n{stderr}")
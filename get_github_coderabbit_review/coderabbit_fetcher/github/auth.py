@@ -0,0 +1,177 @@
+"""
+Authentication state shared between invocations.
+
+Verifying a GitHub CLI login means spawning ``gh auth status``, which costs
+100-300 ms per run. ``AuthCache`` stores the outcome of a successful check
+(user and a credential fingerprint, never the token itself) in a small JSON
+file, so later runs within ``ttl`` seconds skip the subprocess.
+
+An entry is only reused while its fingerprint still matches:
+
+- with a known token (``GH_TOKEN``/``GITHUB_TOKEN`` or the ``http``
+  backend's token) the fingerprint is a hash of the token;
+- for the ``gh`` backend it is derived from the GitHub CLI's ``hosts.yml``,
+  which changes on ``gh auth login``/``logout``.
+
+Clients drop the cache as soon as the API answers 401.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_AUTH_TTL = 15 * 60
+
+#: Environment variables holding a token, in the order the GitHub CLI reads them
+TOKEN_ENV_VARS = ("GH_TOKEN", "GITHUB_TOKEN")
+
+_AUTH_USER_PATTERN = re.compile(r"Logged in to \S+ (?:as|account) (\S+)")
+
+
+def env_token() -> Optional[str]:
+    """Get a GitHub token from ``GH_TOKEN`` or ``GITHUB_TOKEN``, if set."""
+    for name in TOKEN_ENV_VARS:
+        token = os.environ.get(name, "").strip()
+        if token:
+            return token
+    return None
+
+
+def token_fingerprint(token: str) -> str:
+    """Get a short, non-reversible fingerprint of a token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def gh_login_fingerprint() -> Optional[str]:
+    """Get a fingerprint of the GitHub CLI's stored login.
+
+    Returns:
+        Fingerprint of ``hosts.yml`` (size and modification time), or None if
+        the file does not exist (e.g. credentials kept elsewhere)
+    """
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    if config_dir:
+        hosts = Path(config_dir).expanduser() / "hosts.yml"
+    else:
+        xdg_config = os.environ.get("XDG_CONFIG_HOME")
+        base = Path(xdg_config).expanduser() if xdg_config else Path.home() / ".config"
+        hosts = base / "gh" / "hosts.yml"
+
+    try:
+        stat = hosts.stat()
+    except OSError:
+        return None
+    return token_fingerprint(f"{hosts}:{stat.st_size}:{stat.st_mtime_ns}")
+
+
+def parse_auth_user(output: str) -> Optional[str]:
+    """Extract the user name from ``gh auth status`` output.
+
+    Args:
+        output: Combined stdout/stderr of ``gh auth status``
+
+    Returns:
+        User name, or None if not found
+    """
+    match = _AUTH_USER_PATTERN.search(output or "")
+    return match.group(1) if match else None
+
+
+@dataclass
+class AuthState:
+    """Verified authentication of one backend."""
+
+    backend: str
+    user: Optional[str]
+    fingerprint: Optional[str]
+    verified_at: float
+
+
+class AuthCache:
+    """File-backed store of verified authentication states, one per backend."""
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_AUTH_TTL) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: JSON file holding the states (its directory must exist)
+            ttl: Seconds a verified state is trusted
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def get(self, backend: str, fingerprint: Optional[str]) -> Optional[AuthState]:
+        """Look up a verified state.
+
+        Args:
+            backend: Transport backend name
+            fingerprint: Fingerprint of the current credentials
+
+        Returns:
+            The state, or None if missing, expired or for other credentials
+        """
+        if fingerprint is None:
+            return None
+
+        state = self._load().get(backend)
+        if state is None or state.fingerprint != fingerprint:
+            return None
+        if time.time() - state.verified_at > self.ttl:
+            return None
+        return state
+
+    def put(self, backend: str, fingerprint: Optional[str], user: Optional[str] = None) -> None:
+        """Record a successful authentication check.
+
+        Args:
+            backend: Transport backend name
+            fingerprint: Fingerprint of the verified credentials (nothing is
+                stored without one)
+            user: Authenticated user name, if known
+        """
+        if fingerprint is None:
+            return
+
+        with self._lock:
+            states = self._load()
+            states[backend] = AuthState(backend, user, fingerprint, time.time())
+            self._write(states)
+
+    def invalidate(self) -> None:
+        """Forget all verified states."""
+        with self._lock:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _load(self) -> Dict[str, AuthState]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return {name: AuthState(**state) for name, state in data.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _write(self, states: Dict[str, AuthState]) -> None:
+        data = json.dumps({name: asdict(state) for name, state in states.items()})
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
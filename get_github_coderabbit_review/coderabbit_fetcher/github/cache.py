@@ -0,0 +1,322 @@
+"""
+On-disk conditional-request cache for GitHub API reads.
+
+Successful GET responses carrying an ``ETag`` or ``Last-Modified`` header are
+stored on disk, keyed by endpoint and query (and therefore by page). Later
+requests for the same key are sent as conditional requests; a ``304 Not
+Modified`` answer is served from the stored body and does not count against
+the primary rate limit.
+
+The cache is bounded by total size with least-recently-used eviction, and
+entries expire after a per-entry TTL.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from .transport import DEFAULT_TIMEOUT, GitHubResponse, StreamedResponse, Transport
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Response headers kept with a cached entry
+_STORED_HEADERS = ("etag", "last-modified", "link", "content-type")
+
+
+@dataclass
+class CacheStats:
+    """Counters of cache activity."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert counters to a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+@dataclass
+class CacheEntry:
+    """Stored response with its validators."""
+
+    key: str
+    status: int
+    headers: Dict[str, str]
+    text: str
+    stored_at: float
+    ttl: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Entity tag of the stored response."""
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Last-Modified value of the stored response."""
+        return self.headers.get("last-modified")
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry outlived its TTL."""
+        return (now if now is not None else time.time()) - self.stored_at > self.ttl
+
+
+class ResponseCache:
+    """Size-bounded LRU store of API responses, one JSON file per entry.
+
+    Recency is tracked with file modification times, so several processes
+    can share the same directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries (created if missing)
+            max_bytes: Size cap of all entries together
+            ttl: Default lifetime of an entry in seconds
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if missing, unreadable or expired
+        """
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if entry.key != key or entry.is_expired():
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, response: GitHubResponse, ttl: Optional[float] = None) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            response: Successful response with validators
+            ttl: Lifetime override in seconds
+        """
+        entry = CacheEntry(
+            key=key,
+            status=response.status,
+            headers={name: response.headers[name] for name in _STORED_HEADERS if name in response.headers},
+            text=response.text,
+            stored_at=time.time(),
+            ttl=self.ttl if ttl is None else ttl,
+        )
+        data = json.dumps(entry.__dict__).encode("utf-8")
+        path = self._path(key)
+
+        with self._lock:
+            size = self._current_size()
+            previous = path.stat().st_size if path.exists() else 0
+
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_name, path)
+            except OSError:
+                self._remove(Path(tmp_name))
+                return
+
+            self.stats.stores += 1
+            self._size = size - previous + len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup as hit or miss.
+
+        Args:
+            hit: Whether the response was served from the cache
+        """
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob("*.json"):
+            self._remove(path)
+        with self._lock:
+            self._size = 0
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under the size cap."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            self.stats.evictions += 1
+
+        self._size = total
+
+    def _current_size(self) -> int:
+        """Total size of all entries (scanned once, then tracked)."""
+        if self._size is None:
+            self._size = sum(
+                path.stat().st_size for path in self.directory.glob("*.json") if path.exists()
+            )
+        return self._size
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class CachingTransport(Transport):
+    """Transport wrapper sending conditional GET requests backed by a ``ResponseCache``.
+
+    Only GET requests are cached. Transports that do not expose response
+    headers (the GitHub CLI backend) never receive validators, so their
+    responses are not stored.
+    """
+
+    def __init__(self, inner: Transport, cache: ResponseCache, refresh: bool = False) -> None:
+        """Initialize the caching transport.
+
+        Args:
+            inner: Transport performing the actual requests
+            cache: Response store
+            refresh: Ignore stored entries (but store fresh responses)
+        """
+        self.inner = inner
+        self.cache = cache
+        self.refresh = refresh
+        self.name = inner.name
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    @property
+    def stats(self) -> CacheStats:
+        """Cache counters."""
+        return self.cache.stats
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request, revalidating cached GET responses."""
+        if method.upper() != "GET" or body is not None:
+            return self.inner.request(method, path, params, body, headers, timeout)
+
+        key = self._key(path, params)
+        entry = None if self.refresh else self.cache.get(key)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+
+        response = self.inner.request(method, path, params, body, request_headers, timeout)
+
+        if entry is not None and response.not_modified:
+            self.cache.record(hit=True)
+            merged_headers = dict(response.headers)
+            merged_headers.update(entry.headers)
+            return GitHubResponse(
+                status=entry.status, headers=merged_headers, text=entry.text, url=response.url
+            )
+
+        self.cache.record(hit=False)
+        if response.ok and ("etag" in response.headers or "last-modified" in response.headers):
+            self.cache.put(key, response)
+        return response
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Streamed responses bypass the cache (storing them would buffer the body)."""
+        return self.inner.stream(method, path, params, headers, timeout, paginate)
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                timeout: float = DEFAULT_TIMEOUT) -> GitHubResponse:
+        """GraphQL queries are POST requests and bypass the cache."""
+        return self.inner.graphql(query, variables, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
+
+    def _key(self, path: str, params: Optional[Dict[str, Any]]) -> str:
+        origin = getattr(self.inner, "base_url", self.inner.name)
+        query = f"?{urlencode(sorted(params.items()))}" if params else ""
+        return f"GET {origin} {path}{query}"
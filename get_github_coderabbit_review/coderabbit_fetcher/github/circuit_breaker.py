@@ -0,0 +1,389 @@
+"""
+Circuit breakers for GitHub API access.
+
+During a GitHub incident every request of a batch run fails only after its
+timeout and the client's exponential backoff. A ``CircuitBreaker`` watches
+the outcome of recent requests and, once too many of them failed, rejects
+further requests at once with ``CircuitBreakerError`` instead of letting
+them run into the outage:
+
+- **closed**: requests pass; outcomes are recorded in a rolling window of
+  ``window`` seconds. When at least ``minimum_requests`` were recorded and
+  the share of failures reaches ``failure_rate``, the circuit opens.
+- **open**: requests fail fast for ``open_seconds``.
+- **half-open**: up to ``probe_requests`` requests are let through as probes.
+  If they all succeed the circuit closes; any failure opens it again.
+
+Only a failure of the service counts: transport errors (connection failures
+and timeouts) and 5xx answers. Client errors and rate limiting (handled by
+``RateLimitScheduler``) are successful exchanges as far as the breaker is
+concerned.
+
+``CircuitBreakerRegistry`` keeps one breaker per host and endpoint class, so
+an outage of e.g. the GraphQL API does not block REST requests.
+``CircuitBreakerTransport`` and ``AsyncCircuitBreakerTransport`` put the
+breakers in front of every request of a client.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from ..exceptions import CircuitBreakerError, TransportError
+from .async_transport import AsyncTransport
+from .transport import DEFAULT_API_URL, DEFAULT_TIMEOUT, GitHubResponse, StreamedResponse, Transport
+
+DEFAULT_WINDOW = 60.0
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MINIMUM_REQUESTS = 5
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_PROBE_REQUESTS = 1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_WRITE_METHODS = ("POST", "PATCH", "PUT", "DELETE")
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds shared by the breakers of a registry."""
+
+    window: float = DEFAULT_WINDOW
+    failure_rate: float = DEFAULT_FAILURE_RATE
+    minimum_requests: int = DEFAULT_MINIMUM_REQUESTS
+    open_seconds: float = DEFAULT_OPEN_SECONDS
+    probe_requests: int = DEFAULT_PROBE_REQUESTS
+
+
+def is_failure(response: Optional[GitHubResponse]) -> bool:
+    """Whether a request outcome counts as a service failure.
+
+    Args:
+        response: Response of the request, or None if it raised a transport error
+    """
+    return response is None or response.status >= 500
+
+
+def endpoint_class(method: str, path: str) -> str:
+    """Get the breaker class of a request: "graphql", "search", "write" or "read"."""
+    parsed_path = urlparse(path).path
+    if parsed_path == "/graphql":
+        return "graphql"
+    if parsed_path.startswith("/search/"):
+        return "search"
+    return "write" if method.upper() in _WRITE_METHODS else "read"
+
+
+def transport_host(transport: Any) -> str:
+    """Get the API host a transport talks to.
+
+    Wrapping transports are followed through their ``inner`` attribute; the
+    GitHub CLI talks to api.github.com.
+    """
+    while isinstance(transport, (Transport, AsyncTransport)):
+        base_url = getattr(transport, "base_url", None)
+        if isinstance(base_url, str) and base_url:
+            return urlparse(base_url).hostname or base_url
+        transport = getattr(transport, "inner", None)
+    return urlparse(DEFAULT_API_URL).hostname
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit of one host and endpoint class."""
+
+    def __init__(self, name: str, config: Optional[CircuitBreakerConfig] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the breaker in the closed state.
+
+        Args:
+            name: Circuit name reported in errors and statistics
+            config: Thresholds (defaults if omitted)
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        # (timestamp, failed) of the requests in the current window
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.times_opened = 0
+        self.rejected_requests = 0
+
+    @property
+    def state(self) -> str:
+        """Current state ("closed", "open" or "half_open")."""
+        with self._lock:
+            return self._current_state()
+
+    def before_request(self) -> bool:
+        """Admit a request or reject it.
+
+        Returns:
+            Whether the request is a half-open probe (pass it to ``record``)
+
+        Raises:
+            CircuitBreakerError: If the circuit is open, or half-open with all
+                probes already in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return False
+            if state == HALF_OPEN and self._probes_in_flight < self.config.probe_requests:
+                self._probes_in_flight += 1
+                return True
+
+            self.rejected_requests += 1
+            failures, requests = self._window_counts()
+            retry_after = max(0.0, self._opened_at + self.config.open_seconds - self._clock())
+            raise CircuitBreakerError(
+                f"GitHub API circuit '{self.name}' is open; failing fast",
+                failure_count=failures,
+                threshold=requests,
+                retry_after=retry_after,
+            )
+
+    def record(self, failed: bool, probe: bool = False) -> None:
+        """Record the outcome of an admitted request.
+
+        Args:
+            failed: Whether the request failed (see ``is_failure``)
+            probe: Value returned by ``before_request`` for the request
+        """
+        with self._lock:
+            now = self._clock()
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if self._current_state() != HALF_OPEN:
+                    return
+                if failed:
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.config.probe_requests:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+
+            if self._current_state() != CLOSED:
+                # Late outcome of a request admitted before the circuit opened
+                return
+            self._outcomes.append((now, failed))
+            self._expire(now)
+            failures, requests = self._window_counts()
+            if (requests >= self.config.minimum_requests
+                    and failures / requests >= self.config.failure_rate):
+                self._open(now)
+
+    def cancel(self, probe: bool) -> None:
+        """Release an admitted request that ended without an outcome (e.g. an interrupt).
+
+        Args:
+            probe: Value returned by ``before_request`` for the request
+        """
+        with self._lock:
+            if probe:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the state and counters of the circuit."""
+        with self._lock:
+            self._expire(self._clock())
+            failures, requests = self._window_counts()
+            return {
+                "state": self._current_state(),
+                "window_requests": requests,
+                "window_failures": failures,
+                "times_opened": self.times_opened,
+                "rejected_requests": self.rejected_requests,
+            }
+
+    def _current_state(self) -> str:
+        """Advance from open to half-open once the open period ended (caller holds the lock)."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.config.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        return self._state
+
+    def _open(self, now: float) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self.times_opened += 1
+
+    def _expire(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.config.window:
+            self._outcomes.popleft()
+
+    def _window_counts(self) -> Tuple[int, int]:
+        failures = sum(1 for _, failed in self._outcomes if failed)
+        return failures, len(self._outcomes)
+
+
+class CircuitBreakerRegistry:
+    """One ``CircuitBreaker`` per host and endpoint class, created on demand."""
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the registry.
+
+        Args:
+            config: Thresholds of all breakers
+            clock: Monotonic time source
+        """
+        self.config = config or CircuitBreakerConfig()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str, method: str, path: str) -> CircuitBreaker:
+        """Get the breaker guarding a request.
+
+        Args:
+            host: API host
+            method: HTTP method
+            path: API path or absolute URL
+
+        Returns:
+            Breaker of the request's host and endpoint class
+        """
+        name = f"{host}/{endpoint_class(method, path)}"
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name, self.config, self._clock)
+            return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state and counters of every circuit used so far."""
+        with self._lock:
+            breakers = sorted(self._breakers.items())
+        return {name: breaker.stats() for name, breaker in breakers}
+
+
+class CircuitBreakerTransport(Transport):
+    """Transport wrapper guarding every request with a circuit breaker."""
+
+    def __init__(self, inner: Transport, breakers: CircuitBreakerRegistry) -> None:
+        """Initialize the guarded transport.
+
+        Args:
+            inner: Transport performing the actual requests
+            breakers: Registry shared by all requests of the client
+        """
+        self.inner = inner
+        self.breakers = breakers
+        self.name = inner.name
+        self.host = transport_host(inner)
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request unless its circuit is open."""
+        breaker = self.breakers.get(self.host, method, path)
+        probe = breaker.before_request()
+        try:
+            response = self.inner.request(method, path, params, body, headers, timeout)
+        except TransportError:
+            breaker.record(failed=True, probe=probe)
+            raise
+        except BaseException:
+            breaker.cancel(probe)
+            raise
+        breaker.record(is_failure(response), probe)
+        return response
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Start a streamed request unless its circuit is open."""
+        breaker = self.breakers.get(self.host, method, path)
+        probe = breaker.before_request()
+        try:
+            response = self.inner.stream(method, path, params, headers, timeout, paginate)
+        except TransportError:
+            breaker.record(failed=True, probe=probe)
+            raise
+        except BaseException:
+            breaker.cancel(probe)
+            raise
+        breaker.record(response.status >= 500, probe)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
+
+
+class AsyncCircuitBreakerTransport(AsyncTransport):
+    """Asyncio counterpart of ``CircuitBreakerTransport``."""
+
+    def __init__(self, inner: AsyncTransport, breakers: CircuitBreakerRegistry) -> None:
+        """Initialize the guarded transport.
+
+        Args:
+            inner: Asyncio transport performing the actual requests
+            breakers: Registry shared by all requests of the client
+        """
+        self.inner = inner
+        self.breakers = breakers
+        self.name = inner.name
+        self.host = transport_host(inner)
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request unless its circuit is open."""
+        breaker = self.breakers.get(self.host, method, path)
+        probe = breaker.before_request()
+        try:
+            response = await self.inner.request(method, path, params, body, headers, timeout)
+        except TransportError:
+            breaker.record(failed=True, probe=probe)
+            raise
+        except BaseException:
+            breaker.cancel(probe)
+            raise
+        breaker.record(is_failure(response), probe)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.inner.aclose()
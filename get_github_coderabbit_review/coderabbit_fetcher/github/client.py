@@ -10,7 +10,7 @@ import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 from rich.console import Console
@@ -20,7 +20,10 @@ from ..exceptions import (
     InvalidPRUrlError,
     APIRateLimitError,
     CodeRabbitFetcherError,
+    TransportError,
 )
+from .pagination import collect_pages
+from .transport import GitHubResponse, Transport
 
 console = Console()
 
@@ -29,14 +32,16 @@ class GitHubClient:
     """GitHub CLI wrapper for authenticated API access.
 
     Provides methods for fetching pull request data, posting comments,
-    and managing authentication through the GitHub CLI.
+    and managing authentication through the GitHub CLI. When a transport is
+    given, API calls go through it instead of ``gh`` subprocesses.
     """
 
     def __init__(
         self, 
         max_retries: int = 3, 
         retry_delay: float = 1.0,
-        check_gh_cli: bool = True
+        check_gh_cli: bool = True,
+        transport: Optional[Transport] = None
     ) -> None:
         """Initialize GitHub client.
 
@@ -44,11 +49,13 @@ class GitHubClient:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Base delay between retries in seconds
             check_gh_cli: Whether to check GitHub CLI availability on initialization
+            transport: Optional transport used instead of ``gh`` subprocesses
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.transport = transport
         
-        if check_gh_cli:
+        if check_gh_cli and transport is None:
             self._check_gh_cli_availability()
 
     def _check_gh_cli_availability(self) -> None:
@@ -224,6 +231,101 @@ class GitHubClient:
 
         raise CodeRabbitFetcherError("All retry attempts failed")
 
+    def _execute_request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Any] = None,
+        timeout: int = 30,
+        paginate: bool = False
+    ) -> Any:
+        """Execute an API request through the transport with retry logic.
+
+        Args:
+            method: HTTP method
+            path: API path
+            body: Optional JSON request body
+            timeout: Request timeout in seconds
+            paginate: Fetch all pages of a list endpoint (concurrently when
+                the ``Link`` header names the last page)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIRateLimitError: If rate limit is exceeded
+            GitHubAuthenticationError: If the token was rejected
+            CodeRabbitFetcherError: For other request failures
+        """
+        params: Optional[Dict[str, Any]] = {"per_page": 100} if paginate else None
+        response = self._send_with_retry(method, path, params, body, timeout)
+
+        if not paginate:
+            return self._decode_response(response)
+
+        return collect_pages(
+            response,
+            lambda url: self._send_with_retry("GET", url, None, None, timeout),
+            self._decode_response
+        )
+
+    def _send_with_retry(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        body: Optional[Any],
+        timeout: int
+    ) -> GitHubResponse:
+        """Send a request, retrying transport failures and server errors."""
+        response = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.transport.request(
+                    method, path, params=params, body=body, timeout=timeout
+                )
+            except TransportError as e:
+                if attempt < self.max_retries:
+                    wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    console.print(f"⏳ [yellow]Request failed, retrying in {wait_time}s... (attempt {attempt + 1}/{self.max_retries})[/yellow]")
+                    time.sleep(wait_time)
+                    continue
+                raise CodeRabbitFetcherError(f"GitHub API request failed: {e}")
+
+            if response.ok or response.status < 500:
+                break
+            if attempt < self.max_retries:
+                wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                console.print(f"⏳ [yellow]Server error {response.status}, retrying in {wait_time}s... (attempt {attempt + 1}/{self.max_retries})[/yellow]")
+                time.sleep(wait_time)
+
+        return response
+
+    def _decode_response(self, response: GitHubResponse) -> Any:
+        """Raise for unsuccessful responses and decode the JSON body."""
+        if response.is_rate_limited:
+            raise APIRateLimitError(reset_time=response.rate_limit_reset)
+        if response.status == 401:
+            raise GitHubAuthenticationError("GitHub API authentication required or expired")
+        if response.status == 404:
+            raise CodeRabbitFetcherError(
+                "Pull request not found or access denied",
+                details=response.error_message
+            )
+        if not response.ok:
+            raise CodeRabbitFetcherError(
+                f"GitHub API request failed: {response.error_message}",
+                details=f"Status: {response.status}"
+            )
+
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            raise CodeRabbitFetcherError(
+                f"Invalid JSON response from GitHub API: {e}",
+                details=f"Output: {response.text[:500]}"
+            )
+
     def _extract_rate_limit_reset(self, stderr: str) -> int | None:
         """Extract rate limit reset time from error message.
 
@@ -272,6 +374,9 @@ class GitHubClient:
 
         console.print(f"📥 [blue]Fetching PR data for {owner}/{repo}#{pr_number}[/blue]")
 
+        if self.transport is not None:
+            return self._fetch_pr_comments_via_transport(owner, repo, pr_number)
+
         # Fetch PR data with comments and reviews
         pr_data = self._execute_gh_command([
             "pr", "view", str(pr_number),
@@ -281,13 +386,22 @@ class GitHubClient:
 
         # Fetch additional comment details (reviews contain inline comments)
         try:
-            review_comments = self._execute_gh_command([
-                "api", f"repos/{owner}/{repo}/pulls/{pr_number}/comments?per_page=100"
-            ])
+            review_comments = []
+            page = 1
+            while True:
+                page_comments = self._execute_gh_command([
+                    "api", f"repos/{owner}/{repo}/pulls/{pr_number}/comments?per_page=100&page={page}"
+                ])
+                if not isinstance(page_comments, list):
+                    break
+                review_comments.extend(page_comments)
+                # A short page is the last one
+                if len(page_comments) < 100:
+                    break
+                page += 1
 
             # Merge review comments into the main data structure
-            if isinstance(review_comments, list):
-                pr_data["reviewComments"] = review_comments
+            pr_data["reviewComments"] = review_comments
 
         except Exception as e:
             console.print(f"⚠️ [yellow]Could not fetch review comments: {e}[/yellow]")
@@ -297,6 +411,43 @@ class GitHubClient:
 
         return pr_data
 
+    def _fetch_pr_comments_via_transport(self, owner: str, repo: str, pr_number: int) -> Dict[str, Any]:
+        """Fetch pull request data through the transport (REST API).
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            Pull request data in the same layout as the GitHub CLI path
+        """
+        base_path = f"/repos/{owner}/{repo}"
+        pull = self._execute_request("GET", f"{base_path}/pulls/{pr_number}")
+
+        pr_data = {
+            "number": pull.get("number"),
+            "title": pull.get("title", ""),
+            "body": pull.get("body") or "",
+            "state": (pull.get("state") or "").upper(),
+            "author": {"login": (pull.get("user") or {}).get("login", "")},
+            "createdAt": pull.get("created_at"),
+            "updatedAt": pull.get("updated_at"),
+            "comments": self._execute_request(
+                "GET", f"{base_path}/issues/{pr_number}/comments", paginate=True
+            ),
+            "reviews": self._execute_request(
+                "GET", f"{base_path}/pulls/{pr_number}/reviews", paginate=True
+            ),
+            "reviewComments": self._execute_request(
+                "GET", f"{base_path}/pulls/{pr_number}/comments", paginate=True
+            ),
+        }
+
+        console.print(f"✅ [green]Fetched {len(pr_data['comments'])} comments and {len(pr_data['reviewComments'])} review comments[/green]")
+
+        return pr_data
+
     def post_comment(self, pr_url: str, comment: str) -> bool:
         """Post a comment to a pull request.
 
@@ -318,6 +469,14 @@ class GitHubClient:
 
         try:
             # PRはIssueとしてコメントAPIが利用可能
+            if self.transport is not None:
+                self._execute_request(
+                    "POST", f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
+                    body={"body": comment}
+                )
+                console.print("✅ [green]Comment posted successfully[/green]")
+                return True
+
             self._execute_gh_command([
                 "api", f"repos/{owner}/{repo}/issues/{pr_number}/comments",
                 "--method", "POST",
@@ -0,0 +1,352 @@
+"""
+Cross-process coordination of identical pull request fetches.
+
+Several ``coderabbit-fetch`` processes are often started at the same moment
+against the same pull request. ``FetchCoordinator`` lets only one of them
+(the leader) talk to GitHub: the leader holds a lock file in the cache
+directory while it fetches, then writes the result as a snapshot. The other
+processes poll for up to ``wait`` seconds and return that snapshot instead
+of fetching.
+
+Lock files are created with ``O_CREAT | O_EXCL`` and record the owner's
+host, PID and creation time. A lock is stale, and is broken by the next
+process that finds it, when its owner has exited (same host only) or when it
+is older than ``stale_after`` seconds. A waiter whose leader failed (lock
+released without a snapshot) becomes the leader itself; a waiter that runs
+out of time fetches on its own.
+
+By default a snapshot is only served to processes that started before it was
+written, i.e. while its fetch was still in progress; a run started afterwards
+fetches fresh data. A positive ``snapshot_ttl`` opts in to reusing finished
+snapshots for that many seconds. Keys are opaque strings and should
+include a credential fingerprint, so callers with different tokens never
+share a result.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WAIT_SECONDS = 30.0
+DEFAULT_SNAPSHOT_TTL = 0.0
+DEFAULT_STALE_LOCK_SECONDS = 600.0
+DEFAULT_POLL_INTERVAL = 0.1
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process of this host is still running."""
+    if os.name != "posix":
+        # os.kill(pid, 0) terminates the process on Windows; rely on stale_after
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists, but belongs to another user
+        return True
+    return True
+
+
+class FileLock:
+    """Non-blocking exclusive lock held by the existence of a lock file."""
+
+    def __init__(self, path: Path, stale_after: float = DEFAULT_STALE_LOCK_SECONDS) -> None:
+        """Initialize the lock.
+
+        Args:
+            path: Lock file (its directory must exist)
+            stale_after: Age in seconds after which a lock is broken even if
+                its owner may still be running
+        """
+        self.path = Path(path)
+        self.stale_after = stale_after
+        self._token: Optional[str] = None
+
+    @property
+    def held(self) -> bool:
+        """Whether this instance holds the lock."""
+        return self._token is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock if it is free or stale.
+
+        Returns:
+            True if the lock is now held by this instance
+        """
+        if self._token is not None:
+            return True
+        for _ in range(2):
+            if self._create():
+                return True
+            if not self._break_if_stale():
+                return False
+        return False
+
+    def release(self) -> None:
+        """Release the lock (only removes the file if this instance still owns it)."""
+        if self._token is None:
+            return
+        owner = self._read_owner(self.path)
+        if owner is not None and owner.get("token") == self._token:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+        self._token = None
+
+    def _create(self) -> bool:
+        token = uuid.uuid4().hex
+        try:
+            fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        owner = {
+            "token": token,
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "created_at": time.time(),
+        }
+        with os.fdopen(fd, "w", encoding="utf-8") as lock_file:
+            json.dump(owner, lock_file)
+        self._token = token
+        return True
+
+    def _break_if_stale(self) -> bool:
+        """Remove the current lock file if it is stale.
+
+        The file is first renamed to a unique name, so that two processes
+        breaking the same stale lock cannot remove a fresh one.
+
+        Returns:
+            True if a stale lock was removed (or the lock vanished meanwhile)
+        """
+        owner = self._read_owner(self.path)
+        if owner is None:
+            if not self.path.exists():
+                return True
+            # Unreadable (e.g. still being written): judge by its age only
+            try:
+                age = time.time() - self.path.stat().st_mtime
+            except OSError:
+                return True
+            if age <= self.stale_after:
+                return False
+        elif not self._is_stale(owner):
+            return False
+
+        moved = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.stale")
+        try:
+            os.rename(self.path, moved)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+
+        moved_owner = self._read_owner(moved)
+        if owner is not None and (moved_owner or {}).get("token") != owner.get("token"):
+            # Another process took the lock between our check and the rename: give it back
+            try:
+                os.link(moved, self.path)
+            except OSError:
+                pass
+            self._remove(moved)
+            return False
+
+        logger.debug(f"Broke stale fetch lock {self.path} (owner: {owner})")
+        self._remove(moved)
+        return True
+
+    def _is_stale(self, owner: Dict[str, Any]) -> bool:
+        try:
+            age = time.time() - float(owner.get("created_at", 0))
+        except (TypeError, ValueError):
+            return True
+        if age > self.stale_after:
+            return True
+        if owner.get("host") == socket.gethostname() and isinstance(owner.get("pid"), int):
+            return not _pid_alive(owner["pid"])
+        return False
+
+    @staticmethod
+    def _read_owner(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            owner = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return owner if isinstance(owner, dict) else None
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class FetchCoordinator:
+    """Shares one fetch per key among processes using the same directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        wait: float = DEFAULT_WAIT_SECONDS,
+        snapshot_ttl: float = DEFAULT_SNAPSHOT_TTL,
+        stale_after: float = DEFAULT_STALE_LOCK_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            directory: Directory holding lock files and snapshots (created if missing)
+            wait: Seconds a process waits for another one's fetch before
+                fetching itself (0 never waits)
+            snapshot_ttl: Seconds a written snapshot is still served to processes
+                started after it was written (0 shares only in-progress fetches)
+            stale_after: Age in seconds after which a lock is considered stale
+            poll_interval: Seconds between checks while waiting
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.wait = wait
+        self.snapshot_ttl = snapshot_ttl
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self._stats_lock = threading.Lock()
+        self._stats = {"fetched": 0, "shared": 0, "timed_out": 0}
+
+    def fetch(self, key: str, fn: Callable[[], Any], refresh: bool = False) -> Any:
+        """Return a snapshot written for ``key``, or run ``fn`` under the lock and share its result.
+
+        Args:
+            key: Identity of the fetch
+            fn: Performs the fetch; its result must be JSON serializable
+            refresh: Ignore snapshots written before this call
+
+        Returns:
+            Result of ``fn`` (of this or of another process)
+        """
+        started = time.time()
+        lock = self._lock(key)
+        while True:
+            snapshot = self._load(key, started if refresh else started - self.snapshot_ttl)
+            if snapshot is not None:
+                return self._shared(key, snapshot)
+            if lock.try_acquire():
+                try:
+                    # A peer may have finished between the check and the lock
+                    snapshot = self._load(key, started if refresh else started - self.snapshot_ttl)
+                    if snapshot is not None:
+                        return self._shared(key, snapshot)
+                    result = fn()
+                    self._store(key, result)
+                    return result
+                finally:
+                    lock.release()
+            if time.time() - started >= self.wait:
+                self._count("timed_out")
+                logger.debug(f"Gave up waiting for a concurrent fetch of {key}")
+                return fn()
+            time.sleep(self.poll_interval)
+
+    async def fetch_async(self, key: str, fn: Callable[[], Awaitable[Any]],
+                          refresh: bool = False) -> Any:
+        """Asyncio counterpart of ``fetch``."""
+        started = time.time()
+        lock = self._lock(key)
+        while True:
+            snapshot = self._load(key, started if refresh else started - self.snapshot_ttl)
+            if snapshot is not None:
+                return self._shared(key, snapshot)
+            if lock.try_acquire():
+                try:
+                    snapshot = self._load(key, started if refresh else started - self.snapshot_ttl)
+                    if snapshot is not None:
+                        return self._shared(key, snapshot)
+                    result = await fn()
+                    self._store(key, result)
+                    return result
+                finally:
+                    lock.release()
+            if time.time() - started >= self.wait:
+                self._count("timed_out")
+                logger.debug(f"Gave up waiting for a concurrent fetch of {key}")
+                return await fn()
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of fetches performed, served from a peer's snapshot, and given up on."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _shared(self, key: str, snapshot: Dict[str, Any]) -> Any:
+        self._count("shared")
+        logger.debug(f"Using snapshot of {key} written by another process")
+        return snapshot["data"]
+
+    def _load(self, key: str, not_before: float) -> Optional[Dict[str, Any]]:
+        """Read the snapshot of a key if it was written at or after ``not_before``."""
+        path = self._path(key, ".json")
+        try:
+            if path.stat().st_mtime < not_before - 1:
+                # Cheap pre-check; the stored timestamp below is authoritative
+                return None
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+            return None
+        if not isinstance(snapshot.get("written_at"), (int, float)) or snapshot["written_at"] < not_before:
+            return None
+        return snapshot
+
+    def _store(self, key: str, data: Any) -> None:
+        """Atomically write the snapshot of a key (failures only lose the sharing)."""
+        self._count("fetched")
+        path = self._path(key, ".json")
+        try:
+            payload = json.dumps({"key": key, "written_at": time.time(), "data": data}, ensure_ascii=False)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write fetch snapshot: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.debug(f"Could not write fetch snapshot: {e}")
+            FileLock._remove(Path(tmp_name))
+        self._prune()
+
+    def _prune(self) -> None:
+        """Remove snapshots that can no longer be served."""
+        cutoff = time.time() - self.snapshot_ttl - 60
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def _lock(self, key: str) -> FileLock:
+        return FileLock(self._path(key, ".lock"), stale_after=self.stale_after)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}{suffix}"
@@ -0,0 +1,358 @@
+"""
+GraphQL fetch of a pull request with all of its review data.
+
+A single query returns the pull request, its issue comments, reviews and
+review threads (with their comments). Connections that do not fit into one
+page are followed through their cursors; only the connections that still
+have pages left are requested again, so large pull requests need a handful
+of round trips instead of one per page and endpoint.
+
+The result is mapped to the REST-shaped dictionary consumed by
+``CommentAnalyzer.analyze_comments``.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, Tuple, Union
+
+# Page size for every connection (GitHub maximum)
+PAGE_SIZE = 100
+
+# Maximum number of review threads whose comments are paged in one query
+THREAD_BATCH_SIZE = 20
+
+# Executes a GraphQL query and returns its ``data`` member
+GraphQLExecutor = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+AsyncGraphQLExecutor = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Yields (query, variables), receives the query's data, returns the mapped PR
+QueryPlan = Generator[Tuple[str, Dict[str, Any]], Optional[Dict[str, Any]], Any]
+
+_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+
+_AUTHOR = "author { login __typename }"
+
+_ISSUE_COMMENT_FIELDS = f"""
+    databaseId id body createdAt updatedAt url
+    {_AUTHOR}
+"""
+
+_REVIEW_FIELDS = f"""
+    databaseId id body state submittedAt createdAt updatedAt url
+    {_AUTHOR}
+"""
+
+_REVIEW_COMMENT_FIELDS = f"""
+    databaseId id body createdAt updatedAt url path line originalLine diffHunk
+    replyTo {{ databaseId }}
+    pullRequestReview {{ databaseId }}
+    {_AUTHOR}
+"""
+
+_THREAD_FIELDS = f"""
+    id isResolved path line originalLine startLine diffSide
+    comments(first: {PAGE_SIZE}) {{
+        {_PAGE_INFO}
+        nodes {{ {_REVIEW_COMMENT_FIELDS} }}
+    }}
+"""
+
+PULL_REQUEST_QUERY = f"""
+query PullRequestReviewData(
+    $owner: String!, $repo: String!, $number: Int!,
+    $withPullRequest: Boolean!,
+    $withComments: Boolean!, $commentsCursor: String,
+    $withReviews: Boolean!, $reviewsCursor: String,
+    $withThreads: Boolean!, $threadsCursor: String
+) {{
+    repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $number) {{
+            number
+            title @include(if: $withPullRequest)
+            body @include(if: $withPullRequest)
+            state @include(if: $withPullRequest)
+            url @include(if: $withPullRequest)
+            createdAt @include(if: $withPullRequest)
+            updatedAt @include(if: $withPullRequest)
+            author @include(if: $withPullRequest) {{ login __typename }}
+            comments(first: {PAGE_SIZE}, after: $commentsCursor) @include(if: $withComments) {{
+                {_PAGE_INFO}
+                nodes {{ {_ISSUE_COMMENT_FIELDS} }}
+            }}
+            reviews(first: {PAGE_SIZE}, after: $reviewsCursor) @include(if: $withReviews) {{
+                {_PAGE_INFO}
+                nodes {{ {_REVIEW_FIELDS} }}
+            }}
+            reviewThreads(first: {PAGE_SIZE}, after: $threadsCursor) @include(if: $withThreads) {{
+                {_PAGE_INFO}
+                nodes {{ {_THREAD_FIELDS} }}
+            }}
+        }}
+    }}
+}}
+"""
+
+
+def build_thread_comments_query(count: int) -> str:
+    """Build a query paging the comments of ``count`` review threads at once.
+
+    Args:
+        count: Number of threads in the batch
+
+    Returns:
+        GraphQL query using variables ``$id0..`` and ``$cursor0..``
+    """
+    variables = ", ".join(f"$id{i}: ID!, $cursor{i}: String" for i in range(count))
+    selections = "\n".join(
+        f"""
+        thread{i}: node(id: $id{i}) {{
+            ... on PullRequestReviewThread {{
+                comments(first: {PAGE_SIZE}, after: $cursor{i}) {{
+                    {_PAGE_INFO}
+                    nodes {{ {_REVIEW_COMMENT_FIELDS} }}
+                }}
+            }}
+        }}"""
+        for i in range(count)
+    )
+    return f"query ReviewThreadComments({variables}) {{{selections}\n}}"
+
+
+class GraphQLPullRequestFetcher:
+    """Fetch a pull request and its review data through GraphQL.
+
+    The paging logic is written as a generator of queries so that it can be
+    driven by a blocking executor (``fetch``) or a coroutine (``fetch_async``).
+    """
+
+    def __init__(self, execute: Union[GraphQLExecutor, AsyncGraphQLExecutor]) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            execute: Callable running a query and returning its ``data`` member
+                (a coroutine function when used with ``fetch_async``).
+                It is responsible for raising on HTTP and GraphQL errors.
+        """
+        self.execute = execute
+        self.round_trips = 0
+
+    def fetch(self, owner: str, repo: str, number: int) -> Dict[str, Any]:
+        """Fetch the pull request and map it to the REST-shaped layout.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            number: Pull request number
+
+        Returns:
+            Pull request data as consumed by ``CommentAnalyzer``
+
+        Raises:
+            LookupError: If the pull request does not exist
+        """
+        self.round_trips = 0
+        steps = self._queries(owner, repo, number)
+        data = None
+        try:
+            while True:
+                query, variables = steps.send(data)
+                self.round_trips += 1
+                data = self.execute(query, variables)
+        except StopIteration as done:
+            return done.value
+
+    async def fetch_async(self, owner: str, repo: str, number: int) -> Dict[str, Any]:
+        """Asynchronous variant of ``fetch`` awaiting an async executor."""
+        self.round_trips = 0
+        steps = self._queries(owner, repo, number)
+        data = None
+        try:
+            while True:
+                query, variables = steps.send(data)
+                self.round_trips += 1
+                data = await self.execute(query, variables)
+        except StopIteration as done:
+            return done.value
+
+    def _queries(self, owner: str, repo: str, number: int) -> QueryPlan:
+        """Yield the queries needed for a pull request; receives their data."""
+        pull_request: Dict[str, Any] = {}
+        collected: Dict[str, List[Dict[str, Any]]] = {
+            "comments": [], "reviews": [], "reviewThreads": []
+        }
+        cursors: Dict[str, Optional[str]] = {name: None for name in collected}
+        pending = set(collected)
+        first = True
+
+        while pending:
+            variables = {
+                "owner": owner,
+                "repo": repo,
+                "number": int(number),
+                "withPullRequest": first,
+                "withComments": "comments" in pending,
+                "commentsCursor": cursors["comments"],
+                "withReviews": "reviews" in pending,
+                "reviewsCursor": cursors["reviews"],
+                "withThreads": "reviewThreads" in pending,
+                "threadsCursor": cursors["reviewThreads"],
+            }
+            data = yield PULL_REQUEST_QUERY, variables
+            node = ((data or {}).get("repository") or {}).get("pullRequest")
+            if node is None:
+                raise LookupError(f"Pull request not found: {owner}/{repo}#{number}")
+
+            if first:
+                pull_request = node
+                first = False
+
+            for name in list(pending):
+                connection = node.get(name) or {}
+                collected[name].extend(connection.get("nodes") or [])
+                page_info = connection.get("pageInfo") or {}
+                if page_info.get("hasNextPage"):
+                    cursors[name] = page_info.get("endCursor")
+                else:
+                    pending.discard(name)
+
+        yield from self._thread_comment_queries(collected["reviewThreads"])
+
+        return map_pull_request(pull_request, collected)
+
+    def _thread_comment_queries(self, threads: List[Dict[str, Any]]) -> QueryPlan:
+        """Page the comments of threads with more than one page of replies."""
+        incomplete = [
+            thread for thread in threads
+            if ((thread.get("comments") or {}).get("pageInfo") or {}).get("hasNextPage")
+        ]
+
+        while incomplete:
+            batch = incomplete[:THREAD_BATCH_SIZE]
+            variables: Dict[str, Any] = {}
+            for i, thread in enumerate(batch):
+                variables[f"id{i}"] = thread["id"]
+                variables[f"cursor{i}"] = thread["comments"]["pageInfo"]["endCursor"]
+
+            data = (yield build_thread_comments_query(len(batch)), variables) or {}
+
+            for i, thread in enumerate(batch):
+                connection = (data.get(f"thread{i}") or {}).get("comments") or {}
+                thread["comments"]["nodes"].extend(connection.get("nodes") or [])
+                thread["comments"]["pageInfo"] = connection.get("pageInfo") or {}
+
+            incomplete = [
+                thread for thread in incomplete
+                if thread["comments"]["pageInfo"].get("hasNextPage")
+            ]
+
+
+def map_pull_request(
+    pull_request: Dict[str, Any],
+    connections: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Map GraphQL nodes to the REST-shaped pull request layout.
+
+    Inline comments are attached to the review they were submitted with
+    (``reviews[].comments``) and carry their thread's resolution state.
+
+    Args:
+        pull_request: Pull request node (scalar fields)
+        connections: Collected ``comments``, ``reviews`` and ``reviewThreads`` nodes
+
+    Returns:
+        Pull request data as consumed by ``CommentAnalyzer``
+    """
+    review_threads = []
+    comments_by_review: Dict[Any, List[Dict[str, Any]]] = {}
+
+    for thread in connections.get("reviewThreads", []):
+        thread_comments = []
+        for node in (thread.get("comments") or {}).get("nodes") or []:
+            comment = _map_review_comment(node, thread)
+            thread_comments.append(comment)
+            comments_by_review.setdefault(comment["pull_request_review_id"], []).append(comment)
+
+        review_threads.append({
+            "id": thread.get("id"),
+            "is_resolved": bool(thread.get("isResolved")),
+            "path": thread.get("path"),
+            "line": thread.get("line"),
+            "original_line": thread.get("originalLine"),
+            "start_line": thread.get("startLine"),
+            "side": thread.get("diffSide"),
+            "comments": thread_comments,
+        })
+
+    reviews = []
+    for node in connections.get("reviews", []):
+        review = {
+            "id": node.get("databaseId"),
+            "node_id": node.get("id"),
+            "body": node.get("body") or "",
+            "state": node.get("state"),
+            "user": _map_author(node.get("author")),
+            "created_at": node.get("submittedAt") or node.get("createdAt"),
+            "submitted_at": node.get("submittedAt"),
+            "html_url": node.get("url"),
+        }
+        review["comments"] = comments_by_review.get(review["id"], [])
+        reviews.append(review)
+
+    return {
+        "number": pull_request.get("number"),
+        "title": pull_request.get("title", ""),
+        "body": pull_request.get("body") or "",
+        "state": pull_request.get("state", ""),
+        "url": pull_request.get("url", ""),
+        "author": {"login": (pull_request.get("author") or {}).get("login", "")},
+        "createdAt": pull_request.get("createdAt"),
+        "updatedAt": pull_request.get("updatedAt"),
+        "comments": [_map_issue_comment(node) for node in connections.get("comments", [])],
+        "reviews": reviews,
+        "review_threads": review_threads,
+    }
+
+
+def _map_author(author: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Map a GraphQL actor to a REST ``user`` object.
+
+    GraphQL reports bot logins without the ``[bot]`` suffix used by REST.
+    """
+    if not author:
+        return {"login": "ghost"}
+    login = author.get("login", "")
+    if author.get("__typename") == "Bot" and not login.endswith("[bot]"):
+        login = f"{login}[bot]"
+    return {"login": login, "type": author.get("__typename")}
+
+
+def _map_issue_comment(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL issue comment to the REST layout."""
+    return {
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "body": node.get("body") or "",
+        "user": _map_author(node.get("author")),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "html_url": node.get("url"),
+    }
+
+
+def _map_review_comment(node: Dict[str, Any], thread: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL review comment to the REST layout."""
+    return {
+        "id": node.get("databaseId"),
+        "node_id": node.get("id"),
+        "body": node.get("body") or "",
+        "user": _map_author(node.get("author")),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "html_url": node.get("url"),
+        "path": node.get("path"),
+        "line": node.get("line"),
+        "original_line": node.get("originalLine"),
+        "diff_hunk": node.get("diffHunk"),
+        "in_reply_to_id": (node.get("replyTo") or {}).get("databaseId"),
+        "pull_request_review_id": (node.get("pullRequestReview") or {}).get("databaseId"),
+        "thread_id": thread.get("id"),
+        "is_resolved": bool(thread.get("isResolved")),
+    }
@@ -0,0 +1,158 @@
+"""
+Incremental decoding of streamed JSON arrays.
+
+List endpoints return one JSON array per page; ``gh api --paginate``
+concatenates the arrays of all pages into one output stream. Decoding such
+output with ``json.loads`` needs the complete text in memory plus the
+decoded objects. ``JSONArrayStream`` instead consumes the stream chunk by
+chunk and hands out each array element as soon as it is complete, so only
+the element being decoded is buffered.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Union
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+_NUMBER_CHARS = "+-.0123456789eE"
+
+# Compact the buffer once this many consumed characters have accumulated
+_COMPACT_THRESHOLD = 64 * 1024
+
+# Decoder positions
+_OUTSIDE = "outside"      # between arrays
+_FIRST = "first"          # after "[": a value or "]"
+_VALUE = "value"          # after ",": a value
+_SEPARATOR = "separator"  # after a value: "," or "]"
+
+
+class JSONArrayStream:
+    """Push decoder for a sequence of JSON arrays (``[...][...]...``).
+
+    Feed chunks with ``feed`` and collect the completed elements it returns;
+    call ``close`` at the end of the stream to detect truncated input.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _OUTSIDE
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        """Add a chunk of the stream.
+
+        Args:
+            chunk: Next bytes (UTF-8) or text of the stream
+
+        Returns:
+            Elements completed by this chunk, in stream order
+
+        Raises:
+            json.JSONDecodeError: If the stream is not a sequence of JSON arrays
+        """
+        text = self._utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            self._buffer += text
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish the stream.
+
+        Returns:
+            Elements that were only complete at the end of the stream
+
+        Raises:
+            json.JSONDecodeError: If the stream ended inside an array
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state != _OUTSIDE:
+            raise json.JSONDecodeError("Unterminated array", self._buffer, len(self._buffer))
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        """Decode every complete element currently buffered."""
+        items: List[Any] = []
+        buffer = self._buffer
+
+        while True:
+            pos = self._skip_whitespace(buffer, self._pos)
+            if pos >= len(buffer):
+                self._pos = pos
+                break
+
+            char = buffer[pos]
+            if self._state == _OUTSIDE:
+                if char != "[":
+                    raise json.JSONDecodeError("Expected '['", buffer, pos)
+                self._state = _FIRST
+                self._pos = pos + 1
+                continue
+
+            if char == "]" and self._state in (_FIRST, _SEPARATOR):
+                self._state = _OUTSIDE
+                self._pos = pos + 1
+                continue
+
+            if char == "," and self._state == _SEPARATOR:
+                self._state = _VALUE
+                self._pos = pos + 1
+                continue
+
+            if self._state == _SEPARATOR:
+                raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+
+            if not final and char in _NUMBER_START and self._token_end(buffer, pos) >= len(buffer):
+                # A number at the end of the buffer may continue in the next chunk
+                self._pos = pos
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                self._pos = pos
+                break  # incomplete element: wait for more data
+
+            items.append(item)
+            self._state = _SEPARATOR
+            self._pos = end
+
+        if self._pos >= _COMPACT_THRESHOLD:
+            self._buffer = buffer[self._pos:]
+            self._pos = 0
+        return items
+
+    @staticmethod
+    def _token_end(buffer: str, pos: int) -> int:
+        while pos < len(buffer) and buffer[pos] in _NUMBER_CHARS:
+            pos += 1
+        return pos
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, pos: int) -> int:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+
+def iter_array_items(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """Yield the elements of streamed JSON arrays as they complete.
+
+    Args:
+        chunks: Stream of one or more concatenated JSON arrays
+
+    Yields:
+        Array elements in stream order
+
+    Raises:
+        json.JSONDecodeError: If the stream is not a sequence of JSON arrays
+    """
+    stream = JSONArrayStream()
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
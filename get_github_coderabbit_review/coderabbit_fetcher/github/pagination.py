@@ -0,0 +1,114 @@
+"""
+Parallel pagination of GitHub list endpoints.
+
+GitHub's REST list endpoints answer the first page with a ``Link`` header
+naming the ``next`` and ``last`` pages. Once the last page number is known,
+the remaining pages are independent requests: they are fetched concurrently
+with a bounded number of workers and reassembled in page order.
+
+Endpoints without a ``last`` relation (cursor-paginated ones) are followed
+serially through ``next``.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .transport import GitHubResponse
+
+DEFAULT_MAX_WORKERS = 4
+
+# Fetches an absolute page URL
+PageFetcher = Callable[[str], GitHubResponse]
+
+# Validates a page response and returns its items
+PageParser = Callable[[GitHubResponse], List[Any]]
+
+
+def page_urls(links: dict) -> Optional[List[str]]:
+    """Build the URLs of all pages after the first one from ``Link`` relations.
+
+    Args:
+        links: ``rel -> url`` mapping of the first page's ``Link`` header
+
+    Returns:
+        URLs from the ``next`` page to the ``last`` page, or None if the
+        relations do not use numbered pages
+    """
+    next_url, last_url = links.get("next"), links.get("last")
+    if not next_url or not last_url:
+        return None
+
+    next_page = _page_number(next_url)
+    last_page = _page_number(last_url)
+    if next_page is None or last_page is None or last_page < next_page:
+        return None
+
+    return [_with_page(last_url, page) for page in range(next_page, last_page + 1)]
+
+
+def collect_pages(
+    first: GitHubResponse,
+    fetch: PageFetcher,
+    parse: PageParser,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Any]:
+    """Collect the items of all pages of a list endpoint.
+
+    Args:
+        first: Response of the first page
+        fetch: Fetches a page by absolute URL
+        parse: Validates a page response and returns its items (raises on errors)
+        max_workers: Maximum number of concurrent page requests
+
+    Returns:
+        Items of all pages in page order
+
+    Raises:
+        Whatever ``fetch`` or ``parse`` raise for the first failing page
+    """
+    items = list(parse(first))
+    last = first
+
+    urls = page_urls(first.links)
+    if urls:
+        workers = max(1, min(max_workers, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gh-page") as executor:
+            futures = [executor.submit(fetch, url) for url in urls]
+            try:
+                # Consume in page order; a failure cancels the pages not yet started
+                for future in futures:
+                    last = future.result()
+                    items.extend(parse(last))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    # Follow cursors serially (also covers pages added while fetching)
+    next_url = last.links.get("next")
+    while next_url:
+        last = fetch(next_url)
+        items.extend(parse(last))
+        next_url = last.links.get("next")
+
+    return items
+
+
+def _page_number(url: str) -> Optional[int]:
+    """Extract the ``page`` query parameter of a URL."""
+    for name, value in parse_qsl(urlsplit(url).query):
+        if name == "page":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _with_page(url: str, page: int) -> str:
+    """Replace the ``page`` query parameter of a URL."""
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
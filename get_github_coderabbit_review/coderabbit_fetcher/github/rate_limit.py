@@ -0,0 +1,358 @@
+"""
+Rate-limit-aware request scheduling for GitHub API access.
+
+GitHub reports the state of the primary rate limit on every REST and GraphQL
+response (``X-RateLimit-Limit``/``-Remaining``/``-Reset``/``-Resource``) and
+asks clients that trip a secondary limit to wait ``Retry-After`` seconds.
+``RateLimitScheduler`` keeps that state per resource ("core", "graphql",
+"search") and decides when the next request may start:
+
+- While the remaining budget is above ``reserve`` requests go out unpaced.
+- Below ``reserve`` the remaining budget is spread evenly over the time left
+  until the reset; follow-up pages of list endpoints (low priority) wait for
+  the reset so first pages and writes get the remaining budget first.
+- With no budget left, or after ``Retry-After``, every request waits.
+- Content-creating requests (POST/PATCH/PUT/DELETE) are spaced at least
+  ``write_interval`` seconds apart to stay under the secondary
+  "content creation" limit.
+
+The scheduler is thread-safe and can be waited on from threads (``acquire``)
+and from an event loop (``acquire_async``). ``RateLimitedTransport`` and
+``AsyncRateLimitedTransport`` put it in front of every request of a client.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .async_transport import AsyncTransport
+from .transport import DEFAULT_TIMEOUT, GitHubResponse, StreamedResponse, Transport
+
+DEFAULT_RESERVE = 100
+DEFAULT_WRITE_INTERVAL = 1.0
+# Wait after a secondary rate limit response without Retry-After
+DEFAULT_SECONDARY_BACKOFF = 60.0
+
+_WRITE_METHODS = ("POST", "PATCH", "PUT", "DELETE")
+# Endpoints that do not count against any rate limit
+_EXEMPT_PATHS = ("/rate_limit",)
+
+
+@dataclass
+class RateLimitState:
+    """Last known state of one rate limit resource."""
+
+    resource: str
+    limit: int
+    remaining: int
+    reset: int
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the state to a dictionary."""
+        return {"limit": self.limit, "remaining": self.remaining, "reset": self.reset}
+
+
+@dataclass
+class RequestSlot:
+    """A request admitted by the scheduler."""
+
+    resource: str
+    write: bool = False
+    exempt: bool = False
+
+
+class RateLimitScheduler:
+    """Paces requests using the rate limit headers of earlier responses."""
+
+    def __init__(self, reserve: int = DEFAULT_RESERVE,
+                 write_interval: float = DEFAULT_WRITE_INTERVAL,
+                 clock: Callable[[], float] = time.time) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            reserve: Remaining budget below which requests are paced
+            write_interval: Minimum seconds between content-creating requests
+            clock: Time source returning Unix timestamps
+        """
+        self.reserve = reserve
+        self.write_interval = write_interval
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._states: Dict[str, RateLimitState] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._last_start: Dict[str, float] = {}
+        self._next_write = 0.0
+        self._blocked_until = 0.0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+
+    @staticmethod
+    def classify(method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Derive the scheduling attributes of a request.
+
+        Args:
+            method: HTTP method
+            path: API path or absolute URL
+            params: Query parameters
+
+        Returns:
+            Keyword arguments for ``acquire``/``acquire_async``
+        """
+        parsed = urlparse(path)
+        if parsed.path in _EXEMPT_PATHS:
+            return {"exempt": True}
+
+        if parsed.path == "/graphql":
+            return {"resource": "graphql"}
+
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        query.update({key: str(value) for key, value in (params or {}).items()})
+        try:
+            follow_up_page = int(query.get("page", 1)) > 1
+        except ValueError:
+            follow_up_page = False
+
+        return {
+            "resource": "search" if parsed.path.startswith("/search/") else "core",
+            "write": method.upper() in _WRITE_METHODS,
+            "low_priority": follow_up_page,
+        }
+
+    def acquire(self, resource: str = "core", write: bool = False,
+                low_priority: bool = False, exempt: bool = False) -> RequestSlot:
+        """Block until a request may start.
+
+        Args:
+            resource: Rate limit resource the request counts against
+            write: Whether the request creates content
+            low_priority: Whether the request may be deferred to the next window
+            exempt: Whether the request does not count against any limit
+
+        Returns:
+            Slot to pass to ``complete`` once the response arrived
+        """
+        slot = RequestSlot(resource=resource, write=write, exempt=exempt)
+        if exempt:
+            return slot
+
+        waiting_since = None
+        with self._condition:
+            while True:
+                delay = self._delay(slot, low_priority)
+                if delay <= 0:
+                    self._admit(slot, waiting_since)
+                    return slot
+                if waiting_since is None:
+                    waiting_since = self._clock()
+                self._condition.wait(delay)
+
+    async def acquire_async(self, resource: str = "core", write: bool = False,
+                            low_priority: bool = False, exempt: bool = False) -> RequestSlot:
+        """Wait on the event loop until a request may start. See ``acquire``."""
+        slot = RequestSlot(resource=resource, write=write, exempt=exempt)
+        if exempt:
+            return slot
+
+        waiting_since = None
+        while True:
+            with self._condition:
+                delay = self._delay(slot, low_priority)
+                if delay <= 0:
+                    self._admit(slot, waiting_since)
+                    return slot
+                if waiting_since is None:
+                    waiting_since = self._clock()
+            await asyncio.sleep(delay)
+
+    def complete(self, slot: RequestSlot, response: Optional[GitHubResponse]) -> None:
+        """Record the end of a request and the rate limit state it reported.
+
+        Args:
+            slot: Slot returned by ``acquire``
+            response: Response of the request, or None if it failed
+        """
+        with self._condition:
+            if not slot.exempt:
+                self._in_flight[slot.resource] = max(0, self._in_flight.get(slot.resource, 0) - 1)
+            if response is not None:
+                self._update(response, slot.resource)
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the remaining budget per resource and the time spent throttled."""
+        with self._condition:
+            return {
+                "resources": {name: state.to_dict() for name, state in sorted(self._states.items())},
+                "throttled_requests": self.throttled_requests,
+                "throttled_seconds": self.throttled_seconds,
+            }
+
+    def _delay(self, slot: RequestSlot, low_priority: bool) -> float:
+        """Seconds until ``slot`` may start (0 if it may start now)."""
+        now = self._clock()
+        delay = self._blocked_until - now
+
+        state = self._states.get(slot.resource)
+        if state is not None and state.reset > now:
+            budget = state.remaining - self._in_flight.get(slot.resource, 0)
+            if budget <= 0 or (low_priority and budget <= self.reserve):
+                delay = max(delay, state.reset - now)
+            elif budget <= self.reserve:
+                interval = (state.reset - now) / budget
+                delay = max(delay, self._last_start.get(slot.resource, 0.0) + interval - now)
+
+        if slot.write:
+            delay = max(delay, self._next_write - now)
+        return delay
+
+    def _admit(self, slot: RequestSlot, waiting_since: Optional[float]) -> None:
+        """Count ``slot`` as started (caller holds the lock)."""
+        now = self._clock()
+        self._in_flight[slot.resource] = self._in_flight.get(slot.resource, 0) + 1
+        self._last_start[slot.resource] = now
+        if slot.write:
+            self._next_write = now + self.write_interval
+        if waiting_since is not None:
+            self.throttled_requests += 1
+            self.throttled_seconds += now - waiting_since
+
+    def _update(self, response: GitHubResponse, resource: str) -> None:
+        """Apply the rate limit headers of a response."""
+        headers = response.headers
+        now = self._clock()
+        resource = headers.get("x-ratelimit-resource", resource)
+
+        try:
+            limit = int(headers["x-ratelimit-limit"])
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = int(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            pass
+        else:
+            state = self._states.get(resource)
+            if state is not None and state.reset == reset:
+                # Responses of concurrent requests may arrive out of order
+                remaining = min(state.remaining, remaining)
+            self._states[resource] = RateLimitState(resource, limit, remaining, reset)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                self._blocked_until = max(self._blocked_until, now + float(retry_after))
+            except ValueError:
+                pass
+        elif response.is_rate_limited and headers.get("x-ratelimit-remaining") != "0":
+            # Secondary limit without guidance: back off for a minute
+            self._blocked_until = max(self._blocked_until, now + DEFAULT_SECONDARY_BACKOFF)
+
+
+class RateLimitedTransport(Transport):
+    """Transport wrapper admitting every request through a ``RateLimitScheduler``."""
+
+    def __init__(self, inner: Transport, scheduler: RateLimitScheduler) -> None:
+        """Initialize the rate-limited transport.
+
+        Args:
+            inner: Transport performing the actual requests
+            scheduler: Scheduler shared by all requests of the client
+        """
+        self.inner = inner
+        self.scheduler = scheduler
+        self.name = inner.name
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request once the scheduler admits it."""
+        slot = self.scheduler.acquire(**self.scheduler.classify(method, path, params))
+        response = None
+        try:
+            response = self.inner.request(method, path, params, body, headers, timeout)
+            return response
+        finally:
+            self.scheduler.complete(slot, response)
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Start a streamed request once the scheduler admits it.
+
+        The request counts as in flight until the response is closed.
+        """
+        slot = self.scheduler.acquire(**self.scheduler.classify(method, path, params))
+        try:
+            response = self.inner.stream(method, path, params, headers, timeout, paginate)
+        except BaseException:
+            self.scheduler.complete(slot, None)
+            raise
+
+        response.add_close_callback(lambda: self.scheduler.complete(
+            slot, GitHubResponse(status=response.status, headers=response.headers)
+        ))
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
+
+
+class AsyncRateLimitedTransport(AsyncTransport):
+    """Asyncio counterpart of ``RateLimitedTransport``."""
+
+    def __init__(self, inner: AsyncTransport, scheduler: RateLimitScheduler) -> None:
+        """Initialize the rate-limited transport.
+
+        Args:
+            inner: Asyncio transport performing the actual requests
+            scheduler: Scheduler shared by all requests of the client
+        """
+        self.inner = inner
+        self.scheduler = scheduler
+        self.name = inner.name
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request once the scheduler admits it, without blocking the loop."""
+        slot = await self.scheduler.acquire_async(**self.scheduler.classify(method, path, params))
+        response = None
+        try:
+            response = await self.inner.request(method, path, params, body, headers, timeout)
+            return response
+        finally:
+            self.scheduler.complete(slot, response)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.inner.aclose()
@@ -0,0 +1,286 @@
+"""
+Single-flight coalescing of identical concurrent requests.
+
+When several threads (or tasks) of one process ask for the same resource at
+the same moment, only the first one (the leader) performs the call; the
+others wait for it and receive its result, or its exception. Once the call
+has finished the key is forgotten, so this is not a cache: a later request
+is sent again.
+
+``SingleFlight`` serves threads and ``AsyncSingleFlight`` tasks of an event
+loop. ``SingleFlightTransport`` and ``AsyncSingleFlightTransport`` coalesce
+identical read requests (GET and GraphQL queries) of a transport; keys
+include a fingerprint of the credentials, so callers with different tokens
+never share a response. The clients additionally coalesce whole
+``fetch_pr_comments`` calls through the same groups.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .async_transport import AsyncTransport
+from .auth import env_token, gh_login_fingerprint, token_fingerprint
+from .circuit_breaker import transport_host
+from .transport import DEFAULT_TIMEOUT, GitHubResponse, StreamedResponse, Transport
+
+Copier = Callable[[Any], Any]
+
+
+class _Call:
+    """A call in flight and the outcome its waiters receive."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Thread-safe group of calls coalesced by key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], copy: Optional[Copier] = None) -> Any:
+        """Run ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call
+            fn: Performs the call
+            copy: Applied to the result handed to each waiter (e.g. a deep
+                copy for mutable results); the leader gets the original
+
+        Returns:
+            Result of ``fn`` (of this or of the concurrent identical call)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy(call.result) if copy is not None else call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of calls performed and of calls that joined one in flight."""
+        with self._lock:
+            return {"executed": self.executed, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """Group of coroutine calls coalesced by key (per event loop)."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[int, Hashable], "asyncio.Future[Any]"] = {}
+        self.executed = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]],
+                 copy: Optional[Copier] = None) -> Any:
+        """Await ``fn()`` unless an identical call is in flight. See ``SingleFlight.do``."""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        while True:
+            future = self._calls.get(loop_key)
+            if future is None:
+                break
+            self.shared += 1
+            try:
+                # Shielded: a cancelled waiter must not cancel the leader's call
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue  # the leader was cancelled: start over
+                raise
+            return copy(result) if copy is not None else result
+
+        future = self._calls[loop_key] = loop.create_future()
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here so an unobserved failure is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[loop_key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of calls performed and of calls that joined one in flight."""
+        return {"executed": self.executed, "shared": self.shared}
+
+
+#: Groups shared by all clients of the process
+DEFAULT_SINGLE_FLIGHT = SingleFlight()
+DEFAULT_ASYNC_SINGLE_FLIGHT = AsyncSingleFlight()
+
+
+def credential_fingerprint(transport: Any) -> str:
+    """Identify the API host and the credentials of a transport, without revealing them.
+
+    Wrapping transports are followed through their ``inner`` attribute.
+    """
+    host = transport_host(transport)
+    name = getattr(transport, "name", "")
+    while isinstance(transport, (Transport, AsyncTransport)):
+        token = getattr(transport, "_token", None)
+        if isinstance(token, str) and token:
+            return f"{host}:{token_fingerprint(token)}"
+        transport = getattr(transport, "inner", None)
+
+    token = env_token()
+    if token:
+        return f"{host}:{token_fingerprint(token)}"
+    return f"{host}:{gh_login_fingerprint() or name}"
+
+
+def request_key(credentials: str, method: str, path: str, params: Optional[Dict[str, Any]],
+                body: Optional[Any], headers: Optional[Dict[str, str]]) -> Optional[Hashable]:
+    """Get the coalescing key of a request, or None if it must not be shared.
+
+    Only reads are shared: GET requests and GraphQL queries (not mutations).
+    """
+    method = method.upper()
+    if method == "POST" and path == "/graphql" and isinstance(body, dict):
+        if str(body.get("query", "")).lstrip().startswith("mutation"):
+            return None
+    elif method != "GET" or body is not None:
+        return None
+
+    return (
+        credentials,
+        method,
+        path,
+        tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        json.dumps(body, sort_keys=True) if body is not None else None,
+        tuple(sorted((headers or {}).items())),
+    )
+
+
+class SingleFlightTransport(Transport):
+    """Transport wrapper sharing one in-flight request among identical callers."""
+
+    def __init__(self, inner: Transport, group: Optional[SingleFlight] = None) -> None:
+        """Initialize the coalescing transport.
+
+        Args:
+            inner: Transport performing the actual requests
+            group: Group shared with other clients (the process-wide group if omitted)
+        """
+        self.inner = inner
+        self.group = group if group is not None else DEFAULT_SINGLE_FLIGHT
+        self.name = inner.name
+        self._credentials: Optional[str] = None
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request, or join an identical one in flight."""
+        def send() -> GitHubResponse:
+            return self.inner.request(method, path, params, body, headers, timeout)
+
+        if self._credentials is None:
+            self._credentials = credential_fingerprint(self.inner)
+        key = request_key(self._credentials, method, path, params, body, headers)
+        return send() if key is None else self.group.do(key, send)
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Start a streamed request (streams are consumed once and never shared)."""
+        return self.inner.stream(method, path, params, headers, timeout, paginate)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self.inner.close()
+
+
+class AsyncSingleFlightTransport(AsyncTransport):
+    """Asyncio counterpart of ``SingleFlightTransport``."""
+
+    def __init__(self, inner: AsyncTransport, group: Optional[AsyncSingleFlight] = None) -> None:
+        """Initialize the coalescing transport.
+
+        Args:
+            inner: Asyncio transport performing the actual requests
+            group: Group shared with other clients (the process-wide group if omitted)
+        """
+        self.inner = inner
+        self.group = group if group is not None else DEFAULT_ASYNC_SINGLE_FLIGHT
+        self.name = inner.name
+        self._credentials: Optional[str] = None
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the wrapped transport carries its own credentials."""
+        return self.inner.has_credentials
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request, or join an identical one in flight."""
+        def send() -> Awaitable[GitHubResponse]:
+            return self.inner.request(method, path, params, body, headers, timeout)
+
+        if self._credentials is None:
+            self._credentials = credential_fingerprint(self.inner)
+        key = request_key(self._credentials, method, path, params, body, headers)
+        return await (send() if key is None else self.group.do(key, send))
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self.inner.aclose()
@@ -0,0 +1,203 @@
+"""
+Incremental pull request sync.
+
+The first sync of a pull request fetches everything and stores a local
+snapshot together with a high-water mark: the newest ``updated_at`` seen on
+any issue or review comment. Later syncs only ask for comments updated at or
+after that mark (REST ``since``) and merge them into the snapshot by comment
+ID, so edited comments replace their stored version.
+
+Deleted comments never show up in a ``since`` query. The pull request
+object reports the total number of issue and review comments; when the
+merged snapshot disagrees with those totals, the affected collection is
+refetched completely.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..github_client import GitHubClient
+
+logger = logging.getLogger(__name__)
+
+# Snapshot layout version; snapshots with another version are discarded
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """Stores one JSON snapshot per pull request."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the snapshots (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, owner: str, repo: str, pr_number: str) -> Optional[Dict[str, Any]]:
+        """Load the snapshot of a pull request.
+
+        Returns:
+            The snapshot, or None if missing, unreadable or outdated
+        """
+        try:
+            snapshot = json.loads(self._path(owner, repo, pr_number).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def save(self, owner: str, repo: str, pr_number: str, snapshot: Dict[str, Any]) -> None:
+        """Atomically write the snapshot of a pull request."""
+        path = self._path(owner, repo, pr_number)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(snapshot, tmp_file, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, owner: str, repo: str, pr_number: str) -> None:
+        """Remove the snapshot of a pull request, if any."""
+        try:
+            self._path(owner, repo, pr_number).unlink()
+        except OSError:
+            pass
+
+    def _path(self, owner: str, repo: str, pr_number: str) -> Path:
+        return self.directory / f"{owner}__{repo}__{pr_number}.json"
+
+
+class IncrementalSyncer:
+    """Keeps a local snapshot of a pull request up to date."""
+
+    def __init__(self, client: "GitHubClient", store: SnapshotStore) -> None:
+        """Initialize the syncer.
+
+        Args:
+            client: GitHub client used for the REST requests
+            store: Snapshot store
+        """
+        self.client = client
+        self.store = store
+        # Statistics of the last sync
+        self.last_sync: Dict[str, Any] = {}
+
+    def sync(self, pr_url: str, timeout: Optional[int] = None, full: bool = False) -> Dict[str, Any]:
+        """Bring the snapshot up to date and return the PR data.
+
+        Args:
+            pr_url: GitHub pull request URL
+            timeout: Timeout in seconds for each API request
+            full: Ignore the stored snapshot and fetch everything
+
+        Returns:
+            PR data in the ``GitHubClient.fetch_pr_comments`` layout
+        """
+        owner, repo, pr_number = self.client.parse_pr_url(pr_url)
+        snapshot = None if full else self.store.load(owner, repo, pr_number)
+        since = snapshot.get("high_water_mark") if snapshot else None
+
+        updates = self.client.fetch_pr_updates(pr_url, since=since, timeout=timeout)
+
+        if snapshot is None:
+            comments = updates["comments"]
+            review_comments = updates["review_comments"]
+        else:
+            comments = merge_by_id(snapshot["comments"], updates["comments"])
+            review_comments = merge_by_id(snapshot["review_comments"], updates["review_comments"])
+
+        pull = updates["pull"]
+        refetched = []
+        if snapshot is not None:
+            if not _count_matches(comments, pull.get("comment_count")):
+                refetched.append("comments")
+            if not _count_matches(review_comments, pull.get("review_comment_count")):
+                refetched.append("review_comments")
+        if refetched:
+            # Comments were deleted since the last sync
+            complete = self.client.fetch_pr_updates(pr_url, timeout=timeout)
+            pull = complete["pull"]
+            if "comments" in refetched:
+                comments = complete["comments"]
+            if "review_comments" in refetched:
+                review_comments = complete["review_comments"]
+
+        merged = {
+            "version": SNAPSHOT_VERSION,
+            "pr_url": pr_url,
+            "synced_at": datetime.now(timezone.utc).isoformat(),
+            "high_water_mark": high_water_mark(comments + review_comments, since),
+            "pull": pull,
+            "comments": comments,
+            "reviews": updates["reviews"],
+            "review_comments": review_comments,
+        }
+        self.store.save(owner, repo, pr_number, merged)
+
+        self.last_sync = {
+            "incremental": snapshot is not None,
+            "since": since,
+            "updated_comments": len(updates["comments"]) + len(updates["review_comments"]),
+            "refetched": refetched,
+        }
+        logger.info(
+            "Synced %s/%s#%s (%s, %d updated comments)", owner, repo, pr_number,
+            f"since {since}" if since else "full", self.last_sync["updated_comments"]
+        )
+
+        return self.client.assemble_pr_data(merged, owner, repo, pr_number)
+
+
+def merge_by_id(existing: List[Dict[str, Any]], updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Upsert updated comments into a stored list by comment ID.
+
+    Args:
+        existing: Stored comments
+        updates: Comments returned by a ``since`` query
+
+    Returns:
+        Merged comments in creation order
+    """
+    merged = {comment.get("id"): comment for comment in existing}
+    for comment in updates:
+        merged[comment.get("id")] = comment
+    return sorted(merged.values(), key=lambda c: (c.get("created_at") or "", c.get("id") or 0))
+
+
+def high_water_mark(comments: List[Dict[str, Any]], previous: Optional[str] = None) -> Optional[str]:
+    """Get the newest ``updated_at`` of the comments.
+
+    ISO 8601 timestamps in GitHub's ``Z`` form sort lexicographically.
+
+    Args:
+        comments: Comments to inspect
+        previous: Previous mark, kept if no comment is newer
+
+    Returns:
+        Newest timestamp, or ``previous`` when there are no comments
+    """
+    stamps = [c.get("updated_at") or c.get("created_at") for c in comments]
+    stamps = [stamp for stamp in stamps if stamp]
+    if previous:
+        stamps.append(previous)
+    return max(stamps) if stamps else None
+
+
+def _count_matches(comments: List[Dict[str, Any]], expected: Optional[int]) -> bool:
+    """Check a merged collection against the total reported by the API."""
+    return expected is None or len(comments) == expected
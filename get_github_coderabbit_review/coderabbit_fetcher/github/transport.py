@@ -0,0 +1,878 @@
+"""
+Pluggable transports for GitHub API access.
+
+This module provides the low-level request layer used by the GitHub clients.
+Two backends are available:
+
+- ``HTTPTransport``: speaks the REST/GraphQL API directly over a pool of
+  keep-alive connections. The GitHub CLI is only used once, to obtain the
+  authentication token (``gh auth token``).
+- ``GhCliTransport``: the original behaviour, one ``gh api`` subprocess per
+  request. Kept as a fallback for environments where only ``gh`` works.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import queue
+import re
+import socket
+import subprocess
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+from ..exceptions import GitHubAuthenticationError, TransportError, TransportTimeoutError
+from .auth import env_token
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 8
+# Bytes read at a time from streamed response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+USER_AGENT = "coderabbit-comment-fetcher"
+
+SUPPORTED_BACKENDS = ("http", "gh")
+
+# Requests sent again when a pooled connection turns out to be stale
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+_LINK_PATTERN = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+_HTTP_STATUS_PATTERN = re.compile(r"HTTP (\d{3})")
+
+
+@dataclass
+class GitHubResponse:
+    """Response returned by a transport.
+
+    Header names are stored lower-cased. ``error_text`` carries diagnostics
+    that did not come from the HTTP body (e.g. GitHub CLI stderr).
+    """
+
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    text: str = ""
+    url: str = ""
+    error_text: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the response has a 2xx status."""
+        return 200 <= self.status < 300
+
+    @property
+    def not_modified(self) -> bool:
+        """Check whether the response is a 304 Not Modified."""
+        return self.status == 304
+
+    @property
+    def is_rate_limited(self) -> bool:
+        """Check whether the request was rejected by a rate limit."""
+        if self.status not in (403, 429):
+            return False
+        if self.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in self.headers:
+            return True
+        return "rate limit" in self.error_message.lower()
+
+    @property
+    def rate_limit_reset(self) -> Optional[int]:
+        """Get the rate limit reset time as a Unix timestamp, if known."""
+        value = self.headers.get("x-ratelimit-reset")
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    @property
+    def links(self) -> Dict[str, str]:
+        """Parse the ``Link`` header into a ``rel -> url`` mapping."""
+        header = self.headers.get("link", "")
+        return {rel: url for url, rel in _LINK_PATTERN.findall(header)}
+
+    @property
+    def error_message(self) -> str:
+        """Get the most useful error description available."""
+        if self.error_text:
+            return self.error_text
+        try:
+            payload = json.loads(self.text) if self.text else None
+        except ValueError:
+            payload = None
+        if isinstance(payload, dict) and payload.get("message"):
+            return str(payload["message"])
+        if self.text:
+            return self.text[:500]
+        return f"HTTP {self.status}"
+
+    def json(self) -> Any:
+        """Decode the response body as JSON.
+
+        Raises:
+            json.JSONDecodeError: If the body is not valid JSON
+        """
+        return json.loads(self.text)
+
+
+class StreamedResponse:
+    """Response whose body is read incrementally.
+
+    Use as a context manager: closing the response releases the pooled
+    connection or the subprocess behind it, also when the body was not read
+    to the end.
+    """
+
+    def __init__(
+        self,
+        status: int,
+        headers: Dict[str, str],
+        chunks: Iterable[bytes],
+        url: str = "",
+        error_text: str = "",
+        on_close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers (lower-cased names)
+            chunks: Body chunks, consumed once
+            url: Request target
+            error_text: Diagnostics that did not come from the body
+            on_close: Called once when the response is closed
+        """
+        self.status = status
+        self.headers = headers
+        self.url = url
+        self.error_text = error_text
+        self._chunks = iter(chunks)
+        self._close_callbacks: List[Callable[[], None]] = [on_close] if on_close is not None else []
+
+    @classmethod
+    def from_response(cls, response: GitHubResponse) -> "StreamedResponse":
+        """Wrap a completely read response."""
+        body = response.text.encode("utf-8")
+        return cls(response.status, response.headers, [body] if body else [],
+                   url=response.url, error_text=response.error_text)
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the response has a 2xx status."""
+        return 200 <= self.status < 300
+
+    @property
+    def links(self) -> Dict[str, str]:
+        """Parse the ``Link`` header into a ``rel -> url`` mapping."""
+        return GitHubResponse(status=self.status, headers=self.headers).links
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the remaining body chunks."""
+        return self._chunks
+
+    def read(self) -> GitHubResponse:
+        """Read the remaining body into a complete response (e.g. an error body)."""
+        body = b"".join(self._chunks)
+        return GitHubResponse(
+            status=self.status,
+            headers=self.headers,
+            text=body.decode("utf-8", errors="replace"),
+            url=self.url,
+            error_text=self.error_text,
+        )
+
+    def add_close_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback run (after the earlier ones) when the response is closed."""
+        self._close_callbacks.append(callback)
+
+    def close(self) -> None:
+        """Release the resources behind the body."""
+        callbacks, self._close_callbacks = self._close_callbacks, []
+        self._run_callbacks(callbacks)
+
+    @classmethod
+    def _run_callbacks(cls, callbacks: List[Callable[[], None]]) -> None:
+        """Run every callback, even when an earlier one raises."""
+        if callbacks:
+            try:
+                callbacks[0]()
+            finally:
+                cls._run_callbacks(callbacks[1:])
+
+    def __enter__(self) -> "StreamedResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class Transport(ABC):
+    """Abstract request layer for the GitHub API."""
+
+    #: Backend identifier ("http" or "gh")
+    name: str = ""
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether the transport carries its own credentials.
+
+        Transports returning False rely on the GitHub CLI's stored login and
+        need ``gh auth status`` to verify authentication.
+        """
+        return False
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request to the GitHub API.
+
+        Args:
+            method: HTTP method
+            path: API path (``/repos/...``) or absolute URL (e.g. a ``Link`` target)
+            params: Optional query parameters
+            body: Optional JSON-serializable request body
+            headers: Optional extra request headers
+            timeout: Timeout in seconds
+
+        Returns:
+            Response with status, headers and body text
+
+        Raises:
+            TransportTimeoutError: If the request timed out
+            TransportError: If the request could not be delivered
+        """
+
+    def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a GraphQL query.
+
+        Args:
+            query: GraphQL query document
+            variables: Optional query variables
+            timeout: Timeout in seconds
+
+        Returns:
+            Raw response of the GraphQL endpoint
+        """
+        return self.request(
+            "POST", "/graphql",
+            body={"query": query, "variables": variables or {}},
+            timeout=timeout,
+        )
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Send a request and return its body as a stream.
+
+        This default reads the complete response with ``request``; transports
+        that can do better override it.
+
+        Args:
+            method: HTTP method
+            path: API path or absolute URL
+            params: Query parameters
+            headers: Additional request headers
+            timeout: Timeout in seconds
+            paginate: Let the backend append all following pages of a list
+                endpoint to the stream when it can (``gh api --paginate``);
+                otherwise callers follow ``links`` themselves
+
+        Returns:
+            Response to be closed by the caller
+        """
+        return StreamedResponse.from_response(
+            self.request(method, path, params=params, headers=headers, timeout=timeout)
+        )
+
+    # Not abstract: transports holding no resources need not override it
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the transport."""
+
+
+class HTTPTransport(Transport):
+    """Native HTTPS transport backed by a keep-alive connection pool.
+
+    Connections are reused across requests and threads; at most
+    ``max_connections`` requests are in flight at any time.
+    """
+
+    name = "http"
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = DEFAULT_API_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize HTTP transport.
+
+        Args:
+            token: GitHub token used for the ``Authorization`` header
+            base_url: API root URL (a local stub server in tests)
+            max_connections: Maximum number of pooled connections
+        """
+        parsed = urlparse(base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Invalid GitHub API URL: {base_url}")
+
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max(1, max_connections)
+        self._token = token
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._base_path = parsed.path.rstrip("/")
+
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._stats_lock = threading.Lock()
+
+        # Pool statistics
+        self.connections_opened = 0
+        self.requests_sent = 0
+
+    @property
+    def has_credentials(self) -> bool:
+        """Whether a token is configured."""
+        return bool(self._token)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request over a pooled connection."""
+        target = self._build_target(path, params)
+        payload = None if body is None else json.dumps(body).encode("utf-8")
+        request_headers = self._request_headers(payload, headers)
+
+        with self._slots:
+            connection, reused = self._acquire(timeout)
+            try:
+                connection, response = self._exchange(
+                    connection, reused, method, target, payload, request_headers, timeout,
+                    repeatable=_is_repeatable(method, path, body)
+                )
+                raw = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                raise self._transport_error(e, method, target, timeout) from e
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            self._release(connection, response)
+            if response_headers.get("content-encoding") == "gzip" and raw:
+                try:
+                    raw = gzip.decompress(raw)
+                except (OSError, EOFError, zlib.error) as e:
+                    raise self._decoding_error(e, method, target) from e
+
+            return GitHubResponse(
+                status=response.status,
+                headers=response_headers,
+                text=raw.decode("utf-8", errors="replace"),
+                url=target,
+            )
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Send a request and read the body in chunks as the caller consumes it.
+
+        The connection (and its pool slot) stays reserved until the response
+        is closed. ``paginate`` is ignored: callers follow ``links``.
+        """
+        target = self._build_target(path, params)
+        request_headers = self._request_headers(None, headers)
+
+        self._slots.acquire()
+        connection, reused = self._acquire(timeout)
+        try:
+            connection, response = self._exchange(
+                connection, reused, method, target, None, request_headers, timeout,
+                repeatable=_is_repeatable(method, path, None)
+            )
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            self._slots.release()
+            raise self._transport_error(e, method, target, timeout) from e
+        except BaseException:
+            connection.close()
+            self._slots.release()
+            raise
+
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+
+        def chunks() -> Iterator[bytes]:
+            inflater = (
+                zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if response_headers.get("content-encoding") == "gzip" else None
+            )
+            while True:
+                try:
+                    data = response.read(STREAM_CHUNK_SIZE)
+                except (OSError, http.client.HTTPException) as e:
+                    raise self._transport_error(e, method, target, timeout) from e
+                if not data:
+                    break
+                if inflater is None:
+                    yield data
+                    continue
+                try:
+                    yield inflater.decompress(data)
+                except zlib.error as e:
+                    raise self._decoding_error(e, method, target) from e
+            if inflater is not None:
+                try:
+                    yield inflater.flush()
+                except zlib.error as e:
+                    raise self._decoding_error(e, method, target) from e
+
+        def finish() -> None:
+            try:
+                if response.isclosed():
+                    self._release(connection, response)
+                else:
+                    # Body not read to the end: the connection cannot be reused
+                    connection.close()
+            finally:
+                self._slots.release()
+
+        return StreamedResponse(
+            response.status, response_headers, chunks(), url=target, on_close=finish
+        )
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            connection.close()
+
+    def _build_target(self, path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build the request target (path + query) for a path or absolute URL."""
+        if path.startswith(("http://", "https://")):
+            parsed = urlparse(path)
+            target = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        else:
+            target = self._base_path + ("/" + path.lstrip("/"))
+
+        if params:
+            separator = "&" if "?" in target else "?"
+            target += separator + urlencode(params)
+
+        return target
+
+    def _acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection from the pool or open a new one."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._open_connection(timeout), False
+
+    def _open_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """Open a new connection to the API host."""
+        with self._stats_lock:
+            self.connections_opened += 1
+
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._host, self._port, timeout=timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _request_headers(self, payload: Optional[bytes],
+                         headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Build the headers of an API request."""
+        request_headers = {
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "Authorization": f"Bearer {self._token}",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if payload is not None:
+            request_headers["Content-Type"] = "application/json"
+        if headers:
+            request_headers.update(headers)
+        return request_headers
+
+    def _exchange(
+        self,
+        connection: http.client.HTTPConnection,
+        reused: bool,
+        method: str,
+        target: str,
+        payload: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+        repeatable: bool = False,
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request and wait for the response status and headers.
+
+        Args:
+            repeatable: Whether the request may be sent again on a fresh
+                connection when a pooled one was dropped; requests with side
+                effects are not, the server may have processed them
+
+        Returns:
+            The connection used (replaced when a pooled one turned out to be
+            stale) and the response, whose body has not been read yet
+        """
+        try:
+            return connection, self._send(connection, method, target, payload, headers, timeout)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server most likely dropped an idle keep-alive connection
+            # before processing the request; retry once on a fresh connection
+            # when sending it twice is harmless.
+            connection.close()
+            if not reused or not repeatable:
+                raise
+        connection = self._open_connection(timeout)
+        try:
+            return connection, self._send(connection, method, target, payload, headers, timeout)
+        except BaseException:
+            connection.close()
+            raise
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        payload: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> http.client.HTTPResponse:
+        """Send one request and read the response status and headers."""
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        with self._stats_lock:
+            self.requests_sent += 1
+
+        connection.request(method, target, body=payload, headers=headers)
+        return connection.getresponse()
+
+    def _release(self, connection: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse) -> None:
+        """Return the connection to the pool unless the server is closing it."""
+        if response.will_close:
+            connection.close()
+        else:
+            self._idle.put(connection)
+
+    @staticmethod
+    def _transport_error(error: Exception, method: str, target: str, timeout: float) -> TransportError:
+        """Map a connection-level error to a transport exception."""
+        if isinstance(error, socket.timeout):
+            return TransportTimeoutError(
+                f"GitHub API request timed out after {timeout} seconds",
+                details=f"{method} {target}"
+            )
+        return TransportError(f"GitHub API request failed: {error}", details=f"{method} {target}")
+
+    @staticmethod
+    def _decoding_error(error: Exception, method: str, target: str) -> TransportError:
+        """Map a corrupt compressed response body to a transport exception."""
+        return TransportError(
+            f"GitHub API returned an undecodable gzip body: {error}", details=f"{method} {target}"
+        )
+
+
+class GhCliTransport(Transport):
+    """Fallback transport running one ``gh api`` subprocess per request."""
+
+    name = "gh"
+
+    def __init__(self, gh_executable: str = "gh") -> None:
+        """Initialize GitHub CLI transport.
+
+        Args:
+            gh_executable: Name or path of the GitHub CLI executable
+        """
+        self.gh_executable = gh_executable
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> GitHubResponse:
+        """Send a request through ``gh api``."""
+        endpoint = self._build_endpoint(path, params)
+        args = [self.gh_executable, "api", endpoint]
+
+        for name, value in (headers or {}).items():
+            args.extend(["-H", f"{name}: {value}"])
+
+        run_kwargs: Dict[str, Any] = {"capture_output": True, "text": True, "timeout": timeout}
+        if method.upper() != "GET":
+            args.extend(["--method", method.upper()])
+        if body is not None:
+            args.extend(["--input", "-"])
+            run_kwargs["input"] = json.dumps(body)
+
+        try:
+            result = subprocess.run(args, **run_kwargs)
+        except subprocess.TimeoutExpired as e:
+            raise TransportTimeoutError(
+                f"GitHub CLI request timed out after {timeout} seconds",
+                details=endpoint
+            ) from e
+        except FileNotFoundError as e:
+            raise TransportError("GitHub CLI (gh) is not installed or not in PATH") from e
+        except OSError as e:
+            raise TransportError(f"Failed to run GitHub CLI: {e}") from e
+
+        if result.returncode == 0:
+            return GitHubResponse(status=200, text=result.stdout, url=endpoint)
+
+        stderr = result.stderr.strip() if isinstance(result.stderr, str) else ""
+        stdout = result.stdout if isinstance(result.stdout, str) else ""
+        return GitHubResponse(
+            status=self._status_from_stderr(stderr),
+            text=stdout,
+            url=endpoint,
+            error_text=stderr,
+        )
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        paginate: bool = False,
+    ) -> StreamedResponse:
+        """Run ``gh api`` and read its output in chunks as the caller consumes it.
+
+        With ``paginate`` the CLI follows the pages itself (``--paginate``) and
+        writes their arrays one after another. The subprocess is killed when it
+        runs longer than ``timeout`` or when the response is closed early.
+
+        Raises:
+            TransportError: If the CLI could not be started, or (while reading)
+                if it failed after the output had started
+        """
+        endpoint = self._build_endpoint(path, params)
+        args = [self.gh_executable, "api", endpoint]
+        for name, value in (headers or {}).items():
+            args.extend(["-H", f"{name}: {value}"])
+        if method.upper() != "GET":
+            args.extend(["--method", method.upper()])
+        if paginate:
+            args.append("--paginate")
+
+        try:
+            process = subprocess.Popen(
+                args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except FileNotFoundError as e:
+            raise TransportError("GitHub CLI (gh) is not installed or not in PATH") from e
+        except OSError as e:
+            raise TransportError(f"Failed to run GitHub CLI: {e}") from e
+
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.daemon = True
+        timer.start()
+
+        def finish() -> None:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+        def wait_for_exit() -> Tuple[int, str]:
+            returncode = process.wait()
+            stderr = process.stderr.read().decode("utf-8", errors="replace").strip()
+            if timed_out.is_set():
+                finish()
+                raise TransportTimeoutError(
+                    f"GitHub CLI request timed out after {timeout} seconds", details=endpoint
+                )
+            return returncode, stderr
+
+        # The status is only known when the CLI exits, but list endpoints
+        # always answer with an array: anything else is read as a whole.
+        head = b""
+        while not head.strip():
+            data = process.stdout.read1(STREAM_CHUNK_SIZE)
+            if not data:
+                break
+            head += data
+
+        if not head.lstrip().startswith(b"["):
+            body = head + process.stdout.read()
+            returncode, stderr = wait_for_exit()
+            finish()
+            status = 200 if returncode == 0 else self._status_from_stderr(stderr)
+            return StreamedResponse(
+                status, {}, [body] if body else [], url=endpoint,
+                error_text="" if returncode == 0 else stderr,
+            )
+
+        def chunks() -> Iterator[bytes]:
+            yield head
+            while True:
+                data = process.stdout.read1(STREAM_CHUNK_SIZE)
+                if not data:
+                    break
+                yield data
+            returncode, stderr = wait_for_exit()
+            if returncode != 0:
+                raise TransportError(f"GitHub CLI request failed: {stderr}", details=endpoint)
+
+        return StreamedResponse(200, {}, chunks(), url=endpoint, on_close=finish)
+
+    @staticmethod
+    def _build_endpoint(path: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build the ``gh api`` endpoint argument."""
+        if path.startswith(("http://", "https://")):
+            parsed = urlparse(path)
+            path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        if path.rstrip("/") == "/graphql":
+            path = "graphql"
+
+        if params:
+            separator = "&" if "?" in path else "?"
+            path += separator + urlencode(params)
+
+        return path
+
+    @staticmethod
+    def _status_from_stderr(stderr: str) -> int:
+        """Infer the HTTP status from GitHub CLI error output."""
+        match = _HTTP_STATUS_PATTERN.search(stderr)
+        if match:
+            return int(match.group(1))
+        if "not found" in stderr.lower():
+            return 404
+        # Unknown failure: not an HTTP status
+        return 0
+
+
+def _is_repeatable(method: str, path: str, body: Optional[Any]) -> bool:
+    """Whether a request has no side effects: reads and GraphQL queries."""
+    method = method.upper()
+    if method == "POST" and path == "/graphql" and isinstance(body, dict):
+        return not str(body.get("query", "")).lstrip().startswith("mutation")
+    return method in _IDEMPOTENT_METHODS
+
+
+def resolve_token(timeout: float = 10.0) -> str:
+    """Obtain a GitHub token.
+
+    ``GH_TOKEN``/``GITHUB_TOKEN`` are used when set; otherwise the token is
+    read from the GitHub CLI (``gh auth token``).
+
+    Args:
+        timeout: Timeout in seconds for the GitHub CLI call
+
+    Returns:
+        GitHub token
+
+    Raises:
+        GitHubAuthenticationError: If no token could be obtained
+    """
+    token = env_token()
+    if token:
+        return token
+
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        raise GitHubAuthenticationError("GitHub CLI token lookup timed out")
+    except FileNotFoundError:
+        raise GitHubAuthenticationError("GitHub CLI (gh) is not installed or not in PATH")
+    except OSError as e:
+        raise GitHubAuthenticationError(f"Failed to obtain GitHub token: {e}")
+
+    token = result.stdout.strip() if result.returncode == 0 else ""
+    if not token:
+        raise GitHubAuthenticationError(
+            "GitHub CLI is not authenticated. Please run 'gh auth login'"
+        )
+    return token
+
+
+def create_transport(
+    backend: str = "http",
+    token: Optional[str] = None,
+    base_url: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> Transport:
+    """Create a transport for the given backend.
+
+    Args:
+        backend: "http" for the native pooled transport, "gh" for the CLI fallback
+        token: GitHub token (defaults to ``gh auth token``)
+        base_url: API root URL (defaults to ``$GITHUB_API_URL`` or api.github.com)
+        max_connections: Pool size for the native transport
+
+    Returns:
+        Configured transport
+
+    Raises:
+        ValueError: If the backend is unknown
+        GitHubAuthenticationError: If no token could be obtained
+    """
+    if backend == "gh":
+        return GhCliTransport()
+    if backend != "http":
+        raise ValueError(
+            f"Unknown transport backend: {backend} (expected one of {', '.join(SUPPORTED_BACKENDS)})"
+        )
+
+    return HTTPTransport(
+        token=token or resolve_token(),
+        base_url=base_url or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL,
+        max_connections=max_connections,
+    )
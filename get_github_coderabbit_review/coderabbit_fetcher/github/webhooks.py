@@ -0,0 +1,189 @@
+"""
+GitHub webhook payloads for pull request comments.
+
+Parses the ``pull_request_review``, ``pull_request_review_comment`` and
+``issue_comment`` events, verifies their ``X-Hub-Signature-256`` HMAC and
+applies them to a pull request snapshot in the ``IncrementalSyncer`` layout
+(``pull``, ``comments``, ``reviews``, ``review_comments``), so webhook
+updates and ``--incremental`` runs share the same stored state.
+"""
+
+import hashlib
+import hmac
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sync import SNAPSHOT_VERSION, high_water_mark
+
+SUPPORTED_EVENTS = ("pull_request_review", "pull_request_review_comment", "issue_comment")
+
+EVENT_HEADER = "X-GitHub-Event"
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+
+# Collection of the snapshot each event updates
+_COLLECTIONS = {
+    "issue_comment": "comments",
+    "pull_request_review_comment": "review_comments",
+    "pull_request_review": "reviews",
+}
+
+#: A snapshot item changed by an event: (collection, item ID)
+Touched = Tuple[str, Any]
+
+
+def compute_signature(secret: str, body: bytes) -> str:
+    """Compute the ``X-Hub-Signature-256`` value of a payload."""
+    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a payload's ``X-Hub-Signature-256`` header in constant time.
+
+    Args:
+        secret: Webhook secret configured on GitHub
+        body: Raw request body
+        signature: Header value (``sha256=<hex>``)
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(compute_signature(secret, body), signature.strip())
+
+
+@dataclass
+class WebhookEvent:
+    """A supported event concerning a pull request."""
+
+    name: str
+    action: str
+    owner: str
+    repo: str
+    pr_number: str
+    #: The comment or review the event is about
+    item: Dict[str, Any]
+    #: Pull request fields in the ``pull`` layout of a snapshot
+    pull: Dict[str, Any]
+
+    @property
+    def collection(self) -> str:
+        """Snapshot collection holding ``item``."""
+        return _COLLECTIONS[self.name]
+
+    @property
+    def pr_url(self) -> str:
+        """URL of the pull request."""
+        return f"https://github.com/{self.owner}/{self.repo}/pull/{self.pr_number}"
+
+    @property
+    def removes_item(self) -> bool:
+        """Whether the event deletes ``item``."""
+        return self.action == "deleted"
+
+
+def parse_event(name: str, payload: Dict[str, Any]) -> Optional[WebhookEvent]:
+    """Extract the pull request event from a webhook payload.
+
+    Args:
+        name: ``X-GitHub-Event`` header value
+        payload: Decoded request body
+
+    Returns:
+        The event, or None for unsupported events and comments on plain issues
+    """
+    if name not in SUPPORTED_EVENTS or not isinstance(payload, dict):
+        return None
+
+    repository = payload.get("repository") or {}
+    full_name = repository.get("full_name") or ""
+    if "/" not in full_name:
+        return None
+    owner, repo = full_name.split("/", 1)
+
+    if name == "issue_comment":
+        issue = payload.get("issue") or {}
+        if not issue.get("pull_request"):
+            return None
+        source = issue
+        item = payload.get("comment")
+        comment_count = issue.get("comments")
+        review_comment_count = None
+    else:
+        source = payload.get("pull_request") or {}
+        item = payload.get("review" if name == "pull_request_review" else "comment")
+        comment_count = source.get("comments")
+        review_comment_count = source.get("review_comments")
+
+    if not isinstance(item, dict) or item.get("id") is None or source.get("number") is None:
+        return None
+
+    pull = {
+        "title": source.get("title", ""),
+        "body": source.get("body") or "",
+        "number": source.get("number"),
+        "state": (source.get("state") or "").upper(),
+        "url": source.get("html_url", ""),
+        "author": {"login": (source.get("user") or {}).get("login", "")},
+        "createdAt": source.get("created_at"),
+        "updatedAt": source.get("updated_at"),
+        "comment_count": comment_count,
+        "review_comment_count": review_comment_count,
+    }
+    return WebhookEvent(
+        name=name,
+        action=str(payload.get("action") or ""),
+        owner=owner,
+        repo=repo,
+        pr_number=str(source["number"]),
+        item=item,
+        pull=pull,
+    )
+
+
+def empty_snapshot(event: WebhookEvent) -> Dict[str, Any]:
+    """Create the snapshot of a pull request first seen through a webhook."""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "pr_url": event.pr_url,
+        "synced_at": None,
+        "high_water_mark": None,
+        "pull": dict(event.pull),
+        "comments": [],
+        "reviews": [],
+        "review_comments": [],
+    }
+
+
+def apply_event(snapshot: Dict[str, Any], event: WebhookEvent) -> List[Touched]:
+    """Apply an event to a snapshot in place.
+
+    Created and edited items are upserted by ID, deleted ones removed.
+    Pull request fields present in the payload replace the stored ones.
+
+    Args:
+        snapshot: Snapshot in the ``IncrementalSyncer`` layout
+        event: Parsed event
+
+    Returns:
+        The snapshot items the event touched
+    """
+    for key, value in event.pull.items():
+        if value is not None and value != "":
+            snapshot["pull"][key] = value
+
+    items: List[Dict[str, Any]] = snapshot.setdefault(event.collection, [])
+    item_id = event.item["id"]
+    kept = [item for item in items if item.get("id") != item_id]
+    if not event.removes_item:
+        kept.append(event.item)
+        kept.sort(key=lambda c: (c.get("created_at") or c.get("submitted_at") or "", c.get("id") or 0))
+    snapshot[event.collection] = kept
+
+    if event.collection != "reviews" and not event.removes_item:
+        snapshot["high_water_mark"] = high_water_mark([event.item], snapshot.get("high_water_mark"))
+    snapshot["synced_at"] = datetime.now(timezone.utc).isoformat()
+
+    return [(event.collection, item_id)]
@@ -1,12 +1,52 @@
-"""GitHub CLI wrapper for authenticated API access."""
+"""GitHub API client for authenticated API access."""
 
+import copy
 import json
+import logging
 import subprocess
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
 from urllib.parse import urlparse
 
-from .exceptions import GitHubAuthenticationError, InvalidPRUrlError, CodeRabbitFetcherError
+from .exceptions import (
+    GitHubAuthenticationError,
+    InvalidPRUrlError,
+    CodeRabbitFetcherError,
+    APIRateLimitError,
+    CircuitBreakerError,
+    TransportError,
+    TransportTimeoutError
+)
+from .github.auth import AuthCache, env_token, gh_login_fingerprint, parse_auth_user
+from .github.cache import CacheStats, CachingTransport, ResponseCache
+from .github.circuit_breaker import CircuitBreakerRegistry, CircuitBreakerTransport
+from .github.coordination import FetchCoordinator
+from .github.graphql import GraphQLPullRequestFetcher
+from .github.json_stream import iter_array_items
+from .github.pagination import DEFAULT_MAX_WORKERS, collect_pages
+from .github.rate_limit import RateLimitedTransport, RateLimitScheduler
+from .github.single_flight import (
+    DEFAULT_SINGLE_FLIGHT,
+    SingleFlight,
+    SingleFlightTransport,
+    credential_fingerprint,
+)
+from .github.transport import GitHubResponse, Transport, create_transport
+
+# Page size used for list endpoints (GitHub maximum)
+PER_PAGE = 100
+
+# Supported ways of fetching pull request comments
+FETCH_MODES = ("rest", "graphql")
+DEFAULT_FETCH_MODE = "graphql"
+
+# Retries of a single failing endpoint within one PR fetch
+DEFAULT_RETRY_ATTEMPTS = 2
+DEFAULT_RETRY_DELAY = 1.0
+
+logger = logging.getLogger(__name__)
 
 
 class GitHubAPIError(CodeRabbitFetcherError):
@@ -14,16 +54,402 @@ class GitHubAPIError(CodeRabbitFetcherError):
     pass
 
 
-class GitHubClient:
-    """Wrapper for GitHub CLI operations."""
+class GitHubServerError(GitHubAPIError):
+    """Exception raised when the GitHub API answers with a server error (5xx).
+
+    Unlike other API errors, these are worth retrying.
+    """
+    pass
+
+
+class RestEndpoint(NamedTuple):
+    """A REST request that is part of a pull request fetch."""
+
+    path: str
+    context: str
+    paginated: bool = False
+    params: Optional[Dict[str, Any]] = None
+
+
+class PullRequestDataMixin:
+    """Transport-independent request and response handling.
+
+    Shared by the blocking ``GitHubClient`` and the asyncio
+    ``AsyncGitHubClient``; nothing here performs network I/O.
+    """
+
+    #: Verified authentication shared between invocations (dropped on 401)
+    auth_cache: Optional[AuthCache] = None
+
+    def parse_pr_url(self, url: str) -> Tuple[str, str, str]:
+        """Parse GitHub pull request URL to extract components.
+
+        Args:
+            url: GitHub pull request URL
+
+        Returns:
+            Tuple of (owner, repo, pr_number)
+
+        Raises:
+            InvalidPRUrlError: If URL format is invalid
+        """
+        if not url:
+            raise InvalidPRUrlError("PR URL cannot be empty")
+
+        try:
+            parsed = urlparse(url)
+        except Exception:
+            raise InvalidPRUrlError(f"Invalid URL format: {url}")
+
+        if parsed.scheme not in ["http", "https"]:
+            raise InvalidPRUrlError("URL must use HTTP or HTTPS")
+
+        if "github.com" not in parsed.netloc.lower():
+            raise InvalidPRUrlError("URL must be a GitHub.com URL")
+
+        path_parts = [p for p in parsed.path.split("/") if p]
+        if len(path_parts) < 4 or path_parts[2] != "pull":
+            raise InvalidPRUrlError(
+                "URL must be a GitHub pull request URL "
+                "(e.g., https://github.com/owner/repo/pull/123)"
+            )
+
+        try:
+            pr_number = str(int(path_parts[3]))  # Validate it's a number
+        except ValueError:
+            raise InvalidPRUrlError("Pull request number must be a valid integer")
+
+        return path_parts[0], path_parts[1], pr_number
+
+    def assemble_pr_data(self, updates: Dict[str, Any], owner: str, repo: str,
+                         pr_number: str) -> Dict[str, Any]:
+        """Build the ``fetch_pr_comments`` result from ``fetch_pr_updates`` parts.
+
+        Args:
+            updates: Result of ``fetch_pr_updates`` (or a merged snapshot of it)
+            owner: Repository owner
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            PR data with comments and reviews (inline comments attached)
+        """
+        pr_data = {
+            key: value for key, value in updates["pull"].items()
+            if key not in ("comment_count", "review_comment_count")
+        }
+        pr_data["comments"] = list(updates["comments"])
+        pr_data["reviews"] = self._attach_review_comments(
+            [dict(review) for review in updates["reviews"]], updates["review_comments"]
+        )
+        return self._enhance_pr_data(pr_data, owner, repo, pr_number)
+
+    def _enhance_pr_data(self, pr_data: Dict[str, Any], owner: str, repo: str, pr_number: str) -> Dict[str, Any]:
+        """Enhance PR data with additional information if needed.
+
+        Args:
+            pr_data: Basic PR data from gh pr view
+            owner: Repository owner
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            Enhanced PR data
+        """
+        # Add metadata
+        pr_data.update({
+            "owner": owner,
+            "repo": repo,
+            "pr_number": pr_number,
+            "fetched_at": None  # Could add timestamp if needed
+        })
+
+        # Ensure comments field exists
+        if "comments" not in pr_data:
+            pr_data["comments"] = []
+
+        # Ensure reviews field exists
+        if "reviews" not in pr_data:
+            pr_data["reviews"] = []
+
+        return pr_data
+
+    @staticmethod
+    def _rest_endpoints(owner: str, repo: str, pr_number: str,
+                        since: Optional[str] = None) -> Dict[str, "RestEndpoint"]:
+        """Describe the independent REST requests making up a pull request's review data.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_number: Pull request number
+            since: Only request comments updated at or after this timestamp
+
+        Returns:
+            Endpoint per result key of ``_build_updates``
+        """
+        base_path = f"/repos/{owner}/{repo}"
+        since_params = {"since": since} if since else None
+        return {
+            "pull": RestEndpoint(f"{base_path}/pulls/{pr_number}", "Failed to fetch PR data"),
+            "comments": RestEndpoint(
+                f"{base_path}/issues/{pr_number}/comments", "Failed to fetch PR comments",
+                paginated=True, params=since_params
+            ),
+            "reviews": RestEndpoint(
+                f"{base_path}/pulls/{pr_number}/reviews", "Failed to fetch PR reviews", paginated=True
+            ),
+            "review_comments": RestEndpoint(
+                f"{base_path}/pulls/{pr_number}/comments", "Failed to fetch review comments",
+                paginated=True, params=since_params
+            ),
+        }
+
+    def _build_updates(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the ``fetch_pr_updates`` result from the raw REST resources.
+
+        Args:
+            results: Decoded ``pull``, ``comments``, ``reviews`` and
+                ``review_comments`` responses
+
+        Returns:
+            Dictionary in the ``fetch_pr_updates`` layout
+        """
+        pull = results["pull"]
+        summary = self._summarize_pull(pull)
+        summary["comment_count"] = pull.get("comments")
+        summary["review_comment_count"] = pull.get("review_comments")
+
+        return {
+            "pull": summary,
+            "comments": results["comments"],
+            "reviews": results["reviews"],
+            "review_comments": results["review_comments"]
+        }
+
+    def _page_items(self, response: GitHubResponse, context: str,
+                    pr_url: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Validate one page of a list endpoint and return its items."""
+        self._raise_for_status(response, context, pr_url)
+        page_items = response.json()
+        if not isinstance(page_items, list):
+            raise GitHubAPIError(f"{context}: unexpected response type {type(page_items).__name__}")
+        return page_items
+
+    def _graphql_data(self, response: GitHubResponse, context: str,
+                      pr_url: Optional[str] = None) -> Dict[str, Any]:
+        """Validate a GraphQL response and return its ``data`` member.
+
+        Raises:
+            GitHubAPIError: If the API returned an error
+            InvalidPRUrlError: If ``pr_url`` is given and the pull request does not exist
+            APIRateLimitError: If the rate limit is exceeded
+        """
+        self._raise_for_status(response, context, pr_url)
+        payload = response.json()
+
+        errors = payload.get("errors") or []
+        if errors:
+            error_types = {error.get("type") for error in errors}
+            message = "; ".join(error.get("message", "unknown error") for error in errors)
+            if "NOT_FOUND" in error_types and pr_url:
+                raise InvalidPRUrlError(f"Pull request not found: {pr_url} ({message})")
+            if "RATE_LIMITED" in error_types:
+                raise APIRateLimitError(f"{context}: {message}", reset_time=response.rate_limit_reset)
+            raise GitHubAPIError(f"{context}: {message}")
+
+        return payload.get("data") or {}
+
+    def _raise_for_status(self, response: GitHubResponse, context: str,
+                          pr_url: Optional[str] = None) -> None:
+        """Raise the matching exception for an unsuccessful response.
+
+        Args:
+            response: Transport response
+            context: Error message prefix
+            pr_url: PR URL reported when the API answers 404
+
+        Raises:
+            InvalidPRUrlError: If ``pr_url`` is given and the API returned 404
+            GitHubAuthenticationError: If the API rejected the credentials
+            APIRateLimitError: If the rate limit is exceeded
+            GitHubServerError: If the API answered with a server error
+            GitHubAPIError: For any other error status
+        """
+        if response.ok:
+            return
+
+        message = response.error_message
+        if response.status == 404 and pr_url:
+            raise InvalidPRUrlError(f"Pull request not found: {pr_url} ({message})")
+        if response.status == 401:
+            if self.auth_cache is not None:
+                self.auth_cache.invalidate()
+            raise GitHubAuthenticationError(f"GitHub authentication failed: {message}")
+        if response.is_rate_limited:
+            raise APIRateLimitError(f"{context}: {message}", reset_time=response.rate_limit_reset)
+        if response.status >= 500:
+            raise GitHubServerError(f"{context}: {message}")
+        raise GitHubAPIError(f"{context}: {message}")
+
+    @staticmethod
+    def _normalize_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a REST comment object to the fields exposed by this client."""
+        return {
+            "id": comment.get("id"),
+            "html_url": comment.get("html_url"),
+            "body": comment.get("body"),
+            "created_at": comment.get("created_at"),
+            "updated_at": comment.get("updated_at"),
+            "user": (comment.get("user") or {}).get("login"),
+            "node_id": comment.get("node_id")
+        }
+
+    @staticmethod
+    def _summarize_pull(pull: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a REST pull request object to the ``gh pr view`` field names."""
+        return {
+            "title": pull.get("title", ""),
+            "body": pull.get("body") or "",
+            "number": pull.get("number"),
+            "state": (pull.get("state") or "").upper(),
+            "url": pull.get("html_url", ""),
+            "author": {"login": (pull.get("user") or {}).get("login", "")},
+            "createdAt": pull.get("created_at"),
+            "updatedAt": pull.get("updated_at")
+        }
+
+    @staticmethod
+    def _attach_review_comments(
+        reviews: List[Dict[str, Any]],
+        review_comments: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Attach inline review comments to the review they belong to.
+
+        Args:
+            reviews: Review objects from ``/pulls/{n}/reviews``
+            review_comments: Comment objects from ``/pulls/{n}/comments``
+
+        Returns:
+            Reviews with ``created_at`` and a ``comments`` list
+        """
+        by_review: Dict[Any, List[Dict[str, Any]]] = {}
+        for comment in review_comments:
+            by_review.setdefault(comment.get("pull_request_review_id"), []).append(comment)
+
+        for review in reviews:
+            review.setdefault("created_at", review.get("submitted_at"))
+            review["comments"] = by_review.get(review.get("id"), [])
+
+        return reviews
+
+
+class GitHubClient(PullRequestDataMixin):
+    """Client for the GitHub API.
+
+    Requests go through a pluggable transport: ``"http"`` talks to the API
+    directly over pooled keep-alive connections (the GitHub CLI is only used
+    once to obtain a token), ``"gh"`` runs one ``gh api`` subprocess per call.
+
+    Pull request comments are fetched with a single paged GraphQL query
+    (``fetch_mode="graphql"``, the default) or from the REST endpoints.
+    """
+
+    def __init__(self, transport: Optional[Transport] = None, backend: str = "gh",
+                 fetch_mode: str = DEFAULT_FETCH_MODE, cache: Optional[ResponseCache] = None,
+                 refresh_cache: bool = False, retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+                 retry_delay: float = DEFAULT_RETRY_DELAY,
+                 scheduler: Optional[RateLimitScheduler] = None,
+                 auth_cache: Optional[AuthCache] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 coordinator: Optional[FetchCoordinator] = None):
+        """Initialize GitHub client and check authentication.
+
+        Args:
+            transport: Preconfigured transport (overrides ``backend``)
+            backend: Transport backend to create when no transport is given
+                ("http" or "gh")
+            fetch_mode: How ``fetch_pr_comments`` queries the API ("graphql" or "rest")
+            cache: Optional response cache used for conditional GET requests
+            refresh_cache: Ignore cached responses (fresh responses are still stored)
+            retry_attempts: Retries of an endpoint request that failed with an
+                API or transport error (other endpoints are not repeated)
+            retry_delay: Base delay in seconds between retries (doubled per retry)
+            scheduler: Rate limit scheduler pacing all requests (pass one
+                instance to clients sharing a token)
+            auth_cache: Optional store of verified logins; a fresh entry
+                replaces the ``gh auth status`` check
+            circuit_breakers: Circuit breakers failing requests fast during
+                outages (pass one registry to clients that should share them)
+            single_flight: Group coalescing identical concurrent requests and
+                PR fetches (by default shared by all clients of the process)
+            coordinator: Optional lock-file coordination sharing PR fetches
+                with other processes started at the same time
+        """
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode} (expected one of {', '.join(FETCH_MODES)})")
 
-    def __init__(self):
-        """Initialize GitHub client and check authentication."""
         self._authenticated = None
+        self.auth_cache = auth_cache
+        # User reported by the authentication check, if known
+        self.auth_user: Optional[str] = None
+        self.scheduler = scheduler if scheduler is not None else RateLimitScheduler()
+        self.circuit_breakers = (
+            circuit_breakers if circuit_breakers is not None else CircuitBreakerRegistry()
+        )
+        self.single_flight = single_flight if single_flight is not None else DEFAULT_SINGLE_FLIGHT
+        self.coordinator = coordinator
+        self._transport = transport
+        self.backend = transport.name if transport is not None else backend
+        self.fetch_mode = fetch_mode
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        # Concurrent page requests per list endpoint
+        self.max_page_workers = DEFAULT_MAX_WORKERS
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        # Seconds spent per endpoint (retries included) during the last PR fetch
+        self.last_fetch_timings: Dict[str, float] = {}
         self.check_authentication()
 
+    @property
+    def transport(self) -> Transport:
+        """Transport used for API requests (created on first use)."""
+        if self._transport is None:
+            self._transport = create_transport(self.backend)
+        if not isinstance(self._transport, (RateLimitedTransport, CircuitBreakerTransport,
+                                            CachingTransport, SingleFlightTransport)):
+            self._transport = CircuitBreakerTransport(
+                RateLimitedTransport(self._transport, self.scheduler), self.circuit_breakers
+            )
+        if self.cache is not None and not isinstance(self._transport, (CachingTransport, SingleFlightTransport)):
+            self._transport = CachingTransport(self._transport, self.cache, refresh=self.refresh_cache)
+        if not isinstance(self._transport, SingleFlightTransport):
+            self._transport = SingleFlightTransport(self._transport, self.single_flight)
+        return self._transport
+
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Response cache counters, or None when caching is disabled."""
+        return self.cache.stats if self.cache is not None else None
+
+    @property
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Remaining rate limit budget per resource and time spent throttled."""
+        return self.scheduler.stats()
+
+    @property
+    def circuit_breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """State and counters of each circuit breaker used so far."""
+        return self.circuit_breakers.stats()
+
     def check_authentication(self) -> bool:
-        """Check if GitHub CLI is authenticated.
+        """Check if the client is authenticated.
+
+        Transports carrying their own token are authenticated once the token
+        has been obtained. The ``gh`` backend trusts ``GH_TOKEN``/``GITHUB_TOKEN``
+        and a fresh ``auth_cache`` entry, and runs ``gh auth status`` otherwise.
 
         Returns:
             True if authenticated, False otherwise
@@ -34,6 +460,25 @@ class GitHubClient:
         if self._authenticated is not None:
             return self._authenticated
 
+        if self.backend != "gh":
+            # Raises GitHubAuthenticationError if no token can be obtained
+            self._authenticated = self.transport.has_credentials
+            if not self._authenticated:
+                raise GitHubAuthenticationError("No GitHub token available for API access")
+            return True
+
+        if env_token():
+            # The GitHub CLI uses the token from the environment as well
+            self._authenticated = True
+            return True
+
+        fingerprint = gh_login_fingerprint()
+        state = self.auth_cache.get("gh", fingerprint) if self.auth_cache is not None else None
+        if state is not None:
+            self.auth_user = state.user
+            self._authenticated = True
+            return True
+
         try:
             result = subprocess.run(
                 ["gh", "auth", "status"],
@@ -51,6 +496,9 @@ class GitHubClient:
                     error_msg += f". Error: {result.stderr.strip()}"
                 raise GitHubAuthenticationError(error_msg)
 
+            self.auth_user = parse_auth_user(f"{result.stdout}\n{result.stderr}")
+            if self.auth_cache is not None:
+                self.auth_cache.put("gh", fingerprint, self.auth_user)
             return True
 
         except subprocess.TimeoutExpired:
@@ -107,11 +555,17 @@ class GitHubClient:
         }
 
     def fetch_pr_comments(self, pr_url: str, timeout: Optional[int] = None) -> Dict[str, Any]:
-        """Fetch pull request comments using GitHub CLI.
+        """Fetch pull request data, comments and reviews.
+
+        Inline review comments are attached to their review under ``comments``.
+        In GraphQL mode the result additionally contains ``review_threads``
+        with the resolution state of every thread. In REST mode the pull
+        request, issue comments, reviews and review comments are fetched
+        concurrently.
 
         Args:
             pr_url: GitHub pull request URL
-            timeout: Timeout in seconds for GitHub CLI operations
+            timeout: Timeout in seconds for each API request
 
         Returns:
             Dictionary containing PR data and comments
@@ -123,40 +577,108 @@ class GitHubClient:
         self._ensure_authenticated()
         owner, repo, pr_number = self.parse_pr_url(pr_url)
 
+        # Concurrent fetches of the same PR (with the same credentials) share one,
+        # across processes as well when a coordinator is configured
+        key = ("fetch_pr_comments", credential_fingerprint(self.transport), self.fetch_mode,
+               owner.lower(), repo.lower(), pr_number)
+
+        def fetch() -> Dict[str, Any]:
+            if self.coordinator is None:
+                return self._fetch_pr_comments(pr_url, owner, repo, pr_number, timeout)
+            return self.coordinator.fetch(
+                json.dumps(key), lambda: self._fetch_pr_comments(pr_url, owner, repo, pr_number, timeout),
+                refresh=self.refresh_cache
+            )
+
+        return self.single_flight.do(key, fetch, copy=copy.deepcopy)
+
+    def _fetch_pr_comments(self, pr_url: str, owner: str, repo: str, pr_number: str,
+                           timeout: Optional[int]) -> Dict[str, Any]:
+        """Fetch pull request data without coalescing. See ``fetch_pr_comments``."""
+        actual_timeout = timeout if timeout is not None else 60
+
         try:
-            # Fetch PR data with comments
-            actual_timeout = timeout if timeout is not None else 60
-            result = subprocess.run([
-                "gh", "pr", "view", str(pr_number),
-                "--repo", f"{owner}/{repo}",
-                "--json", "title,body,number,state,url,comments,reviews"
-            ], capture_output=True, text=True, timeout=actual_timeout)
-
-            if result.returncode != 0:
-                error_msg = f"Failed to fetch PR data: {result.stderr.strip()}"
-                if "Not Found" in result.stderr:
+            if self.fetch_mode == "graphql":
+                fetcher = GraphQLPullRequestFetcher(
+                    lambda query, variables: self._graphql(
+                        query, variables, "Failed to fetch PR data",
+                        timeout=actual_timeout, pr_url=pr_url
+                    )
+                )
+                timings: Dict[str, float] = {}
+                try:
+                    pr_data = self._fetch_endpoint(
+                        "graphql", lambda: fetcher.fetch(owner, repo, int(pr_number)), timings
+                    )
+                except LookupError:
                     raise InvalidPRUrlError(f"Pull request not found: {pr_url}")
-                raise GitHubAPIError(error_msg)
-
-            pr_data = json.loads(result.stdout)
+                finally:
+                    self.last_fetch_timings = timings
+                return self._enhance_pr_data(pr_data, owner, repo, pr_number)
 
-            # Enhance with additional comment data if needed
-            return self._enhance_pr_data(pr_data, owner, repo, pr_number)
+            updates = self._fetch_rest_updates(owner, repo, pr_number, None, actual_timeout, pr_url)
+            return self.assemble_pr_data(updates, owner, repo, pr_number)
 
-        except subprocess.TimeoutExpired:
-            raise GitHubAPIError(f"GitHub CLI request timed out for {pr_url}")
+        except TransportTimeoutError:
+            raise GitHubAPIError(f"GitHub API request timed out for {pr_url}")
         except json.JSONDecodeError as e:
-            raise GitHubAPIError(f"Failed to parse GitHub CLI response: {e}")
+            raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
         except Exception as e:
-            if isinstance(e, (GitHubAPIError, InvalidPRUrlError)):
+            if isinstance(e, (GitHubAPIError, InvalidPRUrlError, APIRateLimitError,
+                              GitHubAuthenticationError, CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error fetching PR data: {e}")
 
-    def fetch_pr_review_comments(self, pr_url: str) -> List[Dict[str, Any]]:
+    def fetch_pr_updates(self, pr_url: str, since: Optional[str] = None,
+                         timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch pull request metadata and the comments updated since a point in time.
+
+        Uses the REST ``since`` filter on issue and review comments. Reviews
+        cannot be filtered and are always fetched completely.
+
+        Args:
+            pr_url: GitHub pull request URL
+            since: ISO 8601 timestamp; only comments updated at or after it
+                are returned (all comments when None)
+            timeout: Timeout in seconds for each API request
+
+        Returns:
+            Dictionary with ``pull`` (PR fields including the ``comment_count``
+            and ``review_comment_count`` totals), ``comments``, ``reviews``
+            and ``review_comments``
+
+        Raises:
+            GitHubAPIError: If fetching fails
+            InvalidPRUrlError: If PR URL is invalid
+        """
+        self._ensure_authenticated()
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
+        actual_timeout = timeout if timeout is not None else 60
+
+        try:
+            return self._fetch_rest_updates(owner, repo, pr_number, since, actual_timeout, pr_url)
+
+        except TransportTimeoutError:
+            raise GitHubAPIError(f"GitHub API request timed out for {pr_url}")
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
+        except Exception as e:
+            if isinstance(e, (GitHubAPIError, InvalidPRUrlError, APIRateLimitError,
+                              GitHubAuthenticationError, CircuitBreakerError)):
+                raise
+            raise GitHubAPIError(f"Unexpected error fetching PR updates: {e}")
+
+    def fetch_pr_review_comments(
+        self,
+        pr_url: str,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
         """Fetch pull request review comments separately for detailed analysis.
 
         Args:
             pr_url: GitHub pull request URL
+            predicate: Optional filter; when given, the comments are streamed
+                (see ``iter_pr_review_comments``) and only matching ones are kept
 
         Returns:
             List of review comment objects
@@ -164,123 +686,112 @@ class GitHubClient:
         Raises:
             GitHubAPIError: If fetching fails
         """
+        if predicate is not None:
+            return list(self.iter_pr_review_comments(pr_url, predicate))
+
         self._ensure_authenticated()
         owner, repo, pr_number = self.parse_pr_url(pr_url)
 
         try:
-            # Fetch detailed review comments
-            result = subprocess.run([
-                "gh", "api",
+            return self._get_paginated(
                 f"/repos/{owner}/{repo}/pulls/{pr_number}/comments",
-                "--paginate"
-            ], capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                raise GitHubAPIError(f"Failed to fetch review comments: {result.stderr.strip()}")
-
-            return json.loads(result.stdout)
+                "Failed to fetch review comments",
+                timeout=60
+            )
 
-        except subprocess.TimeoutExpired:
+        except TransportTimeoutError:
             raise GitHubAPIError(f"GitHub API request timed out for review comments")
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse review comments response: {e}")
         except Exception as e:
-            if isinstance(e, GitHubAPIError):
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error fetching review comments: {e}")
 
-    def post_comment(self, pr_url: str, comment: str) -> Dict[str, Any]:
-        """Post a comment to a pull request using GitHub REST API.
+    def iter_pr_review_comments(
+        self,
+        pr_url: str,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: float = 60
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream pull request review comments page by page, element by element.
+
+        Each comment is decoded as soon as its bytes arrive and dropped at
+        once unless ``predicate`` accepts it, so the complete response is
+        never held in memory. Pages are read one after another.
 
         Args:
             pr_url: GitHub pull request URL
-            comment: Comment text to post
+            predicate: Optional filter applied before a comment is yielded
+            timeout: Timeout in seconds per page (for the whole output with
+                the ``gh`` backend, which paginates itself)
 
-        Returns:
-            Dictionary with comment metadata including id, html_url, created_at
+        Yields:
+            Review comment objects
 
         Raises:
-            GitHubAPIError: If posting fails
+            GitHubAPIError: If fetching fails
         """
         self._ensure_authenticated()
         owner, repo, pr_number = self.parse_pr_url(pr_url)
 
         try:
-            # Use GitHub REST API to post comment
-            # POST /repos/{owner}/{repo}/issues/{issue_number}/comments
-            api_data = json.dumps({"body": comment})
-
-            result = subprocess.run([
-                "gh", "api",
-                f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
-                "--method", "POST",
-                "--input", "-"
-            ], input=api_data, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise GitHubAPIError(f"Failed to post comment via API: {result.stderr.strip()}")
-
-            # Parse JSON response from GitHub API
-            comment_data = json.loads(result.stdout)
-
-            return {
-                "id": comment_data.get("id"),
-                "html_url": comment_data.get("html_url"),
-                "body": comment_data.get("body"),
-                "created_at": comment_data.get("created_at"),
-                "updated_at": comment_data.get("updated_at"),
-                "user": comment_data.get("user", {}).get("login"),
-                "node_id": comment_data.get("node_id")
-            }
-
-        except subprocess.TimeoutExpired:
-            raise GitHubAPIError("GitHub API comment posting timed out")
+            for comment in self._iter_paginated(
+                f"/repos/{owner}/{repo}/pulls/{pr_number}/comments",
+                "Failed to fetch review comments",
+                timeout=timeout
+            ):
+                if predicate is None or predicate(comment):
+                    yield comment
+
+        except TransportTimeoutError:
+            raise GitHubAPIError("GitHub API request timed out for review comments")
         except json.JSONDecodeError as e:
-            raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
+            raise GitHubAPIError(f"Failed to parse review comments response: {e}")
         except Exception as e:
-            if isinstance(e, GitHubAPIError):
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
                 raise
-            raise GitHubAPIError(f"Unexpected error posting comment: {e}")
+            raise GitHubAPIError(f"Unexpected error fetching review comments: {e}")
 
-    def parse_pr_url(self, url: str) -> Tuple[str, str, str]:
-        """Parse GitHub pull request URL to extract components.
+    def post_comment(self, pr_url: str, comment: str) -> Dict[str, Any]:
+        """Post a comment to a pull request using GitHub REST API.
 
         Args:
-            url: GitHub pull request URL
+            pr_url: GitHub pull request URL
+            comment: Comment text to post
 
         Returns:
-            Tuple of (owner, repo, pr_number)
+            Dictionary with comment metadata including id, html_url, created_at
 
         Raises:
-            InvalidPRUrlError: If URL format is invalid
+            GitHubAPIError: If posting fails
         """
-        if not url:
-            raise InvalidPRUrlError("PR URL cannot be empty")
+        self._ensure_authenticated()
+        owner, repo, pr_number = self.parse_pr_url(pr_url)
 
         try:
-            parsed = urlparse(url)
-        except Exception:
-            raise InvalidPRUrlError(f"Invalid URL format: {url}")
-
-        if parsed.scheme not in ["http", "https"]:
-            raise InvalidPRUrlError("URL must use HTTP or HTTPS")
-
-        if "github.com" not in parsed.netloc.lower():
-            raise InvalidPRUrlError("URL must be a GitHub.com URL")
-
-        path_parts = [p for p in parsed.path.split("/") if p]
-        if len(path_parts) < 4 or path_parts[2] != "pull":
-            raise InvalidPRUrlError(
-                "URL must be a GitHub pull request URL "
-                "(e.g., https://github.com/owner/repo/pull/123)"
+            # POST /repos/{owner}/{repo}/issues/{issue_number}/comments
+            comment_data = self._request_json(
+                "POST",
+                f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
+                "Failed to post comment via API",
+                body={"body": comment},
+                timeout=30
             )
 
-        try:
-            pr_number = str(int(path_parts[3]))  # Validate it's a number
-        except ValueError:
-            raise InvalidPRUrlError("Pull request number must be a valid integer")
+            return self._normalize_comment(comment_data)
 
-        return path_parts[0], path_parts[1], pr_number
+        except TransportTimeoutError:
+            raise GitHubAPIError("GitHub API comment posting timed out")
+        except json.JSONDecodeError as e:
+            raise GitHubAPIError(f"Failed to parse GitHub API response: {e}")
+        except Exception as e:
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
+                raise
+            raise GitHubAPIError(f"Unexpected error posting comment: {e}")
 
     def get_pr_info(self, pr_url: str) -> Dict[str, Any]:
         """Get basic pull request information.
@@ -298,19 +809,11 @@ class GitHubClient:
         owner, repo, pr_number = self.parse_pr_url(pr_url)
 
         try:
-            result = subprocess.run([
-                "gh", "pr", "view", str(pr_number),
-                "--repo", f"{owner}/{repo}",
-                "--json", "title,body,number,state,url,author,createdAt,updatedAt"
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                error_msg = f"Failed to fetch PR info: {result.stderr.strip()}"
-                if "Not Found" in result.stderr:
-                    raise InvalidPRUrlError(f"Pull request not found: {pr_url}")
-                raise GitHubAPIError(error_msg)
-
-            pr_info = json.loads(result.stdout)
+            pull = self._get_json(
+                f"/repos/{owner}/{repo}/pulls/{pr_number}", "Failed to fetch PR info",
+                timeout=30, pr_url=pr_url
+            )
+            pr_info = self._summarize_pull(pull)
 
             # Add parsed URL components
             pr_info.update({
@@ -321,12 +824,13 @@ class GitHubClient:
 
             return pr_info
 
-        except subprocess.TimeoutExpired:
-            raise GitHubAPIError(f"GitHub CLI request timed out")
+        except TransportTimeoutError:
+            raise GitHubAPIError(f"GitHub API request timed out")
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse PR info response: {e}")
         except Exception as e:
-            if isinstance(e, (GitHubAPIError, InvalidPRUrlError)):
+            if isinstance(e, (GitHubAPIError, InvalidPRUrlError, APIRateLimitError,
+                              GitHubAuthenticationError, CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error fetching PR info: {e}")
 
@@ -342,24 +846,23 @@ class GitHubClient:
         self._ensure_authenticated()
 
         try:
-            result = subprocess.run([
-                "gh", "api", "/rate_limit"
-            ], capture_output=True, text=True, timeout=10)
+            return self._get_json("/rate_limit", "Failed to check rate limit", timeout=10)
 
-            if result.returncode != 0:
-                raise GitHubAPIError(f"Failed to check rate limit: {result.stderr.strip()}")
-
-            return json.loads(result.stdout)
-
-        except subprocess.TimeoutExpired:
+        except TransportTimeoutError:
             raise GitHubAPIError("Rate limit check timed out")
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse rate limit response: {e}")
         except Exception as e:
-            if isinstance(e, GitHubAPIError):
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error checking rate limit: {e}")
 
+    def close(self) -> None:
+        """Release transport resources (pooled connections)."""
+        if self._transport is not None:
+            self._transport.close()
+
     def _ensure_authenticated(self) -> None:
         """Ensure client is authenticated.
 
@@ -369,36 +872,6 @@ class GitHubClient:
         if not self.is_authenticated():
             raise GitHubAuthenticationError("GitHub CLI is not authenticated")
 
-    def _enhance_pr_data(self, pr_data: Dict[str, Any], owner: str, repo: str, pr_number: str) -> Dict[str, Any]:
-        """Enhance PR data with additional information if needed.
-
-        Args:
-            pr_data: Basic PR data from gh pr view
-            owner: Repository owner
-            repo: Repository name
-            pr_number: Pull request number
-
-        Returns:
-            Enhanced PR data
-        """
-        # Add metadata
-        pr_data.update({
-            "owner": owner,
-            "repo": repo,
-            "pr_number": pr_number,
-            "fetched_at": None  # Could add timestamp if needed
-        })
-
-        # Ensure comments field exists
-        if "comments" not in pr_data:
-            pr_data["comments"] = []
-
-        # Ensure reviews field exists
-        if "reviews" not in pr_data:
-            pr_data["reviews"] = []
-
-        return pr_data
-
     def validate_github_cli(self) -> Dict[str, Any]:
         """Validate GitHub CLI installation and configuration.
 
@@ -440,8 +913,11 @@ class GitHubClient:
         except Exception as e:
             validation_result["issues"].append(f"GitHub CLI validation error: {e}")
 
-        # Check authentication if gh is available
-        if validation_result["gh_installed"]:
+        # Check authentication if gh is available (reusing this client's check)
+        if validation_result["gh_installed"] and self._authenticated:
+            validation_result["authenticated"] = True
+            validation_result["auth_user"] = self.auth_user
+        elif validation_result["gh_installed"]:
             try:
                 auth_result = subprocess.run(
                     ["gh", "auth", "status"],
@@ -453,9 +929,9 @@ class GitHubClient:
                 if auth_result.returncode == 0:
                     validation_result["authenticated"] = True
                     # Try to extract username
-                    user_match = re.search(r'Logged in to github\.com as (\S+)', auth_result.stderr)
-                    if user_match:
-                        validation_result["auth_user"] = user_match.group(1)
+                    validation_result["auth_user"] = parse_auth_user(
+                        f"{auth_result.stdout}\n{auth_result.stderr}"
+                    )
                 else:
                     validation_result["issues"].append("GitHub CLI is not authenticated")
                     validation_result["recommendations"].append("Run 'gh auth login' to authenticate")
@@ -482,32 +958,21 @@ class GitHubClient:
         owner, repo, _ = self.parse_pr_url(pr_url)
 
         try:
-            result = subprocess.run([
-                "gh", "api",
-                f"/repos/{owner}/{repo}/issues/comments/{comment_id}"
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise GitHubAPIError(f"Failed to get comment {comment_id}: {result.stderr.strip()}")
-
-            comment_data = json.loads(result.stdout)
-
-            return {
-                "id": comment_data.get("id"),
-                "html_url": comment_data.get("html_url"),
-                "body": comment_data.get("body"),
-                "created_at": comment_data.get("created_at"),
-                "updated_at": comment_data.get("updated_at"),
-                "user": comment_data.get("user", {}).get("login"),
-                "node_id": comment_data.get("node_id")
-            }
+            comment_data = self._get_json(
+                f"/repos/{owner}/{repo}/issues/comments/{comment_id}",
+                f"Failed to get comment {comment_id}",
+                timeout=30
+            )
 
-        except subprocess.TimeoutExpired:
+            return self._normalize_comment(comment_data)
+
+        except TransportTimeoutError:
             raise GitHubAPIError("GitHub API comment retrieval timed out")
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse comment response: {e}")
         except Exception as e:
-            if isinstance(e, GitHubAPIError):
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error getting comment: {e}")
 
@@ -528,37 +993,238 @@ class GitHubClient:
         owner, repo, pr_number = self.parse_pr_url(pr_url)
 
         try:
-            result = subprocess.run([
-                "gh", "api",
+            comments = self._get_paginated(
                 f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
-                "--jq", f"sort_by(.created_at) | reverse | .[:{ limit }]"
-            ], capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise GitHubAPIError(f"Failed to get latest comments: {result.stderr.strip()}")
-
-            comments = json.loads(result.stdout)
+                "Failed to get latest comments",
+                timeout=30
+            )
 
-            # Normalize comment data
-            normalized_comments = []
-            for comment in comments:
-                normalized_comments.append({
-                    "id": comment.get("id"),
-                    "html_url": comment.get("html_url"),
-                    "body": comment.get("body"),
-                    "created_at": comment.get("created_at"),
-                    "updated_at": comment.get("updated_at"),
-                    "user": comment.get("user", {}).get("login"),
-                    "node_id": comment.get("node_id")
-                })
+            # The REST API returns comments oldest first
+            comments.sort(key=lambda c: c.get("created_at") or "", reverse=True)
 
-            return normalized_comments
+            return [self._normalize_comment(comment) for comment in comments[:limit]]
 
-        except subprocess.TimeoutExpired:
+        except TransportTimeoutError:
             raise GitHubAPIError("GitHub API latest comments retrieval timed out")
         except json.JSONDecodeError as e:
             raise GitHubAPIError(f"Failed to parse latest comments response: {e}")
         except Exception as e:
-            if isinstance(e, GitHubAPIError):
+            if isinstance(e, (GitHubAPIError, APIRateLimitError, GitHubAuthenticationError,
+                              CircuitBreakerError)):
                 raise
             raise GitHubAPIError(f"Unexpected error getting latest comments: {e}")
+
+    def _fetch_rest_updates(self, owner: str, repo: str, pr_number: str, since: Optional[str],
+                            timeout: float, pr_url: str) -> Dict[str, Any]:
+        """Fetch the REST resources making up a pull request's review data."""
+        def fetcher(endpoint: RestEndpoint) -> Callable[[], Any]:
+            if endpoint.paginated:
+                return lambda: self._get_paginated(
+                    endpoint.path, endpoint.context, timeout=timeout, pr_url=pr_url,
+                    params=endpoint.params
+                )
+            return lambda: self._get_json(endpoint.path, endpoint.context, timeout=timeout, pr_url=pr_url)
+
+        results = self._fetch_concurrently({
+            name: fetcher(endpoint)
+            for name, endpoint in self._rest_endpoints(owner, repo, pr_number, since).items()
+        })
+        return self._build_updates(results)
+
+    def _fetch_concurrently(self, endpoints: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Run independent endpoint fetches in parallel.
+
+        Args:
+            endpoints: Fetch function per endpoint name
+
+        Returns:
+            Result per endpoint name
+
+        Raises:
+            The error of the first endpoint (in ``endpoints`` order) that still
+            fails after its retries
+        """
+        transport = self.transport  # create the shared transport before the workers use it
+        timings: Dict[str, float] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=len(endpoints), thread_name_prefix="gh-fetch") as executor:
+                futures = {
+                    name: executor.submit(self._fetch_endpoint, name, fetch, timings)
+                    for name, fetch in endpoints.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+        finally:
+            self.last_fetch_timings = timings
+            logger.debug("Fetched %s via %s: %s", ", ".join(endpoints), transport.name,
+                         ", ".join(f"{name}={seconds:.2f}s" for name, seconds in timings.items()))
+
+    def _fetch_endpoint(self, name: str, fetch: Callable[[], Any],
+                        timings: Dict[str, float]) -> Any:
+        """Fetch one endpoint, retrying only this endpoint on transient errors.
+
+        Transport failures and server errors are retried; other API errors,
+        such as a 403 or 422, are raised at once.
+
+        Args:
+            name: Endpoint name used for timings and log messages
+            fetch: Performs the request(s) and returns the decoded result
+            timings: Receives the elapsed seconds under ``name``
+
+        Returns:
+            Result of ``fetch``
+        """
+        start = time.monotonic()
+        attempts = max(1, self.retry_attempts + 1)
+        try:
+            for attempt in range(attempts):
+                try:
+                    return fetch()
+                except (GitHubServerError, TransportError) as e:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = self.retry_delay * (2 ** attempt)
+                    logger.warning("Fetching %s failed (attempt %d/%d): %s; retrying in %.2fs",
+                                   name, attempt + 1, attempts, e, delay)
+                    time.sleep(delay)
+        finally:
+            timings[name] = time.monotonic() - start
+
+    def _request_json(
+        self,
+        method: str,
+        path: str,
+        context: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+        timeout: float = 30,
+        pr_url: Optional[str] = None
+    ) -> Any:
+        """Send a request through the transport and decode the JSON response.
+
+        Args:
+            method: HTTP method
+            path: API path
+            context: Error message prefix used when the request fails
+            params: Optional query parameters
+            body: Optional JSON request body
+            timeout: Timeout in seconds
+            pr_url: PR URL reported when the API answers 404
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            GitHubAPIError: If the API returned an error
+            InvalidPRUrlError: If ``pr_url`` is given and the API returned 404
+            APIRateLimitError: If the rate limit is exceeded
+            TransportTimeoutError: If the request timed out
+        """
+        response = self.transport.request(
+            method, path, params=params, body=body, timeout=timeout
+        )
+        self._raise_for_status(response, context, pr_url)
+        return response.json()
+
+    def _graphql(self, query: str, variables: Dict[str, Any], context: str,
+                 timeout: float = 30, pr_url: Optional[str] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its ``data`` member.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            context: Error message prefix used when the query fails
+            timeout: Timeout in seconds
+            pr_url: PR URL reported when the pull request does not exist
+
+        Returns:
+            The ``data`` member of the response
+
+        Raises:
+            GitHubAPIError: If the API returned an error
+            InvalidPRUrlError: If ``pr_url`` is given and the pull request does not exist
+            APIRateLimitError: If the rate limit is exceeded
+        """
+        response = self.transport.graphql(query, variables, timeout=timeout)
+        return self._graphql_data(response, context, pr_url)
+
+    def _get_json(self, path: str, context: str, timeout: float = 30,
+                  pr_url: Optional[str] = None) -> Any:
+        """GET a single API resource. See ``_request_json``."""
+        return self._request_json("GET", path, context, timeout=timeout, pr_url=pr_url)
+
+    def _iter_paginated(self, path: str, context: str, timeout: float = 30,
+                        pr_url: Optional[str] = None) -> Iterator[Any]:
+        """Stream the items of every page of a list endpoint.
+
+        Pages are decoded incrementally (``github.json_stream``) and followed
+        through their ``next`` links; the ``gh`` backend streams all pages
+        in one ``gh api --paginate`` call.
+
+        Args:
+            path: API path of the list endpoint
+            context: Error message prefix used when a request fails
+            timeout: Timeout in seconds per page
+            pr_url: PR URL reported when the API answers 404
+
+        Yields:
+            Items of all pages in order
+        """
+        url: Optional[str] = path
+        params: Optional[Dict[str, Any]] = {"per_page": PER_PAGE}
+        while url:
+            with self.transport.stream("GET", url, params=params, timeout=timeout, paginate=True) as response:
+                if not response.ok:
+                    self._raise_for_status(response.read(), context, pr_url)
+                yield from iter_array_items(response.iter_chunks())
+                url = response.links.get("next")
+            # The next URL already carries all query parameters
+            params = None
+
+    def _get_paginated(self, path: str, context: str, timeout: float = 30,
+                       pr_url: Optional[str] = None,
+                       params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """GET every page of a list endpoint.
+
+        When the transport provides ``Link`` headers, the pages after the
+        first are fetched concurrently (see ``github.pagination``). Otherwise
+        pages are requested one by one until a short page is returned.
+
+        Args:
+            path: API path of the list endpoint
+            context: Error message prefix used when a request fails
+            timeout: Timeout in seconds per page
+            pr_url: PR URL reported when the API answers 404
+            params: Additional query parameters (e.g. ``since``)
+
+        Returns:
+            Concatenated items of all pages
+        """
+        def parse(response: GitHubResponse) -> List[Dict[str, Any]]:
+            return self._page_items(response, context, pr_url)
+
+        base_params = dict(params or {}, per_page=PER_PAGE)
+        response = self.transport.request("GET", path, params=base_params, timeout=timeout)
+
+        if "link" in response.headers:
+            # The next/last URLs already carry all query parameters
+            return collect_pages(
+                response,
+                lambda url: self.transport.request("GET", url, timeout=timeout),
+                parse,
+                max_workers=self.max_page_workers
+            )
+
+        # No Link header (single page or GitHub CLI transport): request
+        # numbered pages until a short page is returned
+        items = parse(response)
+        page_items = items
+        page = 1
+        while len(page_items) >= PER_PAGE:
+            page += 1
+            response = self.transport.request(
+                "GET", path, params=dict(base_params, page=page), timeout=timeout
+            )
+            page_items = parse(response)
+            items.extend(page_items)
+
+        return items
@@ -0,0 +1,237 @@
+"""
+Multi-keyword matching for comment bodies.
+
+``KeywordAutomaton`` is an Aho–Corasick automaton: built once from a
+keyword set, it reports every occurrence of every keyword (overlapping
+ones included) in a single pass over a text. ``KeywordClassifier`` groups
+keywords into labels of several taxonomies on top of one automaton.
+
+``COMMENT_KEYWORDS`` holds the priority, severity, category and topic
+keywords used by the analyzers, processors and formatters: a body is
+scanned once for all of them, and the labels of recently seen bodies are
+memoized since the same body is classified by several components.
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Set, Tuple
+
+# Bodies whose labels are memoized per classifier
+_LABEL_CACHE_SIZE = 256
+
+
+class KeywordHit(NamedTuple):
+    """Occurrence of a keyword in a text (``text[start:end]``)."""
+
+    keyword: str
+    start: int
+    end: int
+
+
+def _fold(text: str) -> str:
+    """Lowercase a text without changing character positions."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # Some characters lowercase to several ("İ"); keep those as they are
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+def is_word_boundary(text: str, index: int) -> bool:
+    """Check for a word boundary before ``text[index]``, like ``\\b`` in a regex."""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == "_")
+    after = index < len(text) and (text[index].isalnum() or text[index] == "_")
+    return before != after
+
+
+class KeywordAutomaton:
+    """Aho–Corasick automaton over a fixed keyword set."""
+
+    def __init__(self, keywords: Iterable[str], case_sensitive: bool = False) -> None:
+        """Build the automaton.
+
+        Args:
+            keywords: Keywords to find (empty ones are ignored)
+            case_sensitive: Match the case of the keywords exactly
+        """
+        self.case_sensitive = case_sensitive
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for keyword in self.keywords:
+            state = 0
+            for ch in self._normalize(keyword):
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (keyword,)
+
+        # Failure links, folded into complete transitions (a DFA) breadth first
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, next_state in goto[state].items():
+                fail[next_state] = delta[fail[state]].get(ch, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+                queue.append(next_state)
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else _fold(text)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Find every occurrence of every keyword.
+
+        Returns:
+            Hits ordered by end position
+        """
+        delta, outputs = self._delta, self._outputs
+        hits = []
+        state = 0
+        for index, ch in enumerate(self._normalize(text)):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                end = index + 1
+                hits.extend(KeywordHit(keyword, end - len(keyword), end) for keyword in outputs[state])
+        return hits
+
+    def found(self, text: str) -> Set[str]:
+        """Get the keywords occurring in a text."""
+        return {hit.keyword for hit in self.find_all(text)}
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any keyword occurs, stopping at the first one."""
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for ch in self._normalize(text):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                return True
+        return False
+
+
+class KeywordClassifier:
+    """Labels texts from keyword groups, scanning each text once.
+
+    Taxonomies map labels, in priority order, to their keywords; a keyword
+    may belong to labels of several taxonomies.
+    """
+
+    def __init__(self, taxonomies: Mapping[str, Mapping[str, Iterable[str]]],
+                 case_sensitive: bool = False) -> None:
+        """Build the classifier.
+
+        Args:
+            taxonomies: Taxonomy name -> label -> keywords
+            case_sensitive: Match the case of the keywords exactly
+        """
+        self.taxonomies = {
+            taxonomy: {label: tuple(keywords) for label, keywords in labels.items()}
+            for taxonomy, labels in taxonomies.items()
+        }
+        self._labels_of: Dict[str, List[Tuple[str, str]]] = {}
+        for taxonomy, labels in self.taxonomies.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    self._labels_of.setdefault(keyword, []).append((taxonomy, label))
+
+        self.automaton = KeywordAutomaton(self._labels_of, case_sensitive=case_sensitive)
+        self._classify = lru_cache(maxsize=_LABEL_CACHE_SIZE)(self._compute)
+
+    def _compute(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        found: Dict[str, Set[str]] = {taxonomy: set() for taxonomy in self.taxonomies}
+        for keyword in self.automaton.found(text):
+            for taxonomy, label in self._labels_of[keyword]:
+                found[taxonomy].add(label)
+        return {
+            taxonomy: tuple(label for label in self.taxonomies[taxonomy] if label in found[taxonomy])
+            for taxonomy in self.taxonomies
+        }
+
+    def classify(self, text: str) -> Dict[str, Tuple[str, ...]]:
+        """Get the labels of every taxonomy found in a text, in priority order."""
+        return self._classify(text)
+
+    def labels(self, text: str, taxonomy: str) -> Tuple[str, ...]:
+        """Get the labels of one taxonomy found in a text, in priority order."""
+        return self._classify(text)[taxonomy]
+
+    def first(self, text: str, taxonomy: str, default: str) -> str:
+        """Get the highest priority label of a taxonomy, or ``default`` if none is found."""
+        labels = self._classify(text)[taxonomy]
+        return labels[0] if labels else default
+
+
+#: Keywords of the comment classifications, matched case-insensitively as substrings
+COMMENT_KEYWORDS = KeywordClassifier({
+    # Priority shown by the formatters
+    "priority": {
+        "High": [
+            "critical", "security", "vulnerability", "error", "exception",
+            "breaking", "urgent", "important", "must fix", "required"
+        ],
+        "Medium": [
+            "should", "recommend", "suggest", "improve", "optimize",
+            "performance", "consider", "enhancement"
+        ],
+    },
+    # Severity of outside diff comments
+    "severity": {
+        "high": ["critical", "security", "vulnerability", "error"],
+        "medium": ["warning", "important", "should"],
+    },
+    # Priority of analyzed review comments
+    "analysis_priority": {
+        "critical": [
+            "security", "vulnerability", "critical", "urgent", "breaking",
+            "セキュリティ", "脆弱性", "重要", "緊急", "致命的"
+        ],
+        "high": [
+            "error", "bug", "issue", "problem", "failure", "fix",
+            "エラー", "バグ", "問題", "不具合", "修正"
+        ],
+        "medium": [
+            "improvement", "optimize", "refactor", "performance",
+            "改善", "最適化", "リファクタリング", "性能"
+        ],
+        "low": [
+            "style", "formatting", "convention", "documentation",
+            "スタイル", "フォーマット", "規約", "ドキュメント"
+        ],
+    },
+    # Category of analyzed review comments ("comment" vetoes "documentation")
+    "category": {
+        "refactor": ["refactor", "リファクタリング", "restructure"],
+        "security": ["security", "セキュリティ", "vulnerability", "脆弱性"],
+        "performance": ["performance", "性能", "optimize", "最適化"],
+        "style": ["style", "format", "スタイル", "フォーマット"],
+        "documentation": ["documentation", "ドキュメント"],
+        "comment": ["comment", "コメント"],
+    },
+    # Topics of CodeRabbit comments in a thread
+    "topic": {
+        "security": ["security"],
+        "performance": ["performance"],
+        "refactoring": ["refactor"],
+        "testing": ["test"],
+        "documentation": ["documentation"],
+        "error handling": ["error handling"],
+        "validation": ["validation"],
+        "async programming": ["async", "await"],
+        "database": ["database"],
+        "API": ["api"],
+        "UI": ["ui", "user interface"],
+        "code style": ["style", "formatting"],
+    },
+})
@@ -0,0 +1,198 @@
+"""
+CLI launcher forwarding to a running analysis server.
+
+The ``coderabbit-fetch`` entry point starts here. When an analysis server
+(``coderabbit-fetch server``) is running, the invocation is sent to it and
+the answer written out, so the call pays neither the import of the analysis
+stack nor authentication and persona loading. Invocations the server cannot
+run (batch mode, snapshots, posting, ...) and any connection failure fall
+back to the regular CLI. This module only uses the standard library.
+"""
+
+import http.client
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .storage import get_cache_dir
+
+#: Environment variable overriding the server address (``unix:<path>`` or ``http://host:port``)
+SERVER_ENV = "CODERABBIT_SERVER"
+
+#: Environment variable overriding the server's access token
+TOKEN_ENV = "CODERABBIT_SERVER_TOKEN"
+
+#: File in the ``server`` cache directory holding the address of the running server
+ADDRESS_FILE = "address"
+
+#: File in the ``server`` cache directory holding the access token (readable by its owner only)
+TOKEN_FILE = "token"
+
+#: Default Unix socket in the ``server`` cache directory
+SOCKET_FILE = "server.sock"
+
+# Commands never forwarded
+LOCAL_COMMANDS = ("server", "serve-webhooks")
+
+# Seconds allowed to reach the server before running locally
+CONNECT_TIMEOUT = 1.0
+
+# Seconds allowed for a forwarded analysis
+RESPONSE_TIMEOUT = 900.0
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def server_address() -> Optional[str]:
+    """Get the address of the running server, or None if none is published."""
+    address = os.environ.get(SERVER_ENV)
+    if address:
+        return address
+    try:
+        return (get_cache_dir("server") / ADDRESS_FILE).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def server_token() -> Optional[str]:
+    """Get the access token of the running server, or None if it cannot be read."""
+    token = os.environ.get(TOKEN_ENV)
+    if token:
+        return token
+    try:
+        return (get_cache_dir("server") / TOKEN_FILE).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def request_server(address: str, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                   timeout: float = RESPONSE_TIMEOUT, token: Optional[str] = None) -> Dict[str, Any]:
+    """Send a JSON request to the server.
+
+    Args:
+        address: Server address (``unix:<path>`` or ``http://host:port``)
+        method: HTTP method
+        path: Request path with query string
+        payload: JSON body
+        timeout: Seconds allowed for the answer
+        token: Access token of the server
+
+    Raises:
+        OSError: If the server cannot be reached
+        ValueError: If the answer is not JSON
+    """
+    if address.startswith("unix:"):
+        connection: http.client.HTTPConnection = _UnixHTTPConnection(address[len("unix:"):], CONNECT_TIMEOUT)
+    else:
+        host_port = address.split("://", 1)[-1].rstrip("/")
+        connection = http.client.HTTPConnection(host_port, timeout=CONNECT_TIMEOUT)
+
+    try:
+        connection.connect()
+        connection.sock.settimeout(timeout)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return json.loads(response.read().decode("utf-8"))
+    except http.client.HTTPException as e:
+        raise OSError(f"Invalid answer from server: {e}") from e
+    finally:
+        connection.close()
+
+
+def forward_to_server(argv: List[str]) -> Optional[int]:
+    """Run a CLI invocation on the running server.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Exit code, or None if the invocation has to run locally
+    """
+    if not argv or argv[0] in LOCAL_COMMANDS or "--no-server" in argv:
+        return None
+    address = server_address()
+    if address is None:
+        return None
+
+    try:
+        result = request_server(address, "POST", "/cli", {"argv": argv, "cwd": os.getcwd()},
+                                token=server_token())
+    except (OSError, ValueError):
+        # Not running (any more) or not answering: run locally
+        return None
+    if not result.get("handled"):
+        # Includes requests the server refused (e.g. a stale token): run locally
+        return None
+
+    if not result.get("success"):
+        if result.get("issues"):
+            print("❌ Configuration validation failed:", file=sys.stderr)
+            for issue in result["issues"]:
+                print(f"   • {issue}", file=sys.stderr)
+            return 1
+        print(f"\n❌ Processing failed: {result.get('error')}", file=sys.stderr)
+        if result.get("recommendations"):
+            print("\n💡 Recommended actions:", file=sys.stderr)
+            for rec in result["recommendations"]:
+                print(f"   {rec}", file=sys.stderr)
+        return 1
+
+    output_file = result.get("output_file")
+    if output_file:
+        try:
+            _write_atomic(Path(output_file), result["content"])
+        except OSError as e:
+            print(f"\n❌ Failed to write output: {e}", file=sys.stderr)
+            return 1
+    else:
+        print(result["content"])
+    print(f"\n✅ Processing completed successfully in {result.get('execution_time', 0):.2f}s (server)!")
+    return 0
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def main() -> int:
+    """Entry point: forward to the server when possible, otherwise run the CLI."""
+    exit_code = forward_to_server(sys.argv[1:])
+    if exit_code is not None:
+        return exit_code
+
+    from .cli.main import main as cli_main
+    return cli_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
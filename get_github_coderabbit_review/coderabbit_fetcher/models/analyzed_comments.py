@@ -2,9 +2,9 @@
 Main analyzed comments data model.
 """
 
-from typing import List
+from typing import Any, List
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from .base import BaseCodeRabbitModel
 from .comment_metadata import CommentMetadata
 from .summary_comment import SummaryComment
@@ -24,6 +24,9 @@ class AnalyzedComments(BaseCodeRabbitModel):
     unresolved_threads: List[ThreadContext] = Field(default_factory=list)
     metadata: CommentMetadata
 
+    # Origin of the results, for ``CommentAnalyzer.apply_delta``
+    _analysis_state: Any = PrivateAttr(default=None)
+
     @property
     def has_summary(self) -> bool:
         """Check if analysis contains summary comments.
@@ -2,9 +2,104 @@
 Base classes for data models.
 """
 
-from typing import Any, Dict
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, List, NamedTuple, Tuple, Type, TypeVar, Union, get_args, get_origin
+)
+
 from pydantic import BaseModel, ConfigDict
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _ConstructionPlan(NamedTuple):
+    """Which fields validation would normalize."""
+
+    strings: Tuple[str, ...]
+    string_lists: Tuple[str, ...]
+    enums: Tuple[str, ...]
+    defaults: Tuple[Tuple[str, Any], ...]
+    factories: Tuple[Tuple[str, Callable[[], Any]], ...]
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Get ``X`` from ``Optional[X]``."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def _construction_plan(model_class: Type[BaseModel]) -> _ConstructionPlan:
+    """Work out once per model which fields validation would normalize.
+
+    Returns:
+        Construction plan; ``defaults`` holds the defaults that validation
+        changes, other defaults are left to ``model_construct``
+    """
+    config = model_class.model_config
+    strip = config.get("str_strip_whitespace", False)
+    enum_values = config.get("use_enum_values", False)
+    strings, string_lists, enums, defaults, factories = [], [], [], [], []
+    for name, field in model_class.model_fields.items():
+        annotation = _unwrap_optional(field.annotation)
+        if strip and annotation is str:
+            strings.append(name)
+        elif strip and get_origin(annotation) in (list, List) and get_args(annotation) == (str,):
+            string_lists.append(name)
+        elif enum_values and isinstance(annotation, type) and issubclass(annotation, Enum):
+            enums.append(name)
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif config.get("validate_default") and not field.is_required():
+            default = field.default
+            if isinstance(default, str) and name in strings and default != default.strip():
+                defaults.append((name, default.strip()))
+            elif isinstance(default, Enum) and name in enums:
+                defaults.append((name, default.value))
+    return _ConstructionPlan(tuple(strings), tuple(string_lists), tuple(enums), tuple(defaults), tuple(factories))
+
+
+def construct_model(model_class: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """Build a model from trusted data without validation.
+
+    Strings are stripped and enums stored as values where the model
+    configuration asks validation to do so (dictionary keys are kept),
+    so the result equals a validated model. The model is then built
+    with ``model_construct``.
+
+    Args:
+        model_class: Model to build
+        data: Field values by field name, already of the field types
+
+    Returns:
+        Model instance
+    """
+    plan = _construction_plan(model_class)
+    values = dict(data)
+    for name in plan.strings:
+        value = values.get(name)
+        if isinstance(value, str):
+            values[name] = value.strip()
+    for name in plan.string_lists:
+        value = values.get(name)
+        if isinstance(value, list):
+            values[name] = [item.strip() if isinstance(item, str) else item for item in value]
+    for name in plan.enums:
+        value = values.get(name)
+        if isinstance(value, Enum):
+            values[name] = value.value
+    for name, default in plan.defaults:
+        values.setdefault(name, default)
+    # model_construct inspects the signature of a default factory on every call
+    for name, factory in plan.factories:
+        if name not in values:
+            values[name] = factory()
+    return model_class.model_construct(_fields_set=set(data), **values)
+
 
 class BaseCodeRabbitModel(BaseModel):
     """Base model for all CodeRabbit data structures.
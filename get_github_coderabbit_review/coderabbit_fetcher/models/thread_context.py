@@ -7,7 +7,7 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 
 from pydantic import Field
-from .base import BaseCodeRabbitModel
+from .base import BaseCodeRabbitModel, construct_model
 
 
 class ResolutionStatus(str, Enum):
@@ -43,6 +43,29 @@ class ThreadContext(BaseCodeRabbitModel):
         if not self.chronological_order:
             self.chronological_order = self._build_chronological_order()
 
+    @classmethod
+    def trusted(cls, **data: Any) -> "ThreadContext":
+        """Build a thread from comments grouped by this package, without validation.
+
+        Validation copies the comment dictionaries and checks the derived
+        fields again when they are assigned, which is most of the cost of
+        processing a thread. Like the constructor, generates the summary
+        and chronological order when they are not given.
+
+        Args:
+            **data: Field values, already of the field types
+
+        Returns:
+            Thread context
+        """
+        thread = construct_model(cls, data)
+        derived: Dict[str, Any] = {}
+        if not thread.contextual_summary:
+            derived["contextual_summary"] = thread._generate_contextual_summary()
+        if not thread.chronological_order:
+            derived["chronological_order"] = thread._build_chronological_order()
+        return thread.model_copy(update=derived) if derived else thread
+
     def _generate_contextual_summary(self) -> str:
         """Generate a contextual summary of the thread.
 
@@ -1,26 +1,43 @@
 """Main orchestration logic for CodeRabbit Comment Fetcher."""
 
+import asyncio
+import json
+import sys
 import time
 import logging
 import random
-from typing import Dict, List, Optional, Any, Callable
+import sqlite3
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, TextIO, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 
 from .exceptions import (
+    CircuitBreakerError,
     CodeRabbitFetcherError,
     GitHubAuthenticationError,
     InvalidPRUrlError,
     PersonaFileError,
-    CommentAnalysisError
+    CommentAnalysisError,
+    SnapshotError
 )
-from .github_client import GitHubClient, GitHubAPIError
+from .async_github_client import AsyncGitHubClient
+from .github_client import DEFAULT_FETCH_MODE, GitHubClient, GitHubAPIError, PullRequestDataMixin
+from .github.auth import AuthCache
+from .github.cache import CacheStats, ResponseCache
+from .github.coordination import FetchCoordinator
+from .github.sync import IncrementalSyncer, SnapshotStore
+from .snapshot import PRSnapshot, load_pr_snapshot, save_pr_snapshot
+from .storage import get_cache_dir
 from .comment_analyzer import CommentAnalyzer
+from .parse_cache import ParseCache
 from .persona_manager import PersonaManager
 from .formatters import MarkdownFormatter, JSONFormatter, PlainTextFormatter
 from .resolved_marker import ResolvedMarkerManager, ResolvedMarkerConfig
 from .comment_poster import ResolutionRequestManager, ResolutionRequestConfig
-from .models import AnalyzedComments, CommentMetadata
+from .models import AnalyzedComments, CommentMetadata, ResolutionStatus
+from .thread_index import narrow_analysis
+from .watch import AdaptiveInterval, content_hash, thread_events, thread_state
 
 
 # Configure logging
@@ -41,6 +58,28 @@ class ExecutionConfig:
     timeout_seconds: int = 300
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    backend: str = 'http'
+    fetch_mode: str = DEFAULT_FETCH_MODE
+    use_cache: bool = True
+    refresh_cache: bool = False
+    incremental: bool = False
+    coordination_wait: float = 30.0
+    coordination_ttl: float = 0.0
+    snapshot_input: Optional[str] = None
+    snapshot_output: Optional[str] = None
+    # Return the formatted output in ``output_info["content"]`` instead of printing it
+    capture_output: bool = False
+    # Poll interval in seconds of ``watch``
+    watch_interval: Optional[float] = None
+    # Print NDJSON thread change events while watching
+    watch_events: bool = False
+    # Worker processes parsing the comments of large pull requests
+    jobs: int = 1
+    # Only report the threads on files matching this glob, updated since this
+    # time, or with this resolution status
+    thread_path: Optional[str] = None
+    thread_since: Optional[datetime] = None
+    thread_status: Optional[str] = None
 
 
 @dataclass
@@ -50,12 +89,17 @@ class ExecutionMetrics:
     end_time: Optional[float] = None
     github_api_calls: int = 0
     github_api_time: float = 0.0
+    github_endpoint_times: Dict[str, float] = field(default_factory=dict)
     analysis_time: float = 0.0
     formatting_time: float = 0.0
     total_comments_processed: int = 0
     coderabbit_comments_found: int = 0
     resolved_comments_filtered: int = 0
     output_size_bytes: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    rate_limit: Dict[str, Any] = field(default_factory=dict)
+    circuit_breakers: Dict[str, Any] = field(default_factory=dict)
     errors_encountered: List[str] = field(default_factory=list)
     warnings_issued: List[str] = field(default_factory=list)
 
@@ -144,6 +188,7 @@ class CodeRabbitOrchestrator:
         self.resolved_marker_manager: Optional[ResolvedMarkerManager] = None
         self.resolution_request_manager: Optional[ResolutionRequestManager] = None
         self.formatters: Dict[str, Any] = {}
+        self._persona: Optional[str] = None
 
         # Execution state
         self.progress_tracker = ProgressTracker()
@@ -176,9 +221,14 @@ class CodeRabbitOrchestrator:
             self.progress_tracker.advance("Initializing components")
             self._initialize_components()
 
-            # Phase 2: Authentication & Validation
-            self.progress_tracker.advance("Validating GitHub CLI authentication")
-            self._validate_github_authentication()
+            # Phase 2: Authentication & Validation (offline snapshots need neither)
+            snapshot = None
+            if self.config.snapshot_input:
+                self.progress_tracker.advance("Loading PR snapshot")
+                snapshot = self._load_snapshot()
+            else:
+                self.progress_tracker.advance("Validating GitHub CLI authentication")
+                self._validate_github_authentication()
 
             # Phase 3: PR URL Validation
             self.progress_tracker.advance("Parsing and validating PR URL")
@@ -189,8 +239,14 @@ class CodeRabbitOrchestrator:
             persona = self._load_persona()
 
             # Phase 5: Data Fetching
-            self.progress_tracker.advance("Fetching PR data from GitHub")
-            pr_data = self._fetch_pr_data()
+            if snapshot is not None:
+                self.progress_tracker.advance("Using PR data from snapshot")
+                pr_data = snapshot.pr_data
+            else:
+                self.progress_tracker.advance("Fetching PR data from GitHub")
+                pr_data = self._fetch_pr_data()
+            if self.config.snapshot_output:
+                self._save_snapshot(pr_data)
 
             # Phase 6: Analysis
             self.progress_tracker.advance("Analyzing CodeRabbit comments")
@@ -208,43 +264,300 @@ class CodeRabbitOrchestrator:
             resolution_info = None
             if self.config.post_resolution_request:
                 resolution_info = self._post_resolution_request(analyzed_comments)
+                self._record_rate_limit(self.github_client)
+                self._record_circuit_breakers(self.github_client)
 
-            # Complete execution
-            self.progress_tracker.complete()
-            self.metrics.end_time = time.time()
-
-            # Prepare results
-            results = {
-                "success": True,
-                "pr_info": pr_info,
-                "analyzed_comments": analyzed_comments,
-                "output_info": output_info,
-                "resolution_info": resolution_info,
-                "metrics": self._get_metrics_summary(),
-                "execution_time": self.metrics.total_execution_time
-            }
+            return self._success_results(pr_info, analyzed_comments, output_info, resolution_info)
+
+        except Exception as e:
+            return self._failure_results(e)
 
-            logger.info(f"Execution completed successfully in {self.metrics.total_execution_time:.2f}s")
-            return results
+    async def execute_async(self, github_client: Optional[AsyncGitHubClient] = None) -> Dict[str, Any]:
+        """Execute the workflow on the running event loop.
+
+        Same phases and result layout as ``execute``, but GitHub requests go
+        through ``AsyncGitHubClient`` and never block the loop. Analysis and
+        formatting are CPU-bound and run inline.
+
+        Args:
+            github_client: Client shared with other executions; when omitted a
+                client is created from the configuration and closed afterwards
+
+        Returns:
+            Dictionary with execution results and metrics
+        """
+        logger.info("Starting CodeRabbit Comment Fetcher execution (async)")
+        owns_client = github_client is None
+
+        try:
+            self.progress_tracker.advance("Initializing components")
+            if not self.is_initialized:
+                self._initialize_components()
+
+            snapshot = None
+            if self.config.snapshot_input:
+                self.progress_tracker.advance("Loading PR snapshot")
+                snapshot = self._load_snapshot()
+            else:
+                self.progress_tracker.advance("Validating GitHub CLI authentication")
+                if github_client is None:
+                    github_client = self.create_async_github_client()
+                start_time = time.time()
+                await github_client.check_authentication()
+                self.metrics.github_api_time += time.time() - start_time
+                self.metrics.github_api_calls += 1
+
+            self.progress_tracker.advance("Parsing and validating PR URL")
+            pr_info = self._validate_pr_url(github_client)
+
+            self.progress_tracker.advance("Loading persona configuration")
+            persona = self._persona if self._persona is not None else self._load_persona()
+
+            if snapshot is not None:
+                self.progress_tracker.advance("Using PR data from snapshot")
+                pr_data = snapshot.pr_data
+            else:
+                self.progress_tracker.advance("Fetching PR data from GitHub")
+                pr_data = await self._fetch_pr_data_async(github_client)
+            if self.config.snapshot_output:
+                self._save_snapshot(pr_data)
+
+            # CPU-bound steps run in a worker thread so the event loop keeps serving
+            # the other executions
+            self.progress_tracker.advance("Analyzing CodeRabbit comments")
+            analyzed_comments = await asyncio.to_thread(self._analyze_comments, pr_data)
+
+            self.progress_tracker.advance("Formatting output")
+            formatted_content = await asyncio.to_thread(self._format_output, persona, analyzed_comments)
+
+            self.progress_tracker.advance("Writing results")
+            output_info = self._write_output(formatted_content)
+
+            resolution_info = None
+            if self.config.post_resolution_request:
+                resolution_info = await self._post_resolution_request_async(github_client, analyzed_comments)
+                self._record_rate_limit(github_client)
+                self._record_circuit_breakers(github_client)
+
+            return self._success_results(pr_info, analyzed_comments, output_info, resolution_info)
 
         except Exception as e:
-            self.metrics.errors_encountered.append(str(e))
-            self.metrics.end_time = time.time()
-
-            logger.exception("Execution failed")
-
-            # Attempt graceful error recovery
-            recovery_info = self._attempt_error_recovery(e)
-
-            # Return failure results with recovery information
-            return {
-                "success": False,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "recovery_info": recovery_info,
-                "metrics": self._get_metrics_summary(),
-                "execution_time": self.metrics.total_execution_time
-            }
+            return self._failure_results(e)
+        finally:
+            if owns_client and github_client is not None:
+                await github_client.aclose()
+
+    def watch(self, max_polls: Optional[int] = None, sleep: Callable[[float], None] = time.sleep,
+              event_stream: Optional[TextIO] = None) -> Dict[str, Any]:
+        """Poll the pull request and re-emit the output only when the analysis changes.
+
+        Polls use conditional REST requests through the response cache and
+        always see fresh data (no coordination with other processes). The
+        analysis runs only when the fetched data changed, and the output is
+        rewritten (atomically when it is a file) only when the formatted
+        content changed. The interval stretches while the PR is quiet and
+        resets on activity. Stops on Ctrl-C or after ``max_polls`` polls.
+
+        Args:
+            max_polls: Stop after this many polls (unlimited when None)
+            sleep: Function waiting between polls
+            event_stream: Stream receiving NDJSON thread events when
+                ``watch_events`` is set (stdout by default)
+
+        Returns:
+            Dictionary with the watch statistics and metrics
+        """
+        logger.info(f"Watching {self.config.pr_url} every {self.config.watch_interval}s")
+        stats = {"polls": 0, "data_changes": 0, "writes": 0, "events": 0, "errors": 0}
+        stream = event_stream or sys.stdout
+
+        try:
+            interval = AdaptiveInterval(self.config.watch_interval or 0)
+            if self.config.fetch_mode != "rest":
+                logger.info("Watch mode polls with conditional REST requests")
+                self.config.fetch_mode = "rest"
+            self.config.coordination_wait = 0
+            self._initialize_components()
+            self._validate_github_authentication()
+            pr_info = self._validate_pr_url()
+            persona = self._load_persona()
+        except Exception as e:
+            return self._failure_results(e)
+
+        data_hash = output_hash = None
+        threads: Dict[str, Any] = {}
+        try:
+            while max_polls is None or stats["polls"] < max_polls:
+                if stats["polls"]:
+                    sleep(interval.current)
+                stats["polls"] += 1
+
+                try:
+                    pr_data = self._fetch_pr_data()
+                except CodeRabbitFetcherError as e:
+                    # Retrying does not help once authentication is gone
+                    if isinstance(e, GitHubAuthenticationError) or isinstance(e.__cause__, GitHubAuthenticationError):
+                        raise
+                    stats["errors"] += 1
+                    logger.warning(f"Poll failed, retrying in {interval.record(False):.0f}s: {e}")
+                    continue
+
+                new_data_hash = content_hash(pr_data)
+                interval.record(new_data_hash != data_hash)
+                if new_data_hash == data_hash:
+                    logger.debug("No changes since the last poll")
+                    continue
+                data_hash = new_data_hash
+                stats["data_changes"] += 1
+
+                analyzed_comments = self._analyze_comments(pr_data)
+                formatted_content = self._format_output(persona, analyzed_comments)
+                new_output_hash = content_hash(formatted_content)
+                if new_output_hash != output_hash:
+                    output_hash = new_output_hash
+                    # With events on stdout, the content only goes to a file
+                    if self.config.output_file or not self.config.watch_events:
+                        self._write_output(formatted_content)
+                        stats["writes"] += 1
+
+                if self.config.watch_events:
+                    current = thread_state(analyzed_comments.unresolved_threads)
+                    for event in thread_events(threads, current, self.config.pr_url):
+                        stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+                        stats["events"] += 1
+                    stream.flush()
+                    threads = current
+
+        except KeyboardInterrupt:
+            logger.info("Watch stopped by user")
+        except Exception as e:
+            return self._failure_results(e)
+
+        self.metrics.end_time = time.time()
+        return {
+            "success": True,
+            "pr_info": pr_info,
+            "watch": stats,
+            "metrics": self._get_metrics_summary(),
+            "execution_time": self.metrics.total_execution_time
+        }
+
+    @classmethod
+    async def execute_many_async(
+        cls,
+        configs: List[ExecutionConfig],
+        max_concurrency: int = 4,
+        github_client: Optional[AsyncGitHubClient] = None
+    ) -> List[Dict[str, Any]]:
+        """Process several pull requests on the running event loop.
+
+        Formatters, parse cache and persona are loaded once and shared by all
+        configurations with the same persona file, resolved marker and jobs. A
+        failing pull request only fails its own result.
+
+        Args:
+            configs: One configuration per pull request
+            max_concurrency: Maximum number of pull requests processed at once
+            github_client: Shared client; when omitted one is created from the
+                first configuration and closed afterwards
+
+        Returns:
+            Results of ``execute_async`` in ``configs`` order
+        """
+        orchestrators = [cls(config) for config in configs]
+        if not orchestrators:
+            return []
+
+        sources: Dict[Tuple[Optional[str], str, int], "CodeRabbitOrchestrator"] = {}
+        for orchestrator in orchestrators:
+            key = (orchestrator.config.persona_file, orchestrator.config.resolved_marker,
+                   orchestrator.config.jobs)
+            orchestrator.share_components(sources.setdefault(key, orchestrator))
+
+        owns_client = github_client is None
+        if github_client is None:
+            github_client = orchestrators[0].create_async_github_client()
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(orchestrator: "CodeRabbitOrchestrator") -> Dict[str, Any]:
+            async with slots:
+                return await orchestrator.execute_async(github_client)
+
+        try:
+            return list(await asyncio.gather(*(run(orchestrator) for orchestrator in orchestrators)))
+        finally:
+            if owns_client:
+                await github_client.aclose()
+
+    def share_components(self, source: "CodeRabbitOrchestrator") -> None:
+        """Reuse the components and persona loaded by ``source``.
+
+        Loading errors are left for ``execute_async`` to report per pull request.
+
+        Args:
+            source: Orchestrator with the same persona file, resolved marker and jobs
+        """
+        if not source.is_initialized:
+            try:
+                source._initialize_components()
+                source._persona = source._load_persona()
+            except CodeRabbitFetcherError:
+                logger.debug("Shared component loading failed", exc_info=True)
+                return
+
+        if source is self:
+            return
+
+        self.formatters = source.formatters
+        self.persona_manager = source.persona_manager
+        self.resolved_marker_manager = source.resolved_marker_manager
+        # The analyzer keeps statistics of its current analysis and executions may
+        # analyze at the same time: each gets its own, sharing the parse cache
+        analyzer = source.comment_analyzer
+        self.comment_analyzer = CommentAnalyzer(analyzer.resolved_marker_config, jobs=analyzer.jobs,
+                                                parse_cache=analyzer.parse_cache)
+        self._persona = source._persona
+        self.is_initialized = True
+
+    def _success_results(self, pr_info: Dict[str, Any], analyzed_comments: AnalyzedComments,
+                         output_info: Dict[str, Any],
+                         resolution_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Complete execution and build the success result."""
+        self.progress_tracker.complete()
+        self.metrics.end_time = time.time()
+
+        results = {
+            "success": True,
+            "pr_info": pr_info,
+            "analyzed_comments": analyzed_comments,
+            "output_info": output_info,
+            "resolution_info": resolution_info,
+            "metrics": self._get_metrics_summary(),
+            "execution_time": self.metrics.total_execution_time
+        }
+
+        logger.info(f"Execution completed successfully in {self.metrics.total_execution_time:.2f}s")
+        return results
+
+    def _failure_results(self, error: Exception) -> Dict[str, Any]:
+        """Record a failed execution and build the failure result."""
+        self.metrics.errors_encountered.append(str(error))
+        self.metrics.end_time = time.time()
+
+        logger.exception("Execution failed")
+
+        # Attempt graceful error recovery
+        recovery_info = self._attempt_error_recovery(error)
+
+        # Return failure results with recovery information
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "recovery_info": recovery_info,
+            "metrics": self._get_metrics_summary(),
+            "execution_time": self.metrics.total_execution_time
+        }
 
     def _initialize_components(self) -> None:
         """Initialize all required components."""
@@ -266,7 +579,8 @@ class CodeRabbitOrchestrator:
             self.resolved_marker_manager = ResolvedMarkerManager(marker_config)
 
             # Initialize comment analyzer
-            self.comment_analyzer = CommentAnalyzer(marker_config)
+            parse_cache = self._create_parse_cache() if self.config.use_cache else None
+            self.comment_analyzer = CommentAnalyzer(marker_config, jobs=self.config.jobs, parse_cache=parse_cache)
 
             self.is_initialized = True
             logger.debug("Component initialization completed")
@@ -280,7 +594,17 @@ class CodeRabbitOrchestrator:
 
         try:
             start_time = time.time()
-            self.github_client = GitHubClient()
+            cache = self._create_response_cache() if self.config.use_cache else None
+            self.github_client = GitHubClient(
+                backend=self.config.backend,
+                fetch_mode=self.config.fetch_mode,
+                cache=cache,
+                refresh_cache=self.config.refresh_cache,
+                retry_attempts=self.config.retry_attempts,
+                retry_delay=self.config.retry_delay,
+                auth_cache=self._create_auth_cache() if self.config.use_cache else None,
+                coordinator=self._create_fetch_coordinator()
+            )
             self.metrics.github_api_time += time.time() - start_time
             self.metrics.github_api_calls += 1
 
@@ -292,12 +616,66 @@ class CodeRabbitOrchestrator:
         except Exception as e:
             raise CodeRabbitFetcherError(f"Failed to validate GitHub authentication: {e}") from e
 
-    def _validate_pr_url(self) -> Dict[str, Any]:
+    def create_async_github_client(self) -> AsyncGitHubClient:
+        """Create an asyncio GitHub client from the configuration."""
+        return AsyncGitHubClient(
+            backend=self.config.backend,
+            fetch_mode=self.config.fetch_mode,
+            cache=self._create_response_cache() if self.config.use_cache else None,
+            refresh_cache=self.config.refresh_cache,
+            retry_attempts=self.config.retry_attempts,
+            retry_delay=self.config.retry_delay,
+            auth_cache=self._create_auth_cache() if self.config.use_cache else None,
+            coordinator=self._create_fetch_coordinator()
+        )
+
+    def _create_auth_cache(self) -> Optional[AuthCache]:
+        """Create the cross-invocation authentication cache, or None if it is unavailable."""
+        try:
+            return AuthCache(get_cache_dir("auth") / "state.json")
+        except OSError as e:
+            logger.warning(f"Authentication cache disabled: {e}")
+            return None
+
+    def _create_fetch_coordinator(self) -> Optional[FetchCoordinator]:
+        """Create the coordination with concurrent processes, or None if disabled or unavailable."""
+        if not self.config.use_cache or self.config.coordination_wait <= 0:
+            return None
+        try:
+            return FetchCoordinator(
+                get_cache_dir("coordination"),
+                wait=self.config.coordination_wait,
+                snapshot_ttl=self.config.coordination_ttl,
+            )
+        except OSError as e:
+            logger.warning(f"Fetch coordination disabled: {e}")
+            return None
+
+    def _create_response_cache(self) -> Optional[ResponseCache]:
+        """Create the on-disk API response cache, or None if it is unavailable."""
+        try:
+            return ResponseCache(get_cache_dir("http"))
+        except OSError as e:
+            logger.warning(f"Response cache disabled: {e}")
+            self.metrics.warnings_issued.append(f"Response cache disabled: {e}")
+            return None
+
+    def _create_parse_cache(self) -> Optional[ParseCache]:
+        """Create the persistent cache of parsed comments, or None if it is unavailable."""
+        try:
+            return ParseCache(get_cache_dir("parse") / "comments.sqlite3")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Parse cache disabled: {e}")
+            self.metrics.warnings_issued.append(f"Parse cache disabled: {e}")
+            return None
+
+    def _validate_pr_url(self, github_client: Optional[PullRequestDataMixin] = None) -> Dict[str, Any]:
         """Validate and parse PR URL."""
         logger.debug(f"Validating PR URL: {self.config.pr_url}")
 
         try:
-            owner, repo, pr_number = self.github_client.parse_pr_url(self.config.pr_url)
+            parser = github_client or self.github_client or PullRequestDataMixin()
+            owner, repo, pr_number = parser.parse_pr_url(self.config.pr_url)
 
             pr_info = {
                 "url": self.config.pr_url,
@@ -315,6 +693,34 @@ class CodeRabbitOrchestrator:
         except Exception as e:
             raise CodeRabbitFetcherError(f"Failed to validate PR URL: {e}") from e
 
+    def _load_snapshot(self) -> PRSnapshot:
+        """Load PR data saved by an earlier run instead of fetching it.
+
+        The PR URL recorded in the snapshot is used when none is configured.
+        """
+        logger.debug(f"Loading PR snapshot from {self.config.snapshot_input}")
+
+        snapshot = load_pr_snapshot(self.config.snapshot_input)
+        if not self.config.pr_url:
+            if not snapshot.pr_url:
+                raise SnapshotError(
+                    "Snapshot does not record its PR URL; pass the URL as well",
+                    self.config.snapshot_input
+                )
+            self.config.pr_url = snapshot.pr_url
+
+        pr_data = snapshot.pr_data
+        self.metrics.total_comments_processed = (
+            len(pr_data.get('comments', [])) + len(pr_data.get('reviews', []))
+        )
+        logger.info(f"PR snapshot loaded ({self.metrics.total_comments_processed} comments)")
+        return snapshot
+
+    def _save_snapshot(self, pr_data: Dict[str, Any]) -> None:
+        """Save the fetched PR data for later offline runs."""
+        size = save_pr_snapshot(self.config.snapshot_output, pr_data, self.config.pr_url)
+        logger.info(f"PR snapshot written to: {self.config.snapshot_output} ({size} bytes)")
+
     def _load_persona(self) -> str:
         """Load persona content."""
         logger.debug("Loading persona configuration...")
@@ -322,10 +728,9 @@ class CodeRabbitOrchestrator:
         try:
             if self.config.persona_file:
                 logger.debug(f"Loading persona from file: {self.config.persona_file}")
-                persona = self.persona_manager.load_persona_file(self.config.persona_file)
             else:
                 logger.debug("Using default persona")
-                persona = self.persona_manager.get_default_persona()
+            persona = self.persona_manager.load_persona(self.config.persona_file)
 
             logger.info(f"Persona loaded ({len(persona)} characters)")
             return persona
@@ -337,47 +742,115 @@ class CodeRabbitOrchestrator:
             raise CodeRabbitFetcherError(f"Failed to load persona: {e}") from e
 
     def _fetch_pr_data(self) -> Dict[str, Any]:
-        """Fetch PR data from GitHub with retry logic."""
+        """Fetch PR data from GitHub.
+
+        The client fetches the independent endpoints concurrently and retries
+        a failing endpoint on its own (``retry_attempts``/``retry_delay``).
+        """
         logger.debug("Fetching PR data from GitHub...")
 
         try:
             start_time = time.time()
-            attempts = max(1, self.config.retry_attempts + 1)
-            last_err = None
-
-            for i in range(attempts):
-                try:
-                    pr_data = self.github_client.fetch_pr_comments(
-                        self.config.pr_url,
-                        timeout=self.config.timeout_seconds
-                    )
-                    fetch_time = time.time() - start_time
+            try:
+                pr_data = self._fetch_pr_comments()
+            finally:
+                self._record_endpoint_times(self.github_client)
+                self._record_circuit_breakers(self.github_client)
+            return self._record_fetch(pr_data, time.time() - start_time, self.github_client)
 
-                    self.metrics.github_api_time += fetch_time
-                    self.metrics.github_api_calls += 1
+        except (GitHubAPIError, CircuitBreakerError) as e:
+            logger.exception("GitHub API error")
+            raise
+        except Exception as e:
+            raise CodeRabbitFetcherError(f"Failed to fetch PR data: {e}") from e
 
-                    # Count comments
-                    total_comments = len(pr_data.get('comments', [])) + len(pr_data.get('reviews', []))
-                    self.metrics.total_comments_processed = total_comments
+    async def _fetch_pr_data_async(self, github_client: AsyncGitHubClient) -> Dict[str, Any]:
+        """Fetch PR data through the asyncio client."""
+        logger.debug("Fetching PR data from GitHub...")
 
-                    logger.info(f"PR data fetched in {fetch_time:.2f}s ({total_comments} comments)")
-                    return pr_data
+        if self.config.incremental:
+            message = "Incremental sync is not available in async mode; fetching the full PR"
+            logger.warning(message)
+            self.metrics.warnings_issued.append(message)
 
-                except GitHubAPIError as e:
-                    last_err = e
-                    if i == attempts - 1:
-                        raise
-                    sleep = self._compute_backoff(i, self.config.retry_delay)
-                    logger.warning("Fetch PR data failed (attempt %d/%d): %s; retrying in %.2fs",
-                                   i + 1, attempts, e, sleep)
-                    time.sleep(sleep)
+        try:
+            start_time = time.time()
+            try:
+                pr_data = await github_client.fetch_pr_comments(
+                    self.config.pr_url,
+                    timeout=self.config.timeout_seconds
+                )
+            finally:
+                self._record_endpoint_times(github_client)
+                self._record_circuit_breakers(github_client)
+            return self._record_fetch(pr_data, time.time() - start_time, github_client)
 
         except GitHubAPIError as e:
             logger.exception("GitHub API error")
             raise
         except Exception as e:
+            if isinstance(e, (InvalidPRUrlError, GitHubAuthenticationError, CircuitBreakerError)):
+                raise
             raise CodeRabbitFetcherError(f"Failed to fetch PR data: {e}") from e
 
+    def _record_fetch(self, pr_data: Dict[str, Any], fetch_time: float,
+                      github_client: Any) -> Dict[str, Any]:
+        """Update the metrics after a successful PR fetch."""
+        self.metrics.github_api_time += fetch_time
+        self.metrics.github_api_calls += 1
+        self._record_cache_stats(github_client)
+        self._record_rate_limit(github_client)
+
+        # Count comments
+        total_comments = len(pr_data.get('comments', [])) + len(pr_data.get('reviews', []))
+        self.metrics.total_comments_processed = total_comments
+
+        logger.info(f"PR data fetched in {fetch_time:.2f}s ({total_comments} comments)")
+        return pr_data
+
+    def _fetch_pr_comments(self) -> Dict[str, Any]:
+        """Fetch PR comments, incrementally when configured."""
+        if not self.config.incremental:
+            return self.github_client.fetch_pr_comments(
+                self.config.pr_url,
+                timeout=self.config.timeout_seconds
+            )
+
+        syncer = IncrementalSyncer(self.github_client, SnapshotStore(get_cache_dir("sync")))
+        return syncer.sync(
+            self.config.pr_url,
+            timeout=self.config.timeout_seconds,
+            full=self.config.refresh_cache
+        )
+
+    def _record_endpoint_times(self, github_client: Any) -> None:
+        """Copy the per-endpoint timings of the last PR fetch into the execution metrics."""
+        timings = getattr(github_client, "last_fetch_timings", None)
+        if isinstance(timings, dict):
+            for name, seconds in timings.items():
+                self.metrics.github_endpoint_times[name] = (
+                    self.metrics.github_endpoint_times.get(name, 0.0) + seconds
+                )
+
+    def _record_cache_stats(self, github_client: Any) -> None:
+        """Copy response cache counters into the execution metrics."""
+        cache_stats = getattr(github_client, "cache_stats", None)
+        if isinstance(cache_stats, CacheStats):
+            self.metrics.cache_hits = cache_stats.hits
+            self.metrics.cache_misses = cache_stats.misses
+
+    def _record_rate_limit(self, github_client: Any) -> None:
+        """Copy the remaining rate limit budget into the execution metrics."""
+        rate_limit_stats = getattr(github_client, "rate_limit_stats", None)
+        if isinstance(rate_limit_stats, dict):
+            self.metrics.rate_limit = rate_limit_stats
+
+    def _record_circuit_breakers(self, github_client: Any) -> None:
+        """Copy the circuit breaker states into the execution metrics."""
+        breaker_stats = getattr(github_client, "circuit_breaker_stats", None)
+        if isinstance(breaker_stats, dict):
+            self.metrics.circuit_breakers = breaker_stats
+
     def _analyze_comments(self, pr_data: Dict[str, Any]) -> AnalyzedComments:
         """Analyze PR comments."""
         logger.debug("Analyzing CodeRabbit comments...")
@@ -403,6 +876,15 @@ class CodeRabbitOrchestrator:
                 if hasattr(analyzed_comments, 'metadata'):
                     analyzed_comments.metadata.resolved_comments = self.metrics.resolved_comments_filtered
 
+            if self.config.thread_path or self.config.thread_since or self.config.thread_status:
+                analyzed_comments = narrow_analysis(
+                    analyzed_comments,
+                    path=self.config.thread_path,
+                    since=self.config.thread_since,
+                    status=self.config.thread_status,
+                )
+                logger.debug(f"Narrowed the report to {len(analyzed_comments.unresolved_threads)} threads")
+
             logger.info(f"Analysis completed in {analysis_time:.2f}s "
                        f"({self.metrics.coderabbit_comments_found} CodeRabbit comments, "
                        f"{self.metrics.resolved_comments_filtered} resolved)")
@@ -463,6 +945,8 @@ class CodeRabbitOrchestrator:
 
                 output_info["file_size"] = output_path.stat().st_size
                 logger.info(f"Output written to: {output_path} ({output_info['file_size']} bytes)")
+            elif self.config.capture_output:
+                output_info["content"] = formatted_content
             else:
                 print(formatted_content)
                 logger.info("Output written to stdout")
@@ -505,7 +989,8 @@ class CodeRabbitOrchestrator:
                     break
                 except Exception as e:
                     last_err = e
-                    if i == attempts - 1:
+                    # An open circuit does not close during the backoff: fail fast
+                    if i == attempts - 1 or isinstance(e, CircuitBreakerError):
                         raise
                     sleep = self._compute_backoff(i, self.config.retry_delay)
                     logger.warning("Posting resolution request failed (attempt %d/%d): %s; retrying in %.2fs",
@@ -531,6 +1016,45 @@ class CodeRabbitOrchestrator:
             # Don't raise - posting failure shouldn't stop main execution
             return {"success": False, "error": str(e)}
 
+    async def _post_resolution_request_async(self, github_client: AsyncGitHubClient,
+                                             analyzed_comments: AnalyzedComments) -> Dict[str, Any]:
+        """Post resolution request to CodeRabbit through the asyncio client.
+
+        The client retries the request itself; failures are recorded but do
+        not fail the execution.
+        """
+        logger.debug("Posting resolution request to CodeRabbit...")
+
+        try:
+            request_config = ResolutionRequestConfig(resolved_marker=self.config.resolved_marker)
+            context = self._generate_resolution_context(analyzed_comments)
+
+            validation = request_config.validate_marker()
+            if not validation["valid"]:
+                self.metrics.warnings_issued.append("Resolution request posting failed")
+                return {
+                    "success": False,
+                    "validation": validation,
+                    "error": "Validation failed: " + "; ".join(validation["issues"])
+                }
+
+            start_time = time.time()
+            comment = await github_client.post_comment(
+                self.config.pr_url, request_config.generate_message(context)
+            )
+            post_time = time.time() - start_time
+
+            self.metrics.github_api_time += post_time
+            self.metrics.github_api_calls += 1
+            logger.info(f"Resolution request posted in {post_time:.2f}s")
+
+            return {"success": True, "validation": validation, "posting": comment}
+
+        except Exception as e:
+            logger.exception("Failed to post resolution request")
+            self.metrics.errors_encountered.append(f"Resolution request error: {e}")
+            return {"success": False, "error": str(e)}
+
     def _generate_resolution_context(self, analyzed_comments: AnalyzedComments) -> str:
         """Generate context for resolution request."""
         context_parts = []
@@ -570,6 +1094,14 @@ class CodeRabbitOrchestrator:
                 "4. Verify with: gh auth status"
             ]
 
+        # Circuit breaker open after repeated GitHub failures
+        elif isinstance(error, CircuitBreakerError):
+            recovery_info["attempted"] = True
+            recovery_info["recommendations"] = [
+                "1. GitHub is failing repeatedly; check https://www.githubstatus.com/",
+                "2. Try again once the service has recovered"
+            ]
+
         # GitHub API errors
         elif isinstance(error, GitHubAPIError):
             recovery_info["attempted"] = True
@@ -589,6 +1121,15 @@ class CodeRabbitOrchestrator:
                 "3. Check for typos in the URL"
             ]
 
+        # Snapshot file errors
+        elif isinstance(error, SnapshotError):
+            recovery_info["attempted"] = True
+            recovery_info["recommendations"] = [
+                "1. Check that the snapshot file exists and is readable",
+                "2. Recreate it with: --save-snapshot PATH",
+                "3. Omit --from-snapshot to fetch the PR from GitHub"
+            ]
+
         # Persona file errors
         elif isinstance(error, PersonaFileError):
             recovery_info["attempted"] = True
@@ -615,12 +1156,17 @@ class CodeRabbitOrchestrator:
             "execution_time": self.metrics.total_execution_time,
             "github_api_calls": self.metrics.github_api_calls,
             "github_api_time": self.metrics.github_api_time,
+            "github_endpoint_times": dict(self.metrics.github_endpoint_times),
             "analysis_time": self.metrics.analysis_time,
             "formatting_time": self.metrics.formatting_time,
             "total_comments_processed": self.metrics.total_comments_processed,
             "coderabbit_comments_found": self.metrics.coderabbit_comments_found,
             "resolved_comments_filtered": self.metrics.resolved_comments_filtered,
             "output_size_bytes": self.metrics.output_size_bytes,
+            "cache_hits": self.metrics.cache_hits,
+            "cache_misses": self.metrics.cache_misses,
+            "rate_limit": self.metrics.rate_limit,
+            "circuit_breakers": self.metrics.circuit_breakers,
             "errors_count": len(self.metrics.errors_encountered),
             "warnings_count": len(self.metrics.warnings_issued),
             "success_rate": self.metrics.success_rate
@@ -651,14 +1197,54 @@ class CodeRabbitOrchestrator:
             "warnings": []
         }
 
-        # Validate PR URL format
+        # Validate PR URL format (a snapshot may provide it)
         if not self.config.pr_url:
-            validation_result["valid"] = False
-            validation_result["issues"].append("PR URL is required")
+            if not self.config.snapshot_input:
+                validation_result["valid"] = False
+                validation_result["issues"].append("PR URL is required")
         elif not self.config.pr_url.startswith(("http://", "https://")):
             validation_result["valid"] = False
             validation_result["issues"].append("PR URL must be a valid HTTP/HTTPS URL")
 
+        # Validate snapshot input
+        if self.config.snapshot_input:
+            if not Path(self.config.snapshot_input).is_file():
+                validation_result["valid"] = False
+                validation_result["issues"].append(f"Snapshot file not found: {self.config.snapshot_input}")
+            if self.config.post_resolution_request:
+                validation_result["valid"] = False
+                validation_result["issues"].append(
+                    "Resolution requests cannot be posted when reading from a snapshot"
+                )
+            if self.config.incremental:
+                validation_result["warnings"].append("--incremental has no effect with a snapshot")
+
+        # Validate watch mode
+        if self.config.watch_interval is not None:
+            if self.config.watch_interval <= 0:
+                validation_result["valid"] = False
+                validation_result["issues"].append("Watch interval must be positive")
+            if self.config.snapshot_input:
+                validation_result["valid"] = False
+                validation_result["issues"].append("A snapshot cannot be watched")
+            if self.config.post_resolution_request:
+                validation_result["valid"] = False
+                validation_result["issues"].append("Resolution requests cannot be posted in watch mode")
+            if not self.config.use_cache:
+                validation_result["warnings"].append(
+                    "Without the response cache, every poll refetches the complete PR"
+                )
+        elif self.config.watch_events:
+            validation_result["warnings"].append("Watch events are only printed with --watch")
+
+        if self.config.jobs < 1:
+            validation_result["valid"] = False
+            validation_result["issues"].append("Jobs must be at least 1")
+
+        if self.config.thread_status and self.config.thread_status not in [s.value for s in ResolutionStatus]:
+            validation_result["valid"] = False
+            validation_result["issues"].append(f"Invalid thread status: {self.config.thread_status}")
+
         # Validate output format
         if self.config.output_format not in ['markdown', 'json', 'plain']:
             validation_result["valid"] = False
@@ -0,0 +1,187 @@
+"""
+Process-pool analysis of large pull requests.
+
+Parsing a CodeRabbit comment does not depend on the other comments, so
+``CommentAnalyzer`` can shard the summary comments, review comments and
+inline comment threads of a large pull request across worker processes
+(``--jobs``). Workers send back compact results instead of model graphs:
+plain model dumps without the comment body, and for threads only the
+chronological order of the comments and the generated summary. The
+parent rebuilds the models from the comments it already holds.
+
+Shards are contiguous runs of items and results are merged in shard
+order, so the analysis is the same as a serial run whatever the number
+of workers.
+"""
+
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from .exceptions import CommentParsingError
+from .models import ThreadContext
+
+logger = logging.getLogger(__name__)
+
+#: Minimum number of CodeRabbit comments analyzed in worker processes
+PARALLEL_THRESHOLD = 200
+
+# Shards per worker, so that workers finishing early pick up more work
+_SHARDS_PER_JOB = 4
+
+#: Errors failing the processing of a single comment or thread (the others fail the analysis)
+PROCESSING_ERRORS = (CommentParsingError, ValueError, KeyError, TypeError, AttributeError)
+
+# Result of one item: compact data, or the error that made its processing fail
+Compact = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+# Processors of a worker process, set by ``_init_worker``
+_processors: Dict[str, Any] = {}
+
+
+def _init_worker(summary_processor: Any, review_processor: Any, thread_processor: Any) -> None:
+    """Install the processors of the analyzer in a worker process."""
+    _processors.update(summary=summary_processor, review=review_processor, thread=thread_processor)
+
+
+def compact_model(model: BaseModel, body: Any) -> Dict[str, Any]:
+    """Dump a model to JSON-compatible data without the body it was parsed from."""
+    # Defaults are kept: validators fill in missing fields from the content
+    data = model.model_dump(mode="json")
+    if data.get("raw_content") == body:
+        del data["raw_content"]
+    return data
+
+
+def compact_thread(processor: Any, group: List[Dict[str, Any]], thread: ThreadContext) -> Dict[str, Any]:
+    """Reduce a processed thread to what is not already in the comments of its group."""
+    # Same stable sort as ``process_thread``, as positions in the group
+    position = {id(comment): index for index, comment in enumerate(group)}
+    return {
+        "thread_id": thread.thread_id,
+        "order": [position[id(comment)] for comment in processor._sort_comments_chronologically(group)],
+        "resolution_status": thread.resolution_status,
+        "contextual_summary": thread.contextual_summary,
+    }
+
+
+def _process_summary_shard(comments: List[Dict[str, Any]]) -> List[Compact]:
+    """Process summary comments in a worker."""
+    processor = _processors["summary"]
+    results: List[Compact] = []
+    for comment in comments:
+        try:
+            summary = processor.process_summary_comment(comment)
+        except PROCESSING_ERRORS as e:
+            results.append((None, str(e)))
+        else:
+            results.append((compact_model(summary, comment.get("body")), None))
+    return results
+
+
+def _process_review_shard(comments: List[Dict[str, Any]]) -> List[Compact]:
+    """Process review comments in a worker."""
+    processor = _processors["review"]
+    results: List[Compact] = []
+    for comment in comments:
+        try:
+            review = processor.process_review_comment(comment)
+        except PROCESSING_ERRORS as e:
+            results.append((None, str(e)))
+        else:
+            results.append((compact_model(review, comment.get("body")), None))
+    return results
+
+
+def _process_thread_shard(groups: List[List[Dict[str, Any]]]) -> List[Compact]:
+    """Process comment threads in a worker."""
+    processor = _processors["thread"]
+    results: List[Compact] = []
+    for group in groups:
+        try:
+            thread = processor.process_thread(group)
+        except PROCESSING_ERRORS as e:
+            results.append((None, str(e)))
+        else:
+            results.append((compact_thread(processor, group, thread), None))
+    return results
+
+
+def restore_model(model_class: Type[BaseModel], data: Dict[str, Any], body: Any) -> BaseModel:
+    """Rebuild a model dumped by a worker.
+
+    Args:
+        model_class: Class of the dumped model
+        data: Compact dump
+        body: Body of the comment the model was parsed from
+    """
+    if "raw_content" not in data:
+        data = {**data, "raw_content": body}
+    return model_class.model_validate(data)
+
+
+def restore_thread(group: List[Dict[str, Any]], data: Dict[str, Any]) -> ThreadContext:
+    """Rebuild a thread processed by a worker from the comments of its group."""
+    ordered = [group[index] for index in data["order"]]
+    return ThreadContext(
+        thread_id=data["thread_id"],
+        main_comment=ordered[0],
+        replies=ordered[1:],
+        resolution_status=data["resolution_status"],
+        chronological_order=ordered,
+        contextual_summary=data["contextual_summary"],
+    )
+
+
+def _shards(items: Sequence[Any], size: int) -> List[List[Any]]:
+    return [list(items[start:start + size]) for start in range(0, len(items), size)]
+
+
+def process_in_pool(
+    jobs: int,
+    processors: Tuple[Any, Any, Any],
+    summary_comments: Sequence[Dict[str, Any]],
+    review_comments: Sequence[Dict[str, Any]],
+    thread_groups: Sequence[List[Dict[str, Any]]],
+) -> Tuple[List[Compact], List[Compact], List[Compact]]:
+    """Process comments and threads in a pool of worker processes.
+
+    Exceptions other than the per-item processing errors are raised as
+    in a serial run.
+
+    Args:
+        jobs: Number of worker processes
+        processors: Summary, review and thread processors of the analyzer
+        summary_comments: Summary comments to process
+        review_comments: Review comments to process
+        thread_groups: Comment threads to process
+
+    Returns:
+        Compact results of the summary comments, review comments and
+        threads, in input order
+
+    Raises:
+        OSError, concurrent.futures.process.BrokenProcessPool: If the
+            worker processes cannot be started or die
+    """
+    total = len(summary_comments) + len(review_comments) + len(thread_groups)
+    size = max(1, math.ceil(total / (jobs * _SHARDS_PER_JOB)))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=processors) as executor:
+        futures = [
+            [executor.submit(function, shard) for shard in _shards(items, size)]
+            for function, items in (
+                (_process_summary_shard, summary_comments),
+                (_process_review_shard, review_comments),
+                (_process_thread_shard, thread_groups),
+            )
+        ]
+        summaries, reviews, threads = (
+            [result for future in kind for result in future.result()] for kind in futures
+        )
+
+    logger.debug("Processed %d items in %d shards on %d workers", total, sum(map(len, futures)), jobs)
+    return summaries, reviews, threads
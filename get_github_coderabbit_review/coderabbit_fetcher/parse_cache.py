@@ -0,0 +1,205 @@
+"""
+Persistent cache of parsed CodeRabbit comments.
+
+CodeRabbit comments rarely change once posted, yet every run used to parse
+every body again. ``ParseCache`` keeps the processor results between runs
+in a SQLite database, keyed by a hash of everything a result depends on:
+the comment body and ``updated_at`` (all comments for a thread), the
+processor and its version, and the resolved marker configuration. Only new
+or edited comments are parsed again.
+
+Entries are the compact results of ``parallel_analysis`` stored as JSON.
+The database is bounded by total size with least-recently-used eviction,
+and can be shared by several processes.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from .github.cache import CacheStats
+from .resolved_marker import ResolvedMarkerConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Keys per query (SQLite limits the number of bound parameters)
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used_at REAL NOT NULL
+)
+"""
+
+
+def parse_key(kind: str, processor: Any, marker_config: ResolvedMarkerConfig, item: Any) -> str:
+    """Get the cache key of a comment or thread.
+
+    Args:
+        kind: ``"summary"``, ``"review"`` or ``"thread"``
+        processor: Processor producing the result; its class name and
+            ``VERSION`` are part of the key
+        marker_config: Resolved marker configuration of the analysis
+        item: Comment, or list of the comments of a thread
+
+    Returns:
+        Hex digest identifying the result
+    """
+    if kind == "thread":
+        # Thread results depend on the ids, authors, timestamps and positions of all comments
+        content: Any = item
+    else:
+        content = [item.get("body") or "", item.get("updated_at")]
+    material = json.dumps(
+        [
+            kind, type(processor).__name__, getattr(processor, "VERSION", 0),
+            [marker_config.all_patterns, marker_config.case_sensitive, marker_config.exact_match],
+            content,
+        ],
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """Size-bounded LRU store of parsed comments in a SQLite database.
+
+    Database errors are logged and treated as misses: the cache never makes
+    an analysis fail.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open (and create) the cache.
+
+        Args:
+            path: Database file
+            max_bytes: Size cap of all stored results together
+
+        Raises:
+            OSError, sqlite3.Error: If the database cannot be opened
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            # Not supported by the file system; the default journal works too
+            pass
+        self._connection.execute(_SCHEMA)
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at)")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Look up results and mark them as recently used.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Stored results by key (missing keys are left out)
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        with self._lock:
+            try:
+                for start in range(0, len(keys), _BATCH_SIZE):
+                    batch = keys[start:start + _BATCH_SIZE]
+                    rows = self._connection.execute(
+                        f"SELECT key, data FROM entries WHERE key IN ({', '.join('?' * len(batch))})", batch
+                    ).fetchall()
+                    for key, data in rows:
+                        try:
+                            found[key] = json.loads(data)
+                        except ValueError:
+                            continue
+                if found:
+                    now = time.time()
+                    self._connection.executemany(
+                        "UPDATE entries SET used_at = ? WHERE key = ?", [(now, key) for key in found]
+                    )
+            except sqlite3.Error as e:
+                logger.debug("Parse cache lookup failed: %s", e)
+
+            self.stats.hits += len(found)
+            self.stats.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Dict[str, Any]) -> None:
+        """Store results, evicting the least recently used ones above the size cap.
+
+        Args:
+            entries: JSON-serializable results by key
+        """
+        if not entries:
+            return
+        now = time.time()
+        rows = []
+        for key, result in entries.items():
+            data = json.dumps(result, separators=(",", ":"), ensure_ascii=False, default=str)
+            rows.append((key, data, len(data.encode("utf-8")), now))
+
+        with self._lock:
+            try:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO entries (key, data, size, used_at) VALUES (?, ?, ?, ?)", rows
+                    )
+                    self.stats.evictions += self._evict()
+                except sqlite3.Error:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+                self.stats.stores += len(rows)
+            except sqlite3.Error as e:
+                logger.debug("Parse cache store failed: %s", e)
+
+    def _evict(self) -> int:
+        """Remove least recently used entries until under the size cap."""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        cursor = self._connection.execute(
+            """
+            DELETE FROM entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY used_at DESC, key) AS kept FROM entries
+                ) WHERE kept > ?
+            )
+            """,
+            (self.max_bytes,),
+        )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            try:
+                self._connection.execute("DELETE FROM entries")
+            except sqlite3.Error as e:
+                logger.debug("Parse cache clear failed: %s", e)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Number of stored results."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
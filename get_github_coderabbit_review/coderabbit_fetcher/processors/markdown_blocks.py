@@ -0,0 +1,354 @@
+"""One-pass block tokenizer for CodeRabbit comment bodies.
+
+A comment body is split once, line by line, into headings, ``<details>``
+blocks (with their ``<summary>`` as title and their content as children),
+fenced code blocks, tables, list items, thematic breaks and paragraphs.
+Processors query the resulting block tree instead of running section
+regexes over the whole body, so the cost of a body is linear in its size
+whatever the number of extractors.
+
+Line recognition follows the conventions of CodeRabbit bodies rather than
+full CommonMark: indentation is ignored (bodies are often quoted or
+indented), HTML tags are only recognized at the start or end of a line,
+and table rows are lines holding at least two ``|``.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional, Pattern, Tuple, Union
+
+# Block kinds
+HEADING = "heading"
+DETAILS = "details"
+CODE = "code"
+TABLE = "table"
+LIST_ITEM = "list_item"
+RULE = "rule"
+PARAGRAPH = "paragraph"
+
+_HEADING = re.compile(r"(#{1,6})\s+(.*?)\s*#*$")
+_FENCE = re.compile(r"(`{3,}|~{3,})\s*(.*)$")
+_LIST_ITEM = re.compile(r"([-*+•·]|\d+[.)])\s+(.*)$")
+_RULE = re.compile(r"(?:-\s*){3,}$|(?:\*\s*){3,}$|(?:_\s*){3,}$")
+_LEADING_TAG = re.compile(r"<(/?)(details|summary|blockquote)(?:\s[^>]*)?>", re.IGNORECASE)
+_TRAILING_TAG = re.compile(r"</(details|blockquote)>\s*$", re.IGNORECASE)
+_SUMMARY_END = re.compile(r"</summary>", re.IGNORECASE)
+_TAGS = re.compile(r"<[^>]+>")
+
+# Parsed bodies kept for the extractors of the same comment
+_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class Block:
+    """A block of a comment body.
+
+    Attributes:
+        kind: Block kind (``heading``, ``details``, ``code``, ``table``,
+            ``list_item``, ``rule`` or ``paragraph``)
+        text: Heading title, code content, list item text (without the
+            marker, continuation lines included) or paragraph/table lines
+        start: First line of the block in the body
+        end: Line after the last line of the block
+        level: Heading level, or indentation of a list item
+        info: Code fence info string, details summary or list marker
+        children: Blocks inside a ``<details>`` block
+    """
+
+    kind: str
+    text: str
+    start: int
+    end: int
+    level: int = 0
+    info: str = ""
+    children: Tuple["Block", ...] = ()
+
+    @property
+    def title(self) -> str:
+        """Title of a heading or ``<details>`` block (first line for other blocks)."""
+        if self.kind == DETAILS:
+            return self.info
+        return self.text.split("\n", 1)[0]
+
+
+@dataclass(frozen=True)
+class Section:
+    """A run of blocks with the body lines they were parsed from.
+
+    ``parse_blocks`` returns the whole body as an untitled section;
+    ``sections`` finds the titled sections inside it.
+    """
+
+    title: str
+    blocks: Tuple[Block, ...]
+    lines: Tuple[str, ...]
+
+    @property
+    def text(self) -> str:
+        """Source text of the section, without its title line."""
+        if not self.blocks:
+            return ""
+        return self.source(self.blocks[0].start, self.blocks[-1].end).strip()
+
+    def source(self, start: Union[int, Block], end: Optional[int] = None) -> str:
+        """Source text of a block or of a line range."""
+        if isinstance(start, Block):
+            start, end = start.start, start.end
+        return "\n".join(self.lines[start:end])
+
+    def walk(self, *kinds: str) -> Iterator[Block]:
+        """Iterate over the blocks in document order, descending into ``<details>``.
+
+        Args:
+            kinds: Only yield blocks of these kinds (all when omitted)
+        """
+        stack = [iter(self.blocks)]
+        while stack:
+            block = next(stack[-1], None)
+            if block is None:
+                stack.pop()
+                continue
+            if not kinds or block.kind in kinds:
+                yield block
+            if block.children:
+                stack.append(iter(block.children))
+
+    def sections(self, title: Union[Pattern[str], Callable[[str], bool]], labels: bool = True) -> List["Section"]:
+        """Find the sections with a matching title.
+
+        A heading section runs until the next heading of the same or a
+        higher level or a thematic break; a ``<details>`` section is the
+        block's content. With ``labels``, a paragraph whose first line
+        matches (such as ``**Actionable comments posted: 3**``) starts a
+        section running until the next heading. Sections nested in a
+        matching section are part of it and not returned on their own.
+
+        Args:
+            title: Pattern searched in titles, or predicate on titles
+            labels: Also consider paragraph labels
+        """
+        matches = title.search if hasattr(title, "search") else title
+        found: List[Section] = []
+        # Blocks of the open <details> and the index of their next block; an
+        # explicit stack like the tokenizer's, so nesting depth is unbounded
+        stack: List[list] = [[self.blocks, 0]]
+        while stack:
+            frame = stack[-1]
+            blocks, index = frame
+            if index >= len(blocks):
+                stack.pop()
+                continue
+            block = blocks[index]
+            frame[1] = index + 1
+            if block.kind == DETAILS:
+                if matches(block.title):
+                    found.append(Section(block.title, block.children, self.lines))
+                else:
+                    stack.append([block.children, 0])
+            elif block.kind == HEADING and matches(block.title):
+                end = index + 1
+                while end < len(blocks) and not (
+                    blocks[end].kind == RULE
+                    or (blocks[end].kind == HEADING and blocks[end].level <= block.level)
+                ):
+                    end += 1
+                found.append(Section(block.title, blocks[index + 1:end], self.lines))
+                frame[1] = end
+            elif labels and block.kind == PARAGRAPH and matches(block.title):
+                end = index + 1
+                while end < len(blocks) and blocks[end].kind != HEADING:
+                    end += 1
+                found.append(Section(block.title, blocks[index + 1:end], self.lines))
+                frame[1] = end
+        return found
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_blocks(text: str) -> Section:
+    """Split a comment body into its block tree.
+
+    Results are cached, so extractors called one after the other on the
+    same body share one parse.
+
+    Args:
+        text: Comment body
+
+    Returns:
+        Untitled section holding the top-level blocks
+    """
+    lines = tuple(text.split("\n"))
+    return Section("", _Tokenizer(lines).run(), lines)
+
+
+class _Tokenizer:
+    """Single forward pass over the lines of a body."""
+
+    def __init__(self, lines: Tuple[str, ...]) -> None:
+        self.lines = lines
+        # Open containers: [summary, blocks, start line]; the root first
+        self.stack: List[list] = [["", [], 0]]
+        self.summary: Optional[List[str]] = None
+        self.paragraph: List[int] = []
+        self.table: List[int] = []
+        self.item: Optional[list] = None
+
+    def run(self) -> Tuple[Block, ...]:
+        lines = self.lines
+        index = 0
+        while index < len(lines):
+            line = lines[index]
+            stripped, closes = self._consume_tags(line.strip(), index)
+            if stripped is None:
+                # Inside a multi-line <summary>
+                index += 1
+                continue
+
+            fence = _FENCE.match(stripped) if stripped[:1] in "`~" else None
+            if fence:
+                self._flush()
+                index = self._fence(index, fence)
+                self._close(closes, index - 1)
+                continue
+
+            if not stripped:
+                self._flush()
+            elif stripped.count("|") >= 2:
+                self._flush_except(TABLE)
+                self.table.append(index)
+            elif stripped[0] == "#" and _HEADING.match(stripped):
+                self._flush()
+                heading = _HEADING.match(stripped)
+                self._emit(Block(HEADING, heading.group(2), index, index + 1, level=len(heading.group(1))))
+            elif stripped[0] in "-*_" and _RULE.match(stripped):
+                self._flush()
+                self._emit(Block(RULE, stripped, index, index + 1))
+            elif _LIST_ITEM.match(stripped):
+                self._flush()
+                item = _LIST_ITEM.match(stripped)
+                indent = len(line) - len(line.lstrip())
+                self.item = [item.group(1), indent, index, [item.group(2)]]
+            elif self.item is not None:
+                self.item[3].append(stripped)
+            else:
+                self._flush_except(PARAGRAPH)
+                self.paragraph.append(index)
+            self._close(closes, index)
+            index += 1
+
+        self._flush()
+        while len(self.stack) > 1:
+            self._pop(len(lines))
+        return tuple(self.stack[0][1])
+
+    def _consume_tags(self, stripped: str, index: int) -> Tuple[Optional[str], int]:
+        """Handle ``<details>``/``<summary>``/``<blockquote>`` tags at the line edges.
+
+        Returns:
+            The rest of the line (None while a ``<summary>`` is still open)
+            and the number of ``</details>`` closing the line
+        """
+        if self.summary is not None:
+            end = _SUMMARY_END.search(stripped)
+            if end is None:
+                self.summary.append(stripped)
+                return None, 0
+            self.summary.append(stripped[:end.start()])
+            self._set_summary(" ".join(self.summary))
+            self.summary = None
+            stripped = stripped[end.end():].strip()
+
+        while stripped.startswith("<"):
+            tag = _LEADING_TAG.match(stripped)
+            if tag is None:
+                break
+            closing, name = tag.group(1), tag.group(2).lower()
+            stripped = stripped[tag.end():].strip()
+            if name == "details":
+                self._flush()
+                if closing:
+                    self._pop(index + 1)
+                else:
+                    self.stack.append(["", [], index])
+            elif name == "summary" and not closing:
+                end = _SUMMARY_END.search(stripped)
+                if end is None:
+                    self.summary = [stripped]
+                    return None, 0
+                self._set_summary(stripped[:end.start()])
+                stripped = stripped[end.end():].strip()
+
+        closes = 0
+        while stripped.endswith(">"):
+            tag = _TRAILING_TAG.search(stripped)
+            if tag is None:
+                break
+            closes += tag.group(1).lower() == "details"
+            stripped = stripped[:tag.start()].rstrip()
+        return stripped, closes
+
+    def _set_summary(self, summary: str) -> None:
+        if len(self.stack) > 1:
+            self.stack[-1][0] = _TAGS.sub("", summary).strip()
+
+    def _fence(self, index: int, fence: "re.Match[str]") -> int:
+        """Consume a fenced code block; an unclosed fence runs to the end."""
+        marker = fence.group(1)
+        end = index + 1
+        while end < len(self.lines):
+            candidate = self.lines[end].strip()
+            if candidate.startswith(marker) and not candidate.strip(marker[0]):
+                break
+            end += 1
+        content = "\n".join(self.lines[index + 1:end])
+        self._emit(Block(CODE, content, index, min(end + 1, len(self.lines)), info=fence.group(2).strip()))
+        return end + 1
+
+    def _close(self, closes: int, index: int) -> None:
+        if closes:
+            self._flush()
+        for _ in range(closes):
+            self._pop(index + 1)
+
+    def _pop(self, end: int) -> None:
+        """Close the innermost ``<details>`` block."""
+        if len(self.stack) == 1:
+            return
+        self._flush()
+        summary, blocks, start = self.stack.pop()
+        self._emit(Block(DETAILS, "\n".join(self.lines[start:end]), start, end,
+                         info=summary, children=tuple(blocks)))
+
+    def _emit(self, block: Block) -> None:
+        self.stack[-1][1].append(block)
+
+    def _flush_except(self, kind: str) -> None:
+        if kind != PARAGRAPH and self.paragraph:
+            self._flush_paragraph()
+        if kind != TABLE and self.table:
+            self._flush_table()
+        if self.item is not None:
+            self._flush_item()
+
+    def _flush(self) -> None:
+        self._flush_except("")
+
+    def _flush_paragraph(self) -> None:
+        text = "\n".join(self.lines[i].strip() for i in self.paragraph)
+        self._emit(Block(PARAGRAPH, text, self.paragraph[0], self.paragraph[-1] + 1))
+        self.paragraph = []
+
+    def _flush_table(self) -> None:
+        rows = self.table
+        self.table = []
+        if len(rows) < 2:
+            # A single row is a paragraph line
+            self._emit(Block(PARAGRAPH, self.lines[rows[0]].strip(), rows[0], rows[0] + 1))
+            return
+        text = "\n".join(self.lines[i].strip() for i in rows)
+        self._emit(Block(TABLE, text, rows[0], rows[-1] + 1))
+
+    def _flush_item(self) -> None:
+        marker, indent, start, text = self.item
+        self.item = None
+        self._emit(Block(LIST_ITEM, "\n".join(text), start, start + len(text), level=indent, info=marker))
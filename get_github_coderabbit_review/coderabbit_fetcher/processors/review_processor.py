@@ -1,16 +1,42 @@
 """Review comment processor for extracting actionable comments and specialized sections."""
 
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Tuple
 
 from ..models import ActionableComment, AIAgentPrompt
 from ..models.review_comment import ReviewComment, NitpickComment, OutsideDiffComment
 from ..exceptions import CommentParsingError
+from .markdown_blocks import CODE, DETAILS, LIST_ITEM, PARAGRAPH, Section, parse_blocks
+
+# List item anchored to a file: "`path:10-12` - text", "path:10 - text", "path - text"
+_FILE_ITEM = re.compile(
+    r"(?:`(?P<file>[^`:]+)(?::(?P<line>\d+(?:-\d+)?))?`"
+    r"|(?P<file2>[^\s:`]+)(?::(?P<line2>\d+(?:-\d+)?))?)"
+    r"\s*[-:–—]\s*(?P<desc>[^-:–—\s].*)",
+    re.DOTALL
+)
+
+# CodeRabbit per-file <details> title: "path/to/file.py (2)"
+_FILE_TITLE = re.compile(r"(?P<file>\S+)\s+\(\d+\)$")
+
+# Entry of a per-file <details> block: "`10-12`: **text**"
+_RANGE_ENTRY = re.compile(r"`(?P<line>\d+(?:-\d+)?)`\s*:\s*(?P<desc>.+)", re.DOTALL)
+
+# Inline code and HTML code tags
+_INLINE_CODE = re.compile(r"`([^`\n]+)`|<code>(.*?)</code>", re.DOTALL)
+
+
+def _title_pattern(patterns: List[str]) -> "re.Pattern[str]":
+    """Combine section title patterns into one case-insensitive pattern."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
 
 
 class ReviewProcessor:
     """Processes CodeRabbit review comments to extract actionable items and specialized sections."""
-    
+
+    # Bump when the parsed output changes, to invalidate cached results
+    VERSION = 1
+
     def __init__(self):
         """Initialize the review processor."""
         self.nitpick_patterns = [
@@ -33,6 +59,16 @@ class ReviewProcessor:
             r"AI Agent Prompt",
             r"For AI Agents"
         ]
+
+        self.actionable_patterns = [
+            r"Actionable comments?"
+        ]
+        
+        # Section titles are matched against the block tree of a body
+        self._actionable_title = _title_pattern(self.actionable_patterns)
+        self._nitpick_title = _title_pattern(self.nitpick_patterns)
+        self._outside_diff_title = _title_pattern(self.outside_diff_patterns)
+        self._ai_agent_title = _title_pattern(self.ai_agent_patterns)
     
     def process_review_comment(self, comment: Dict[str, Any]) -> ReviewComment:
         """Process a CodeRabbit review comment.
@@ -79,27 +115,16 @@ class ReviewProcessor:
         Returns:
             List of ActionableComment objects
         """
-        actionable_comments = []
+        tree = parse_blocks(content)
         
         # Look for sections that contain actionable items
-        actionable_patterns = [
-            r"### Actionable comments[^#]*?(?=\n#{1,3}|\\Z)",
-            r"## Actionable comments[^#]*?(?=\n#{1,2}|\\Z)",
-            r"#### Actionable comments[^#]*?(?=\n#{1,4}|\\Z)",
-            r"\*\*Actionable comments posted:\s*(\d+)\*\*.*?(?=\n#{1,3}|\\Z)",
-        ]
-        
-        for pattern in actionable_patterns:
-            matches = re.finditer(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                section = match.group(0)
-                items = self._parse_actionable_items(section)
-                actionable_comments.extend(items)
+        actionable_comments = []
+        for section in tree.sections(self._actionable_title, labels=False):
+            actionable_comments.extend(self._actionable_items(section))
         
         # If no specific actionable sections found, look for general issue patterns
         if not actionable_comments:
-            items = self._parse_actionable_items(content)
-            actionable_comments.extend(items)
+            actionable_comments = self._actionable_items(tree)
         
         return actionable_comments
     
@@ -112,22 +137,15 @@ class ReviewProcessor:
         Returns:
             List of NitpickComment objects
         """
-        nitpick_comments = []
+        tree = parse_blocks(content)
         
-        for pattern in self.nitpick_patterns:
-            # Look for nitpick sections
-            section_pattern = f"{pattern}[^#]*?(?=\n#{1,3}|\\Z)"
-            matches = re.finditer(section_pattern, content, re.DOTALL | re.IGNORECASE)
-            
-            for match in matches:
-                section = match.group(0)
-                items = self._parse_nitpick_items(section)
-                nitpick_comments.extend(items)
+        nitpick_comments = []
+        for section in tree.sections(self._nitpick_title):
+            nitpick_comments.extend(self._nitpick_items(section))
         
         # If no nitpick sections found but emoji pattern exists, look for general suggestions
         if not nitpick_comments and "🧹" in content:
-            items = self._parse_nitpick_items(content)
-            nitpick_comments.extend(items)
+            nitpick_comments = self._nitpick_items(tree)
         
         return nitpick_comments
     
@@ -140,22 +158,15 @@ class ReviewProcessor:
         Returns:
             List of OutsideDiffComment objects
         """
-        outside_diff_comments = []
+        tree = parse_blocks(content)
         
-        for pattern in self.outside_diff_patterns:
-            # Look for outside diff sections
-            section_pattern = f"{pattern}[^#]*?(?=\n#{1,3}|\\Z)"
-            matches = re.finditer(section_pattern, content, re.DOTALL | re.IGNORECASE)
-            
-            for match in matches:
-                section = match.group(0)
-                items = self._parse_outside_diff_items(section)
-                outside_diff_comments.extend(items)
+        outside_diff_comments = []
+        for section in tree.sections(self._outside_diff_title):
+            outside_diff_comments.extend(self._outside_diff_items(section))
         
         # If no outside diff sections found but pattern exists, look for general items
         if not outside_diff_comments and ("⚠️" in content or "outside diff" in content.lower()):
-            items = self._parse_outside_diff_items(content)
-            outside_diff_comments.extend(items)
+            outside_diff_comments = self._outside_diff_items(tree)
         
         return outside_diff_comments
     
@@ -170,39 +181,33 @@ class ReviewProcessor:
         """
         ai_prompts = []
         
-        for pattern in self.ai_agent_patterns:
-            # Look for AI agent prompt sections
-            section_pattern = f"<details>[^<]*?<summary>{pattern}</summary>(.*?)</details>"
-            matches = re.finditer(section_pattern, content, re.DOTALL | re.IGNORECASE)
+        for section in parse_blocks(content).sections(self._ai_agent_title, labels=False):
+            prompt_content = section.text
             
-            for match in matches:
-                prompt_content = match.group(1).strip()
-                
-                # Extract code blocks from the prompt
-                code_blocks = self._extract_code_blocks(prompt_content)
+            # Extract code blocks from the prompt
+            code_blocks = self._code_blocks(section)
+            
+            if code_blocks:
+                # Use first code block as main content, first other block as description
+                description = next(
+                    (block.title.strip() for block in section.blocks if block.kind != CODE and block.title.strip()),
+                    "AI Agent Prompt"
+                )
                 
-                if code_blocks:
-                    # Use first code block as main content
-                    main_code_block = code_blocks[0]
-                    
-                    # Extract description from prompt content
-                    lines = prompt_content.split('\n')
-                    description = next((line.strip() for line in lines if line.strip() and not line.strip().startswith('```')), "AI Agent Prompt")
-                    
-                    ai_prompts.append(AIAgentPrompt(
-                        code_block=main_code_block,
-                        description=description[:200] if description else "AI Agent Prompt",
-                        file_path="",  # Will be filled by context analysis
-                        line_range=""  # Will be filled by context analysis
-                    ))
-                else:
-                    # If no code blocks, create a prompt with the content as description
-                    ai_prompts.append(AIAgentPrompt(
-                        code_block=prompt_content,  # Use content as code block
-                        description=prompt_content[:200] if prompt_content else "AI Agent Prompt",
-                        file_path="",
-                        line_range=""
-                    ))
+                ai_prompts.append(AIAgentPrompt(
+                    code_block=code_blocks[0],
+                    description=description[:200],
+                    file_path="",  # Will be filled by context analysis
+                    line_range=""  # Will be filled by context analysis
+                ))
+            else:
+                # If no code blocks, create a prompt with the content as description
+                ai_prompts.append(AIAgentPrompt(
+                    code_block=prompt_content,  # Use content as code block
+                    description=prompt_content[:200] if prompt_content else "AI Agent Prompt",
+                    file_path="",
+                    line_range=""
+                ))
         
         return ai_prompts
     
@@ -239,43 +244,7 @@ class ReviewProcessor:
         Returns:
             List of ActionableComment objects
         """
-        items = []
-        
-        # Look for individual actionable items
-        # Pattern for file:line format
-        # 箇条書き/番号付き、`file`またはfile、:line(または:start-end)→区切り(–—含む)→説明
-        item_pattern = (
-            r"(?m)^(?:[-*+]|\d+\.)\s*"
-            r"(?:`(?P<file>[^`]+)`|(?P<file2>[^:\n]+))"
-            r"(?::(?P<line>\d+(?:-\d+)?))?\s*[-:–—]\s*"
-            r"(?P<desc>.+?)"
-            r"(?=(?:\n(?:[-*+]|\d+\.)\s+)|\n{2,}|\Z)"
-        )
-        
-        matches = re.finditer(item_pattern, section, re.MULTILINE | re.DOTALL)
-        
-        for match in matches:
-            file_info = (match.group("file") or match.group("file2") or "").strip()
-            line_number = match.group("line")
-            description = match.group("desc").strip()
-            
-            if len(description) > 10:  # Filter out very short descriptions
-                # Clean up the description
-                description = re.sub(r'\n+', ' ', description)
-                description = re.sub(r'\s+', ' ', description)
-                
-                line_range = line_number if line_number else "0"
-                
-                items.append(ActionableComment(
-                    comment_id=f"actionable_{len(items)}",
-                    file_path=file_info,
-                    line_range=line_range,
-                    issue_description=description,
-                    priority="medium",  # Default priority
-                    raw_content=match.group(0)
-                ))
-        
-        return items
+        return self._actionable_items(parse_blocks(section))
     
     def _parse_nitpick_items(self, section: str) -> List[NitpickComment]:
         """Parse nitpick items from a section.
@@ -286,31 +255,7 @@ class ReviewProcessor:
         Returns:
             List of NitpickComment objects
         """
-        items = []
-        
-        # Look for file:line patterns in nitpick sections
-        item_pattern = r"(?:`([^`]+)`|([^:\n]+)):?(\d+)?[:\-\s]*(.+?)(?=\n[-*+]|\n`|\n\n|\\Z)"
-        
-        matches = re.finditer(item_pattern, section, re.MULTILINE | re.DOTALL)
-        
-        for match in matches:
-            file_path = match.group(1) or match.group(2) or ""
-            line_number = match.group(3) or "0"
-            suggestion = match.group(4).strip()
-            
-            if len(suggestion) > 5 and file_path:
-                # Clean up the suggestion
-                suggestion = re.sub(r'\n+', ' ', suggestion)
-                suggestion = re.sub(r'\s+', ' ', suggestion)
-                
-                items.append(NitpickComment(
-                    file_path=file_path.strip(),
-                    line_range=line_number,
-                    suggestion=suggestion,
-                    raw_content=match.group(0)
-                ))
-        
-        return items
+        return self._nitpick_items(parse_blocks(section))
     
     def _parse_outside_diff_items(self, section: str) -> List[OutsideDiffComment]:
         """Parse outside diff items from a section.
@@ -321,59 +266,119 @@ class ReviewProcessor:
         Returns:
             List of OutsideDiffComment objects
         """
+        return self._outside_diff_items(parse_blocks(section))
+    
+    def _extract_code_blocks(self, content: str) -> List[str]:
+        """Extract code blocks from content.
+        
+        Args:
+            content: Text content that may contain code blocks
+            
+        Returns:
+            List of code block contents
+        """
+        return self._code_blocks(parse_blocks(content))
+    
+    def _actionable_items(self, section: Section) -> List[ActionableComment]:
+        """Build the actionable comments of the file entries of a section."""
         items = []
         
-        # Look for file patterns in outside diff sections
-        item_pattern = r"(?:`([^`]+)`|([^:\n]+)):?(\d+)?[:\-\s]*(.+?)(?=\n[-*+]|\n`|\n\n|\\Z)"
+        # Per-file entries are nitpick or outside diff comments; actionable ones are posted inline
+        for file_path, line_range, description, raw_content in self._file_entries(section, per_file=False):
+            description = " ".join(description.split())
+            
+            if len(description) > 10:  # Filter out very short descriptions
+                items.append(ActionableComment(
+                    comment_id=f"actionable_{len(items)}",
+                    file_path=file_path,
+                    line_range=line_range,
+                    issue_description=description,
+                    priority="medium",  # Default priority
+                    raw_content=raw_content
+                ))
         
-        matches = re.finditer(item_pattern, section, re.MULTILINE | re.DOTALL)
+        return items
+    
+    def _nitpick_items(self, section: Section) -> List[NitpickComment]:
+        """Build the nitpick comments of the file entries of a section."""
+        items = []
         
-        for match in matches:
-            file_path = match.group(1) or match.group(2) or ""
-            line_number = match.group(3) or "0"
-            content = match.group(4).strip()
+        for file_path, line_range, suggestion, raw_content in self._file_entries(section):
+            suggestion = " ".join(suggestion.split())
             
-            if len(content) > 10 and file_path:
-                # Clean up the content
-                content = re.sub(r'\n+', ' ', content)
-                content = re.sub(r'\s+', ' ', content)
-                
+            if len(suggestion) > 5:
+                items.append(NitpickComment(
+                    file_path=file_path,
+                    line_range=line_range,
+                    suggestion=suggestion,
+                    raw_content=raw_content
+                ))
+        
+        return items
+    
+    def _outside_diff_items(self, section: Section) -> List[OutsideDiffComment]:
+        """Build the outside diff comments of the file entries of a section."""
+        items = []
+        
+        for file_path, line_range, content, raw_content in self._file_entries(section):
+            content = " ".join(content.split())
+            
+            if len(content) > 10:
                 items.append(OutsideDiffComment(
-                    file_path=file_path.strip(),
-                    line_range=line_number,
+                    file_path=file_path,
+                    line_range=line_range,
                     content=content,
                     reason="Outside diff range",
-                    raw_content=match.group(0)
+                    raw_content=raw_content
                 ))
         
         return items
     
-    def _extract_code_blocks(self, content: str) -> List[str]:
-        """Extract code blocks from content.
+    def _file_entries(self, section: Section, per_file: bool = True) -> Iterator[Tuple[str, str, str, str]]:
+        """Iterate over the entries of a section anchored to a file.
+        
+        Entries are list items such as ``- `path:10-12` - text`` and, in
+        CodeRabbit's per-file ``<details>`` blocks (``<summary>path (N)</summary>``),
+        paragraphs starting with a line range such as ``\`10-12\`: text``.
         
         Args:
-            content: Text content that may contain code blocks
+            section: Section to search, nested blocks included
+            per_file: Include the entries of per-file ``<details>`` blocks
             
-        Returns:
-            List of code block contents
+        Yields:
+            Tuples of file path, line range ("0" when unknown), text and source
         """
-        code_blocks = []
-        
-        # Look for various code block patterns
-        patterns = [
-            r"```(?:\w+)?\s*\n(.*?)\n```",  # Standard markdown code blocks
-            r"`([^`\n]+)`",                 # Inline code (single line only)
-            r"<code>(.*?)</code>",          # HTML code tags
-        ]
+        for block in section.walk(LIST_ITEM, DETAILS) if per_file else section.walk(LIST_ITEM):
+            if block.kind == LIST_ITEM:
+                match = _FILE_ITEM.match(block.text)
+                if match:
+                    yield (
+                        match.group("file") or match.group("file2"),
+                        match.group("line") or match.group("line2") or "0",
+                        match.group("desc"),
+                        section.source(block)
+                    )
+                continue
+            
+            title = _FILE_TITLE.match(block.title)
+            if not title:
+                continue
+            for child in block.children:
+                entry = _RANGE_ENTRY.match(child.text) if child.kind == PARAGRAPH else None
+                if entry:
+                    yield title.group("file"), entry.group("line"), entry.group("desc"), section.source(child)
+    
+    def _code_blocks(self, section: Section) -> List[str]:
+        """Get fenced code blocks, then inline code, of a section (longer than 3 characters)."""
+        code_blocks = [block.text.strip() for block in section.walk(CODE)]
         
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.DOTALL)
-            for match in matches:
-                code_content = match.group(1).strip()
-                if code_content and len(code_content) > 3:
-                    code_blocks.append(code_content)
+        for block in section.walk():
+            if block.kind not in (CODE, DETAILS):
+                code_blocks.extend(
+                    match.group(1) or match.group(2) or "" for match in _INLINE_CODE.finditer(block.text)
+                )
         
-        return code_blocks
+        return [code for code in (block.strip() for block in code_blocks) if len(code) > 3]
     
     def has_review_content(self, content: str) -> bool:
         """Check if content contains review-like information.
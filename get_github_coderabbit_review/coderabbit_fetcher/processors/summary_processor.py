@@ -5,11 +5,28 @@ from typing import List, Optional, Dict, Any
 
 from ..models import SummaryComment, ChangeEntry
 from ..exceptions import CommentParsingError
+from .markdown_blocks import CODE, LIST_ITEM, TABLE, parse_blocks
+
+# Section titles (headings, optionally with an emoji) and "- **Label**: text" list items
+_NEW_FEATURES_TITLE = re.compile(r"^(?:✨\s*)?New features?:?$", re.IGNORECASE)
+_NEW_FEATURES_LABEL = re.compile(r"\*\*New features?\*\*:?\s*(.*)", re.IGNORECASE | re.DOTALL)
+_DOCUMENTATION_TITLE = re.compile(r"^(?:📚\s*)?Documentation:?$", re.IGNORECASE)
+_DOCUMENTATION_LABEL = re.compile(r"\*\*Documentation\*\*:?\s*(.*)", re.IGNORECASE | re.DOTALL)
+_TESTS_TITLE = re.compile(r"^(?:🧪\s*)?Tests?:?$", re.IGNORECASE)
+_TESTS_LABEL = re.compile(r"\*\*Tests?\*\*:?\s*(.*)", re.IGNORECASE | re.DOTALL)
+_WALKTHROUGH_TITLE = re.compile(r"^(?:🚶\s*)?Walkthrough:?$", re.IGNORECASE)
+
+# Code fence languages of diagrams
+_DIAGRAM_LANGUAGES = ("diagram", "flow", "graph")
+_SEQUENCE_KEYWORDS = ("sequence", "participant", "actor", "->", "activate", "deactivate")
 
 
 class SummaryProcessor:
     """Processes CodeRabbit summary comments to extract structured information."""
 
+    # Bump when the parsed output changes, to invalidate cached results
+    VERSION = 1
+
     def __init__(self):
         """Initialize the summary processor."""
         self.summary_patterns = [
@@ -26,6 +43,9 @@ class SummaryProcessor:
             r"## 📋 サマリー",
             r"🤖 サマリー by CodeRabbit"
         ]
+        self._summary_pattern = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.summary_patterns), re.IGNORECASE
+        )
 
     def process_summary_comment(self, comment: Dict[str, Any]) -> SummaryComment:
         """Process a CodeRabbit summary comment.
@@ -77,11 +97,7 @@ class SummaryProcessor:
         Returns:
             True if this is a summary comment
         """
-        body_lines = body.lower()
-        return any(
-            re.search(pattern, body_lines, re.IGNORECASE)
-            for pattern in self.summary_patterns
-        )
+        return self._summary_pattern.search(body) is not None
 
     def is_summary_comment(self, body: str) -> bool:
         """Public API to check if the comment body contains a CodeRabbit summary.
@@ -103,32 +119,7 @@ class SummaryProcessor:
         Returns:
             List of new features mentioned
         """
-        features = []
-
-        # Common patterns for new features
-        feature_patterns = [
-            r"### New features?\s*\n(.*?)(?=\n###|\n##|\n---|\Z)",
-            r"## New features?\s*\n(.*?)(?=\n##|\n---|\Z)",
-            r"#### New features?\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"#### ✨ New features?\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"- \*\*New features?\*\*:?\s*(.*?)(?=\n-|\n##|\Z)"
-        ]
-
-        for pattern in feature_patterns:
-            matches = re.finditer(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                section = match.group(1).strip()
-                features.extend(self._parse_bullet_points(section))
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_features = []
-        for feature in features:
-            if feature not in seen:
-                seen.add(feature)
-                unique_features.append(feature)
-
-        return unique_features
+        return self._extract_section_items(content, _NEW_FEATURES_TITLE, _NEW_FEATURES_LABEL)
 
     def _extract_documentation_changes(self, content: str) -> List[str]:
         """Extract documentation changes from summary content.
@@ -139,32 +130,7 @@ class SummaryProcessor:
         Returns:
             List of documentation changes mentioned
         """
-        doc_changes = []
-
-        # Common patterns for documentation changes
-        doc_patterns = [
-            r"### Documentation\s*\n(.*?)(?=\n###|\n##|\n---|\Z)",
-            r"## Documentation\s*\n(.*?)(?=\n##|\n---|\Z)",
-            r"#### Documentation\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"#### 📚 Documentation\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"- \*\*Documentation\*\*:?\s*(.*?)(?=\n-|\n##|\Z)"
-        ]
-
-        for pattern in doc_patterns:
-            matches = re.finditer(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                section = match.group(1).strip()
-                doc_changes.extend(self._parse_bullet_points(section))
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_changes = []
-        for change in doc_changes:
-            if change not in seen:
-                seen.add(change)
-                unique_changes.append(change)
-
-        return unique_changes
+        return self._extract_section_items(content, _DOCUMENTATION_TITLE, _DOCUMENTATION_LABEL)
 
     def _extract_test_changes(self, content: str) -> List[str]:
         """Extract test changes from summary content.
@@ -175,32 +141,37 @@ class SummaryProcessor:
         Returns:
             List of test changes mentioned
         """
-        test_changes = []
-
-        # Common patterns for test changes
-        test_patterns = [
-            r"### Tests?\s*\n(.*?)(?=\n###|\n##|\n---|\Z)",
-            r"## Tests?\s*\n(.*?)(?=\n##|\n---|\Z)",
-            r"#### Tests?\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"#### 🧪 Tests?\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"- \*\*Tests?\*\*:?\s*(.*?)(?=\n-|\n##|\Z)"
-        ]
+        return self._extract_section_items(content, _TESTS_TITLE, _TESTS_LABEL)
 
-        for pattern in test_patterns:
-            matches = re.finditer(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                section = match.group(1).strip()
-                test_changes.extend(self._parse_bullet_points(section))
+    def _extract_section_items(self, content: str, title: "re.Pattern[str]",
+                               label: "re.Pattern[str]") -> List[str]:
+        """Collect the items of the sections with a title.
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_changes = []
-        for change in test_changes:
-            if change not in seen:
-                seen.add(change)
-                unique_changes.append(change)
+        Items come from the sections headed by a matching heading or
+        ``<details>`` summary and from list items starting with a bold label
+        (``- **New features**: ...``).
+
+        Args:
+            content: Summary comment body
+            title: Section title pattern
+            label: List item label pattern capturing the item content
+
+        Returns:
+            Items without duplicates, in order of appearance
+        """
+        tree = parse_blocks(content)
+        items = []
 
-        return unique_changes
+        for section in tree.sections(title, labels=False):
+            items.extend(self._parse_bullet_points(section.text))
+
+        for block in tree.walk(LIST_ITEM):
+            match = label.match(block.text)
+            if match:
+                items.extend(self._parse_bullet_points(match.group(1).strip()))
+
+        # Remove duplicates while preserving order
+        return list(dict.fromkeys(items))
 
     def _extract_walkthrough(self, content: str) -> str:
         """Extract walkthrough section from summary content.
@@ -211,20 +182,8 @@ class SummaryProcessor:
         Returns:
             Walkthrough text or empty string if not found
         """
-        # Common patterns for walkthrough
-        walkthrough_patterns = [
-            r"### Walkthrough\s*\n(.*?)(?=\n###|\n##|\n---|\Z)",
-            r"## Walkthrough\s*\n(.*?)(?=\n##|\n---|\Z)",
-            r"#### Walkthrough\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-            r"#### 🚶 Walkthrough\s*\n(.*?)(?=\n####|\n###|\n##|\Z)",
-        ]
-
-        for pattern in walkthrough_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ""
+        sections = parse_blocks(content).sections(_WALKTHROUGH_TITLE, labels=False)
+        return sections[0].text if sections else ""
 
     def _extract_changes_table(self, content: str) -> List[ChangeEntry]:
         """Extract changes table from summary content.
@@ -237,43 +196,9 @@ class SummaryProcessor:
         """
         changes = []
 
-        # Look for markdown tables - simpler approach
-        # Find lines that look like table rows
-        lines = content.split('\n')
-        table_lines = []
-        current_table = []
-        in_code_block = False
-        
-        for line in lines:
-            line_stripped = line.strip()
-            
-            # Check for fenced code block markers
-            if line_stripped.startswith("```"):
-                in_code_block = not in_code_block
-                # If we're entering a code block and have an open table, close it
-                if in_code_block and len(current_table) >= 2:
-                    table_lines.append(current_table)
-                    current_table = []
-                continue
-            
-            # Skip table detection inside code blocks
-            if in_code_block:
-                continue
-                
-            if line_stripped and '|' in line_stripped and line_stripped.count('|') >= 2:
-                current_table.append(line_stripped)
-            else:
-                if len(current_table) >= 2:  # At least header + one data row
-                    table_lines.append(current_table)
-                current_table = []
-        
-        # Don't forget the last table (if not in code block)
-        if not in_code_block and len(current_table) >= 2:
-            table_lines.append(current_table)
-
-        # Process each table
-        for table_rows in table_lines:
-            self._process_table_rows(table_rows, changes)
+        # Tables inside code blocks are code blocks, not tables
+        for table in parse_blocks(content).walk(TABLE):
+            self._process_table_rows(table.text.split('\n'), changes)
 
         return changes
 
@@ -326,33 +251,19 @@ class SummaryProcessor:
         Returns:
             Sequence diagram text or None if not found
         """
-        # Look for mermaid sequence diagrams
-        mermaid_patterns = [
-            r"```mermaid\s*\n(sequenceDiagram.*?)```",
-            r"```\s*mermaid\s*\n(sequenceDiagram.*?)```",
-            r"```sequence\s*\n(.*?)```"
+        code_blocks = [
+            (block.info.lower(), block.text.strip()) for block in parse_blocks(content).walk(CODE)
         ]
 
-        for pattern in mermaid_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        # Look for other diagram formats
-        diagram_patterns = [
-            r"```\s*diagram\s*\n(.*?)```",
-            r"```\s*flow\s*\n(.*?)```",
-            r"```\s*graph\s*\n(.*?)```"
-        ]
-
-        for pattern in diagram_patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                diagram_content = match.group(1).strip()
-                # Check if it looks like a sequence diagram
-                if any(keyword in diagram_content.lower() for keyword in
-                       ['sequence', 'participant', 'actor', '->', 'activate', 'deactivate']):
-                    return diagram_content
+        # Look for mermaid sequence diagrams
+        for language, code in code_blocks:
+            if language == "sequence" or (language == "mermaid" and code.lower().startswith("sequencediagram")):
+                return code
+
+        # Look for other diagram formats that look like a sequence diagram
+        for language, code in code_blocks:
+            if language in _DIAGRAM_LANGUAGES and any(keyword in code.lower() for keyword in _SEQUENCE_KEYWORDS):
+                return code
 
         return None
 
@@ -2,16 +2,19 @@
 
 import re
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timezone
-from collections import defaultdict
 
 from ..models import ThreadContext
 from ..exceptions import CommentParsingError
+from ..keywords import COMMENT_KEYWORDS
+from ..thread_index import ThreadIndex, sort_chronologically, thread_key
 
 
 class ThreadProcessor:
     """Processes comment threads to analyze structure and generate contextual summaries."""
 
+    # Bump when the parsed output changes, to invalidate cached results
+    VERSION = 2
+
     def __init__(self, resolved_marker: str = "🔒 CODERABBIT_RESOLVED 🔒"):
         """Initialize the thread processor.
 
@@ -35,7 +38,7 @@ class ThreadProcessor:
         """
         if not thread_comments:
             # Return early for empty thread - this is a normal case
-            return ThreadContext(
+            return ThreadContext.trusted(
                 thread_id="empty",
                 main_comment={"id": "empty", "body": "Empty thread", "user": {"login": "system"}},
                 replies=[],
@@ -65,7 +68,7 @@ class ThreadProcessor:
             # Determine resolution status
             resolution_status = "resolved" if is_resolved else "unresolved"
 
-            return ThreadContext(
+            return ThreadContext.trusted(
                 thread_id=thread_id,
                 main_comment=root_comment,
                 replies=replies,
@@ -116,24 +119,9 @@ class ThreadProcessor:
             comments: List of comments to sort
 
         Returns:
-            Comments sorted by creation time
+            Comments sorted by creation time (comments without a valid time last)
         """
-        def parse_datetime(dt_string: str) -> datetime:
-            """Parse datetime string with fallback handling."""
-            try:
-                # Try parsing ISO format with Z suffix
-                if dt_string.endswith('Z'):
-                    return datetime.fromisoformat(dt_string[:-1] + '+00:00')
-                else:
-                    return datetime.fromisoformat(dt_string)
-            except (ValueError, TypeError):
-                # Fallback to current time if parsing fails
-                return datetime.now(timezone.utc)
-
-        return sorted(
-            comments,
-            key=lambda c: parse_datetime(c.get("created_at", ""))
-        )
+        return sort_chronologically(comments)
 
     def _group_comments_into_threads(self, comments: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
         """Group comments into threads based on reply relationships.
@@ -144,28 +132,31 @@ class ThreadProcessor:
         Returns:
             List of comment threads
         """
-        # Create mapping of comment ID to comment
-        comment_map = {str(c.get("id", "")): c for c in comments if c.get("id")}
+        return list(self.group_comments_by_root(comments).values())
 
-        # Group comments by thread
-        threads = defaultdict(list)
-        root_comments = []
+    def group_comments_by_root(self, comments: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group comments into threads keyed by their root comment ID.
 
-        for comment in comments:
-            comment_id = str(comment.get("id", ""))
-            reply_to_id = comment.get("in_reply_to_id")
+        Args:
+            comments: List of all comments
 
-            if reply_to_id is None:
-                # This is a root comment
-                root_comments.append(comment)
-                threads[comment_id].append(comment)
-            else:
-                # This is a reply - find the root comment
-                root_id = self._find_thread_root(str(reply_to_id), comment_map)
-                threads[root_id].append(comment)
+        Returns:
+            Comments of each thread in input order, by root comment ID, in
+            the order of the first comment of each thread
+        """
+        return ThreadIndex.group_comments(comments)
+
+    def thread_root_id(self, comment: Dict[str, Any], comment_map: Dict[str, Dict[str, Any]]) -> str:
+        """Get the ID of the root comment of a comment's thread.
 
-        # Convert to list of thread lists
-        return [thread for thread in threads.values() if thread]
+        Args:
+            comment: Comment to find the thread of
+            comment_map: Mapping of comment IDs to the comments of all threads
+
+        Returns:
+            Root comment ID
+        """
+        return thread_key(comment, comment_map)
 
     def _find_thread_root(self, comment_id: str, comment_map: Dict[str, Dict[str, Any]]) -> str:
         """Find the root comment ID for a given comment.
@@ -177,26 +168,9 @@ class ThreadProcessor:
         Returns:
             Root comment ID
         """
-        visited = set()
-        current_id = comment_id
-
-        while current_id and current_id not in visited:
-            visited.add(current_id)
-
-            if current_id not in comment_map:
-                break
-
-            comment = comment_map[current_id]
-            reply_to_id = comment.get("in_reply_to_id")
-
-            if reply_to_id is None:
-                # Found root comment
-                return current_id
-            else:
-                current_id = str(reply_to_id)
-
-        # If we couldn't find root or hit a cycle, return the original ID
-        return comment_id
+        if comment_id not in comment_map:
+            return comment_id
+        return thread_key(comment_map[comment_id], comment_map)
 
     def _extract_line_context(self, comment: Dict[str, Any]) -> str:
         """Extract line context from a comment.
@@ -240,7 +214,11 @@ class ThreadProcessor:
         return sorted(list(participants))
 
     def _determine_resolution_status(self, comments: List[Dict[str, Any]]) -> bool:
-        """Determine if a thread is resolved based on resolved markers.
+        """Determine if a thread is resolved.
+
+        A thread GitHub reports as resolved (``is_resolved`` of comments
+        fetched through GraphQL) is resolved; otherwise resolved markers
+        in the last comments decide.
 
         Args:
             comments: List of comments in chronological order
@@ -248,6 +226,9 @@ class ThreadProcessor:
         Returns:
             True if thread is resolved
         """
+        if any(comment.get("is_resolved") for comment in comments):
+            return True
+
         # Check the last few comments for resolved markers
         for comment in reversed(comments[-3:]):  # Check last 3 comments
             body = comment.get("body", "")
@@ -329,29 +310,9 @@ class ThreadProcessor:
         """
         topics = set()
 
-        # Common patterns that indicate topics
-        topic_patterns = [
-            (r"security", "security"),
-            (r"performance", "performance"),
-            (r"refactor", "refactoring"),
-            (r"test", "testing"),
-            (r"documentation", "documentation"),
-            (r"error handling", "error handling"),
-            (r"validation", "validation"),
-            (r"async|await", "async programming"),
-            (r"database", "database"),
-            (r"api", "API"),
-            (r"ui|user interface", "UI"),
-            (r"style|formatting", "code style"),
-        ]
-
         for comment in comments:
             if comment.get("user", {}).get("login") == self.coderabbit_author:
-                body = comment.get("body", "").lower()
-
-                for pattern, topic in topic_patterns:
-                    if re.search(pattern, body):
-                        topics.add(topic)
+                topics.update(COMMENT_KEYWORDS.labels(comment.get("body", ""), "topic"))
 
         return sorted(list(topics))
 
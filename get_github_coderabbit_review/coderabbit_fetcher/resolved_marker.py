@@ -1,9 +1,10 @@
 """Resolved marker management for CodeRabbit comments."""
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 
+from .keywords import KeywordAutomaton, is_word_boundary
 from .models import ThreadContext, ResolutionStatus
 
 
@@ -88,7 +89,10 @@ class ResolvedMarkerDetector:
             config: Optional configuration, uses default if not provided
         """
         self.config = config or ResolvedMarkerConfig()
-        self._compiled_patterns = self.config.get_compiled_patterns()
+        self._automaton_key: Optional[Tuple[Tuple[str, ...], bool]] = None
+        self._automaton: Optional[KeywordAutomaton] = None
+        # Patterns made of word characters only need word boundaries in exact match mode
+        self._word_patterns: Set[str] = set()
 
     def is_comment_resolved(self, comment: Dict[str, Any]) -> bool:
         """Check if a single comment contains resolved markers.
@@ -242,32 +246,25 @@ class ResolvedMarkerDetector:
         if not content:
             return False
 
-        # Simple string containment check for exact match mode
-        if self.config.exact_match:
-            for pattern in self.config.all_patterns:
-                if pattern in content:
-                    # Additional check to ensure it's not part of a larger word
-                    # Only for patterns that contain only word characters
-                    if re.match(r'^[\w\s]+$', pattern):
-                        # Use word boundary check for word-only patterns
-                        if re.search(rf'\b{re.escape(pattern)}\b', content,
-                                   0 if self.config.case_sensitive else re.IGNORECASE):
-                            return True
-                    else:
-                        # For patterns with special characters, direct containment is enough
-                        if self.config.case_sensitive:
-                            if pattern in content:
-                                return True
-                        else:
-                            if pattern.lower() in content.lower():
-                                return True
-        else:
-            # Use compiled patterns for non-exact match
-            for pattern in self._compiled_patterns:
-                if pattern.search(content):
-                    return True
-
-        return False
+        hits = self._marker_automaton().find_all(content)
+        if not self.config.exact_match:
+            return bool(hits)
+
+        # Exact match: word-only patterns must not be part of a larger word
+        return any(
+            hit.keyword not in self._word_patterns
+            or (is_word_boundary(content, hit.start) and is_word_boundary(content, hit.end))
+            for hit in hits
+        )
+
+    def _marker_automaton(self) -> KeywordAutomaton:
+        """Get the automaton of the configured markers, rebuilt when the configuration changes."""
+        key = (tuple(self.config.all_patterns), self.config.case_sensitive)
+        if self._automaton is None or key != self._automaton_key:
+            self._automaton = KeywordAutomaton(key[0], case_sensitive=key[1])
+            self._automaton_key = key
+            self._word_patterns = {pattern for pattern in key[0] if re.match(r'^[\w\s]+$', pattern)}
+        return self._automaton
 
     def _find_last_coderabbit_comment(self, comments: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Find the last comment from CodeRabbit in a thread.
@@ -0,0 +1,423 @@
+"""
+Persistent analysis server.
+
+``coderabbit-fetch server`` keeps one process warm between analyses: the
+imports, the authenticated GitHub client with its connection pool, response
+cache and rate limit state, and the formatters, compiled resolved marker
+patterns and personas of every persona/marker combination already used.
+Requests are served concurrently on a Unix socket (default) or a localhost
+port:
+
+* ``GET /analyze?pr=<url>&format=<markdown|json|plain>`` returns the
+  formatted analysis as JSON (optional ``persona_file``, ``resolved_marker``,
+  ``fetch_mode`` and ``refresh`` parameters)
+* ``POST /cli`` runs a CLI invocation forwarded by the launcher
+  (``{"argv": [...], "cwd": "..."}``)
+* ``GET /healthz`` returns the server statistics
+
+Requests run with the server's GitHub credentials and may name files to
+read (``persona_file``), so every request must carry the server's access
+token as ``Authorization: Bearer <token>``. The server publishes its address
+and the token (readable by its owner only) in the ``server`` cache
+directory, where the CLI launcher looks for them.
+"""
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import logging
+import os
+import secrets
+import socket
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .async_github_client import AsyncGitHubClient
+from .github_client import DEFAULT_FETCH_MODE, FETCH_MODES
+from .launcher import ADDRESS_FILE, SOCKET_FILE, TOKEN_FILE
+from .orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+from .storage import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted (argv and query parameters are small)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+OUTPUT_FORMATS = ("markdown", "json", "plain")
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class AnalysisServer:
+    """Serves analyses from one warm process."""
+
+    def __init__(self, backend: str = "http", fetch_mode: str = DEFAULT_FETCH_MODE, use_cache: bool = True,
+                 timeout_seconds: int = 300, max_concurrency: int = 8,
+                 github_client: Optional[AsyncGitHubClient] = None, token: Optional[str] = None) -> None:
+        """Initialize the server.
+
+        Args:
+            backend: GitHub API transport of the shared client
+            fetch_mode: Fetch mode of the shared client
+            use_cache: Use the on-disk response cache
+            timeout_seconds: Default timeout of each API request
+            max_concurrency: Maximum number of analyses running at once
+            github_client: Shared client; created from the settings above when omitted
+            token: Access token requests must carry; generated when omitted
+        """
+        self.defaults = ExecutionConfig(
+            pr_url="", backend=backend, fetch_mode=fetch_mode, use_cache=use_cache,
+            timeout_seconds=timeout_seconds, capture_output=True,
+        )
+        self.max_concurrency = max(1, max_concurrency)
+        self._client = github_client
+        self._owns_client = github_client is None
+        # Orchestrators whose loaded components are shared, per persona and marker
+        self._sources: Dict[Tuple[Any, ...], CodeRabbitOrchestrator] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._started_at = time.time()
+        #: Address the server listens on once serving
+        self.address: Optional[str] = None
+        #: Access token requests must carry
+        self.token = token or secrets.token_urlsafe(32)
+        self._stats = {"requests": 0, "active": 0, "succeeded": 0, "failed": 0}
+
+    def build_config(self, params: Dict[str, Any]) -> ExecutionConfig:
+        """Build the configuration of an ``/analyze`` request.
+
+        Raises:
+            ValueError: If the PR URL is missing or a parameter is invalid
+        """
+        pr_url = params.get("pr")
+        if not pr_url:
+            raise ValueError("Missing 'pr' parameter")
+        output_format = params.get("format") or "markdown"
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid format: {output_format}")
+        fetch_mode = params.get("fetch_mode") or self.defaults.fetch_mode
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Invalid fetch_mode: {fetch_mode}")
+
+        config = ExecutionConfig(
+            pr_url=pr_url,
+            output_format=output_format,
+            persona_file=params.get("persona_file") or None,
+            backend=self.defaults.backend,
+            fetch_mode=fetch_mode,
+            use_cache=self.defaults.use_cache,
+            refresh_cache=str(params.get("refresh", "")).lower() in ("1", "true", "yes"),
+            timeout_seconds=self.defaults.timeout_seconds,
+        )
+        if params.get("resolved_marker"):
+            config.resolved_marker = params["resolved_marker"]
+        return config
+
+    async def analyze(self, config: ExecutionConfig) -> Dict[str, Any]:
+        """Run one analysis on the shared client and components.
+
+        Args:
+            config: Execution configuration; the output is captured
+
+        Returns:
+            JSON-serializable result with the formatted ``content``
+        """
+        config.capture_output = True
+        config.output_file = None
+        self._count("requests")
+
+        orchestrator = CodeRabbitOrchestrator(config)
+        validation = orchestrator.validate_configuration()
+        if not validation["valid"]:
+            self._count("failed")
+            return {"success": False, "error": "Configuration validation failed",
+                    "error_type": "ValidationError", "issues": validation["issues"]}
+
+        orchestrator.share_components(self._sources.setdefault(self._component_key(config), orchestrator))
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._count("active")
+        try:
+            async with self._slots:
+                results = await orchestrator.execute_async(self._client_for(config))
+        finally:
+            self._count("active", -1)
+        self._count("succeeded" if results["success"] else "failed")
+
+        if not results["success"]:
+            return {
+                "success": False,
+                "error": results["error"],
+                "error_type": results["error_type"],
+                "recommendations": results.get("recovery_info", {}).get("recommendations", []),
+                "execution_time": results["execution_time"],
+            }
+        return {
+            "success": True,
+            "pr_url": config.pr_url,
+            "format": config.output_format,
+            "content": results["output_info"]["content"],
+            "execution_time": results["execution_time"],
+            "metrics": results["metrics"],
+        }
+
+    async def run_cli(self, argv: List[str], cwd: str) -> Dict[str, Any]:
+        """Run a CLI invocation forwarded by the launcher.
+
+        The server's transport, fetch mode and cache settings replace the
+        invocation's so it runs on the warm client; ``--refresh`` still
+        gets a client of its own.
+
+        Returns:
+            ``{"handled": False}`` when the invocation must run locally,
+            otherwise the ``analyze`` result with the requested output file
+        """
+        from .cli.main import build_forwarded_config
+
+        config = build_forwarded_config(argv, cwd)
+        if config is None:
+            return {"handled": False}
+        config.backend = self.defaults.backend
+        config.fetch_mode = self.defaults.fetch_mode
+        config.use_cache = self.defaults.use_cache
+        output_file = config.output_file
+        result = await self.analyze(config)
+        return dict(result, handled=True, output_file=output_file)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the request counters."""
+        return dict(self._stats, uptime_seconds=time.time() - self._started_at,
+                    warm_components=len(self._sources), client_ready=self._client is not None)
+
+    async def aclose(self) -> None:
+        """Close the shared GitHub client."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def start(self, socket_path: Optional[Path] = None, host: str = "127.0.0.1",
+                    port: Optional[int] = None) -> Tuple[asyncio.AbstractServer, str]:
+        """Start listening.
+
+        Args:
+            socket_path: Unix socket to listen on
+            host: Host of the TCP listener (used when ``port`` is given or
+                Unix sockets are unavailable)
+            port: TCP port; 0 picks a free port
+
+        Returns:
+            The asyncio server and its address (``unix:<path>`` or ``http://host:port``)
+        """
+        if port is None and hasattr(socket, "AF_UNIX"):
+            socket_path = Path(socket_path or get_cache_dir("server") / SOCKET_FILE)
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            _remove_stale_socket(socket_path)
+            server = await asyncio.start_unix_server(self._handle_connection, path=str(socket_path))
+            os.chmod(socket_path, 0o600)
+            return server, f"unix:{socket_path}"
+
+        if not _is_loopback(host):
+            logger.warning("Analysis server listening on %s is reachable from other hosts; "
+                           "requests need the token in %s", host, get_cache_dir("server") / TOKEN_FILE)
+        server = await asyncio.start_server(self._handle_connection, host=host, port=port or 0)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        return server, f"http://{bound_host}:{bound_port}"
+
+    async def serve(self, socket_path: Optional[Path] = None, host: str = "127.0.0.1",
+                    port: Optional[int] = None, ready: Optional[asyncio.Event] = None) -> None:
+        """Serve until cancelled, publishing the address for the CLI launcher."""
+        server, address = await self.start(socket_path, host, port)
+        token_file = get_cache_dir("server") / TOKEN_FILE
+        _write_private(token_file, self.token)
+        address_file = get_cache_dir("server") / ADDRESS_FILE
+        address_file.write_text(address, encoding="utf-8")
+        logger.info("Analysis server listening on %s", address)
+        self.address = address
+        if ready is not None:
+            ready.set()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for published, value in ((address_file, address), (token_file, self.token)):
+                try:
+                    if published.read_text(encoding="utf-8") == value:
+                        published.unlink()
+                except OSError:
+                    pass
+            if address.startswith("unix:"):
+                try:
+                    os.unlink(address[len("unix:"):])
+                except OSError:
+                    pass
+            await self.aclose()
+
+    def _client_for(self, config: ExecutionConfig) -> Optional[AsyncGitHubClient]:
+        """Get the shared client, or None when the request needs a client of its own."""
+        defaults = self.defaults
+        if (config.backend, config.fetch_mode, config.use_cache) != (defaults.backend, defaults.fetch_mode,
+                                                                     defaults.use_cache) or config.refresh_cache:
+            return None
+        if self._client is None:
+            self._client = CodeRabbitOrchestrator(defaults).create_async_github_client()
+        return self._client
+
+    @staticmethod
+    def _component_key(config: ExecutionConfig) -> Tuple[Any, ...]:
+        """Key of shareable components; an edited persona file is loaded again."""
+        mtime = None
+        if config.persona_file:
+            try:
+                mtime = os.stat(config.persona_file).st_mtime_ns
+            except OSError:
+                pass
+        return (config.persona_file, mtime, config.resolved_marker, config.jobs)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self._stats[name] += amount
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, target, headers, body = await _read_request(reader)
+            except ValueError as e:
+                status, payload = (413 if "too large" in str(e) else 400), {"error": str(e)}
+            else:
+                if self._authorized(headers):
+                    status, payload = await self._dispatch(method, target, body)
+                else:
+                    status, payload = 401, {"error": "Missing or invalid access token"}
+            _write_response(writer, status, payload)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            logger.debug("Client disconnected", exc_info=True)
+        finally:
+            writer.close()
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        """Check the request's bearer token."""
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        return scheme.lower() == "bearer" and hmac.compare_digest(token.strip().encode(), self.token.encode())
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/")
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        if path == "/healthz":
+            return 200, dict(status="ok", **self.stats())
+        if path == "/analyze":
+            if method == "POST" and body:
+                try:
+                    params.update(json.loads(body.decode("utf-8")))
+                except ValueError:
+                    return 400, {"error": "Request body is not JSON"}
+            elif method != "GET":
+                return 405, {"error": "Use GET or POST"}
+            try:
+                config = self.build_config(params)
+            except ValueError as e:
+                return 400, {"success": False, "error": str(e)}
+            return await self._guarded(self.analyze(config))
+        if path == "/cli":
+            if method != "POST":
+                return 405, {"error": "Use POST"}
+            try:
+                request = json.loads(body.decode("utf-8"))
+                argv, cwd = list(request["argv"]), str(request.get("cwd") or os.getcwd())
+            except (ValueError, KeyError, TypeError):
+                return 400, {"error": "Expected {\"argv\": [...], \"cwd\": ...}"}
+            return await self._guarded(self.run_cli(argv, cwd))
+        return 404, {"error": "Not found"}
+
+    async def _guarded(self, call: Any) -> Tuple[int, Dict[str, Any]]:
+        """Turn unexpected errors into a 500 answer instead of a dropped connection."""
+        try:
+            result = await call
+        except Exception as e:
+            logger.exception("Request failed")
+            return 500, {"success": False, "error": str(e), "error_type": type(e).__name__}
+        if result.get("issues"):
+            return 400, result
+        return (500 if result.get("success") is False else 200), result
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+    """Read an HTTP/1.1 request (request line, headers by lower-case name, and body)."""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    try:
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError:
+        raise ValueError("Malformed request line")
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1")
+        if line in ("\r\n", "\n", ""):
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise ValueError("Invalid Content-Length")
+    if length > MAX_REQUEST_BYTES:
+        raise ValueError("Request body too large")
+
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any]) -> None:
+    body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+def _is_loopback(host: str) -> bool:
+    """Check if a listening host is only reachable from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _write_private(path: Path, content: str) -> None:
+    """Write a file only its owner can read."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as private_file:
+        os.chmod(path, 0o600)
+        private_file.write(content)
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file left behind by a server that is gone.
+
+    Raises:
+        OSError: If another server is still listening on it
+    """
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise OSError(f"Another server is listening on {path}")
@@ -0,0 +1,174 @@
+"""
+Offline pull request snapshots.
+
+A snapshot is the normalized ``pr_data`` produced by the fetch phase of the
+orchestrator, saved with ``--save-snapshot`` and read back with
+``--from-snapshot``. Analysing or formatting a snapshot again (e.g. with
+another persona or output format) needs neither authentication nor API
+calls.
+
+Snapshots are JSON objects with a ``format`` marker, a ``version``, the PR
+URL and the ``pr_data``. A bare ``pr_data`` object is accepted as well,
+including the output of ``gh pr view --json comments,reviews`` (such as
+``pr_104_raw_data.json``), whose comments and reviews are converted to the
+REST layout the analyzer reads.
+"""
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .exceptions import SnapshotError
+
+SNAPSHOT_FORMAT = "coderabbit-fetcher/pr-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class PRSnapshot:
+    """Pull request data read from a snapshot file."""
+
+    pr_data: Dict[str, Any]
+    pr_url: Optional[str] = None
+    saved_at: Optional[float] = None
+
+
+def save_pr_snapshot(path: Union[str, Path], pr_data: Dict[str, Any], pr_url: Optional[str] = None) -> int:
+    """Atomically write a pull request snapshot.
+
+    Args:
+        path: Destination file (parent directories are created)
+        pr_data: Normalized PR data as returned by the fetch phase
+        pr_url: URL of the pull request
+
+    Returns:
+        Size of the written file in bytes
+
+    Raises:
+        SnapshotError: If the data cannot be serialized or written
+    """
+    path = Path(path)
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "pr_url": pr_url,
+        "saved_at": time.time(),
+        "pr_data": pr_data,
+    }
+
+    try:
+        payload = json.dumps(snapshot, ensure_ascii=False, indent=2)
+    except (TypeError, ValueError) as e:
+        raise SnapshotError(f"PR data cannot be saved as JSON: {e}", str(path))
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError as e:
+        raise SnapshotError(f"Failed to write snapshot: {e}", str(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise SnapshotError(f"Failed to write snapshot: {e}", str(path))
+
+    return path.stat().st_size
+
+
+def _is_gh_view_item(item: Any) -> bool:
+    """Check if a comment or review uses the ``gh pr view`` field names."""
+    return isinstance(item, dict) and "author" in item and "user" not in item
+
+
+def _from_gh_view(item: Dict[str, Any], submitted: bool = False) -> Dict[str, Any]:
+    """Map a ``gh pr view`` comment or review to the REST layout.
+
+    ``gh pr view`` only reports node IDs, which are kept as ``id``.
+    """
+    created_at = item.get("submittedAt") if submitted else item.get("createdAt")
+    mapped = {
+        "id": item.get("id"),
+        "node_id": item.get("id"),
+        "body": item.get("body") or "",
+        "user": {"login": (item.get("author") or {}).get("login", "")},
+        "created_at": created_at or item.get("createdAt"),
+        "updated_at": item.get("updatedAt"),
+        "html_url": item.get("url"),
+    }
+    if submitted:
+        mapped.update(state=item.get("state"), submitted_at=item.get("submittedAt"),
+                      comments=[_from_gh_view(comment) if _is_gh_view_item(comment) else comment
+                                for comment in item.get("comments") or []])
+    return mapped
+
+
+def _normalize_gh_view(pr_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the comments and reviews of ``gh pr view`` output to the REST layout."""
+    comments = pr_data.get("comments") or []
+    reviews = pr_data.get("reviews") or []
+    if not any(_is_gh_view_item(item) for item in [*comments, *reviews]):
+        return pr_data
+    return {
+        **pr_data,
+        "comments": [_from_gh_view(item) if _is_gh_view_item(item) else item for item in comments],
+        "reviews": [_from_gh_view(item, submitted=True) if _is_gh_view_item(item) else item
+                    for item in reviews],
+    }
+
+
+def load_pr_snapshot(path: Union[str, Path]) -> PRSnapshot:
+    """Read a pull request snapshot.
+
+    Args:
+        path: Snapshot file written by ``save_pr_snapshot``, or a bare
+            ``pr_data`` JSON object (``gh pr view`` output is converted)
+
+    Returns:
+        The snapshot; ``pr_url`` is taken from the envelope or from the PR's
+        own ``url`` field when present
+
+    Raises:
+        SnapshotError: If the file cannot be read or holds no PR data
+    """
+    path = Path(path)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise SnapshotError("Snapshot file not found", str(path))
+    except OSError as e:
+        raise SnapshotError(f"Failed to read snapshot: {e}", str(path))
+    except ValueError as e:
+        raise SnapshotError(f"Snapshot is not valid JSON: {e}", str(path))
+
+    if not isinstance(data, dict):
+        raise SnapshotError("Snapshot must be a JSON object", str(path))
+
+    if data.get("format") == SNAPSHOT_FORMAT:
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version: {data.get('version')}", str(path))
+        pr_data = data.get("pr_data")
+        pr_url = data.get("pr_url")
+        saved_at = data.get("saved_at")
+    else:
+        pr_data, pr_url, saved_at = data, None, None
+
+    if not isinstance(pr_data, dict) or not ("comments" in pr_data or "reviews" in pr_data):
+        raise SnapshotError("Snapshot contains no pull request comments or reviews", str(path))
+
+    if not isinstance(pr_data.get("comments", []), list) or not isinstance(pr_data.get("reviews", []), list):
+        raise SnapshotError("Snapshot comments and reviews must be lists", str(path))
+    pr_data = _normalize_gh_view(pr_data)
+
+    if not pr_url and isinstance(pr_data.get("url"), str):
+        pr_url = pr_data["url"]
+
+    return PRSnapshot(pr_data=pr_data, pr_url=pr_url or None, saved_at=saved_at)
@@ -0,0 +1,35 @@
+"""Locations of the fetcher's on-disk state."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+# Environment variable overriding the cache root
+CACHE_DIR_ENV = "CODERABBIT_FETCHER_CACHE_DIR"
+
+
+def get_cache_dir(subdir: Optional[str] = None) -> Path:
+    """Get (and create) the fetcher's cache directory.
+
+    The root is ``$CODERABBIT_FETCHER_CACHE_DIR`` if set, otherwise
+    ``$XDG_CACHE_HOME/coderabbit-fetcher`` (``~/.cache/coderabbit-fetcher``).
+
+    Args:
+        subdir: Optional subdirectory for a specific kind of data
+
+    Returns:
+        Path of the existing directory
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    if root:
+        path = Path(root).expanduser()
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+        path = base / "coderabbit-fetcher"
+
+    if subdir:
+        path = path / subdir
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
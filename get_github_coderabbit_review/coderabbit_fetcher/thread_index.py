@@ -0,0 +1,401 @@
+"""
+Indexed store of comment threads.
+
+``ThreadIndex`` groups comments into threads in a single union-find pass
+over the reply links (and, for the legacy analyzer, over comment
+locations), instead of walking the reply chain of every reply. Timestamps
+are parsed once and memoized. The index keeps the threads by file path,
+line range, author, resolution status and update time, so that large
+reports can be narrowed (``--path``, ``--since``, ``--status``) before
+they are formatted.
+
+Thread keys are root comment IDs: the ID of the comment the thread starts
+with, or, when that comment is missing from the data, the ID it replied to.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .models import AnalyzedComments, ThreadContext
+
+# Comment fields holding line numbers
+_LINE_FIELDS = ("line", "original_line", "start_line", "original_start_line")
+
+_RELATIVE_TIME = re.compile(r"^(\d+)\s*([mhdw])$")
+_TIME_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp of the GitHub API.
+
+    Args:
+        value: Timestamp such as ``2025-01-01T10:00:00Z``; timestamps
+            without a time zone are taken as UTC
+
+    Returns:
+        Time-zone aware timestamp, or None if the value is not a timestamp
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_since(value: str, now: Optional[datetime] = None) -> datetime:
+    """Parse the time of ``--since``.
+
+    Args:
+        value: ISO 8601 date or timestamp (UTC unless a zone is given), or a
+            time before now such as ``30m``, ``12h``, ``7d`` or ``2w``
+        now: Current time of relative values
+
+    Returns:
+        Time-zone aware timestamp
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    match = _RELATIVE_TIME.match(value.strip())
+    if match:
+        delta = timedelta(**{_TIME_UNITS[match.group(2)]: int(match.group(1))})
+        return (now or datetime.now(timezone.utc)) - delta
+    parsed = parse_timestamp(value.strip())
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value!r} (expected e.g. 2025-01-31, 2025-01-31T12:00:00Z or 7d)")
+    return parsed
+
+
+def _sort_key(timestamp: Optional[datetime]) -> Tuple[int, datetime]:
+    # Comments without a valid timestamp come last
+    return (0, timestamp) if timestamp is not None else (1, datetime.min)
+
+
+def sort_chronologically(comments: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort comments by creation time (stable; comments without a valid time last)."""
+    return sorted(comments, key=lambda comment: _sort_key(parse_timestamp(comment.get("created_at"))))
+
+
+def thread_key(comment: Dict[str, Any], comment_map: Dict[str, Dict[str, Any]]) -> str:
+    """Get the key of the thread of a comment by walking its reply chain.
+
+    Gives the same keys as ``ThreadIndex``, for comments added to an
+    existing grouping.
+
+    Args:
+        comment: Comment to find the thread of
+        comment_map: Comments of all threads by ID
+
+    Returns:
+        Root comment ID
+    """
+    chain: List[str] = []
+    seen: Dict[str, int] = {}
+    current = comment
+    while True:
+        reply_to_id = current.get("in_reply_to_id")
+        if reply_to_id is None:
+            return str(current.get("id", ""))
+        parent_id = str(reply_to_id)
+        parent = comment_map.get(parent_id)
+        if parent is None:
+            return parent_id
+        if parent_id in seen:
+            # Reply cycle: the smallest ID on it
+            return min(chain[seen[parent_id]:])
+        seen[parent_id] = len(chain)
+        chain.append(parent_id)
+        current = parent
+
+
+def _lines(comment: Dict[str, Any]) -> List[int]:
+    return [comment[name] for name in _LINE_FIELDS if isinstance(comment.get(name), int)]
+
+
+def _author(comment: Dict[str, Any]) -> str:
+    user = comment.get("user")
+    if isinstance(user, dict):
+        return user.get("login") or ""
+    return user if isinstance(user, str) else ""
+
+
+@dataclass
+class IndexedThread:
+    """A thread of an index.
+
+    Attributes:
+        key: Root comment ID
+        comments: Comments in chronological order
+        path: File path of the first comment with one ("" for none)
+        lines: First and last line commented on, if any
+        authors: Logins of the comment authors
+        updated_at: Latest creation or update time of the comments
+        status: Resolution status, once known
+        context: Processed thread the entry was made from
+    """
+    key: str
+    comments: List[Dict[str, Any]]
+    path: str = ""
+    lines: Optional[Tuple[int, int]] = None
+    authors: Set[str] = field(default_factory=set)
+    updated_at: Optional[datetime] = None
+    status: Optional[str] = None
+    context: Optional[ThreadContext] = None
+
+
+class _UnionFind:
+    """Disjoint sets of positions with path halving and union by size."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+
+
+class ThreadIndex:
+    """Comment threads with indexes by path, lines, author, status and update time."""
+
+    def __init__(self, comments: Iterable[Dict[str, Any]] = (), group_by_location: bool = False) -> None:
+        """Group comments into threads.
+
+        Args:
+            comments: Comments to group
+            group_by_location: Also group comments on the same file, line
+                and diff position (and all comments without a file); used
+                for comments without reply links
+        """
+        self._threads: Dict[str, IndexedThread] = {}
+        self._groups: Dict[str, List[Dict[str, Any]]] = {}
+        self._rank: Dict[str, int] = {}
+        self._by_path: Dict[str, List[str]] = defaultdict(list)
+        self._by_lines: Dict[str, List[Tuple[int, int, int, str]]] = defaultdict(list)
+        self._by_author: Dict[str, Set[str]] = defaultdict(set)
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_update: List[Tuple[datetime, int, str]] = []
+
+        comments = list(comments)
+        for key, group in self.group_comments(comments, group_by_location).items():
+            self._groups[key] = group
+            self._add(key, sort_chronologically(group))
+
+    @classmethod
+    def from_threads(cls, threads: Sequence[ThreadContext]) -> "ThreadIndex":
+        """Index processed threads as they are.
+
+        Args:
+            threads: Processed threads
+
+        Returns:
+            Index whose entries keep their thread in ``context``
+        """
+        index = cls()
+        for position, thread in enumerate(threads):
+            key = thread.thread_id if thread.thread_id not in index._threads else f"{thread.thread_id}#{position}"
+            comments = list(thread.chronological_order) or [thread.main_comment, *thread.replies]
+            index._groups[key] = comments
+            index._add(key, comments, status=thread.resolution_status, context=thread)
+        return index
+
+    @staticmethod
+    def group_comments(comments: Sequence[Dict[str, Any]],
+                       group_by_location: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Group comments into threads without indexing them.
+
+        Args:
+            comments: Comments to group
+            group_by_location: Also group comments on the same location
+
+        Returns:
+            Comments of each thread in input order, by thread key, in the
+            order of the first comment of each thread
+        """
+        positions = {str(comment.get("id", "")): index for index, comment in enumerate(comments) if comment.get("id")}
+        sets = _UnionFind(len(comments))
+        locations: Dict[str, int] = {}
+        for index, comment in enumerate(comments):
+            reply_to_id = comment.get("in_reply_to_id")
+            if reply_to_id is not None and str(reply_to_id) in positions:
+                sets.union(index, positions[str(reply_to_id)])
+            if group_by_location:
+                path = comment.get("path")
+                location = (
+                    f"{path}:{comment.get('line') or comment.get('original_line') or 0}:{comment.get('position', 0)}"
+                    if path else ""
+                )
+                sets.union(index, locations.setdefault(location, index))
+
+        # Key of each set: its root comment, else the missing comment it hangs from, else its reply cycle
+        roots: Dict[int, str] = {}
+        for index, comment in enumerate(comments):
+            reply_to_id = comment.get("in_reply_to_id")
+            if reply_to_id is None:
+                roots.setdefault(sets.find(index), str(comment.get("id", "")))
+            elif str(reply_to_id) not in positions:
+                roots.setdefault(sets.find(index), str(reply_to_id))
+
+        groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        comment_map: Optional[Dict[str, Dict[str, Any]]] = None
+        for index, comment in enumerate(comments):
+            root = sets.find(index)
+            if root not in roots:
+                if comment_map is None:
+                    comment_map = {key: comments[position] for key, position in positions.items()}
+                roots[root] = thread_key(comment, comment_map)
+            groups[roots[root]].append(comment)
+        return dict(groups)
+
+    def _add(self, key: str, comments: List[Dict[str, Any]], status: Optional[str] = None,
+             context: Optional[ThreadContext] = None) -> None:
+        """Add a thread to the indexes."""
+        rank = len(self._rank)
+        self._rank[key] = rank
+        lines = [line for comment in comments for line in _lines(comment)]
+        times = [
+            parse_timestamp(comment.get("updated_at")) or parse_timestamp(comment.get("created_at"))
+            for comment in comments
+        ]
+        thread = IndexedThread(
+            key=key,
+            comments=comments,
+            path=next((comment["path"] for comment in comments if comment.get("path")), ""),
+            lines=(min(lines), max(lines)) if lines else None,
+            authors={author for author in map(_author, comments) if author},
+            updated_at=max((time for time in times if time is not None), default=None),
+            context=context,
+        )
+        self._threads[key] = thread
+
+        self._by_path[thread.path].append(key)
+        if thread.lines is not None:
+            insort(self._by_lines[thread.path], (*thread.lines, rank, key))
+        for author in thread.authors:
+            self._by_author[author].add(key)
+        if thread.updated_at is not None:
+            insort(self._by_update, (thread.updated_at, rank, key))
+        if status is not None:
+            self.set_status(key, status)
+
+    def set_status(self, key: str, status: str) -> None:
+        """Set the resolution status of a thread.
+
+        Raises:
+            KeyError: If there is no thread with the key
+        """
+        thread = self._threads[key]
+        if thread.status is not None:
+            self._by_status[thread.status].discard(key)
+        thread.status = str(getattr(status, "value", status))
+        self._by_status[thread.status].add(key)
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._threads)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._threads
+
+    def __getitem__(self, key: str) -> IndexedThread:
+        return self._threads[key]
+
+    def groups(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the comments of each thread in input order, by thread key."""
+        return dict(self._groups)
+
+    def chronological(self, key: str) -> List[Dict[str, Any]]:
+        """Get the comments of a thread in chronological order."""
+        return self._threads[key].comments
+
+    def query(self, path: Optional[str] = None, since: Optional[datetime] = None,
+              status: Union[str, Iterable[str], None] = None, author: Optional[str] = None,
+              lines: Optional[Tuple[int, int]] = None) -> List[IndexedThread]:
+        """Find threads matching all given criteria.
+
+        Args:
+            path: Glob pattern of the file path (``*`` also matches ``/``,
+                so ``src/**`` matches everything below ``src``)
+            since: Only threads created or updated at or after this time
+            status: Resolution status, or statuses
+            author: Login of one of the comment authors
+            lines: Inclusive line range the commented lines must overlap
+
+        Returns:
+            Matching threads in index order
+        """
+        selected: Optional[Set[str]] = None
+
+        def narrow(keys: Iterable[str]) -> None:
+            nonlocal selected
+            selected = set(keys) if selected is None else selected.intersection(keys)
+
+        if path is not None:
+            narrow(key for indexed in self._by_path if fnmatchcase(indexed, path) for key in self._by_path[indexed])
+        if lines is not None:
+            first, last = lines
+            paths = [indexed for indexed in self._by_lines if path is None or fnmatchcase(indexed, path)]
+            narrow(
+                key
+                for indexed in paths
+                # Entries starting after the range end cannot overlap it
+                for start, end, _, key in self._by_lines[indexed][:bisect_left(self._by_lines[indexed], (last + 1,))]
+                if end >= first
+            )
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            narrow(key for _, _, key in self._by_update[bisect_left(self._by_update, (since,)):])
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            narrow(key for value in statuses for key in self._by_status.get(str(getattr(value, "value", value)), ()))
+        if author is not None:
+            narrow(self._by_author.get(author, ()))
+
+        keys = self._threads if selected is None else sorted(selected, key=self._rank.__getitem__)
+        return [self._threads[key] for key in keys]
+
+
+def narrow_analysis(analyzed: AnalyzedComments, path: Optional[str] = None, since: Optional[datetime] = None,
+                    status: Union[str, Iterable[str], None] = None) -> AnalyzedComments:
+    """Keep only the unresolved threads of an analysis matching a query.
+
+    Args:
+        analyzed: Analysis to narrow (not modified)
+        path: Glob pattern of the file path
+        since: Only threads created or updated at or after this time
+        status: Resolution status, or statuses
+
+    Returns:
+        Copy of the analysis with the matching threads; summary and review
+        comments are kept
+    """
+    index = ThreadIndex.from_threads(analyzed.unresolved_threads)
+    threads = [thread.context for thread in index.query(path=path, since=since, status=status)]
+    narrowed = analyzed.model_copy(update={"unresolved_threads": threads})
+    # Incremental updates apply to the complete analysis only
+    narrowed._analysis_state = None
+    return narrowed
@@ -0,0 +1,107 @@
+"""
+Watch mode helpers.
+
+``--watch`` keeps polling a pull request. Polls go through the response
+cache, so unchanged endpoints are answered by ``304 Not Modified``; the
+analysis only runs when the fetched data differs from the previous poll,
+and the output is only rewritten when the formatted content changes.
+``CodeRabbitOrchestrator.watch`` drives the loop; this module provides the
+adaptive poll interval, content hashing and the NDJSON thread events.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import ThreadContext
+
+# Factor applied to the interval after each poll without changes
+DEFAULT_BACKOFF = 1.5
+
+# Longest interval, as a multiple of the configured one
+DEFAULT_MAX_FACTOR = 8
+
+#: Thread ID -> (fingerprint, event fields)
+ThreadState = Dict[str, Tuple[str, Dict[str, Any]]]
+
+
+class AdaptiveInterval:
+    """Poll interval that stretches while a pull request is quiet.
+
+    Every poll without changes multiplies the interval by ``backoff`` up to
+    ``max_interval``; any change resets it to the base interval.
+    """
+
+    def __init__(self, base: float, max_interval: Optional[float] = None,
+                 backoff: float = DEFAULT_BACKOFF) -> None:
+        """Initialize the interval.
+
+        Args:
+            base: Interval in seconds while the pull request is active
+            max_interval: Upper bound in seconds (``base`` times 8 by default)
+            backoff: Growth factor per quiet poll
+        """
+        if base <= 0:
+            raise ValueError("Watch interval must be positive")
+        self.base = base
+        self.max_interval = max(base, max_interval if max_interval is not None else base * DEFAULT_MAX_FACTOR)
+        self.backoff = backoff
+        self.current = base
+
+    def record(self, changed: bool) -> float:
+        """Record the outcome of a poll and get the next interval."""
+        if changed:
+            self.current = self.base
+        else:
+            self.current = min(self.current * self.backoff, self.max_interval)
+        return self.current
+
+
+def content_hash(value: Any) -> str:
+    """Hash text, or JSON data independently of key order."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def thread_state(threads: List[ThreadContext]) -> ThreadState:
+    """Fingerprint the unresolved threads of an analysis."""
+    state: ThreadState = {}
+    for thread in threads:
+        comments = thread.chronological_order or [thread.main_comment, *thread.replies]
+        fingerprint = content_hash([
+            (c.get("id"), c.get("updated_at") or c.get("created_at"), c.get("body")) for c in comments
+        ] + [str(thread.resolution_status)])
+        main = thread.main_comment
+        state[thread.thread_id] = (fingerprint, {
+            "thread_id": thread.thread_id,
+            "path": main.get("path"),
+            "line": main.get("line"),
+            "comments": len(comments),
+            "summary": thread.contextual_summary,
+        })
+    return state
+
+
+def thread_events(previous: ThreadState, current: ThreadState, pr_url: str) -> List[Dict[str, Any]]:
+    """Compare two thread states.
+
+    Returns:
+        ``new``, ``updated`` and ``resolved`` events; a thread that is no
+        longer unresolved is reported as resolved
+    """
+    observed_at = datetime.now(timezone.utc).isoformat()
+    events = []
+    for thread_id, (fingerprint, fields) in current.items():
+        if thread_id not in previous:
+            kind = "new"
+        elif previous[thread_id][0] != fingerprint:
+            kind = "updated"
+        else:
+            continue
+        events.append(dict(event=kind, pr_url=pr_url, observed_at=observed_at, **fields))
+    for thread_id, (_, fields) in previous.items():
+        if thread_id not in current:
+            events.append(dict(event="resolved", pr_url=pr_url, observed_at=observed_at, **fields))
+    return events
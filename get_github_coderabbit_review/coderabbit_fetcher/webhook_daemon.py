@@ -0,0 +1,567 @@
+"""
+Webhook daemon keeping pull request analyses warm.
+
+``coderabbit-fetch serve-webhooks`` runs a small HTTP server receiving
+GitHub ``pull_request_review``, ``pull_request_review_comment`` and
+``issue_comment`` webhooks. Each event is applied to the stored snapshot of
+its pull request (shared with ``--incremental`` runs) and only the comments
+and review threads it touched are analysed again. The formatted report is
+rewritten to the report directory after every event, so consumers read it
+without any fetch latency:
+
+* ``POST /webhook`` receives the events (``X-Hub-Signature-256`` verified)
+* ``GET /reports/<owner>/<repo>/<number>`` returns the current report
+* ``GET /healthz`` returns the daemon statistics
+
+Recorded payloads can be replayed through the same code path with
+``replay_payloads`` (``serve-webhooks --replay``).
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .comment_analyzer import CommentAnalyzer
+from .exceptions import CodeRabbitFetcherError
+from .formatters import JSONFormatter, MarkdownFormatter, PlainTextFormatter
+from .github.sync import IncrementalSyncer, SnapshotStore
+from .github.webhooks import (
+    EVENT_HEADER,
+    SIGNATURE_HEADER,
+    Touched,
+    WebhookEvent,
+    apply_event,
+    empty_snapshot,
+    parse_event,
+    verify_signature,
+)
+from .models import (
+    AnalyzedComments,
+    CommentMetadata,
+    ResolutionStatus,
+    ReviewComment,
+    SummaryComment,
+    ThreadContext,
+)
+from .persona_manager import PersonaManager
+from .resolved_marker import ResolvedMarkerConfig
+from .storage import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+#: File extension of the reports per output format
+REPORT_EXTENSIONS = {"markdown": "md", "json": "json", "plain": "txt"}
+
+_CONTENT_TYPES = {
+    "markdown": "text/markdown; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+    "plain": "text/plain; charset=utf-8",
+}
+
+# GitHub caps webhook payloads at 25 MB
+MAX_PAYLOAD_BYTES = 25 * 1024 * 1024
+
+#: Key of a pull request: (owner, repo, number)
+PRKey = Tuple[str, str, str]
+
+
+def review_comment_roots(review_comments: List[Dict[str, Any]]) -> Dict[Any, Any]:
+    """Map each review comment ID to the ID of the first comment of its thread.
+
+    Replies point to their parent through ``in_reply_to_id``; a reply whose
+    parent is missing (deleted) starts a thread of its own.
+    """
+    parents = {c.get("id"): c.get("in_reply_to_id") for c in review_comments}
+    roots: Dict[Any, Any] = {}
+    for comment_id in parents:
+        current, seen = comment_id, set()
+        while parents.get(current) in parents and current not in seen:
+            seen.add(current)
+            current = parents[current]
+        roots[comment_id] = current
+    return roots
+
+
+class IncrementalAnalysis:
+    """Analysis of one pull request, updated item by item.
+
+    Summary, review and single-comment results are kept per snapshot item
+    and review comment threads per thread, so an update only processes the
+    items and threads an event touched.
+    """
+
+    def __init__(self, analyzer: CommentAnalyzer, owner: str, repo: str) -> None:
+        """Initialize the analysis.
+
+        Args:
+            analyzer: Analyzer providing the processors and resolved marker detection
+            owner: Repository owner
+            repo: Repository name
+        """
+        self.analyzer = analyzer
+        self.owner = owner
+        self.repo = repo
+        self.primed = False
+        # Results keyed by (collection, ID); review threads by their root comment
+        self._results: Dict[Touched, Any] = {}
+        self._order: Dict[Touched, int] = {}
+        self._members: Dict[Any, Tuple[Any, ...]] = {}
+        self._pull: Dict[str, Any] = {}
+        self._total_comments = 0
+        self._coderabbit_comments = 0
+        self.processing_time = 0.0
+        #: Items and threads processed by the last update
+        self.recomputed = 0
+
+    def update(self, snapshot: Dict[str, Any], touched: Optional[Iterable[Touched]] = None) -> int:
+        """Bring the analysis in line with the snapshot.
+
+        Args:
+            snapshot: Snapshot in the ``IncrementalSyncer`` layout
+            touched: Items changed since the last update; None (or a first
+                update) analyses everything
+
+        Returns:
+            Number of items and threads processed
+        """
+        start_time = time.time()
+        full = touched is None or not self.primed
+        if full:
+            self._results.clear()
+            self._members.clear()
+        changed = set(touched or ())
+        recomputed = 0
+
+        comments = snapshot.get("comments", [])
+        reviews = [self._review_as_comment(review) for review in snapshot.get("reviews", [])]
+        self._order = {}
+        for collection, items in (("comments", comments), ("reviews", reviews)):
+            by_id = {item.get("id"): item for item in items if item}
+            for item_id in by_id:
+                self._order[(collection, item_id)] = len(self._order)
+            ids = by_id if full else [i for c, i in changed if c == collection]
+            for item_id in ids:
+                key = (collection, item_id)
+                self._results.pop(key, None)
+                item = by_id.get(item_id)
+                if item is not None and self.analyzer.is_coderabbit_comment(item):
+                    self._analyze_item(key, item)
+                    recomputed += 1
+
+        recomputed += self._update_threads(snapshot.get("review_comments", []), changed, full)
+
+        self._pull = snapshot.get("pull", {})
+        review_bodies = [review for review in reviews if review]
+        everything = comments + review_bodies + snapshot.get("review_comments", [])
+        self._total_comments = len(everything)
+        self._coderabbit_comments = sum(1 for c in everything if self.analyzer.is_coderabbit_comment(c))
+
+        self.primed = True
+        self.recomputed = recomputed
+        self.processing_time = time.time() - start_time
+        return recomputed
+
+    def result(self) -> AnalyzedComments:
+        """Get the current analysis result."""
+        ordered = sorted(self._results.items(), key=lambda entry: self._order.get(entry[0], len(self._order)))
+        results = [value for _, value in ordered]
+
+        summaries = [value for value in results if isinstance(value, SummaryComment)]
+        reviews = [value for value in results if isinstance(value, ReviewComment)]
+        threads = [value for value in results if isinstance(value, ThreadContext)]
+        unresolved = [t for t in threads if t.resolution_status != ResolutionStatus.RESOLVED]
+
+        metadata = CommentMetadata(
+            pr_number=int(self._pull.get("number") or 0),
+            pr_title=self._pull.get("title", ""),
+            owner=self.owner,
+            repo=self.repo,
+            total_comments=self._total_comments,
+            coderabbit_comments=self._coderabbit_comments,
+            resolved_comments=len(threads) - len(unresolved),
+            actionable_comments=sum(review.actionable_count for review in reviews),
+            processing_time_seconds=self.processing_time,
+        )
+        return AnalyzedComments(
+            summary_comments=summaries,
+            review_comments=reviews,
+            unresolved_threads=unresolved,
+            metadata=metadata,
+        )
+
+    def _update_threads(self, review_comments: List[Dict[str, Any]], changed: set, full: bool) -> int:
+        """Process the review comment threads whose comments changed."""
+        roots = review_comment_roots(review_comments)
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for comment in review_comments:
+            groups.setdefault(roots[comment.get("id")], []).append(comment)
+        members = {root: tuple(c.get("id") for c in group) for root, group in groups.items()}
+
+        for root in groups:
+            self._order[("review_comments", root)] = len(self._order)
+
+        if full:
+            dirty = set(groups)
+        else:
+            changed_ids = {item_id for collection, item_id in changed if collection == "review_comments"}
+            dirty = {
+                root for root, ids in members.items()
+                if ids != self._members.get(root) or changed_ids.intersection(ids)
+            }
+            dirty.update(set(self._members) - set(members))
+        self._members = members
+
+        recomputed = 0
+        for root in dirty:
+            key = ("review_comments", root)
+            self._results.pop(key, None)
+            group = groups.get(root)
+            if group and any(self.analyzer.is_coderabbit_comment(c) for c in group):
+                thread = self._analyze_thread(key, group)
+                if thread is not None:
+                    self._results[key] = thread
+                recomputed += 1
+        return recomputed
+
+    def _analyze_item(self, key: Touched, comment: Dict[str, Any]) -> None:
+        """Process an issue comment or review body into its category's result."""
+        category = self.analyzer.categorize_comment(comment)
+        try:
+            if category == "summary":
+                self._results[key] = self.analyzer.summary_processor.process_summary_comment(comment)
+            elif category == "review":
+                self._results[key] = self.analyzer.review_processor.process_review_comment(comment)
+            else:
+                thread = self._analyze_thread(key, [comment])
+                if thread is not None:
+                    self._results[key] = thread
+        except (CodeRabbitFetcherError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Failed to process %s %s: %s", key[0], key[1], e, exc_info=True)
+
+    def _analyze_thread(self, key: Touched, comments: List[Dict[str, Any]]) -> Optional[ThreadContext]:
+        """Process a thread and detect its resolution status."""
+        try:
+            thread = self.analyzer.thread_processor.process_thread(comments)
+            thread.resolution_status = self.analyzer.resolved_marker_detector.detect_resolution_status(thread)
+            return thread
+        except (CodeRabbitFetcherError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Failed to process thread of %s %s: %s", key[0], key[1], e, exc_info=True)
+            return None
+
+    @staticmethod
+    def _review_as_comment(review: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Turn a review with a body into a comment, like ``CommentAnalyzer`` does."""
+        if not review.get("body"):
+            return None
+        return {
+            "id": review.get("id"),
+            "body": review["body"],
+            "user": review.get("user", {}),
+            "created_at": review.get("submitted_at") or review.get("created_at"),
+            "comment_type": "review",
+        }
+
+
+class WebhookDaemon:
+    """Applies webhook events to pull request snapshots and keeps reports current."""
+
+    def __init__(
+        self,
+        report_dir: Union[str, Path],
+        output_format: str = "markdown",
+        persona_file: Optional[str] = None,
+        resolved_marker: Optional[str] = None,
+        client: Optional[Any] = None,
+        store: Optional[SnapshotStore] = None,
+    ) -> None:
+        """Initialize the daemon.
+
+        Args:
+            report_dir: Directory the reports are written to (created if missing)
+            output_format: Report format (markdown, json or plain)
+            persona_file: Persona file; the default persona when omitted
+            resolved_marker: Custom resolved marker
+            client: GitHub client used to fetch a pull request seen for the
+                first time; without one its snapshot starts from the event
+            store: Snapshot store; the ``sync`` cache directory by default
+
+        Raises:
+            ValueError: If the output format is unknown
+        """
+        formatters = {"markdown": MarkdownFormatter, "json": JSONFormatter, "plain": PlainTextFormatter}
+        if output_format not in formatters:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.output_format = output_format
+        self.formatter = formatters[output_format]()
+        self.persona = PersonaManager().load_persona(persona_file)
+        self.marker_config = (
+            ResolvedMarkerConfig(resolved_marker=resolved_marker) if resolved_marker else ResolvedMarkerConfig()
+        )
+        self.client = client
+        self.store = store or SnapshotStore(get_cache_dir("sync"))
+        self.report_dir = Path(report_dir)
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        self._analyses: Dict[PRKey, IncrementalAnalysis] = {}
+        self._reports: Dict[PRKey, str] = {}
+        self._locks: Dict[PRKey, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._stats = {"received": 0, "processed": 0, "ignored": 0, "failed": 0, "recomputed": 0}
+
+    def handle(self, event_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a decoded webhook payload.
+
+        Args:
+            event_name: ``X-GitHub-Event`` header value
+            payload: Decoded request body
+
+        Returns:
+            Outcome with a ``status`` of ``processed``, ``ignored`` or ``failed``
+        """
+        self._count("received")
+        event = parse_event(event_name, payload)
+        if event is None:
+            self._count("ignored")
+            return {"status": "ignored", "event": event_name}
+
+        try:
+            outcome = self.process(event)
+        except (CodeRabbitFetcherError, OSError) as e:
+            logger.exception("Failed to process %s event for %s", event_name, event.pr_url)
+            self._count("failed")
+            return {"status": "failed", "event": event_name, "pr_url": event.pr_url, "error": str(e)}
+
+        self._count("processed")
+        self._count("recomputed", outcome["recomputed"])
+        return outcome
+
+    def process(self, event: WebhookEvent) -> Dict[str, Any]:
+        """Apply an event, update the analysis and rewrite the report.
+
+        Args:
+            event: Parsed event
+
+        Returns:
+            Outcome with the report path and the number of recomputed items
+        """
+        key = (event.owner, event.repo, event.pr_number)
+        with self._lock_for(key):
+            snapshot = self.store.load(*key)
+            if snapshot is None:
+                snapshot = self._bootstrap(event)
+            touched = apply_event(snapshot, event)
+            self.store.save(*key, snapshot)
+
+            analysis = self._analyses.get(key)
+            if analysis is None:
+                # First event since start-up: analyse the whole stored snapshot
+                analysis = IncrementalAnalysis(CommentAnalyzer(self.marker_config), event.owner, event.repo)
+                self._analyses[key] = analysis
+            recomputed = analysis.update(snapshot, touched)
+
+            try:
+                report = self.formatter.format(self.persona, analysis.result())
+            except Exception as e:
+                raise CodeRabbitFetcherError(f"Failed to format report: {e}") from e
+            path = self.report_path(*key)
+            _write_atomic(path, report)
+            self._reports[key] = report
+
+        logger.info("Updated report of %s after %s/%s (%d recomputed)",
+                    event.pr_url, event.name, event.action, recomputed)
+        return {
+            "status": "processed",
+            "event": event.name,
+            "action": event.action,
+            "pr_url": event.pr_url,
+            "recomputed": recomputed,
+            "report": str(path),
+        }
+
+    def report(self, owner: str, repo: str, pr_number: str) -> Optional[str]:
+        """Get the current report of a pull request, or None if there is none."""
+        key = (owner, repo, str(pr_number))
+        if key in self._reports:
+            return self._reports[key]
+        try:
+            return self.report_path(*key).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def report_path(self, owner: str, repo: str, pr_number: str) -> Path:
+        """Get the report file of a pull request."""
+        extension = REPORT_EXTENSIONS[self.output_format]
+        return self.report_dir / f"{owner}_{repo}_pr{pr_number}.{extension}"
+
+    def stats(self) -> Dict[str, int]:
+        """Get the event counters."""
+        with self._guard:
+            return dict(self._stats, pull_requests=len(self._analyses))
+
+    def _bootstrap(self, event: WebhookEvent) -> Dict[str, Any]:
+        """Create the snapshot of a pull request not seen before."""
+        if self.client is not None:
+            try:
+                IncrementalSyncer(self.client, self.store).sync(event.pr_url)
+                snapshot = self.store.load(event.owner, event.repo, event.pr_number)
+                if snapshot is not None:
+                    return snapshot
+            except (CodeRabbitFetcherError, OSError) as e:
+                logger.warning("Could not fetch %s, starting from the event: %s", event.pr_url, e)
+        return empty_snapshot(event)
+
+    def _lock_for(self, key: PRKey) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._guard:
+            self._stats[name] += amount
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Replace a file with new content without exposing partial writes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_name, path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def load_recorded_payloads(path: Union[str, Path]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Read recorded webhook deliveries.
+
+    The file holds ``{"event": <X-GitHub-Event>, "payload": {...}}`` objects:
+    a single object, a JSON array of them, or one per line (NDJSON).
+
+    Returns:
+        (event name, payload) pairs in file order
+
+    Raises:
+        ValueError: If the file holds no valid deliveries
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+        entries = data if isinstance(data, list) else [data]
+    except ValueError:
+        entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    deliveries = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("payload"), dict) or not entry.get("event"):
+            raise ValueError(f"{path}: expected objects with 'event' and 'payload'")
+        deliveries.append((str(entry["event"]), entry["payload"]))
+    return deliveries
+
+
+def replay_payloads(daemon: WebhookDaemon, paths: Iterable[Union[str, Path]]) -> List[Dict[str, Any]]:
+    """Feed recorded deliveries to a daemon in order.
+
+    Recorded payloads are trusted local files, so signatures are not checked.
+
+    Returns:
+        Outcome of each delivery
+    """
+    outcomes = []
+    for path in paths:
+        for event_name, payload in load_recorded_payloads(path):
+            outcomes.append(daemon.handle(event_name, payload))
+    return outcomes
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """HTTP server delivering webhooks to a ``WebhookDaemon``."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], webhooks: WebhookDaemon, secret: Optional[str]) -> None:
+        """Initialize the server.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            webhooks: Daemon handling the events
+            secret: Webhook secret; None accepts unsigned deliveries
+        """
+        self.webhooks = webhooks
+        self.secret = secret
+        super().__init__(address, _WebhookRequestHandler)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    server: WebhookServer
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") not in ("", "/webhook"):
+            self._reply(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_PAYLOAD_BYTES:
+            self._reply(413, {"error": "payload too large"})
+            return
+        body = self.rfile.read(length) if length else b""
+
+        secret = self.server.secret
+        if secret is not None and not verify_signature(secret, body, self.headers.get(SIGNATURE_HEADER)):
+            self._reply(401, {"error": "invalid signature"})
+            return
+
+        event_name = self.headers.get(EVENT_HEADER, "")
+        if event_name == "ping":
+            self._reply(200, {"status": "pong"})
+            return
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except ValueError:
+            self._reply(400, {"error": "payload is not JSON"})
+            return
+
+        outcome = self.server.webhooks.handle(event_name, payload)
+        self._reply(500 if outcome["status"] == "failed" else 200, outcome)
+
+    def do_GET(self) -> None:
+        parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+        if parts == ["healthz"]:
+            self._reply(200, dict(status="ok", **self.server.webhooks.stats()))
+        elif len(parts) == 4 and parts[0] == "reports":
+            report = self.server.webhooks.report(*parts[1:])
+            if report is None:
+                self._reply(404, {"error": "no report for this pull request"})
+            else:
+                self._send(200, report.encode("utf-8"), _CONTENT_TYPES[self.server.webhooks.output_format])
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _reply(self, status: int, data: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(data).encode("utf-8"), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
@@ -0,0 +1,65 @@
+"""
+Pull request data with many CodeRabbit comments for analysis tests.
+"""
+
+BOT = {"login": "coderabbitai[bot]"}
+
+SUMMARY_BODY = """## Summary by CodeRabbit
+
+* **New Features**
+  * Added a cache for API responses.
+* **Tests**
+  * Covered the cache.
+"""
+
+REVIEW_BODY = """**Actionable comments posted: 1**
+
+<details>
+<summary>🧹 Nitpick comments (1)</summary><blockquote>
+
+<details>
+<summary>src/a.py (1)</summary><blockquote>
+
+`12`: **Rename the variable.**
+
+</blockquote></details>
+
+</blockquote></details>
+"""
+
+
+def analysis_pr_data(threads=20):
+    """PR with a summary, a review and ``threads`` inline threads (every third one resolved)."""
+    comments = [
+        {"id": 1, "body": SUMMARY_BODY, "user": BOT, "created_at": "2025-01-01T00:00:00Z"},
+        {"id": 2, "body": "Unrelated note", "user": {"login": "dev"}, "created_at": "2025-01-01T00:00:00Z"},
+    ]
+    review_comments = []
+    for index in range(threads):
+        root = 1000 + index * 10
+        review_comments.append({
+            "id": root, "body": f"Potential security issue {index}", "user": BOT, "path": f"src/{index}.py",
+            "line": index, "created_at": f"2025-01-02T00:{index % 60:02d}:00Z",
+        })
+        review_comments.append({
+            "id": root + 1, "body": "Please also add a test.", "user": BOT, "in_reply_to_id": root,
+            "created_at": f"2025-01-03T00:{index % 60:02d}:00Z",
+        })
+        if index % 3 == 0:
+            review_comments.append({
+                "id": root + 2, "body": "Thanks! 🔒 CODERABBIT_RESOLVED 🔒", "user": BOT, "in_reply_to_id": root,
+                "created_at": f"2025-01-04T00:{index % 60:02d}:00Z",
+            })
+    return {
+        "number": 7, "title": "Large PR", "owner": "o", "repo": "r",
+        "comments": comments,
+        "reviews": [
+            {"id": 50, "body": REVIEW_BODY, "user": BOT, "created_at": "2025-01-02T00:00:00Z",
+             "comments": review_comments},
+        ],
+    }
+
+
+def analysis_dump(result):
+    """Dump an analysis without its timing fields."""
+    return result.model_dump(exclude={"metadata": {"processing_time_seconds", "processed_at"}})
@@ -0,0 +1,150 @@
+"""Local stub HTTP server standing in for api.github.com in tests."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+# A route answers with (status, payload, headers). Payloads that are not
+# str/bytes are JSON-encoded; a None status closes the connection without
+# answering.
+RouteResult = Tuple[Optional[int], Any, Dict[str, str]]
+RouteHandler = Callable[["StubRequest"], RouteResult]
+
+
+class StubRequest:
+    """Request received by the stub server."""
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        parts = urlsplit(target)
+        self.method = method
+        self.target = target
+        self.path = parts.path
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        """Decode the request body as JSON."""
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+
+class StubGitHubServer:
+    """Threaded HTTP/1.1 server answering registered GitHub API routes.
+
+    Usage::
+
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/pulls/1", {"number": 1})
+            transport = HTTPTransport(token="t", base_url=server.url)
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Union[RouteResult, RouteHandler]] = {}
+        self.requests: List[StubRequest] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_route(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        handler: Optional[RouteHandler] = None,
+    ) -> None:
+        """Register a static response or a handler for ``method path``."""
+        self.routes[(method.upper(), path)] = handler or (status, payload, headers or {})
+
+    def requests_for(self, path: str) -> List[StubRequest]:
+        """Get the recorded requests for a path."""
+        return [request for request in self.requests if request.path == path]
+
+    def start(self) -> "StubGitHubServer":
+        """Start serving on an ephemeral localhost port."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubGitHubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _dispatch(self, request: StubRequest) -> RouteResult:
+        with self._lock:
+            self.requests.append(request)
+        route = self.routes.get((request.method, request.path))
+        if route is None:
+            return 404, {"message": "Not Found"}, {}
+        if callable(route):
+            return route(request)
+        return route
+
+    def _make_handler(self) -> type:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                status, payload, extra_headers = stub._dispatch(
+                    StubRequest(self.command, self.path, headers, body)
+                )
+                if status is None:
+                    self.close_connection = True
+                    return
+
+                if payload is None:
+                    data = b""
+                elif isinstance(payload, bytes):
+                    data = payload
+                elif isinstance(payload, str):
+                    data = payload.encode("utf-8")
+                else:
+                    data = json.dumps(payload).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in extra_headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -98,7 +98,7 @@ class TestOrchestratorIntegration(unittest.TestCase):
         mock_github.return_value = mock_github_instance
 
         mock_persona_instance = Mock()
-        mock_persona_instance.get_default_persona.return_value = "Test persona"
+        mock_persona_instance.load_persona.return_value = "Test persona"
         mock_persona.return_value = mock_persona_instance
 
         # Mock analyzed comments
@@ -552,6 +552,45 @@ class TestPerformanceRegression(PerformanceTestBase):
         print(f"  Variation: {max_time - min_time:.3f}s")
 
 
+class TestModelConstructionPerformance(PerformanceTestBase):
+    """Test building thread contexts without validation."""
+
+    def test_trusted_threads_are_faster(self):
+        """Trusted construction should beat validation for processed threads."""
+        from coderabbit_fetcher.models import ThreadContext
+
+        def github_comment(comment_id, login, reply_to=None):
+            comment = {f"field_{index}": f"value {index}" for index in range(20)}
+            comment.update(id=comment_id, in_reply_to_id=reply_to, user={"login": login},
+                           body="Consider handling the error case", path="src/main.py", line=10,
+                           created_at=f"2025-01-01T10:{comment_id % 60:02d}:00Z")
+            return comment
+
+        threads = [
+            dict(
+                thread_id=str(i),
+                main_comment=github_comment(i, "coderabbitai[bot]"),
+                replies=[github_comment(i + 1, "dev", i), github_comment(i + 2, "coderabbitai[bot]", i + 1)],
+                resolution_status="unresolved",
+            )
+            for i in range(0, 6000, 3)
+        ]
+
+        validated, validated_time = self.measure_execution_time(
+            lambda: [ThreadContext(**data) for data in threads]
+        )
+        trusted, trusted_time = self.measure_execution_time(
+            lambda: [ThreadContext.trusted(**data) for data in threads]
+        )
+
+        self.assertEqual(validated, trusted)
+        self.assertLess(trusted_time, validated_time)
+
+        print("Thread construction (2000 threads):")
+        print(f"  Validated: {validated_time:.3f}s")
+        print(f"  Trusted: {trusted_time:.3f}s")
+
+
 if __name__ == '__main__':
     # Run performance tests with verbose output
     unittest.main(verbosity=2)
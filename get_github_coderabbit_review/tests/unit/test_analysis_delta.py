@@ -0,0 +1,147 @@
+"""
+Unit tests for incremental updates of an analysis.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalysisError, CommentAnalyzer
+from coderabbit_fetcher.models import AnalyzedComments, CommentMetadata
+from coderabbit_fetcher.parse_cache import ParseCache
+from tests.fixtures.analysis_data import BOT, REVIEW_BODY, analysis_dump, analysis_pr_data
+
+RESOLVED = "Thanks! 🔒 CODERABBIT_RESOLVED 🔒"
+
+
+def inline(data):
+    return data["reviews"][0]["comments"]
+
+
+def full_analysis(data):
+    return analysis_dump(CommentAnalyzer().analyze_comments(data))
+
+
+class TestApplyDelta:
+    """Test updating an analysis with changed comments."""
+
+    def setup_method(self):
+        self.analyzer = CommentAnalyzer()
+        self.analyzed = self.analyzer.analyze_comments(analysis_pr_data(threads=6))
+        self.changed = analysis_pr_data(threads=6)
+
+    def test_edited_comment_reprocesses_its_thread_only(self):
+        # Root comment of the second (unresolved) thread
+        inline(self.changed)[3]["body"] = "Edited: potential race condition"
+        edited = dict(inline(self.changed)[3], comment_type="review_comment")
+
+        with patch.object(self.analyzer.thread_processor, "process_thread",
+                          wraps=self.analyzer.thread_processor.process_thread) as process_thread:
+            result = self.analyzer.apply_delta(self.analyzed, edited=[edited])
+
+        assert result is self.analyzed
+        assert process_thread.call_count == 1
+        assert analysis_dump(result) == full_analysis(self.changed)
+
+    def test_added_resolved_marker_resolves_thread(self):
+        reply = {"id": 1013, "body": RESOLVED, "user": BOT, "in_reply_to_id": 1010,
+                 "created_at": "2025-01-05T00:00:00Z"}
+        inline(self.changed).append(dict(reply))
+
+        self.analyzer.apply_delta(self.analyzed, added=[reply])
+
+        assert analysis_dump(self.analyzed) == full_analysis(self.changed)
+        assert 1010 not in [thread.main_comment["id"] for thread in self.analyzed.unresolved_threads]
+        assert self.analyzed.metadata.resolved_comments == 3
+
+    def test_deleted_resolved_marker_restores_thread_in_order(self):
+        del inline(self.changed)[2]
+
+        self.analyzer.apply_delta(self.analyzed, deleted=[1002])
+
+        assert analysis_dump(self.analyzed) == full_analysis(self.changed)
+        assert self.analyzed.unresolved_threads[0].main_comment["id"] == 1000
+        assert self.analyzed.metadata.total_comments == 16
+
+    def test_deleted_root_splits_replies_off(self):
+        del inline(self.changed)[3]
+
+        self.analyzer.apply_delta(self.analyzed, deleted=[1010])
+
+        assert analysis_dump(self.analyzed) == full_analysis(self.changed)
+
+    def test_added_thread(self):
+        new = [
+            {"id": 2000, "body": "Potential bug", "user": BOT, "path": "src/new.py", "line": 3,
+             "created_at": "2025-01-06T00:00:00Z"},
+            {"id": 2001, "body": "Still open", "user": BOT, "in_reply_to_id": 2000,
+             "created_at": "2025-01-07T00:00:00Z"},
+        ]
+        inline(self.changed).extend(dict(comment) for comment in new)
+
+        self.analyzer.apply_delta(self.analyzed, added=new)
+
+        assert analysis_dump(self.analyzed) == full_analysis(self.changed)
+        assert self.analyzed.unresolved_threads[-1].main_comment["id"] == 2000
+
+    def test_passed_comments_are_not_modified(self):
+        reply = {"id": 1013, "body": RESOLVED, "user": BOT, "in_reply_to_id": 1010,
+                 "created_at": "2025-01-05T00:00:00Z"}
+        original = dict(reply)
+
+        self.analyzer.apply_delta(self.analyzed, added=[reply])
+
+        assert reply == original
+
+    def test_review_and_summary_changes(self):
+        self.changed["reviews"][0]["body"] = REVIEW_BODY.replace("comments posted: 1", "comments posted: 3")
+        del self.changed["comments"][0]
+        review = {"id": 50, "body": self.changed["reviews"][0]["body"], "user": BOT,
+                  "created_at": "2025-01-02T00:00:00Z", "comment_type": "review"}
+
+        self.analyzer.apply_delta(
+            self.analyzed, edited=[review], deleted=[{"id": 1, "comment_type": "issue"}]
+        )
+
+        assert analysis_dump(self.analyzed) == full_analysis(self.changed)
+        assert not self.analyzed.summary_comments
+        assert self.analyzed.metadata.actionable_comments == 3
+
+    def test_comments_of_other_users_are_only_counted(self):
+        note = {"id": 3, "body": "LGTM", "user": {"login": "dev"}, "comment_type": "issue"}
+
+        with patch.object(self.analyzer, "_process_work", wraps=self.analyzer._process_work) as process_work:
+            self.analyzer.apply_delta(self.analyzed, added=[note])
+
+        process_work.assert_called_once_with({"summary": [], "review": [], "thread": []})
+        assert self.analyzed.metadata.total_comments == 18
+        assert self.analyzed.metadata.coderabbit_comments == 16
+
+    def test_statistics_follow_the_update(self):
+        self.analyzer.apply_delta(self.analyzed, deleted=[1002, 1032])
+
+        stats = self.analyzer.get_analysis_statistics()
+        assert stats["resolved_comments"] == 0
+        assert stats["inline_comments"] == 12
+        assert stats["threads_processed"] == 6
+        assert len(self.analyzed.unresolved_threads) == 6
+
+    def test_uses_parse_cache(self, tmp_path):
+        analyzer = CommentAnalyzer(parse_cache=ParseCache(tmp_path / "parse.sqlite3"))
+        analyzed = analyzer.analyze_comments(analysis_pr_data(threads=6))
+        original = inline(analysis_pr_data(threads=6))[3]
+
+        analyzer.apply_delta(analyzed, edited=[dict(original, body="Edited")])
+        analyzer.apply_delta(analyzed, edited=[dict(original)])
+
+        stats = analyzer.get_analysis_statistics()
+        # Going back to the original comment reuses the thread parsed by the full analysis
+        assert (stats["parse_cache_hits"], stats["parse_cache_misses"]) == (1, 0)
+
+    def test_analysis_without_state(self):
+        analyzed = AnalyzedComments(metadata=CommentMetadata(
+            pr_number=1, pr_title="t", owner="o", repo="r", total_comments=0, coderabbit_comments=0,
+            resolved_comments=0, actionable_comments=0, processing_time_seconds=0.0,
+        ))
+
+        with pytest.raises(CommentAnalysisError):
+            self.analyzer.apply_delta(analyzed, added=[])
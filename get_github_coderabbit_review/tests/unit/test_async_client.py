@@ -0,0 +1,231 @@
+"""
+Unit tests for the asyncio GitHub client and async orchestration.
+"""
+
+import asyncio
+import stat
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coderabbit_fetcher.async_github_client import AsyncGitHubClient
+from coderabbit_fetcher.exceptions import GitHubAuthenticationError, InvalidPRUrlError
+from coderabbit_fetcher.github.async_transport import AsyncGhCliTransport, AsyncTransportAdapter
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.models import AnalyzedComments, CommentMetadata
+from coderabbit_fetcher.github_client import GitHubAPIError
+from coderabbit_fetcher.orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+from coderabbit_fetcher.persona_manager import PersonaManager
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+def _comment(comment_id, **extra):
+    comment = {
+        "id": comment_id,
+        "body": f"comment {comment_id}",
+        "user": {"login": "coderabbitai[bot]"},
+        "created_at": f"2024-01-0{comment_id}T00:00:00Z",
+    }
+    comment.update(extra)
+    return comment
+
+
+def _add_pull_request(server, number, failures=None):
+    """Serve a small PR; ``failures`` maps a path to a number of 502 answers."""
+    failures = failures if failures is not None else {}
+
+    def route(path, payload):
+        def handler(request):
+            if failures.get(path, 0) > 0:
+                failures[path] -= 1
+                return 502, {"message": "bad gateway"}, {}
+            return 200, payload, {}
+        server.add_route("GET", path, handler=handler)
+
+    route(f"/repos/o/r/pulls/{number}", {
+        "number": number, "title": f"PR {number}", "state": "open",
+        "html_url": f"https://github.com/o/r/pull/{number}", "user": {"login": "dev"},
+    })
+    route(f"/repos/o/r/issues/{number}/comments", [_comment(1), _comment(2)])
+    route(f"/repos/o/r/pulls/{number}/reviews", [
+        {"id": 10, "body": "review", "user": {"login": "coderabbitai[bot]"},
+         "submitted_at": "2024-01-03T00:00:00Z"}
+    ])
+    route(f"/repos/o/r/pulls/{number}/comments", [_comment(3, pull_request_review_id=10)])
+
+
+@pytest.fixture
+def server():
+    """Running stub GitHub API server."""
+    with StubGitHubServer() as stub:
+        yield stub
+
+
+def _client(server, fetch_mode="rest", **kwargs):
+    transport = AsyncTransportAdapter(HTTPTransport(token="secret", base_url=server.url))
+    return AsyncGitHubClient(transport=transport, fetch_mode=fetch_mode, retry_delay=0.01, **kwargs)
+
+
+class TestAsyncGitHubClient:
+    """Test the asyncio client against the stub server."""
+
+    def test_fetch_pr_comments(self, server):
+        _add_pull_request(server, 1)
+
+        async def run():
+            async with _client(server) as client:
+                return await client.fetch_pr_comments("https://github.com/o/r/pull/1"), client
+
+        pr_data, client = asyncio.run(run())
+
+        assert pr_data["title"] == "PR 1"
+        assert [c["id"] for c in pr_data["comments"]] == [1, 2]
+        assert [c["id"] for c in pr_data["reviews"][0]["comments"]] == [3]
+        assert set(client.last_fetch_timings) == {"pull", "comments", "reviews", "review_comments"}
+
+    def test_failing_endpoint_retried_alone(self, server):
+        _add_pull_request(server, 1, failures={"/repos/o/r/pulls/1/reviews": 1})
+
+        pr_data = asyncio.run(_client(server).fetch_pr_comments("https://github.com/o/r/pull/1"))
+
+        assert pr_data["reviews"][0]["id"] == 10
+        assert len(server.requests_for("/repos/o/r/pulls/1/reviews")) == 2
+        assert len(server.requests_for("/repos/o/r/issues/1/comments")) == 1
+
+    def test_client_errors_not_retried(self, server):
+        _add_pull_request(server, 1)
+        server.add_route("GET", "/repos/o/r/pulls/1/reviews", {"message": "Resource not accessible"}, status=403)
+
+        with pytest.raises(GitHubAPIError, match="Resource not accessible"):
+            asyncio.run(_client(server).fetch_pr_comments("https://github.com/o/r/pull/1"))
+
+        assert len(server.requests_for("/repos/o/r/pulls/1/reviews")) == 1
+
+    def test_graphql_mode(self, server):
+        server.add_route("POST", "/graphql", {"data": {"repository": {"pullRequest": {
+            "number": 1, "title": "PR", "state": "OPEN", "url": "https://github.com/o/r/pull/1",
+            "author": {"login": "dev", "__typename": "User"},
+            "comments": {"pageInfo": {"hasNextPage": False}, "nodes": []},
+            "reviews": {"pageInfo": {"hasNextPage": False}, "nodes": []},
+            "reviewThreads": {"pageInfo": {"hasNextPage": False}, "nodes": []},
+        }}}})
+
+        pr_data = asyncio.run(
+            _client(server, fetch_mode="graphql").fetch_pr_comments("https://github.com/o/r/pull/1")
+        )
+
+        assert pr_data["title"] == "PR"
+        assert pr_data["review_threads"] == []
+        assert len(server.requests) == 1
+
+    def test_not_found(self, server):
+        server.add_route("GET", "/repos/o/r/pulls/9", {"message": "Not Found"}, status=404)
+
+        with pytest.raises(InvalidPRUrlError):
+            asyncio.run(_client(server, retry_attempts=0).fetch_pr_comments("https://github.com/o/r/pull/9"))
+
+    def test_post_and_get_comment(self, server):
+        server.add_route("POST", "/repos/o/r/issues/1/comments", handler=lambda request: (
+            201, {"id": 77, "body": request.json()["body"], "user": {"login": "me"}}, {}
+        ))
+        server.add_route("GET", "/repos/o/r/issues/comments/77", {"id": 77, "body": "hi"})
+        client = _client(server)
+
+        posted = asyncio.run(client.post_comment("https://github.com/o/r/pull/1", "hi"))
+        fetched = asyncio.run(client.get_comment("https://github.com/o/r/pull/1", 77))
+
+        assert posted["id"] == 77 and posted["user"] == "me"
+        assert fetched["body"] == "hi"
+
+    def test_check_rate_limit(self, server):
+        server.add_route("GET", "/rate_limit", {"resources": {"core": {"remaining": 10}}})
+
+        assert asyncio.run(_client(server).check_rate_limit())["resources"]["core"]["remaining"] == 10
+
+
+class TestAsyncGhCliTransport:
+    """Test the subprocess transport with a fake ``gh`` executable."""
+
+    @pytest.fixture
+    def fake_gh(self, tmp_path):
+        script = tmp_path / "gh"
+        script.write_text(
+            "#!/bin/sh\n"
+            "if [ \"$2\" = \"/missing\" ]; then echo 'gh: Not Found (HTTP 404)' >&2; exit 1; fi\n"
+            "echo \"{\\\"args\\\": \\\"$*\\\"}\"\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        return str(script)
+
+    def test_request(self, fake_gh):
+        response = asyncio.run(AsyncGhCliTransport(fake_gh).request("GET", "/rate_limit", params={"a": 1}))
+
+        assert response.status == 200
+        assert response.json() == {"args": "api /rate_limit?a=1"}
+
+    def test_error_status_from_stderr(self, fake_gh):
+        response = asyncio.run(AsyncGhCliTransport(fake_gh).request("GET", "/missing"))
+
+        assert response.status == 404
+        assert "Not Found" in response.error_message
+
+    def test_missing_cli_fails_authentication(self):
+        client = AsyncGitHubClient(transport=AsyncGhCliTransport("/nonexistent/gh"))
+
+        with pytest.raises(GitHubAuthenticationError):
+            asyncio.run(client.check_rate_limit())
+
+
+def _analyzed_comments():
+    return AnalyzedComments(metadata=CommentMetadata(
+        pr_number=1, pr_title="PR", owner="o", repo="r", total_comments=2,
+        coderabbit_comments=2, resolved_comments=0, actionable_comments=0,
+        processing_time_seconds=0.0,
+    ))
+
+
+class TestExecuteAsync:
+    """Test async orchestration of several pull requests."""
+
+    @patch.object(PersonaManager, 'load_persona', autospec=True, side_effect=PersonaManager.load_persona)
+    @patch('coderabbit_fetcher.orchestrator.CommentAnalyzer')
+    def test_execute_many_shares_client(self, mock_analyzer, load_persona, server, tmp_path):
+        mock_analyzer.return_value = Mock(analyze_comments=Mock(return_value=_analyzed_comments()))
+        for number in (1, 2, 3):
+            _add_pull_request(server, number)
+        configs = [
+            ExecutionConfig(
+                pr_url=f"https://github.com/o/r/pull/{number}",
+                output_format="json",
+                output_file=str(tmp_path / f"pr-{number}.json"),
+            )
+            for number in (1, 2, 3)
+        ]
+        client = _client(server)
+
+        results = asyncio.run(
+            CodeRabbitOrchestrator.execute_many_async(configs, max_concurrency=2, github_client=client)
+        )
+
+        assert [result["success"] for result in results] == [True, True, True]
+        assert [result["pr_info"]["pr_number"] for result in results] == ["1", "2", "3"]
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["pr-1.json", "pr-2.json", "pr-3.json"]
+        assert set(results[0]["metrics"]["github_endpoint_times"]) == {
+            "pull", "comments", "reviews", "review_comments"
+        }
+        # The persona is loaded once for the whole batch; each execution gets its
+        # own analyzer over the shared parse cache
+        assert load_persona.call_count == 1
+        assert mock_analyzer.call_count == 3
+        shared_cache = mock_analyzer.return_value.parse_cache
+        assert all(call.kwargs["parse_cache"] is shared_cache for call in mock_analyzer.call_args_list[1:])
+
+    def test_failure_is_isolated(self, server, tmp_path):
+        server.add_route("GET", "/repos/o/r/pulls/5", {"message": "Not Found"}, status=404)
+
+        result = asyncio.run(CodeRabbitOrchestrator(
+            ExecutionConfig(pr_url="https://github.com/o/r/pull/5", retry_attempts=0)
+        ).execute_async(_client(server)))
+
+        assert not result["success"]
+        assert result["error_type"] == "InvalidPRUrlError"
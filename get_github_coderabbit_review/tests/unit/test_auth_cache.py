@@ -0,0 +1,160 @@
+"""
+Unit tests for the cross-invocation authentication cache.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from coderabbit_fetcher.exceptions import GitHubAuthenticationError
+from coderabbit_fetcher.github.auth import (
+    AuthCache,
+    env_token,
+    gh_login_fingerprint,
+    parse_auth_user,
+    token_fingerprint,
+)
+from coderabbit_fetcher.github.transport import HTTPTransport, resolve_token
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+@pytest.fixture
+def clean_env(monkeypatch, tmp_path):
+    """Environment without tokens and with an isolated gh config directory."""
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        monkeypatch.delenv(name, raising=False)
+    config_dir = tmp_path / "gh"
+    config_dir.mkdir()
+    (config_dir / "hosts.yml").write_text("github.com:\n    user: dev\n")
+    monkeypatch.setenv("GH_CONFIG_DIR", str(config_dir))
+    return config_dir
+
+
+def _auth_status(returncode=0):
+    return MagicMock(returncode=returncode, stdout="",
+                     stderr="  ✓ Logged in to github.com account dev (keyring)\n")
+
+
+class TestAuthCache:
+    """Test storing and expiring verified states."""
+
+    def test_round_trip(self, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+        cache.put("gh", "fp", user="dev")
+
+        state = cache.get("gh", "fp")
+
+        assert state.user == "dev"
+        assert cache.get("gh", "other") is None
+        assert cache.get("http", "fp") is None
+        assert "fp" in (tmp_path / "auth.json").read_text()
+
+    def test_expired(self, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json", ttl=10)
+        cache.put("gh", "fp")
+
+        with patch("coderabbit_fetcher.github.auth.time.time", return_value=time.time() + 11):
+            assert cache.get("gh", "fp") is None
+
+    def test_invalidate_and_corrupt_file(self, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+        cache.put("gh", "fp")
+        cache.invalidate()
+
+        assert cache.get("gh", "fp") is None
+        (tmp_path / "auth.json").write_text("not json")
+        assert cache.get("gh", "fp") is None
+
+    def test_token_is_not_stored(self, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+        cache.put("http", token_fingerprint("ghp_secret"))
+
+        assert "ghp_secret" not in (tmp_path / "auth.json").read_text()
+
+
+class TestHelpers:
+    """Test token and login helpers."""
+
+    def test_env_token_precedence(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "second")
+        monkeypatch.setenv("GH_TOKEN", "first")
+
+        assert env_token() == "first"
+
+    def test_resolve_token_prefers_environment(self, clean_env, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "from-env")
+
+        with patch("subprocess.run") as mock_run:
+            assert resolve_token() == "from-env"
+        mock_run.assert_not_called()
+
+    def test_login_fingerprint_changes_on_login(self, clean_env):
+        before = gh_login_fingerprint()
+        (clean_env / "hosts.yml").write_text("github.com:\n    user: someone-else\n")
+
+        assert before is not None and gh_login_fingerprint() != before
+
+    def test_parse_auth_user(self):
+        assert parse_auth_user("✓ Logged in to github.com as octocat (oauth_token)") == "octocat"
+        assert parse_auth_user("✓ Logged in to github.com account dev (keyring)") == "dev"
+        assert parse_auth_user("You are not logged in") is None
+
+
+class TestClientAuthentication:
+    """Test that clients skip ``gh auth status`` when possible."""
+
+    def test_second_client_uses_cache(self, clean_env, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+
+        with patch("subprocess.run", return_value=_auth_status()) as mock_run:
+            GitHubClient(auth_cache=cache)
+            client = GitHubClient(auth_cache=cache)
+
+        assert mock_run.call_count == 1
+        assert client.auth_user == "dev"
+
+    def test_env_token_skips_gh(self, clean_env, monkeypatch):
+        monkeypatch.setenv("GH_TOKEN", "token")
+
+        with patch("subprocess.run") as mock_run:
+            assert GitHubClient().check_authentication()
+        mock_run.assert_not_called()
+
+    def test_failed_check_is_not_cached(self, clean_env, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+
+        with patch("subprocess.run", return_value=_auth_status(returncode=1)):
+            with pytest.raises(GitHubAuthenticationError):
+                GitHubClient(auth_cache=cache)
+
+        assert not os.path.exists(tmp_path / "auth.json")
+
+    def test_unauthorized_response_invalidates(self, tmp_path):
+        cache = AuthCache(tmp_path / "auth.json")
+        cache.put("gh", "fp")
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/rate_limit", {"message": "Bad credentials"}, status=401)
+            client = GitHubClient(
+                transport=HTTPTransport(token="expired", base_url=server.url), auth_cache=cache
+            )
+
+            with pytest.raises(GitHubAuthenticationError):
+                client.check_rate_limit()
+
+        assert cache.get("gh", "fp") is None
+
+    def test_validate_reuses_authentication_check(self, clean_env):
+        def run(cmd, **kwargs):
+            if cmd[1] == "--version":
+                return MagicMock(returncode=0, stdout="gh version 2.40.0", stderr="")
+            return _auth_status()
+
+        with patch("subprocess.run", side_effect=run) as mock_run:
+            result = GitHubClient().validate_github_cli()
+
+        assert result["authenticated"] and result["auth_user"] == "dev"
+        auth_calls = [call for call in mock_run.call_args_list if call.args[0][1] == "auth"]
+        assert len(auth_calls) == 1
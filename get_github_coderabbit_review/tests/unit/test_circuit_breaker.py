@@ -0,0 +1,215 @@
+"""
+Unit tests for the GitHub API circuit breakers.
+"""
+
+import asyncio
+
+import pytest
+
+from coderabbit_fetcher.async_github_client import AsyncGitHubClient
+from coderabbit_fetcher.exceptions import CircuitBreakerError, InvalidPRUrlError, TransportError
+from coderabbit_fetcher.github.async_transport import AsyncTransportAdapter
+from coderabbit_fetcher.github.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerRegistry,
+    CircuitBreakerTransport,
+    endpoint_class,
+)
+from coderabbit_fetcher.github.transport import HTTPTransport, Transport
+from coderabbit_fetcher.github_client import GitHubAPIError, GitHubClient, GitHubServerError
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+CONFIG = CircuitBreakerConfig(window=10, failure_rate=0.5, minimum_requests=4,
+                              open_seconds=30, probe_requests=2)
+
+
+def _run(breaker, *outcomes):
+    for failed in outcomes:
+        breaker.record(failed, breaker.before_request())
+
+
+class TestCircuitBreaker:
+    """Test the state machine with a fake clock."""
+
+    def test_opens_at_failure_rate(self):
+        breaker = CircuitBreaker("x", CONFIG, FakeClock())
+
+        _run(breaker, True, True, True)
+        # Too few requests to judge
+        assert breaker.state == CLOSED
+
+        _run(breaker, False)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitBreakerError) as error:
+            breaker.before_request()
+        assert error.value.failure_count == 3 and error.value.threshold == 4
+        assert error.value.retry_after == pytest.approx(30)
+        assert error.value.details.endswith("circuit half-opens in 30s")
+        assert breaker.stats()["rejected_requests"] == 1
+
+    def test_old_outcomes_leave_the_window(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("x", CONFIG, clock)
+
+        _run(breaker, True, True, True)
+        clock.now += 11
+        _run(breaker, True, False, False)
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_probes_close_the_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("x", CONFIG, clock)
+        _run(breaker, True, True, True, True)
+
+        clock.now += 30
+        assert breaker.state == HALF_OPEN
+        first, second = breaker.before_request(), breaker.before_request()
+        assert first and second
+        # Only ``probe_requests`` probes at a time
+        with pytest.raises(CircuitBreakerError):
+            breaker.before_request()
+
+        breaker.record(False, first)
+        assert breaker.state == HALF_OPEN
+        breaker.record(False, second)
+        assert breaker.state == CLOSED
+        assert breaker.stats()["window_requests"] == 0
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("x", CONFIG, clock)
+        _run(breaker, True, True, True, True)
+
+        clock.now += 30
+        breaker.record(True, breaker.before_request())
+
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 2
+
+    def test_late_outcome_is_not_a_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("x", CONFIG, clock)
+        slow = breaker.before_request()
+        _run(breaker, True, True, True, True)
+
+        clock.now += 30
+        breaker.record(True, slow)
+
+        assert breaker.state == HALF_OPEN
+
+
+class TestRegistry:
+    """Test circuits per host and endpoint class."""
+
+    def test_endpoint_classes(self):
+        assert endpoint_class("GET", "/repos/o/r/pulls/1") == "read"
+        assert endpoint_class("POST", "/repos/o/r/issues/1/comments") == "write"
+        assert endpoint_class("POST", "/graphql") == "graphql"
+        assert endpoint_class("GET", "https://api.github.com/search/issues?q=x") == "search"
+
+    def test_outage_of_one_class_does_not_block_others(self):
+        registry = CircuitBreakerRegistry(CONFIG, FakeClock())
+        _run(registry.get("api.github.com", "POST", "/graphql"), True, True, True, True)
+
+        registry.get("api.github.com", "GET", "/repos/o/r/pulls/1").before_request()
+        assert registry.stats()["api.github.com/graphql"]["state"] == OPEN
+        assert registry.stats()["api.github.com/read"]["state"] == CLOSED
+
+
+class FailingTransport(Transport):
+    """Transport whose requests fail with a transport error."""
+
+    name = "http"
+    base_url = "https://github.example.com/api/v3"
+
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, path, params=None, body=None, headers=None, timeout=30):
+        self.calls += 1
+        raise TransportError("connection refused")
+
+
+class TestTransportIntegration:
+    """Test breakers in front of the clients' requests."""
+
+    def test_transport_errors_open_the_circuit(self):
+        inner = FailingTransport()
+        registry = CircuitBreakerRegistry(CONFIG)
+        transport = CircuitBreakerTransport(inner, registry)
+
+        for _ in range(4):
+            with pytest.raises(TransportError):
+                transport.request("GET", "/repos/o/r")
+        with pytest.raises(CircuitBreakerError):
+            transport.request("GET", "/repos/o/r")
+
+        assert inner.calls == 4
+        assert set(registry.stats()) == {"github.example.com/read"}
+
+    def test_client_fails_fast_during_outage(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/pulls/1", {"message": "bad gateway"}, status=502)
+            registry = CircuitBreakerRegistry(CircuitBreakerConfig(minimum_requests=2))
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url), fetch_mode="rest",
+                                  retry_attempts=5, retry_delay=0.01, circuit_breakers=registry)
+
+            with pytest.raises(GitHubAPIError):
+                client.get_pr_info("https://github.com/o/r/pull/1")
+            with pytest.raises(GitHubAPIError):
+                client.get_pr_info("https://github.com/o/r/pull/1")
+            with pytest.raises(CircuitBreakerError):
+                client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+            assert len(server.requests_for("/repos/o/r/pulls/1")) == 2
+            assert client.circuit_breaker_stats["127.0.0.1/read"]["state"] == OPEN
+
+    def test_client_errors_do_not_count(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/pulls/9", {"message": "Not Found"}, status=404)
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url),
+                                  circuit_breakers=CircuitBreakerRegistry(CircuitBreakerConfig(minimum_requests=1)))
+
+            for _ in range(3):
+                with pytest.raises(InvalidPRUrlError):
+                    client.get_pr_info("https://github.com/o/r/pull/9")
+
+            assert client.circuit_breaker_stats["127.0.0.1/read"]["state"] == CLOSED
+
+    def test_async_client_fails_fast(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/issues/comments/5", {"message": "oops"}, status=503)
+            client = AsyncGitHubClient(
+                transport=AsyncTransportAdapter(HTTPTransport(token="secret", base_url=server.url)),
+                circuit_breakers=CircuitBreakerRegistry(CircuitBreakerConfig(minimum_requests=2)),
+            )
+
+            async def get_three_times():
+                errors = []
+                for _ in range(3):
+                    try:
+                        await client.get_comment("https://github.com/o/r/pull/1", 5)
+                    except Exception as e:
+                        errors.append(type(e))
+                return errors
+
+            errors = asyncio.run(get_three_times())
+
+            assert errors == [GitHubServerError, GitHubServerError, CircuitBreakerError]
+            assert len(server.requests_for("/repos/o/r/issues/comments/5")) == 2
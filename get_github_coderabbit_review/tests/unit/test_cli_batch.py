@@ -0,0 +1,135 @@
+"""
+Unit tests for multi-PR batch mode of the CLI.
+"""
+
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from coderabbit_fetcher.cli.main import (
+    CLIError,
+    batch_output_path,
+    collect_pr_urls,
+    create_argument_parser,
+    run_batch_command,
+)
+from coderabbit_fetcher.exceptions import InvalidPRUrlError
+
+
+def _args(*argv):
+    return create_argument_parser().parse_args(list(argv))
+
+
+def _result(success, error=None):
+    result = {"success": success, "execution_time": 0.5}
+    if not success:
+        result.update(error=error, error_type="GitHubAPIError")
+    return result
+
+
+class TestCollectPrUrls:
+    """Test gathering PR URLs from arguments, files and stdin."""
+
+    def test_positional_urls(self):
+        args = _args("https://github.com/o/r/pull/1", "https://github.com/o/r/pull/2")
+
+        assert collect_pr_urls(args) == ["https://github.com/o/r/pull/1", "https://github.com/o/r/pull/2"]
+
+    def test_urls_file_skips_comments_and_duplicates(self, tmp_path):
+        urls_file = tmp_path / "prs.txt"
+        urls_file.write_text(
+            "# weekly review\n"
+            "https://github.com/o/r/pull/2\n"
+            "\n"
+            "  https://github.com/o/r/pull/3  \n"
+            "https://github.com/o/r/pull/1\n"
+        )
+        args = _args("https://github.com/o/r/pull/1", "--urls-file", str(urls_file))
+
+        assert collect_pr_urls(args) == [
+            "https://github.com/o/r/pull/1",
+            "https://github.com/o/r/pull/2",
+            "https://github.com/o/r/pull/3",
+        ]
+
+    def test_urls_from_stdin(self):
+        args = _args("--urls-file", "-")
+        stdin = io.StringIO("https://github.com/o/r/pull/4\nhttps://github.com/o/r/pull/5\n")
+
+        assert collect_pr_urls(args, stdin=stdin) == [
+            "https://github.com/o/r/pull/4", "https://github.com/o/r/pull/5"
+        ]
+
+    def test_missing_urls_file(self, tmp_path):
+        with pytest.raises(CLIError):
+            collect_pr_urls(_args("--urls-file", str(tmp_path / "missing.txt")))
+
+
+class TestBatchOutputPath:
+    """Test per-PR output file naming."""
+
+    def test_name_from_url(self, tmp_path):
+        path = batch_output_path(tmp_path, "https://github.com/owner/repo/pull/12", "markdown")
+
+        assert path == tmp_path / "owner_repo_pr12.md"
+
+    def test_invalid_url(self, tmp_path):
+        with pytest.raises(InvalidPRUrlError):
+            batch_output_path(tmp_path, "https://github.com/owner/repo/issues/12", "json")
+
+
+class TestRunBatchCommand:
+    """Test batch execution and the aggregate summary."""
+
+    @patch('coderabbit_fetcher.cli.main.CodeRabbitOrchestrator.execute_many_async', new_callable=AsyncMock)
+    def test_failures_are_isolated(self, mock_execute, tmp_path):
+        mock_execute.return_value = [_result(True), _result(False, "Not Found")]
+        urls = [
+            "https://github.com/o/r/pull/1",
+            "not-a-pr-url",
+            "https://github.com/o/r/pull/2",
+        ]
+        args = _args(*urls, "--output-dir", str(tmp_path), "--output-format", "json", "--workers", "3")
+
+        exit_code = run_batch_command(args, urls)
+
+        assert exit_code == 1
+        configs = mock_execute.call_args.args[0]
+        assert [config.output_file for config in configs] == [
+            str(tmp_path / "o_r_pr1.json"), str(tmp_path / "o_r_pr2.json")
+        ]
+        assert mock_execute.call_args.kwargs["max_concurrency"] == 3
+
+        summary = json.loads((tmp_path / "summary.json").read_text())
+        assert (summary["total"], summary["succeeded"], summary["failed"]) == (3, 1, 2)
+        assert [entry["success"] for entry in summary["results"]] == [True, False, False]
+        assert summary["results"][0]["output_file"] == str(tmp_path / "o_r_pr1.json")
+        assert summary["results"][1]["error_type"] == "InvalidPRUrlError"
+        assert summary["results"][2]["error"] == "Not Found"
+
+    @patch('coderabbit_fetcher.cli.main.CodeRabbitOrchestrator.execute_many_async', new_callable=AsyncMock)
+    def test_all_succeeded(self, mock_execute, tmp_path):
+        mock_execute.return_value = [_result(True), _result(True)]
+        urls = ["https://github.com/o/r/pull/1", "https://github.com/o/r/pull/2"]
+
+        assert run_batch_command(_args(*urls, "--output-dir", str(tmp_path)), urls) == 0
+
+    def test_output_file_rejected(self, tmp_path):
+        urls = ["https://github.com/o/r/pull/1", "https://github.com/o/r/pull/2"]
+        args = _args(*urls, "--output-file", str(tmp_path / "out.md"))
+
+        assert run_batch_command(args, urls) == 1
+
+    @pytest.mark.parametrize("argv", [
+        ["https://github.com/o/r/pull/1", "https://github.com/o/r/pull/2"],
+        ["https://github.com/o/r/pull/1", "--output-dir", "out"],
+    ])
+    @patch('coderabbit_fetcher.cli.main.CodeRabbitOrchestrator.execute_many_async', new_callable=AsyncMock)
+    def test_incremental_rejected(self, mock_execute, argv, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        args = _args(*argv, "--incremental")
+
+        assert run_batch_command(args, args.pr_urls) == 1
+        mock_execute.assert_not_called()
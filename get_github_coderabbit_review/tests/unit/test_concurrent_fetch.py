@@ -0,0 +1,112 @@
+"""
+Unit tests for the concurrent endpoint fan-out of a PR fetch.
+"""
+
+import threading
+import time
+
+import pytest
+
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.github_client import GitHubAPIError, GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+PR_URL = "https://github.com/o/r/pull/7"
+
+ENDPOINTS = {
+    "pull": "/repos/o/r/pulls/7",
+    "comments": "/repos/o/r/issues/7/comments",
+    "reviews": "/repos/o/r/pulls/7/reviews",
+    "review_comments": "/repos/o/r/pulls/7/comments",
+}
+
+
+class SlowPullRequest:
+    """Serves a PR whose endpoints each take ``delay`` seconds."""
+
+    def __init__(self, server, delay=0.1):
+        self.delay = delay
+        self.failures = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        payloads = {
+            "pull": {"number": 7, "title": "PR", "state": "open", "html_url": PR_URL,
+                     "user": {"login": "dev"}, "comments": 1, "review_comments": 1},
+            "comments": [{"id": 1, "body": "hi", "user": {"login": "coderabbitai[bot]"}}],
+            "reviews": [{"id": 9, "body": "review", "user": {"login": "coderabbitai[bot]"}}],
+            "review_comments": [{"id": 2, "body": "inline", "pull_request_review_id": 9}],
+        }
+        for name, path in ENDPOINTS.items():
+            server.add_route("GET", path, handler=self._handler(name, payloads[name]))
+
+    def _handler(self, name, payload):
+        def handler(request):
+            with self._lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                time.sleep(self.delay)
+                if self.failures.get(name, 0) > 0:
+                    self.failures[name] -= 1
+                    return 502, {"message": "bad gateway"}, {}
+                return 200, payload, {}
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        return handler
+
+
+@pytest.fixture
+def setup():
+    with StubGitHubServer() as server:
+        pull_request = SlowPullRequest(server)
+        client = GitHubClient(
+            transport=HTTPTransport(token="secret", base_url=server.url), fetch_mode="rest", retry_delay=0.01
+        )
+        yield server, pull_request, client
+
+
+class TestConcurrentFetch:
+    """Test the REST fan-out against the stub server."""
+
+    def test_endpoints_fetched_concurrently(self, setup):
+        _, pull_request, client = setup
+
+        pr_data = client.fetch_pr_comments(PR_URL)
+
+        assert pull_request.max_in_flight == 4
+        assert [c["id"] for c in pr_data["comments"]] == [1]
+        assert [c["id"] for c in pr_data["reviews"][0]["comments"]] == [2]
+        assert set(client.last_fetch_timings) == set(ENDPOINTS)
+        assert all(seconds >= 0.1 for seconds in client.last_fetch_timings.values())
+
+    def test_failing_endpoint_retried_alone(self, setup):
+        server, pull_request, client = setup
+        pull_request.failures["reviews"] = 1
+
+        pr_data = client.fetch_pr_comments(PR_URL)
+
+        assert pr_data["reviews"][0]["id"] == 9
+        assert len(server.requests_for(ENDPOINTS["reviews"])) == 2
+        for name in ("pull", "comments", "review_comments"):
+            assert len(server.requests_for(ENDPOINTS[name])) == 1
+
+    def test_exhausted_retries_raise(self, setup):
+        server, pull_request, client = setup
+        pull_request.failures["comments"] = 10
+
+        with pytest.raises(GitHubAPIError):
+            client.fetch_pr_comments(PR_URL)
+
+        assert len(server.requests_for(ENDPOINTS["comments"])) == client.retry_attempts + 1
+        assert "comments" in client.last_fetch_timings
+
+    def test_client_errors_not_retried(self, setup):
+        server, _, client = setup
+        server.add_route("GET", ENDPOINTS["reviews"], {"message": "Resource not accessible"}, status=403)
+
+        with pytest.raises(GitHubAPIError, match="Resource not accessible"):
+            client.fetch_pr_comments(PR_URL)
+
+        assert len(server.requests_for(ENDPOINTS["reviews"])) == 1
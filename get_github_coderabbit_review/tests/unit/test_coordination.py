@@ -0,0 +1,192 @@
+"""
+Unit tests for cross-process coordination of PR fetches.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from coderabbit_fetcher.github.coordination import FetchCoordinator, FileLock
+from coderabbit_fetcher.github.single_flight import SingleFlight
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+def _write_lock(path, pid, created_at, host=None):
+    path.write_text(json.dumps({
+        "token": "other",
+        "host": host or socket.gethostname(),
+        "pid": pid,
+        "created_at": created_at,
+    }))
+
+
+def _exited_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class TestFileLock:
+    """Test the lock file."""
+
+    def test_exclusive(self, tmp_path):
+        first = FileLock(tmp_path / "x.lock")
+        second = FileLock(tmp_path / "x.lock")
+
+        assert first.try_acquire()
+        assert not second.try_acquire()
+        first.release()
+        assert second.try_acquire()
+        second.release()
+        assert not (tmp_path / "x.lock").exists()
+
+    def test_lock_of_exited_process_is_broken(self, tmp_path):
+        if os.name != "posix":
+            pytest.skip("process liveness is only checked on POSIX")
+        path = tmp_path / "x.lock"
+        _write_lock(path, _exited_pid(), time.time())
+
+        lock = FileLock(path)
+        assert lock.try_acquire()
+        assert json.loads(path.read_text())["pid"] == os.getpid()
+
+    def test_old_lock_is_broken(self, tmp_path):
+        path = tmp_path / "x.lock"
+        _write_lock(path, os.getpid(), time.time() - 100, host="elsewhere")
+
+        assert not FileLock(path, stale_after=200).try_acquire()
+        assert FileLock(path, stale_after=50).try_acquire()
+
+    def test_release_keeps_a_lock_taken_over_by_another_owner(self, tmp_path):
+        path = tmp_path / "x.lock"
+        lock = FileLock(path)
+        assert lock.try_acquire()
+        _write_lock(path, os.getpid(), time.time())
+
+        lock.release()
+
+        assert path.exists()
+
+
+class TestFetchCoordinator:
+    """Test sharing of one fetch among coordinators on the same directory."""
+
+    def test_waiters_reuse_the_leaders_snapshot(self, tmp_path):
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"title": "PR"}
+
+        coordinators = [FetchCoordinator(tmp_path, wait=5, poll_interval=0.01) for _ in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(c.fetch, "key", fetch) for c in coordinators]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [{"title": "PR"}] * 4
+        assert len(calls) == 1
+        assert sum(c.stats()["shared"] for c in coordinators) == 3
+
+    def test_finished_snapshot_is_not_reused_by_default(self, tmp_path):
+        FetchCoordinator(tmp_path).fetch("key", lambda: [1])
+
+        assert FetchCoordinator(tmp_path).fetch("key", lambda: [2]) == [2]
+
+    def test_recent_snapshot_is_reused_with_ttl(self, tmp_path):
+        FetchCoordinator(tmp_path).fetch("key", lambda: [1])
+
+        assert FetchCoordinator(tmp_path, snapshot_ttl=30).fetch("key", lambda: [2]) == [1]
+        assert FetchCoordinator(tmp_path, snapshot_ttl=30).fetch("other", lambda: [3]) == [3]
+
+    def test_refresh_ignores_earlier_snapshots(self, tmp_path):
+        FetchCoordinator(tmp_path).fetch("key", lambda: [1])
+
+        assert FetchCoordinator(tmp_path).fetch("key", lambda: [2], refresh=True) == [2]
+
+    def test_waiter_takes_over_after_leader_failure(self, tmp_path):
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        leader = FetchCoordinator(tmp_path, wait=5, poll_interval=0.01)
+        waiter = FetchCoordinator(tmp_path, wait=5, poll_interval=0.01)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            failed = executor.submit(leader.fetch, "key", failing)
+            time.sleep(0.05)
+            taken_over = executor.submit(waiter.fetch, "key", lambda: "fetched")
+            release.set()
+            with pytest.raises(RuntimeError):
+                failed.result()
+            assert taken_over.result() == "fetched"
+
+    def test_waiter_fetches_itself_after_timeout(self, tmp_path):
+        coordinator = FetchCoordinator(tmp_path, wait=0.1, poll_interval=0.01)
+        held = FileLock(coordinator._path("key", ".lock"))
+        assert held.try_acquire()
+
+        assert coordinator.fetch("key", lambda: "own") == "own"
+        assert coordinator.stats()["timed_out"] == 1
+        held.release()
+
+    def test_async_waiters_reuse_the_snapshot(self, tmp_path):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"title": "PR"}
+
+        async def run():
+            coordinators = [FetchCoordinator(tmp_path, wait=5, poll_interval=0.01) for _ in range(3)]
+            return await asyncio.gather(*(c.fetch_async("key", fetch) for c in coordinators))
+
+        assert asyncio.run(run()) == [{"title": "PR"}] * 3
+        assert len(calls) == 1
+
+
+class TestClientCoordination:
+    """Test that clients of different processes share one PR fetch."""
+
+    def test_clients_share_the_fetch_through_the_directory(self, tmp_path):
+        with StubGitHubServer() as server:
+            def handler(request):
+                time.sleep(0.2)
+                return 200, {"number": 1, "title": "PR", "state": "open",
+                             "html_url": "https://github.com/o/r/pull/1", "user": {"login": "dev"}}, {}
+
+            server.add_route("GET", "/repos/o/r/pulls/1", handler=handler)
+            server.add_route("GET", "/repos/o/r/issues/1/comments", [])
+            server.add_route("GET", "/repos/o/r/pulls/1/reviews", [])
+            server.add_route("GET", "/repos/o/r/pulls/1/comments", [])
+
+            def fetch():
+                # A separate single-flight group per client stands in for a separate process
+                client = GitHubClient(
+                    transport=HTTPTransport(token="secret", base_url=server.url),
+                    fetch_mode="rest",
+                    single_flight=SingleFlight(),
+                    coordinator=FetchCoordinator(tmp_path, wait=5, poll_interval=0.01),
+                )
+                return client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = [future.result() for future in [executor.submit(fetch) for _ in range(3)]]
+
+            assert [result["title"] for result in results] == ["PR"] * 3
+            assert len(server.requests_for("/repos/o/r/pulls/1")) == 1
@@ -170,11 +170,10 @@ class TestGitHubClientRefactored:
             5
         )
 
-        # Verify the API call
+        # Verify the API call (sorting happens client-side)
         mock_run.assert_called_once_with([
             "gh", "api",
-            "/repos/owner/repo/issues/1/comments",
-            "--jq", "sort_by(.created_at) | reverse | .[:5]"
+            "/repos/owner/repo/issues/1/comments?per_page=100"
         ], capture_output=True, text=True, timeout=30)
 
         # Verify response
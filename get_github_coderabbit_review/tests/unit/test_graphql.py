@@ -0,0 +1,162 @@
+"""
+Unit tests for the GraphQL pull request fetch.
+"""
+
+import pytest
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalyzer
+from coderabbit_fetcher.exceptions import InvalidPRUrlError
+from coderabbit_fetcher.github.graphql import GraphQLPullRequestFetcher, map_pull_request
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+BOT = {"login": "coderabbitai", "__typename": "Bot"}
+USER = {"login": "dev", "__typename": "User"}
+
+
+def _connection(nodes, has_next=False, cursor=None):
+    return {"pageInfo": {"hasNextPage": has_next, "endCursor": cursor}, "nodes": nodes}
+
+
+def _review_comment(database_id, review_id, reply_to=None, author=BOT):
+    return {
+        "databaseId": database_id, "id": f"RC_{database_id}", "body": f"inline {database_id}",
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+        "url": f"https://github.com/o/r/pull/1#discussion_r{database_id}",
+        "path": "src/app.py", "line": 10, "originalLine": 10, "diffHunk": "@@",
+        "replyTo": {"databaseId": reply_to} if reply_to else None,
+        "pullRequestReview": {"databaseId": review_id},
+        "author": author,
+    }
+
+
+class FakeGraphQL:
+    """Serve paged GraphQL responses keyed by cursor."""
+
+    def __init__(self, resolved=True):
+        self.calls = []
+        self.resolved = resolved
+
+    def __call__(self, query, variables):
+        self.calls.append(variables)
+
+        if "ReviewThreadComments" in query:
+            assert variables == {"id0": "T1", "cursor0": "t1c1"}
+            return {"thread0": {"comments": _connection([_review_comment(102, 20, reply_to=101, author=USER)])}}
+
+        pull_request = {"number": 1}
+        if variables["withPullRequest"]:
+            pull_request.update({
+                "title": "Add feature", "body": "desc", "state": "OPEN",
+                "url": "https://github.com/o/r/pull/1", "author": USER,
+            })
+        if variables["withComments"]:
+            if variables["commentsCursor"] is None:
+                pull_request["comments"] = _connection([{"databaseId": 1, "id": "IC_1", "body": "first", "author": BOT}], True, "c1")
+            else:
+                pull_request["comments"] = _connection([{"databaseId": 2, "id": "IC_2", "body": "second", "author": USER}])
+        if variables["withReviews"]:
+            pull_request["reviews"] = _connection([{
+                "databaseId": 20, "id": "R_20", "body": "Actionable comments posted: 1",
+                "state": "COMMENTED", "submittedAt": "2024-01-01T00:00:00Z", "author": BOT,
+            }])
+        if variables["withThreads"]:
+            pull_request["reviewThreads"] = _connection([{
+                "id": "T1", "isResolved": self.resolved, "path": "src/app.py", "line": 10,
+                "comments": _connection([_review_comment(101, 20)], True, "t1c1"),
+            }])
+        return {"repository": {"pullRequest": pull_request}}
+
+
+class TestGraphQLPullRequestFetcher:
+    """Test cursor paging and mapping."""
+
+    def test_pages_only_pending_connections(self):
+        execute = FakeGraphQL()
+        pr_data = GraphQLPullRequestFetcher(execute).fetch("o", "r", 1)
+
+        # Initial query, second page of issue comments, thread replies
+        assert len(execute.calls) == 3
+        second = execute.calls[1]
+        assert second["withComments"] and second["commentsCursor"] == "c1"
+        assert not second["withReviews"] and not second["withThreads"]
+        assert not second["withPullRequest"]
+
+        assert pr_data["title"] == "Add feature"
+        assert [c["id"] for c in pr_data["comments"]] == [1, 2]
+
+        thread = pr_data["review_threads"][0]
+        assert thread["is_resolved"] is True
+        assert [c["id"] for c in thread["comments"]] == [101, 102]
+        assert thread["comments"][1]["in_reply_to_id"] == 101
+
+    def test_maps_to_analyzer_layout(self):
+        pr_data = GraphQLPullRequestFetcher(FakeGraphQL()).fetch("o", "r", 1)
+
+        review = pr_data["reviews"][0]
+        assert review["user"]["login"] == "coderabbitai[bot]"
+        assert review["created_at"] == "2024-01-01T00:00:00Z"
+        assert [c["id"] for c in review["comments"]] == [101, 102]
+        assert pr_data["comments"][0]["user"]["login"] == "coderabbitai[bot]"
+
+        analyzer = CommentAnalyzer()
+        all_comments = analyzer._collect_all_comments(pr_data)
+        assert len(analyzer._filter_coderabbit_comments(all_comments)) == 3
+
+    @pytest.mark.parametrize("resolved", [True, False])
+    def test_thread_resolution_from_github(self, resolved):
+        pr_data = GraphQLPullRequestFetcher(FakeGraphQL(resolved=resolved)).fetch("o", "r", 1)
+
+        analyzed = CommentAnalyzer().analyze_comments(pr_data)
+
+        # The issue comment is a thread of its own
+        assert [thread.thread_id for thread in analyzed.unresolved_threads] == (["1"] if resolved else ["1", "101"])
+        assert analyzed.metadata.resolved_comments == (1 if resolved else 0)
+
+    def test_missing_pull_request(self):
+        with pytest.raises(LookupError):
+            GraphQLPullRequestFetcher(lambda query, variables: {"repository": {"pullRequest": None}}).fetch("o", "r", 1)
+
+    def test_ghost_author(self):
+        pr_data = map_pull_request({"number": 1}, {"comments": [{"databaseId": 1, "author": None}]})
+
+        assert pr_data["comments"][0]["user"]["login"] == "ghost"
+
+
+class TestGitHubClientGraphQLMode:
+    """Test GitHubClient in GraphQL mode against the stub server."""
+
+    def test_fetch_pr_comments_single_round_trip(self):
+        execute = FakeGraphQL()
+
+        with StubGitHubServer() as server:
+            server.add_route("POST", "/graphql", handler=lambda request: (
+                200, {"data": execute(request.json()["query"], request.json()["variables"])}, {}
+            ))
+            transport = HTTPTransport(token="secret", base_url=server.url)
+            client = GitHubClient(transport=transport, fetch_mode="graphql")
+
+            pr_data = client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+        assert pr_data["owner"] == "o"
+        assert pr_data["pr_number"] == "1"
+        assert len(pr_data["review_threads"]) == 1
+        assert transport.requests_sent == 3
+
+    def test_graphql_not_found(self):
+        with StubGitHubServer() as server:
+            server.add_route("POST", "/graphql", {
+                "data": {"repository": {"pullRequest": None}},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a PullRequest"}],
+            })
+            client = GitHubClient(
+                transport=HTTPTransport(token="secret", base_url=server.url), fetch_mode="graphql"
+            )
+
+            with pytest.raises(InvalidPRUrlError):
+                client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+    def test_unknown_fetch_mode(self):
+        with pytest.raises(ValueError):
+            GitHubClient(transport=HTTPTransport(token="secret"), fetch_mode="soap")
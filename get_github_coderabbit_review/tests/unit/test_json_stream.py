@@ -0,0 +1,138 @@
+"""
+Unit tests for streamed JSON array decoding and streamed review comments.
+"""
+
+import json
+import stat
+
+import pytest
+
+from coderabbit_fetcher.github.json_stream import JSONArrayStream, iter_array_items
+from coderabbit_fetcher.github.transport import GhCliTransport, HTTPTransport, TransportError
+from coderabbit_fetcher.github_client import GitHubAPIError, GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+def _chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+ITEMS = [
+    {"id": 1, "body": "café ☃ [not, an] \"array\"", "line": -12.5e3},
+    [1, 2, [3]],
+    "text",
+    0,
+    None,
+    True,
+    12345678901234567890,
+]
+
+
+class TestJSONArrayStream:
+    """Test the incremental decoder."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10 ** 6])
+    def test_any_chunking(self, size):
+        data = (json.dumps(ITEMS) + "\n" + json.dumps([{"id": 2}]) + "[]").encode("utf-8")
+
+        assert list(iter_array_items(_chunked(data, size))) == ITEMS + [{"id": 2}]
+
+    def test_elements_handed_out_as_they_complete(self):
+        stream = JSONArrayStream()
+
+        assert stream.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+        assert stream.feed(b': 2}, 4') == [{"id": 2}]
+        # A number is only complete once a delimiter follows
+        assert stream.feed(b'2') == []
+        assert stream.feed(b']') == [42]
+        assert stream.close() == []
+
+    @pytest.mark.parametrize("data", [b'{"id": 1}', b'[1 2]', b'[1,', b'[{"id": 1}', b'[1.]', b'[1] x'])
+    def test_invalid_input(self, data):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array_items([data]))
+
+
+def _comments(first, count):
+    return [{"id": i, "body": "nit" if i % 2 else "fix"} for i in range(first, first + count)]
+
+
+class TestStreamedReviewComments:
+    """Test streaming review comments through the transports."""
+
+    def test_http_follows_links_and_filters(self):
+        with StubGitHubServer() as server:
+            page2 = f"{server.url}/repos/o/r/pulls/1/comments?per_page=100&page=2"
+
+            def handler(request):
+                if request.query.get("page") == "2":
+                    return 200, _comments(101, 5), {}
+                return 200, _comments(1, 100), {"Link": f'<{page2}>; rel="next"'}
+
+            server.add_route("GET", "/repos/o/r/pulls/1/comments", handler=handler)
+            transport = HTTPTransport(token="secret", base_url=server.url)
+            client = GitHubClient(transport=transport)
+
+            comments = client.fetch_pr_review_comments(
+                "https://github.com/o/r/pull/1", predicate=lambda c: c["body"] == "fix"
+            )
+
+            assert [c["id"] for c in comments] == list(range(2, 106, 2))
+            # Both connections went back to the pool for reuse
+            assert transport._idle.qsize() == 1
+
+    def test_http_error_status(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/pulls/1/comments",
+                             {"message": "Server Error"}, status=500)
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url))
+
+            with pytest.raises(GitHubAPIError):
+                list(client.iter_pr_review_comments("https://github.com/o/r/pull/1"))
+
+    def test_stop_early_releases_connection(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/pulls/1/comments", _comments(1, 100))
+            transport = HTTPTransport(token="secret", base_url=server.url)
+            client = GitHubClient(transport=transport)
+
+            comments = client.iter_pr_review_comments("https://github.com/o/r/pull/1")
+            assert next(comments)["id"] == 1
+            comments.close()
+
+            assert transport._slots.acquire(blocking=False)
+
+
+class TestGhCliStream:
+    """Test ``gh api --paginate`` streaming with a fake ``gh`` executable."""
+
+    @pytest.fixture
+    def fake_gh(self, tmp_path):
+        script = tmp_path / "gh"
+        script.write_text(
+            "#!/bin/sh\n"
+            "case \"$*\" in\n"
+            "  *missing*) echo 'gh: Not Found (HTTP 404)' >&2; exit 1;;\n"
+            "  *broken*) echo '[{\"id\": 1},'; echo 'gh: HTTP 502' >&2; exit 1;;\n"
+            "  *--paginate*) echo '[{\"id\": 1}, {\"id\": 2}]'; echo '[{\"id\": 3}]';;\n"
+            "  *) echo '[{\"id\": 1}]';;\n"
+            "esac\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        return str(script)
+
+    def test_paginated_arrays(self, fake_gh):
+        with GhCliTransport(fake_gh).stream("GET", "/repos/o/r/pulls/1/comments", paginate=True) as response:
+            items = list(iter_array_items(response.iter_chunks()))
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+
+    def test_error_before_output(self, fake_gh):
+        with GhCliTransport(fake_gh).stream("GET", "/missing") as response:
+            assert response.status == 404
+            assert "Not Found" in response.read().error_message
+
+    def test_error_after_output(self, fake_gh):
+        with GhCliTransport(fake_gh).stream("GET", "/broken") as response:
+            with pytest.raises(TransportError):
+                list(iter_array_items(response.iter_chunks()))
@@ -0,0 +1,97 @@
+"""Unit tests for the keyword automaton and classifier."""
+
+from coderabbit_fetcher.keywords import (
+    COMMENT_KEYWORDS, KeywordAutomaton, KeywordClassifier, KeywordHit, is_word_boundary
+)
+from coderabbit_fetcher.resolved_marker import ResolvedMarkerConfig, ResolvedMarkerDetector
+
+
+class TestKeywordAutomaton:
+    """Test multi-keyword matching."""
+
+    def test_overlapping_hits(self):
+        automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+
+        hits = automaton.find_all("ushers")
+
+        assert sorted(hits) == sorted([
+            KeywordHit("she", 1, 4), KeywordHit("he", 2, 4), KeywordHit("hers", 2, 6),
+        ])
+
+    def test_case_insensitive_by_default(self):
+        automaton = KeywordAutomaton(["Security"])
+
+        assert automaton.found("A SECURITY issue") == {"Security"}
+        assert not KeywordAutomaton(["Security"], case_sensitive=True).contains_any("a security issue")
+
+    def test_positions_follow_the_original_text(self):
+        [hit] = KeywordAutomaton(["bug"]).find_all("İİ bug")
+
+        assert (hit.start, hit.end) == (3, 6)
+
+    def test_non_ascii_keywords(self):
+        assert KeywordAutomaton(["セキュリティ", "脆弱性"]).found("重大な脆弱性です") == {"脆弱性"}
+
+    def test_empty_keywords_are_ignored(self):
+        automaton = KeywordAutomaton(["", "a"])
+
+        assert automaton.keywords == ("a",)
+        assert not KeywordAutomaton([]).contains_any("anything")
+
+    def test_word_boundary(self):
+        assert is_word_boundary("a fix", 2)
+        assert is_word_boundary("a fix", 5)
+        assert not is_word_boundary("prefix", 3)
+
+
+class TestKeywordClassifier:
+    """Test labelling texts."""
+
+    def test_labels_in_priority_order(self):
+        classifier = KeywordClassifier({"level": {"high": ["error"], "low": ["style"]}})
+
+        assert classifier.labels("style error", "level") == ("high", "low")
+        assert classifier.first("style only", "level", "none") == "low"
+        assert classifier.first("nothing", "level", "none") == "none"
+
+    def test_keyword_shared_by_taxonomies(self):
+        classifier = KeywordClassifier({"a": {"x": ["bug"]}, "b": {"y": ["bug"]}})
+
+        assert classifier.classify("a bug") == {"a": ("x",), "b": ("y",)}
+
+    def test_results_are_memoized(self):
+        classifier = KeywordClassifier({"a": {"x": ["bug"]}})
+
+        assert classifier.classify("a bug") is classifier.classify("a bug")
+
+    def test_comment_keywords(self):
+        body = "This is a security vulnerability; consider async validation."
+
+        assert COMMENT_KEYWORDS.first(body, "priority", "Low") == "High"
+        assert COMMENT_KEYWORDS.first(body, "analysis_priority", "info") == "critical"
+        assert set(COMMENT_KEYWORDS.labels(body, "topic")) == {"security", "async programming", "validation"}
+
+
+class TestResolvedMarkers:
+    """Test resolved marker detection through the automaton."""
+
+    def test_exact_match_needs_word_boundaries(self):
+        detector = ResolvedMarkerDetector(ResolvedMarkerConfig(
+            resolved_marker="RESOLVED", additional_patterns=[], exact_match=True, case_sensitive=True))
+
+        assert detector._contains_resolved_marker("Marked RESOLVED.")
+        assert not detector._contains_resolved_marker("UNRESOLVEDX")
+
+    def test_exact_match_honours_case_insensitivity(self):
+        detector = ResolvedMarkerDetector(ResolvedMarkerConfig(
+            resolved_marker="Resolved", additional_patterns=[], exact_match=True, case_sensitive=False))
+
+        assert detector._contains_resolved_marker("this is resolved")
+
+    def test_markers_added_later_are_found(self):
+        detector = ResolvedMarkerDetector(ResolvedMarkerConfig(resolved_marker="🔒 DONE 🔒"))
+        assert not detector._contains_resolved_marker("all fixed ✅")
+
+        detector.config.additional_patterns.append("fixed ✅")
+
+        assert detector._contains_resolved_marker("all fixed ✅")
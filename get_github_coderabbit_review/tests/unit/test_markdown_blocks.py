@@ -0,0 +1,176 @@
+"""Unit tests for the comment body block tokenizer."""
+
+import re
+
+from coderabbit_fetcher.processors.markdown_blocks import (
+    CODE, DETAILS, HEADING, LIST_ITEM, PARAGRAPH, RULE, TABLE, parse_blocks
+)
+
+REVIEW_BODY = """**Actionable comments posted: 1**
+
+<details>
+<summary>🧹 Nitpick comments (2)</summary><blockquote>
+
+<details>
+<summary>src/a.py (2)</summary><blockquote>
+
+`15-20`: **Use a constant.**
+
+Magic numbers are hard to read.
+
+`30`: **Rename the variable.**
+
+</blockquote></details>
+
+</blockquote></details>
+
+## Walkthrough
+
+The PR adds a cache.
+
+| File | Summary |
+|------|---------|
+| `a.py` | Cache |
+
+- first item
+  continued
+- second item
+
+```python
+# not a heading
+| not | a table |
+```
+
+---
+
+<details>
+<summary>
+🤖 Prompt for AI Agents
+</summary>
+
+```
+Fix it
+```
+</details>
+"""
+
+
+def kinds(blocks):
+    return [block.kind for block in blocks]
+
+
+class TestParseBlocks:
+    """Test splitting bodies into blocks."""
+
+    def test_block_tree(self):
+        tree = parse_blocks(REVIEW_BODY)
+
+        assert kinds(tree.blocks) == [
+            PARAGRAPH, DETAILS, HEADING, PARAGRAPH, TABLE, LIST_ITEM, LIST_ITEM, CODE, RULE, DETAILS
+        ]
+        nitpicks = tree.blocks[1]
+        assert nitpicks.title == "🧹 Nitpick comments (2)"
+        assert kinds(nitpicks.children) == [DETAILS]
+        assert nitpicks.children[0].title == "src/a.py (2)"
+        assert kinds(nitpicks.children[0].children) == [PARAGRAPH] * 3
+
+    def test_blocks(self):
+        tree = parse_blocks(REVIEW_BODY)
+        heading, table, item, code, prompt = (tree.blocks[i] for i in (2, 4, 5, 7, 9))
+
+        assert (heading.title, heading.level) == ("Walkthrough", 2)
+        assert table.text.split("\n")[0] == "| File | Summary |"
+        assert (item.info, item.text) == ("-", "first item\ncontinued")
+        assert (code.info, code.text) == ("python", "# not a heading\n| not | a table |")
+        # Multi-line summary
+        assert prompt.title == "🤖 Prompt for AI Agents"
+        assert kinds(prompt.children) == [CODE]
+
+    def test_source_lines(self):
+        tree = parse_blocks(REVIEW_BODY)
+
+        assert tree.source(tree.blocks[5]) == "- first item\n  continued"
+        assert tree.lines == tuple(REVIEW_BODY.split("\n"))
+
+    def test_walk(self):
+        tree = parse_blocks(REVIEW_BODY)
+
+        assert [block.title for block in tree.walk(DETAILS)] == [
+            "🧹 Nitpick comments (2)", "src/a.py (2)", "🤖 Prompt for AI Agents"
+        ]
+        assert [block.text for block in tree.walk(CODE)] == [
+            "# not a heading\n| not | a table |", "Fix it"
+        ]
+
+    def test_unclosed_blocks_run_to_the_end(self):
+        tree = parse_blocks("<details>\n<summary>Open</summary>\n\n```\ncode\n- not an item")
+
+        assert kinds(tree.blocks) == [DETAILS]
+        assert kinds(tree.blocks[0].children) == [CODE]
+        assert tree.blocks[0].children[0].text == "code\n- not an item"
+
+    def test_indented_lines(self):
+        tree = parse_blocks("    ## Title\n    - item\n    text")
+
+        assert kinds(tree.blocks) == [HEADING, LIST_ITEM]
+        assert tree.blocks[1].text == "item\ntext"
+        assert tree.blocks[1].level == 4
+
+    def test_single_pipe_row_is_a_paragraph(self):
+        assert kinds(parse_blocks("a | b | c\n\nnext").blocks) == [PARAGRAPH, PARAGRAPH]
+
+    def test_empty_body(self):
+        assert parse_blocks("").blocks == ()
+
+    def test_large_body(self):
+        body = "### Section\n" + "- `a.py:1` - An issue description\n" * 20000 + "<details>\n" * 500
+
+        tree = parse_blocks(body)
+
+        assert len(list(tree.walk(LIST_ITEM))) == 20000
+
+
+class TestSections:
+    """Test section queries."""
+
+    def test_heading_section_runs_to_same_level_heading(self):
+        tree = parse_blocks("## A\n### A.1\ntext\n## B\nother")
+
+        [section] = tree.sections(re.compile("^A$"))
+
+        assert section.title == "A"
+        assert section.text == "### A.1\ntext"
+
+    def test_heading_section_stops_at_thematic_break(self):
+        [section] = parse_blocks("## A\ntext\n---\nafter").sections(re.compile("A"))
+
+        assert section.text == "text"
+
+    def test_details_section(self):
+        [section] = parse_blocks(REVIEW_BODY).sections(re.compile("Prompt for AI Agents"))
+
+        assert section.text == "```\nFix it\n```"
+
+    def test_nested_matches_are_part_of_the_outer_section(self):
+        sections = parse_blocks(REVIEW_BODY).sections(re.compile("Nitpick|src/"))
+
+        assert [section.title for section in sections] == ["🧹 Nitpick comments (2)"]
+
+    def test_labels(self):
+        tree = parse_blocks("🧹 Nitpick comments\n\n- one\n- two\n\n## Next\n- three")
+
+        [section] = tree.sections(re.compile("Nitpick"))
+
+        assert [block.text for block in section.walk(LIST_ITEM)] == ["one", "two"]
+        assert tree.sections(re.compile("Nitpick"), labels=False) == []
+
+    def test_predicate(self):
+        assert len(parse_blocks(REVIEW_BODY).sections(lambda title: title.startswith("Walk"))) == 1
+
+    def test_deeply_nested_details(self):
+        depth = 2000
+        body = "<details>\n<summary>Level</summary>\n" * depth + "## Deep\ntext\n" + "</details>\n" * depth
+
+        [section] = parse_blocks(body).sections(re.compile("^Deep$"))
+
+        assert section.text == "text"
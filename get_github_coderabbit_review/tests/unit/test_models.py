@@ -19,6 +19,7 @@ from coderabbit_fetcher.models import (
     Priority,
     ResolutionStatus,
 )
+from coderabbit_fetcher.models.base import construct_model
 
 
 class TestCommentMetadata:
@@ -273,3 +274,50 @@ class TestAnalyzedComments:
         assert analysis.has_ai_prompts
         assert analysis.total_actionable_items == 1
         assert "test.py" in analysis.files_with_issues
+
+
+class TestTrustedConstruction:
+    """Test building models from processed data without validation."""
+
+    def test_normalization(self):
+        """Test strings are stripped and enums stored as values like validation does."""
+        data = dict(new_features=[" Feature ", "Other"], walkthrough="Walkthrough ", raw_content="Content")
+
+        summary = construct_model(SummaryComment, data)
+        validated = SummaryComment(**data)
+
+        assert summary == validated
+        assert summary.model_fields_set == validated.model_fields_set
+        for name in SummaryComment.model_fields:
+            assert type(getattr(summary, name)) is type(getattr(validated, name)), name
+        assert summary.new_features == ["Feature", "Other"]
+        assert summary.changes_table == []
+
+    def test_thread_derived_fields(self):
+        """Test trusted threads get a summary and chronological order."""
+        data = dict(
+            thread_id=" thread123 ",
+            main_comment={"user": {"login": "user1"}, "created_at": "2023-01-01T10:00:00Z"},
+            replies=[{"user": {"login": "user2"}, "created_at": "2023-01-01T11:00:00Z"}],
+            resolution_status=ResolutionStatus.RESOLVED,
+        )
+
+        thread = ThreadContext.trusted(**data)
+        validated = ThreadContext(**data)
+
+        assert thread == validated
+        assert thread.model_fields_set == validated.model_fields_set
+        assert thread.thread_id == "thread123"
+        assert type(thread.resolution_status) is str
+        assert len(thread.chronological_order) == 2
+        assert "user2" in thread.contextual_summary
+
+    def test_processed_threads_match_validated_threads(self):
+        """Test the analyzer builds the same threads as validation would."""
+        from coderabbit_fetcher.comment_analyzer import CommentAnalyzer
+        from tests.fixtures.analysis_data import analysis_pr_data
+
+        threads = CommentAnalyzer().analyze_comments(analysis_pr_data(threads=6)).unresolved_threads
+
+        assert threads
+        assert threads == [ThreadContext(**thread.model_dump()) for thread in threads]
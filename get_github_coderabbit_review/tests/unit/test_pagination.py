@@ -0,0 +1,137 @@
+"""
+Unit tests for parallel pagination.
+"""
+
+import threading
+import time
+
+import pytest
+
+from coderabbit_fetcher.github.pagination import collect_pages, page_urls
+from coderabbit_fetcher.github.transport import GitHubResponse, HTTPTransport
+from coderabbit_fetcher.github_client import GitHubAPIError, GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+PR_URL = "https://github.com/o/r/pull/1"
+
+
+class PagedRoute:
+    """Serve ``pages`` numbered pages with GitHub-style Link headers."""
+
+    def __init__(self, server, path, pages, per_page=100, delay=0.0, fail_page=None):
+        self.server = server
+        self.path = path
+        self.pages = pages
+        self.per_page = per_page
+        self.delay = delay
+        self.fail_page = fail_page
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server.add_route("GET", path, handler=self)
+
+    def __call__(self, request):
+        page = int(request.query.get("page", 1))
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if page == self.fail_page:
+                return 500, {"message": "boom"}, {}
+
+            links = []
+            base = f"{self.server.url}{self.path}?per_page={self.per_page}"
+            if page < self.pages:
+                links.append(f'<{base}&page={page + 1}>; rel="next"')
+                links.append(f'<{base}&page={self.pages}>; rel="last"')
+            items = [{"id": (page - 1) * self.per_page + i} for i in range(self.per_page)]
+            return 200, items, {"Link": ", ".join(links)} if links else {}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestPageUrls:
+    """Test Link relation expansion."""
+
+    def test_expands_next_to_last(self):
+        urls = page_urls({
+            "next": "https://api.github.com/x?per_page=100&page=2",
+            "last": "https://api.github.com/x?per_page=100&page=4",
+        })
+
+        assert urls == [
+            "https://api.github.com/x?per_page=100&page=2",
+            "https://api.github.com/x?per_page=100&page=3",
+            "https://api.github.com/x?per_page=100&page=4",
+        ]
+
+    def test_cursor_links_are_not_expanded(self):
+        assert page_urls({"next": "https://api.github.com/x?after=abc"}) is None
+        assert page_urls({}) is None
+
+
+class TestCollectPages:
+    """Test concurrent page collection against the stub server."""
+
+    def test_pages_fetched_concurrently_in_order(self):
+        with StubGitHubServer() as server:
+            route = PagedRoute(server, "/items", pages=6, per_page=3, delay=0.05)
+            transport = HTTPTransport(token="secret", base_url=server.url)
+            first = transport.request("GET", "/items", params={"per_page": 3})
+
+            items = collect_pages(
+                first, lambda url: transport.request("GET", url), lambda r: r.json(), max_workers=4
+            )
+
+        assert [item["id"] for item in items] == list(range(18))
+        assert route.max_in_flight > 1
+
+    def test_cursor_pagination_is_serial(self):
+        responses = {
+            "u2": GitHubResponse(status=200, text="[2]", headers={"link": '<u3>; rel="next"'}),
+            "u3": GitHubResponse(status=200, text="[3]"),
+        }
+        first = GitHubResponse(status=200, text="[1]", headers={"link": '<u2>; rel="next"'})
+
+        items = collect_pages(first, responses.__getitem__, lambda r: r.json())
+
+        assert items == [1, 2, 3]
+
+    def test_failing_page_propagates(self):
+        first = GitHubResponse(status=200, text="[1]", headers={
+            "link": '<https://x/y?page=2>; rel="next", <https://x/y?page=3>; rel="last"'
+        })
+
+        def parse(response):
+            if response.status != 200:
+                raise ValueError("bad page")
+            return response.json()
+
+        def fetch(url):
+            return GitHubResponse(status=500 if url.endswith("page=2") else 200, text="[9]")
+
+        with pytest.raises(ValueError):
+            collect_pages(first, fetch, parse)
+
+
+class TestClientPagination:
+    """Test GitHubClient list endpoints with parallel pagination."""
+
+    def test_review_comments_all_pages(self):
+        with StubGitHubServer() as server:
+            PagedRoute(server, "/repos/o/r/pulls/1/comments", pages=5)
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url))
+
+            comments = client.fetch_pr_review_comments(PR_URL)
+
+        assert [c["id"] for c in comments] == list(range(500))
+
+    def test_page_error_raises_api_error(self):
+        with StubGitHubServer() as server:
+            PagedRoute(server, "/repos/o/r/pulls/1/comments", pages=4, fail_page=3)
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url))
+
+            with pytest.raises(GitHubAPIError):
+                client.fetch_pr_review_comments(PR_URL)
@@ -0,0 +1,73 @@
+"""
+Unit tests for process-pool comment analysis.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalysisError, CommentAnalyzer
+from tests.fixtures.analysis_data import analysis_dump, analysis_pr_data
+
+
+class TestParallelAnalysis:
+    """Test analyzing pull requests with worker processes."""
+
+    def test_same_result_as_serial(self):
+        serial = CommentAnalyzer()
+        parallel = CommentAnalyzer(jobs=3, parallel_threshold=1)
+
+        expected = serial.analyze_comments(analysis_pr_data())
+        result = parallel.analyze_comments(analysis_pr_data())
+
+        assert analysis_dump(result) == analysis_dump(expected)
+        assert parallel.get_analysis_statistics()["workers"] == 3
+        assert serial.get_analysis_statistics()["workers"] == 1
+        # Resolved threads are filtered out
+        assert len(result.unresolved_threads) == 13
+        assert result.summary_comments and result.review_comments
+
+    def test_threads_keep_chronological_order(self):
+        result = CommentAnalyzer(jobs=2, parallel_threshold=1).analyze_comments(analysis_pr_data(threads=4))
+
+        thread = result.unresolved_threads[0]
+        assert thread.main_comment["id"] == 1010
+        assert [c["id"] for c in thread.chronological_order] == [1010, 1011]
+
+    def test_small_pull_requests_are_analyzed_serially(self):
+        analyzer = CommentAnalyzer(jobs=4)
+
+        with patch("coderabbit_fetcher.comment_analyzer.process_in_pool") as pool:
+            analyzer.analyze_comments(analysis_pr_data(threads=2))
+
+        pool.assert_not_called()
+        assert analyzer.get_analysis_statistics()["workers"] == 1
+
+    def test_falls_back_to_serial_without_worker_processes(self):
+        analyzer = CommentAnalyzer(jobs=2, parallel_threshold=1)
+
+        with patch("coderabbit_fetcher.comment_analyzer.process_in_pool", side_effect=OSError("no semaphores")):
+            result = analyzer.analyze_comments(analysis_pr_data(threads=3))
+
+        assert analysis_dump(result) == analysis_dump(CommentAnalyzer().analyze_comments(analysis_pr_data(threads=3)))
+        assert analyzer.get_analysis_statistics()["workers"] == 1
+
+    def test_missing_results_are_an_error(self):
+        analyzer = CommentAnalyzer()
+        process_work = analyzer._process_work
+
+        def short_shard(work):
+            results = process_work(work)
+            results["summary"].pop()
+            return results
+
+        with patch.object(analyzer, "_process_work", side_effect=short_shard):
+            with pytest.raises(CommentAnalysisError):
+                analyzer.analyze_comments(analysis_pr_data(threads=3))
+
+    def test_jobs_validation(self):
+        from coderabbit_fetcher.orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+
+        config = ExecutionConfig(pr_url="https://github.com/o/r/pull/1", jobs=0)
+
+        assert "Jobs must be at least 1" in CodeRabbitOrchestrator(config).validate_configuration()["issues"]
@@ -0,0 +1,104 @@
+"""
+Unit tests for the persistent cache of parsed comments.
+"""
+
+from unittest.mock import patch
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalyzer
+from coderabbit_fetcher.parse_cache import ParseCache, parse_key
+from coderabbit_fetcher.processors import ReviewProcessor
+from coderabbit_fetcher.resolved_marker import ResolvedMarkerConfig
+from tests.fixtures.analysis_data import analysis_dump, analysis_pr_data
+
+
+class TestParseCache:
+    """Test the SQLite store."""
+
+    def test_round_trip(self, tmp_path):
+        cache = ParseCache(tmp_path / "parse.sqlite3")
+        cache.put_many({"a": {"x": 1}, "b": [1, "two"]})
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": {"x": 1}, "b": [1, "two"]}
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (2, 1, 2)
+
+    def test_persists_across_instances(self, tmp_path):
+        ParseCache(tmp_path / "parse.sqlite3").put_many({"a": "value"})
+
+        assert ParseCache(tmp_path / "parse.sqlite3").get_many(["a"]) == {"a": "value"}
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ParseCache(tmp_path / "parse.sqlite3", max_bytes=250)
+        value = "x" * 100
+        cache.put_many({"a": value})
+        cache.put_many({"b": value})
+        # "a" becomes more recent than "b"
+        with patch("coderabbit_fetcher.parse_cache.time.time", return_value=4e9):
+            cache.get_many(["a"])
+
+        with patch("coderabbit_fetcher.parse_cache.time.time", return_value=5e9):
+            cache.put_many({"c": value})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_keys(self):
+        processor, config = ReviewProcessor(), ResolvedMarkerConfig()
+        comment = {"id": 1, "body": "text", "updated_at": "2025-01-01T00:00:00Z"}
+
+        key = parse_key("review", processor, config, comment)
+
+        # Same content, other comment: same result
+        assert parse_key("review", processor, config, {**comment, "id": 2}) == key
+        assert parse_key("review", processor, config, {**comment, "body": "edited"}) != key
+        assert parse_key("review", processor, config, {**comment, "updated_at": "2025-02-01T00:00:00Z"}) != key
+        assert parse_key("summary", processor, config, comment) != key
+        assert parse_key("review", processor, ResolvedMarkerConfig(resolved_marker="DONE"), comment) != key
+        with patch.object(ReviewProcessor, "VERSION", 2):
+            assert parse_key("review", processor, config, comment) != key
+
+
+class TestCachedAnalysis:
+    """Test analysis reusing cached results."""
+
+    def test_second_run_parses_nothing(self, tmp_path):
+        expected = CommentAnalyzer().analyze_comments(analysis_pr_data(threads=5))
+        path = tmp_path / "parse.sqlite3"
+        CommentAnalyzer(parse_cache=ParseCache(path)).analyze_comments(analysis_pr_data(threads=5))
+        analyzer = CommentAnalyzer(parse_cache=ParseCache(path))
+
+        with patch.object(analyzer.review_processor, "process_review_comment") as review, \
+                patch.object(analyzer.thread_processor, "process_thread") as thread:
+            result = analyzer.analyze_comments(analysis_pr_data(threads=5))
+
+        review.assert_not_called()
+        thread.assert_not_called()
+        assert analysis_dump(result) == analysis_dump(expected)
+        stats = analyzer.get_analysis_statistics()
+        assert stats["parse_cache_misses"] == 0
+        assert stats["parse_cache_hit_rate"] == 1.0
+
+    def test_only_edited_comments_are_parsed(self, tmp_path):
+        cache = ParseCache(tmp_path / "parse.sqlite3")
+        CommentAnalyzer(parse_cache=cache).analyze_comments(analysis_pr_data(threads=5))
+        data = analysis_pr_data(threads=5)
+        # Root comment of the second (unresolved) thread
+        data["reviews"][0]["comments"][3]["body"] = "Edited: potential security issue"
+        analyzer = CommentAnalyzer(parse_cache=cache)
+
+        result = analyzer.analyze_comments(data)
+
+        stats = analyzer.get_analysis_statistics()
+        # The summary, the review body and 4 threads are reused; the edited thread is parsed again
+        assert (stats["parse_cache_hits"], stats["parse_cache_misses"]) == (6, 1)
+        assert result.unresolved_threads[0].main_comment["body"] == "Edited: potential security issue"
+
+    def test_parallel_results_are_cached(self, tmp_path):
+        cache = ParseCache(tmp_path / "parse.sqlite3")
+        CommentAnalyzer(jobs=2, parallel_threshold=1, parse_cache=cache).analyze_comments(analysis_pr_data(threads=5))
+        analyzer = CommentAnalyzer(parse_cache=cache)
+
+        result = analyzer.analyze_comments(analysis_pr_data(threads=5))
+
+        assert analyzer.get_analysis_statistics()["parse_cache_misses"] == 0
+        assert analysis_dump(result) == analysis_dump(CommentAnalyzer().analyze_comments(analysis_pr_data(threads=5)))
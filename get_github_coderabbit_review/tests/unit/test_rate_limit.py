@@ -0,0 +1,162 @@
+"""
+Unit tests for the rate-limit-aware request scheduler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from coderabbit_fetcher.async_github_client import AsyncGitHubClient
+from coderabbit_fetcher.github.async_transport import AsyncTransportAdapter
+from coderabbit_fetcher.github.rate_limit import RateLimitScheduler, RequestSlot
+from coderabbit_fetcher.github.transport import GitHubResponse, HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _headers(remaining, reset, limit=5000, resource="core"):
+    return {
+        "x-ratelimit-limit": str(limit),
+        "x-ratelimit-remaining": str(remaining),
+        "x-ratelimit-reset": str(reset),
+        "x-ratelimit-resource": resource,
+    }
+
+
+def _complete(scheduler, headers, status=200, resource="core"):
+    slot = scheduler.acquire(resource=resource)
+    scheduler.complete(slot, GitHubResponse(status=status, headers=headers))
+
+
+class TestClassify:
+    """Test deriving scheduling attributes from a request."""
+
+    def test_read_write_and_pages(self):
+        classify = RateLimitScheduler.classify
+
+        assert classify("GET", "/repos/o/r/pulls/1") == {
+            "resource": "core", "write": False, "low_priority": False
+        }
+        assert classify("POST", "/repos/o/r/issues/1/comments")["write"] is True
+        assert classify("GET", "/repos/o/r/issues/1/comments", {"page": 3})["low_priority"] is True
+        assert classify("GET", "https://api.github.com/x?per_page=100&page=2")["low_priority"] is True
+
+    def test_graphql_and_exempt(self):
+        assert RateLimitScheduler.classify("POST", "/graphql") == {"resource": "graphql"}
+        assert RateLimitScheduler.classify("GET", "/rate_limit") == {"exempt": True}
+
+
+class TestScheduler:
+    """Test pacing decisions with a fake clock."""
+
+    def test_unpaced_above_reserve(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(reserve=10, clock=clock)
+        _complete(scheduler, _headers(remaining=500, reset=1600))
+
+        assert scheduler._delay(RequestSlot("core"), low_priority=False) <= 0
+
+    def test_paced_below_reserve(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(reserve=10, clock=clock)
+        _complete(scheduler, _headers(remaining=5, reset=1100))
+
+        # 100 seconds left for 5 requests: one every 20 seconds
+        assert scheduler._delay(RequestSlot("core"), low_priority=False) == pytest.approx(20.0)
+        # Follow-up pages wait for the reset
+        assert scheduler._delay(RequestSlot("core"), low_priority=True) == pytest.approx(100.0)
+
+    def test_exhausted_waits_for_reset(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(clock=clock)
+        _complete(scheduler, _headers(remaining=0, reset=1030), status=403)
+
+        assert scheduler._delay(RequestSlot("core"), low_priority=False) == pytest.approx(30.0)
+        # Other resources are unaffected
+        assert scheduler._delay(RequestSlot("graphql"), low_priority=False) <= 0
+
+        clock.now = 1031
+        assert scheduler._delay(RequestSlot("core"), low_priority=False) <= 0
+
+    def test_retry_after_blocks_everything(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(clock=clock)
+        _complete(scheduler, {"retry-after": "42"}, status=403)
+
+        assert scheduler._delay(RequestSlot("graphql"), low_priority=False) == pytest.approx(42.0)
+
+    def test_in_flight_requests_count_against_budget(self):
+        clock = FakeClock()
+        scheduler = RateLimitScheduler(reserve=0, clock=clock)
+        _complete(scheduler, _headers(remaining=2, reset=1100))
+
+        scheduler.acquire()
+        scheduler.acquire()
+
+        assert scheduler._delay(RequestSlot("core"), low_priority=False) == pytest.approx(100.0)
+
+    def test_out_of_order_responses_keep_lowest_remaining(self):
+        scheduler = RateLimitScheduler(reserve=0, clock=FakeClock())
+        _complete(scheduler, _headers(remaining=40, reset=1100))
+        _complete(scheduler, _headers(remaining=45, reset=1100))
+
+        assert scheduler.stats()["resources"]["core"]["remaining"] == 40
+
+    def test_writes_are_spaced(self):
+        scheduler = RateLimitScheduler(write_interval=0.1)
+
+        started = time.monotonic()
+        for _ in range(3):
+            scheduler.complete(scheduler.acquire(write=True), None)
+
+        assert time.monotonic() - started >= 0.2
+        assert scheduler.stats()["throttled_requests"] == 2
+
+
+class TestClientIntegration:
+    """Test that clients feed the scheduler from real responses."""
+
+    def test_sync_client_reports_remaining_budget(self):
+        with StubGitHubServer() as server:
+            server.add_route("GET", "/repos/o/r/issues/comments/5", {"id": 5, "body": "x"},
+                             headers={"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4321",
+                                      "X-RateLimit-Reset": "1900000000",
+                                      "X-RateLimit-Resource": "core"})
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url))
+
+            client.get_comment("https://github.com/o/r/pull/1", 5)
+
+        assert client.rate_limit_stats["resources"]["core"] == {
+            "limit": 5000, "remaining": 4321, "reset": 1900000000
+        }
+
+    def test_async_posts_are_spaced(self):
+        scheduler = RateLimitScheduler(write_interval=0.1)
+        with StubGitHubServer() as server:
+            server.add_route("POST", "/repos/o/r/issues/1/comments", {"id": 1, "body": "hi"})
+            client = AsyncGitHubClient(
+                transport=AsyncTransportAdapter(HTTPTransport(token="secret", base_url=server.url)),
+                scheduler=scheduler,
+            )
+
+            async def post_three():
+                await asyncio.gather(*(
+                    client.post_comment("https://github.com/o/r/pull/1", "hi") for _ in range(3)
+                ))
+
+            started = time.monotonic()
+            asyncio.run(post_three())
+
+        assert time.monotonic() - started >= 0.2
+        assert scheduler.throttled_requests == 2
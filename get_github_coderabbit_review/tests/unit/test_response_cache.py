@@ -0,0 +1,136 @@
+"""
+Unit tests for the conditional-request response cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from coderabbit_fetcher.github.cache import CachingTransport, ResponseCache
+from coderabbit_fetcher.github.transport import GitHubResponse, HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from coderabbit_fetcher.storage import get_cache_dir
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+ETAG = '"abc123"'
+
+
+def _etag_route(payload):
+    """Answer 304 when the client presents the current ETag."""
+    def handler(request):
+        if request.headers.get("if-none-match") == ETAG:
+            return 304, None, {"ETag": ETAG}
+        return 200, payload, {"ETag": ETAG}
+    return handler
+
+
+@pytest.fixture
+def server():
+    """Running stub GitHub API server."""
+    with StubGitHubServer() as stub:
+        yield stub
+
+
+class TestResponseCache:
+    """Test the on-disk entry store."""
+
+    def test_put_and_get(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put("key", GitHubResponse(status=200, headers={"etag": ETAG, "x-other": "1"}, text="[]"))
+
+        entry = cache.get("key")
+
+        assert entry.etag == ETAG
+        assert entry.text == "[]"
+        assert "x-other" not in entry.headers
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=0.01)
+        cache.put("key", GitHubResponse(status=200, headers={"etag": ETAG}, text="[]"))
+        time.sleep(0.05)
+
+        assert cache.get("key") is None
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_lru_eviction(self, tmp_path):
+        body = "x" * 400
+        cache = ResponseCache(tmp_path, max_bytes=1700)
+        for name in ("a", "b", "c"):
+            cache.put(name, GitHubResponse(status=200, headers={"etag": ETAG}, text=body))
+
+        # Make "a" the most recently used entry
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (1, 1))
+        assert cache.get("a") is not None
+
+        cache.put("d", GitHubResponse(status=200, headers={"etag": ETAG}, text=body))
+
+        assert cache.stats.evictions >= 1
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 1700
+
+
+class TestCachingTransport:
+    """Test conditional requests against the stub server."""
+
+    def test_not_modified_served_from_cache(self, server, tmp_path):
+        server.add_route("GET", "/repos/o/r/issues/1/comments", handler=_etag_route([{"id": 1}]))
+        transport = CachingTransport(
+            HTTPTransport(token="secret", base_url=server.url), ResponseCache(tmp_path)
+        )
+
+        first = transport.request("GET", "/repos/o/r/issues/1/comments", params={"per_page": 100})
+        second = transport.request("GET", "/repos/o/r/issues/1/comments", params={"per_page": 100})
+
+        assert first.json() == second.json() == [{"id": 1}]
+        assert second.status == 200
+        assert server.requests[1].headers["if-none-match"] == ETAG
+        assert transport.stats.hits == 1
+        assert transport.stats.misses == 1
+
+    def test_pages_are_cached_separately(self, server, tmp_path):
+        server.add_route("GET", "/items", handler=lambda request: (
+            200, [request.query.get("page")], {"ETag": f'"{request.query.get("page")}"'}
+        ))
+        transport = CachingTransport(
+            HTTPTransport(token="secret", base_url=server.url), ResponseCache(tmp_path)
+        )
+
+        transport.request("GET", "/items", params={"page": 1})
+        transport.request("GET", "/items", params={"page": 2})
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_refresh_skips_validators(self, server, tmp_path):
+        server.add_route("GET", "/rate_limit", handler=_etag_route({"ok": True}))
+        cache = ResponseCache(tmp_path)
+        inner = HTTPTransport(token="secret", base_url=server.url)
+
+        CachingTransport(inner, cache).request("GET", "/rate_limit")
+        CachingTransport(inner, cache, refresh=True).request("GET", "/rate_limit")
+
+        assert "if-none-match" not in server.requests[1].headers
+        assert cache.stats.hits == 0
+
+    def test_client_uses_cache(self, server, tmp_path):
+        server.add_route("GET", "/rate_limit", handler=_etag_route({"resources": {}}))
+        client = GitHubClient(
+            transport=HTTPTransport(token="secret", base_url=server.url),
+            cache=ResponseCache(tmp_path)
+        )
+
+        client.check_rate_limit()
+        assert client.check_rate_limit() == {"resources": {}}
+        assert client.cache_stats.hits == 1
+
+
+def test_cache_dir_env_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("CODERABBIT_FETCHER_CACHE_DIR", str(tmp_path / "root"))
+
+    path = get_cache_dir("http")
+
+    assert path == tmp_path / "root" / "http"
+    assert path.is_dir()
@@ -433,3 +433,30 @@ salt generation; update all related authentication functions.
         result = self.processor.process_review_comment(large_comment)
         assert isinstance(result, ReviewComment)
         assert result.actionable_count == 1
+
+    def test_nitpicks_in_per_file_details(self):
+        """Test nitpicks listed in CodeRabbit's per-file <details> blocks."""
+        content = """**Actionable comments posted: 0**
+
+<details>
+<summary>🧹 Nitpick comments (2)</summary><blockquote>
+
+<details>
+<summary>src/cache.py (2)</summary><blockquote>
+
+`15-20`: **Extract the timeout into a constant.**
+
+The value is repeated in three places.
+
+`42`: **Prefer pathlib over os.path.**
+
+</blockquote></details>
+
+</blockquote></details>
+"""
+
+        nitpicks = self.processor.extract_nitpick_comments(content)
+
+        assert [(n.file_path, n.line_range) for n in nitpicks] == [("src/cache.py", "15-20"), ("src/cache.py", "42")]
+        assert nitpicks[0].suggestion == "**Extract the timeout into a constant.**"
+        assert self.processor.extract_actionable_comments(content) == []
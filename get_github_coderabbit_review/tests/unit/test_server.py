@@ -0,0 +1,255 @@
+"""
+Unit tests for the persistent analysis server and the CLI launcher.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coderabbit_fetcher.async_github_client import AsyncGitHubClient
+from coderabbit_fetcher.cli.main import build_forwarded_config
+from coderabbit_fetcher.github.async_transport import AsyncTransportAdapter
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.launcher import SERVER_ENV, TOKEN_ENV, forward_to_server, request_server, server_token
+from coderabbit_fetcher.models import AnalyzedComments, CommentMetadata
+from coderabbit_fetcher.persona_manager import PersonaManager
+from coderabbit_fetcher.server import AnalysisServer
+from coderabbit_fetcher.storage import CACHE_DIR_ENV
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+PR_URL = "https://github.com/o/r/pull/1"
+
+SUMMARY = {
+    "id": 10, "body": "<!-- This is an auto-generated comment: summarize by coderabbit.ai -->\n"
+                      "## Summary by CodeRabbit\n\n- New Features\n  - Adds a feature",
+    "user": {"login": "coderabbitai[bot]"}, "created_at": "2025-01-01T00:00:00Z",
+}
+
+
+def _analyzed_comments():
+    return AnalyzedComments(metadata=CommentMetadata(
+        pr_number=1, pr_title="PR 1", owner="o", repo="r", total_comments=0,
+        coderabbit_comments=0, resolved_comments=0, actionable_comments=0,
+        processing_time_seconds=0.0,
+    ))
+
+
+@pytest.fixture
+def components():
+    """Stub the analysis, which is not under test here, and count persona loads."""
+    with patch("coderabbit_fetcher.orchestrator.CommentAnalyzer") as analyzer, \
+            patch.object(PersonaManager, "load_persona", autospec=True,
+                         side_effect=PersonaManager.load_persona) as load_persona:
+        analyzer.return_value = Mock(analyze_comments=Mock(side_effect=lambda pr_data: _analyzed_comments()))
+        yield load_persona
+
+
+@pytest.fixture
+def github():
+    """Stub GitHub API serving one small PR."""
+    with StubGitHubServer() as stub:
+        stub.add_route("GET", "/repos/o/r/pulls/1", {
+            "number": 1, "title": "PR 1", "state": "open", "html_url": PR_URL, "user": {"login": "dev"},
+        })
+        stub.add_route("GET", "/repos/o/r/issues/1/comments", [SUMMARY])
+        stub.add_route("GET", "/repos/o/r/pulls/1/reviews", [])
+        stub.add_route("GET", "/repos/o/r/pulls/1/comments", [])
+        yield stub
+
+
+@pytest.fixture
+def analysis_server(github):
+    client = AsyncGitHubClient(transport=AsyncTransportAdapter(HTTPTransport(token="t", base_url=github.url)),
+                               fetch_mode="rest")
+    return AnalysisServer(fetch_mode="rest", use_cache=False, github_client=client, token="secret")
+
+
+@contextmanager
+def running(server):
+    """Serve on a Unix socket from a background event loop."""
+    directory = tempfile.mkdtemp(prefix="crf")
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def start():
+        state["server"], state["address"] = await server.start(Path(directory) / "s.sock")
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(start())
+        started.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    try:
+        yield state["address"]
+    finally:
+        loop.call_soon_threadsafe(state["server"].close)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestAnalysisServer:
+    """Test the JSON API."""
+
+    def test_analyze(self, components, analysis_server):
+        with running(analysis_server) as address:
+            result = request_server(address, "GET", f"/analyze?pr={PR_URL}&format=json", token="secret")
+
+        assert result["success"], result.get("error")
+        assert result["format"] == "json"
+        assert '"summary_comments"' in result["content"]
+
+    def test_analyze_end_to_end(self, analysis_server):
+        with running(analysis_server) as address:
+            result = request_server(address, "GET", f"/analyze?pr={PR_URL}&format=json", token="secret")
+
+        assert result["success"], result.get("error")
+        content = json.loads(result["content"])
+        assert content["persona"] == PersonaManager().load_persona()
+        assert content["metadata"]["statistics"]["summary_count"] == 1
+
+    def test_concurrent_requests_share_warm_components(self, components, analysis_server, github):
+        with running(analysis_server) as address:
+            threads = [threading.Thread(target=lambda: results.append(
+                request_server(address, "GET", f"/analyze?pr={PR_URL}", token="secret"))) for _ in range(4)]
+            results = []
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+            health = request_server(address, "GET", "/healthz", token="secret")
+
+        assert [r["success"] for r in results] == [True] * 4
+        assert health["requests"] == 4
+        assert health["warm_components"] == 1
+        # Persona and components were loaded once for all requests
+        assert components.call_count == 1
+        assert len(github.requests_for("/repos/o/r/pulls/1")) <= 4
+
+    def test_analysis_does_not_block_other_requests(self, components, analysis_server):
+        started, release = threading.Event(), threading.Event()
+
+        def analyze(pr_data):
+            started.set()
+            assert release.wait(10)
+            return _analyzed_comments()
+
+        results = []
+        with patch("coderabbit_fetcher.orchestrator.CommentAnalyzer") as analyzer:
+            analyzer.return_value = Mock(analyze_comments=Mock(side_effect=analyze))
+            with running(analysis_server) as address:
+                thread = threading.Thread(target=lambda: results.append(
+                    request_server(address, "GET", f"/analyze?pr={PR_URL}", token="secret")))
+                thread.start()
+                try:
+                    assert started.wait(10)
+                    # Answered while the analysis is still running
+                    health = request_server(address, "GET", "/healthz", timeout=2, token="secret")
+                finally:
+                    release.set()
+                    thread.join(10)
+
+        assert health["active"] == 1
+        assert results[0]["success"], results[0].get("error")
+
+    def test_invalid_request(self, analysis_server):
+        with running(analysis_server) as address:
+            def get(path):
+                return request_server(address, "GET", path, token="secret")
+
+            assert "Missing 'pr'" in get("/analyze?format=json")["error"]
+            assert "Invalid format" in get(f"/analyze?pr={PR_URL}&format=x")["error"]
+            assert get("/nope") == {"error": "Not found"}
+
+    @pytest.mark.parametrize("token", [None, "wrong"])
+    def test_requests_need_the_token(self, analysis_server, github, token):
+        with running(analysis_server) as address:
+            result = request_server(address, "GET", f"/analyze?pr={PR_URL}&persona_file=/etc/passwd",
+                                    token=token)
+            cli = request_server(address, "POST", "/cli", {"argv": [PR_URL], "cwd": "/"}, token=token)
+
+        assert result == cli == {"error": "Missing or invalid access token"}
+        assert not github.requests_for("/repos/o/r/pulls/1")
+
+    def test_serve_publishes_a_private_token(self, monkeypatch):
+        directory = tempfile.mkdtemp(prefix="crf")
+        monkeypatch.setenv(CACHE_DIR_ENV, directory)
+        monkeypatch.delenv(TOKEN_ENV, raising=False)
+        server = AnalysisServer(github_client=Mock())
+        token_file = Path(directory) / "server" / "token"
+
+        async def serve_once():
+            ready = asyncio.Event()
+            task = asyncio.ensure_future(server.serve(Path(directory) / "s.sock", ready=ready))
+            await ready.wait()
+            published = (server_token(), stat.S_IMODE(os.stat(token_file).st_mode))
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return published
+
+        try:
+            assert asyncio.run(serve_once()) == (server.token, 0o600)
+            assert not token_file.exists()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+class TestForwarding:
+    """Test the CLI launcher forwarding to the server."""
+
+    def test_forwarded_config(self, tmp_path):
+        config = build_forwarded_config([PR_URL, "-o", "out.md", "-f", "plain"], str(tmp_path))
+
+        assert config.pr_url == PR_URL
+        assert config.output_format == "plain"
+        assert config.output_file == str(tmp_path / "out.md")
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        [PR_URL, PR_URL],
+        [PR_URL, "--output-dir", "out"],
+        [PR_URL, "--post-resolution-request"],
+        [PR_URL, "--no-server"],
+        ["--version"],
+        [PR_URL, "--unknown-option"],
+    ])
+    def test_local_only_invocations(self, argv, tmp_path):
+        assert build_forwarded_config(argv, str(tmp_path)) is None
+
+    def test_launcher_writes_the_servers_output(self, analysis_server, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(TOKEN_ENV, "secret")
+        with running(analysis_server) as address:
+            monkeypatch.setenv(SERVER_ENV, address)
+            exit_code = forward_to_server([PR_URL, "-o", "out/result.md"])
+
+        assert exit_code == 0
+        assert "**Summary Comments**: 1" in (tmp_path / "out" / "result.md").read_text()
+        assert "(server)" in capsys.readouterr().out
+
+    def test_launcher_runs_locally_when_refused(self, analysis_server, monkeypatch):
+        monkeypatch.setenv(TOKEN_ENV, "stale")
+        with running(analysis_server) as address:
+            monkeypatch.setenv(SERVER_ENV, address)
+            assert forward_to_server([PR_URL]) is None
+
+    def test_launcher_runs_locally_without_server(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(SERVER_ENV, f"unix:{tmp_path}/missing.sock")
+
+        assert forward_to_server([PR_URL]) is None
+        assert forward_to_server(["server"]) is None
@@ -0,0 +1,210 @@
+"""
+Unit tests for single-flight coalescing of concurrent requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from coderabbit_fetcher.async_github_client import AsyncGitHubClient
+from coderabbit_fetcher.github.async_transport import AsyncTransportAdapter
+from coderabbit_fetcher.github.single_flight import AsyncSingleFlight, SingleFlight, request_key
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+
+def _call_concurrently(count, fn):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(fn) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """Test coalescing of threads."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return {"items": [1]}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(group.do, "key", slow, dict) for _ in range(4)]
+            while group.stats()["shared"] < 3:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert results == [{"items": [1]}] * 4
+        # Waiters receive copies
+        assert len({id(result) for result in results}) == 4
+        assert group.stats() == {"executed": 1, "shared": 3}
+
+    def test_error_reaches_every_waiter(self):
+        group = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(group.do, "key", failing) for _ in range(3)]
+            while group.stats()["shared"] < 2:
+                time.sleep(0.01)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_finished_calls_are_not_cached(self):
+        group = SingleFlight()
+
+        assert group.do("key", lambda: 1) == 1
+        assert group.do("key", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    """Test coalescing of tasks."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def run():
+            return await asyncio.gather(*(group.do("key", slow) for _ in range(5)))
+
+        assert asyncio.run(run()) == [42] * 5
+        assert len(calls) == 1
+
+    def test_cancelled_leader_hands_over(self):
+        group = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            leader = asyncio.ensure_future(group.do("key", slow))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(group.do("key", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()) == "done"
+
+
+class TestRequestKey:
+    """Test which requests are coalesced."""
+
+    def test_reads_only(self):
+        assert request_key("c", "GET", "/x", {"page": 1}, None, None) is not None
+        assert request_key("c", "POST", "/repos/o/r/issues/1/comments", None, {"body": "x"}, None) is None
+        assert request_key("c", "POST", "/graphql", None, {"query": "query { viewer { login } }"}, None)
+        assert request_key("c", "POST", "/graphql", None, {"query": "mutation { x }"}, None) is None
+
+    def test_identity(self):
+        assert request_key("c", "GET", "/x", {"a": 1, "b": 2}, None, None) == \
+            request_key("c", "get", "/x", {"b": 2, "a": 1}, None, None)
+        assert request_key("c", "GET", "/x", {"page": 1}, None, None) != \
+            request_key("c", "GET", "/x", {"page": 2}, None, None)
+        assert request_key("c", "GET", "/x", None, None, None) != \
+            request_key("other", "GET", "/x", None, None, None)
+
+
+def _slow_pull_request(server, delay=0.2):
+    def route(path, payload):
+        def handler(request):
+            time.sleep(delay)
+            return 200, payload, {}
+        server.add_route("GET", path, handler=handler)
+
+    route("/repos/o/r/pulls/1", {"number": 1, "title": "PR", "state": "open",
+                                 "html_url": "https://github.com/o/r/pull/1", "user": {"login": "dev"}})
+    route("/repos/o/r/issues/1/comments", [{"id": 1, "body": "hi", "user": {"login": "coderabbitai[bot]"}}])
+    route("/repos/o/r/pulls/1/reviews", [])
+    route("/repos/o/r/pulls/1/comments", [])
+
+
+class TestClientCoalescing:
+    """Test that concurrent fetches of one PR reach the API once."""
+
+    def test_clients_sharing_a_token_share_the_fetch(self):
+        with StubGitHubServer() as server:
+            _slow_pull_request(server)
+            group = SingleFlight()
+
+            def fetch():
+                client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url),
+                                      fetch_mode="rest", single_flight=group)
+                return client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+            results = _call_concurrently(4, fetch)
+
+            assert all(result["title"] == "PR" for result in results)
+            assert len(server.requests_for("/repos/o/r/pulls/1")) == 1
+            # Results are independent copies
+            results[0]["comments"].clear()
+            assert len(results[1]["comments"]) == 1
+
+    def test_different_tokens_are_not_shared(self):
+        with StubGitHubServer() as server:
+            _slow_pull_request(server, delay=0.1)
+            group = SingleFlight()
+            tokens = iter(["a", "b"])
+            lock = threading.Lock()
+
+            def fetch():
+                with lock:
+                    token = next(tokens)
+                client = GitHubClient(transport=HTTPTransport(token=token, base_url=server.url),
+                                      fetch_mode="rest", single_flight=group)
+                return client.fetch_pr_comments("https://github.com/o/r/pull/1")
+
+            _call_concurrently(2, fetch)
+
+            assert len(server.requests_for("/repos/o/r/pulls/1")) == 2
+
+    def test_identical_pages_are_shared(self):
+        with StubGitHubServer() as server:
+            _slow_pull_request(server)
+            client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url),
+                                  single_flight=SingleFlight())
+
+            _call_concurrently(3, lambda: client.fetch_pr_review_comments("https://github.com/o/r/pull/1"))
+
+            assert len(server.requests_for("/repos/o/r/pulls/1/comments")) == 1
+
+    def test_async_fetches_are_shared(self):
+        with StubGitHubServer() as server:
+            _slow_pull_request(server)
+            client = AsyncGitHubClient(
+                transport=AsyncTransportAdapter(HTTPTransport(token="secret", base_url=server.url)),
+                fetch_mode="rest",
+                single_flight=AsyncSingleFlight(),
+            )
+
+            async def run():
+                return await asyncio.gather(*(
+                    client.fetch_pr_comments("https://github.com/o/r/pull/1") for _ in range(3)
+                ))
+
+            results = asyncio.run(run())
+
+            assert [result["title"] for result in results] == ["PR"] * 3
+            assert len(server.requests_for("/repos/o/r/pulls/1")) == 1
@@ -0,0 +1,164 @@
+"""
+Unit tests for offline PR snapshots.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalyzer
+from coderabbit_fetcher.exceptions import SnapshotError
+from coderabbit_fetcher.models import AnalyzedComments, CommentMetadata
+from coderabbit_fetcher.orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+from coderabbit_fetcher.snapshot import SNAPSHOT_FORMAT, load_pr_snapshot, save_pr_snapshot
+
+PR_URL = "https://github.com/o/r/pull/1"
+
+PR_DATA = {
+    "title": "Add feature",
+    "body": "",
+    "number": 1,
+    "url": PR_URL,
+    "comments": [
+        {"id": 1, "body": "**Summary by CodeRabbit**\n\nAdds a feature.",
+         "user": "coderabbitai[bot]", "created_at": "2025-01-01T00:00:00Z"}
+    ],
+    "reviews": [],
+    "owner": "o",
+    "repo": "r",
+    "pr_number": "1",
+}
+
+
+class TestSnapshotFile:
+    """Test reading and writing snapshot files."""
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "nested" / "pr.json"
+
+        assert save_pr_snapshot(path, PR_DATA, PR_URL) > 0
+        snapshot = load_pr_snapshot(path)
+
+        assert snapshot.pr_data == PR_DATA
+        assert snapshot.pr_url == PR_URL
+        assert json.loads(path.read_text())["format"] == SNAPSHOT_FORMAT
+        assert not list(path.parent.glob("*.tmp"))
+
+    def test_bare_pr_data_is_accepted(self, tmp_path):
+        path = tmp_path / "raw.json"
+        path.write_text(json.dumps({"title": "t", "comments": [], "reviews": []}))
+
+        snapshot = load_pr_snapshot(path)
+
+        assert snapshot.pr_data["title"] == "t"
+        assert snapshot.pr_url is None
+
+    def test_gh_pr_view_output_is_converted(self):
+        snapshot = load_pr_snapshot(Path(__file__).parents[2] / "pr_104_raw_data.json")
+
+        review = snapshot.pr_data["reviews"][0]
+        assert review["user"] == {"login": "coderabbitai"}
+        assert review["created_at"] == review["submitted_at"]
+        assert snapshot.pr_data["comments"][0]["created_at"]
+
+        result = CommentAnalyzer().analyze_comments(snapshot.pr_data)
+        assert result.metadata.coderabbit_comments == 4
+        assert result.summary_comments
+        assert result.metadata.actionable_comments > 0
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"title": "no comments"}', '{"comments": {}}'])
+    def test_invalid_content(self, tmp_path, content):
+        path = tmp_path / "bad.json"
+        path.write_text(content)
+
+        with pytest.raises(SnapshotError):
+            load_pr_snapshot(path)
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(SnapshotError) as excinfo:
+            load_pr_snapshot(tmp_path / "missing.json")
+        assert "missing.json" in str(excinfo.value)
+
+
+def _analyzed_comments():
+    return AnalyzedComments(metadata=CommentMetadata(
+        pr_number=1, pr_title="Add feature", owner="o", repo="r", total_comments=1,
+        coderabbit_comments=1, resolved_comments=0, actionable_comments=0,
+        processing_time_seconds=0.0,
+    ))
+
+
+@pytest.fixture
+def components():
+    """Stub the analysis, which is not under test here."""
+    with patch("coderabbit_fetcher.orchestrator.CommentAnalyzer") as analyzer:
+        analyzer.return_value = Mock(analyze_comments=Mock(return_value=_analyzed_comments()))
+        yield analyzer.return_value
+
+
+class TestOrchestratorSnapshots:
+    """Test the orchestrator's offline mode."""
+
+    def test_from_snapshot_needs_no_github_client(self, components, tmp_path):
+        path = tmp_path / "pr.json"
+        save_pr_snapshot(path, PR_DATA, PR_URL)
+        config = ExecutionConfig(pr_url="", snapshot_input=str(path), output_format="json",
+                                 output_file=str(tmp_path / "out.json"))
+
+        with patch("coderabbit_fetcher.orchestrator.GitHubClient") as client_class:
+            results = CodeRabbitOrchestrator(config).execute()
+
+        assert results["success"], results.get("error")
+        client_class.assert_not_called()
+        assert results["pr_info"]["pr_number"] == "1"
+        assert results["metrics"]["github_api_calls"] == 0
+        assert (tmp_path / "out.json").exists()
+        components.analyze_comments.assert_called_once_with(PR_DATA)
+
+    def test_from_snapshot_async(self, components, tmp_path):
+        path = tmp_path / "pr.json"
+        save_pr_snapshot(path, PR_DATA, PR_URL)
+        config = ExecutionConfig(pr_url=PR_URL, snapshot_input=str(path),
+                                 output_file=str(tmp_path / "out.md"))
+
+        with patch("coderabbit_fetcher.orchestrator.AsyncGitHubClient") as client_class:
+            results = asyncio.run(CodeRabbitOrchestrator(config).execute_async())
+
+        assert results["success"], results.get("error")
+        client_class.assert_not_called()
+
+    def test_save_snapshot_after_fetch(self, components, tmp_path):
+        path = tmp_path / "saved.json"
+        config = ExecutionConfig(pr_url=PR_URL, snapshot_output=str(path),
+                                 output_file=str(tmp_path / "out.md"))
+
+        with patch("coderabbit_fetcher.orchestrator.GitHubClient") as client_class:
+            client_class.return_value.fetch_pr_comments.return_value = PR_DATA
+            client_class.return_value.parse_pr_url.return_value = ("o", "r", "1")
+            results = CodeRabbitOrchestrator(config).execute()
+
+        assert results["success"], results.get("error")
+        assert load_pr_snapshot(path).pr_data == PR_DATA
+
+    def test_snapshot_without_url_requires_one(self, components, tmp_path):
+        path = tmp_path / "raw.json"
+        path.write_text(json.dumps({"comments": [], "reviews": []}))
+        config = ExecutionConfig(pr_url="", snapshot_input=str(path))
+
+        results = CodeRabbitOrchestrator(config).execute()
+
+        assert not results["success"]
+        assert results["error_type"] == "SnapshotError"
+
+    def test_validation(self, tmp_path):
+        config = ExecutionConfig(pr_url="", snapshot_input=str(tmp_path / "missing.json"),
+                                 post_resolution_request=True)
+
+        issues = CodeRabbitOrchestrator(config).validate_configuration()["issues"]
+
+        assert any("Snapshot file not found" in issue for issue in issues)
+        assert any("Resolution requests" in issue for issue in issues)
+        assert not any("PR URL is required" in issue for issue in issues)
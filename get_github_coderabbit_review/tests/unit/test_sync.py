@@ -0,0 +1,132 @@
+"""
+Unit tests for incremental pull request sync.
+"""
+
+import pytest
+
+from coderabbit_fetcher.github.sync import (
+    IncrementalSyncer,
+    SnapshotStore,
+    high_water_mark,
+    merge_by_id,
+)
+from coderabbit_fetcher.github.transport import HTTPTransport
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+PR_URL = "https://github.com/o/r/pull/3"
+
+
+def _comment(comment_id, updated_at, body=None, **extra):
+    comment = {
+        "id": comment_id,
+        "body": body or f"comment {comment_id}",
+        "user": {"login": "coderabbitai[bot]"},
+        "created_at": f"2024-01-0{comment_id}T00:00:00Z",
+        "updated_at": updated_at,
+    }
+    comment.update(extra)
+    return comment
+
+
+class FakePullRequest:
+    """Mutable PR state served by the stub server, honouring ``since``."""
+
+    def __init__(self, server):
+        self.comments = [_comment(1, "2024-01-01T00:00:00Z"), _comment(2, "2024-01-02T00:00:00Z")]
+        self.review_comments = [_comment(5, "2024-01-05T00:00:00Z", pull_request_review_id=9)]
+        server.add_route("GET", "/repos/o/r/pulls/3", handler=lambda request: (200, {
+            "number": 3, "title": "PR", "state": "open", "html_url": PR_URL, "user": {"login": "dev"},
+            "comments": len(self.comments), "review_comments": len(self.review_comments),
+        }, {}))
+        server.add_route("GET", "/repos/o/r/issues/3/comments",
+                         handler=lambda request: (200, self._since(self.comments, request), {}))
+        server.add_route("GET", "/repos/o/r/pulls/3/comments",
+                         handler=lambda request: (200, self._since(self.review_comments, request), {}))
+        server.add_route("GET", "/repos/o/r/pulls/3/reviews", [
+            {"id": 9, "body": "review", "user": {"login": "coderabbitai[bot]"},
+             "submitted_at": "2024-01-05T00:00:00Z"}
+        ])
+
+    @staticmethod
+    def _since(comments, request):
+        since = request.query.get("since")
+        return [c for c in comments if not since or c["updated_at"] >= since]
+
+
+@pytest.fixture
+def setup(tmp_path):
+    with StubGitHubServer() as server:
+        pull_request = FakePullRequest(server)
+        client = GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url))
+        syncer = IncrementalSyncer(client, SnapshotStore(tmp_path))
+        yield server, pull_request, syncer
+
+
+def _since_params(server, path):
+    return [request.query.get("since") for request in server.requests_for(path)]
+
+
+class TestIncrementalSyncer:
+    """Test snapshot merging against the stub server."""
+
+    def test_first_sync_is_full(self, setup):
+        server, _, syncer = setup
+
+        pr_data = syncer.sync(PR_URL)
+
+        assert [c["id"] for c in pr_data["comments"]] == [1, 2]
+        assert [c["id"] for c in pr_data["reviews"][0]["comments"]] == [5]
+        assert _since_params(server, "/repos/o/r/issues/3/comments") == [None]
+        assert not syncer.last_sync["incremental"]
+
+    def test_second_sync_uses_high_water_mark(self, setup):
+        server, pull_request, syncer = setup
+        syncer.sync(PR_URL)
+
+        pull_request.comments.append(_comment(6, "2024-01-06T00:00:00Z"))
+        pr_data = syncer.sync(PR_URL)
+
+        assert _since_params(server, "/repos/o/r/issues/3/comments")[-1] == "2024-01-05T00:00:00Z"
+        assert [c["id"] for c in pr_data["comments"]] == [1, 2, 6]
+        assert syncer.last_sync["updated_comments"] == 2  # new comment + boundary review comment
+
+    def test_edited_comment_replaces_stored_version(self, setup):
+        _, pull_request, syncer = setup
+        syncer.sync(PR_URL)
+
+        pull_request.comments[0] = _comment(1, "2024-02-01T00:00:00Z", body="edited")
+        pr_data = syncer.sync(PR_URL)
+
+        assert [c["body"] for c in pr_data["comments"]] == ["edited", "comment 2"]
+        assert syncer.store.load("o", "r", "3")["high_water_mark"] == "2024-02-01T00:00:00Z"
+
+    def test_deleted_comment_triggers_refetch(self, setup):
+        server, pull_request, syncer = setup
+        syncer.sync(PR_URL)
+
+        del pull_request.comments[0]
+        pr_data = syncer.sync(PR_URL)
+
+        assert [c["id"] for c in pr_data["comments"]] == [2]
+        assert syncer.last_sync["refetched"] == ["comments"]
+
+    def test_full_sync_ignores_snapshot(self, setup):
+        server, _, syncer = setup
+        syncer.sync(PR_URL)
+
+        syncer.sync(PR_URL, full=True)
+
+        assert _since_params(server, "/repos/o/r/issues/3/comments") == [None, None]
+
+
+def test_merge_by_id_orders_by_creation():
+    merged = merge_by_id([_comment(2, "b"), _comment(1, "a")], [_comment(3, "c"), _comment(1, "d", body="new")])
+
+    assert [c["id"] for c in merged] == [1, 2, 3]
+    assert merged[0]["body"] == "new"
+
+
+def test_high_water_mark_keeps_previous():
+    assert high_water_mark([], "2024-01-01T00:00:00Z") == "2024-01-01T00:00:00Z"
+    assert high_water_mark([_comment(1, "2024-03-01T00:00:00Z")], "2024-01-01T00:00:00Z") == "2024-03-01T00:00:00Z"
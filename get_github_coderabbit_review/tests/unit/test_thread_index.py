@@ -0,0 +1,187 @@
+"""
+Unit tests for the indexed thread store.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from coderabbit_fetcher.comment_analyzer import CommentAnalyzer
+from coderabbit_fetcher.processors import ThreadProcessor
+from coderabbit_fetcher.thread_index import (
+    ThreadIndex, narrow_analysis, parse_since, parse_timestamp, sort_chronologically, thread_key
+)
+from tests.fixtures.analysis_data import analysis_pr_data
+
+
+def comment(comment_id, reply_to=None, path="src/a.py", line=1, created="2025-01-01T10:00:00Z", login="dev", **extra):
+    return {"id": comment_id, "in_reply_to_id": reply_to, "path": path, "line": line,
+            "created_at": created, "user": {"login": login}, **extra}
+
+
+class TestGrouping:
+    """Test grouping comments into threads."""
+
+    def test_reply_chains(self):
+        comments = [
+            comment(1), comment(2, reply_to=1), comment(3), comment(4, reply_to=2), comment(5, reply_to=3),
+        ]
+
+        groups = ThreadIndex.group_comments(comments)
+
+        assert {key: [c["id"] for c in group] for key, group in groups.items()} == {"1": [1, 2, 4], "3": [3, 5]}
+
+    def test_replies_to_missing_comments_stay_together(self):
+        comments = [comment(2, reply_to=1), comment(3, reply_to=2)]
+
+        assert list(ThreadIndex.group_comments(comments)) == ["1"]
+
+    def test_reply_cycles(self):
+        comments = [comment(5, reply_to=6), comment(6, reply_to=5), comment(7, reply_to=6)]
+
+        assert list(ThreadIndex.group_comments(comments)) == ["5"]
+
+    @pytest.mark.parametrize("comments", [
+        [comment(1), comment(2, reply_to=1), comment(3, reply_to=2)],
+        [comment(2, reply_to=1), comment(3, reply_to=2), comment(4)],
+        [comment(5, reply_to=6), comment(6, reply_to=5), comment(7, reply_to=6)],
+    ])
+    def test_thread_key_agrees_with_index(self, comments):
+        comment_map = {str(c["id"]): c for c in comments}
+        groups = ThreadIndex.group_comments(comments)
+
+        for key, group in groups.items():
+            assert {thread_key(c, comment_map) for c in group} == {key}
+
+    def test_location_grouping(self):
+        comments = [
+            comment(1, line=3), comment(2, line=3, created="2025-01-01T09:00:00Z"), comment(3, line=4),
+            comment(4, path=None), comment(5, path=None),
+        ]
+
+        index = ThreadIndex(comments, group_by_location=True)
+
+        assert [[c["id"] for c in index.chronological(key)] for key in index] == [[2, 1], [3], [4, 5]]
+
+    def test_processor_groups_through_the_index(self):
+        comments = [comment(1), comment(2, reply_to=1), comment(3)]
+
+        assert ThreadProcessor().group_comments_by_root(comments) == ThreadIndex.group_comments(comments)
+
+
+class TestTimestamps:
+    """Test timestamp parsing and chronological order."""
+
+    def test_parse_timestamp(self):
+        assert parse_timestamp("2025-01-01T10:00:00Z") == datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+        assert parse_timestamp("2025-01-01T10:00:00").tzinfo == timezone.utc
+        assert parse_timestamp("yesterday") is None
+        assert parse_timestamp(None) is None
+
+    def test_timestamps_are_parsed_once(self):
+        parse_timestamp.cache_clear()
+        comments = [comment(i, created="2025-03-01T00:00:00Z") for i in range(50)]
+
+        sort_chronologically(comments)
+        ThreadIndex(comments)
+
+        assert parse_timestamp.cache_info().misses <= 2
+
+    def test_comments_without_time_come_last(self):
+        comments = [comment(1, created=None), comment(2, created="2025-01-02T00:00:00Z"),
+                    comment(3, created="2025-01-01T00:00:00Z")]
+
+        assert [c["id"] for c in sort_chronologically(comments)] == [3, 2, 1]
+
+    def test_parse_since(self):
+        now = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+        assert parse_since("2d", now=now) == datetime(2025, 1, 8, tzinfo=timezone.utc)
+        assert parse_since("2025-01-05") == datetime(2025, 1, 5, tzinfo=timezone.utc)
+        with pytest.raises(ValueError):
+            parse_since("last week")
+
+
+class TestQueries:
+    """Test the secondary indexes."""
+
+    def setup_method(self):
+        self.index = ThreadIndex([
+            comment(1, path="src/app/main.py", line=10, created="2025-01-01T00:00:00Z"),
+            comment(2, reply_to=1, path="src/app/main.py", line=12, created="2025-01-05T00:00:00Z", login="bot"),
+            comment(3, path="docs/guide.md", line=40, created="2025-01-02T00:00:00Z"),
+            comment(4, path="src/util.py", line=1, created="2025-01-03T00:00:00Z",
+                    updated_at="2025-01-09T00:00:00Z"),
+        ])
+
+    def keys(self, **query):
+        return [thread.key for thread in self.index.query(**query)]
+
+    def test_thread_attributes(self):
+        thread = self.index["1"]
+
+        assert (thread.path, thread.lines, thread.authors) == ("src/app/main.py", (10, 12), {"dev", "bot"})
+        assert thread.updated_at == datetime(2025, 1, 5, tzinfo=timezone.utc)
+
+    def test_path(self):
+        assert self.keys(path="src/**") == ["1", "4"]
+        assert self.keys(path="*.md") == ["3"]
+
+    def test_since(self):
+        assert self.keys(since=datetime(2025, 1, 4, tzinfo=timezone.utc)) == ["1", "4"]
+        assert self.keys(since=datetime(2025, 1, 6)) == ["4"]
+
+    def test_lines(self):
+        assert self.keys(lines=(11, 20)) == ["1"]
+        assert self.keys(lines=(1, 10)) == ["1", "4"]
+
+    def test_author_and_status(self):
+        self.index.set_status("3", "unresolved")
+        self.index.set_status("4", "pending")
+
+        assert self.keys(author="bot") == ["1"]
+        assert self.keys(status="pending") == ["4"]
+        assert self.keys(status=["pending", "unresolved"], path="src/**") == ["4"]
+
+    def test_no_criteria(self):
+        assert self.keys() == ["1", "3", "4"]
+
+
+class TestNarrowAnalysis:
+    """Test narrowing a report before formatting."""
+
+    def test_keeps_matching_threads(self):
+        analyzed = CommentAnalyzer().analyze_comments(analysis_pr_data(threads=12))
+
+        narrowed = narrow_analysis(analyzed, path="src/1?.py")
+
+        assert [thread.main_comment["path"] for thread in narrowed.unresolved_threads] == ["src/10.py", "src/11.py"]
+        assert narrowed.summary_comments == analyzed.summary_comments
+        assert len(analyzed.unresolved_threads) == 8
+
+    def test_status(self):
+        analyzed = CommentAnalyzer().analyze_comments(analysis_pr_data(threads=3))
+
+        assert len(narrow_analysis(analyzed, status="unresolved").unresolved_threads) == 2
+        assert narrow_analysis(analyzed, status="dismissed").unresolved_threads == []
+
+
+class TestCommandLine:
+    """Test the thread filter options."""
+
+    def test_options_reach_the_configuration(self):
+        from coderabbit_fetcher.cli.main import _create_execution_config, create_argument_parser
+
+        args = create_argument_parser().parse_args(
+            ["https://github.com/o/r/pull/1", "--path", "src/**", "--since", "2025-01-05", "--status", "pending"]
+        )
+        config = _create_execution_config(args, args.pr_urls[0], None)
+
+        assert (config.thread_path, config.thread_status) == ("src/**", "pending")
+        assert config.thread_since == datetime(2025, 1, 5, tzinfo=timezone.utc)
+
+    def test_invalid_since(self):
+        from coderabbit_fetcher.cli.main import create_argument_parser
+
+        with pytest.raises(SystemExit):
+            create_argument_parser().parse_args(["https://github.com/o/r/pull/1", "--since", "soon"])
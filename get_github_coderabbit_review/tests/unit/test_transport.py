@@ -0,0 +1,297 @@
+"""
+Unit tests for the GitHub API transports.
+"""
+
+import gzip
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from coderabbit_fetcher.exceptions import (
+    APIRateLimitError,
+    GitHubAuthenticationError,
+    InvalidPRUrlError,
+    TransportError,
+    TransportTimeoutError,
+)
+from coderabbit_fetcher.github.transport import (
+    GhCliTransport,
+    GitHubResponse,
+    HTTPTransport,
+    create_transport,
+    resolve_token,
+)
+from coderabbit_fetcher.github_client import GitHubClient
+from tests.fixtures.stub_github_server import StubGitHubServer
+
+PR_URL = "https://github.com/owner/repo/pull/7"
+
+
+@pytest.fixture
+def server():
+    """Running stub GitHub API server."""
+    with StubGitHubServer() as stub:
+        yield stub
+
+
+def _comment(comment_id, login="coderabbitai[bot]", created_at="2024-01-01T00:00:00Z", **extra):
+    comment = {
+        "id": comment_id,
+        "body": f"comment {comment_id}",
+        "user": {"login": login},
+        "created_at": created_at,
+        "html_url": f"https://github.com/owner/repo/pull/7#issuecomment-{comment_id}",
+    }
+    comment.update(extra)
+    return comment
+
+
+class TestGitHubResponse:
+    """Test GitHubResponse helpers."""
+
+    def test_links_parsed(self):
+        response = GitHubResponse(status=200, headers={
+            "link": '<https://api.github.com/x?page=2>; rel="next", '
+                    '<https://api.github.com/x?page=5>; rel="last"'
+        })
+
+        assert response.links == {
+            "next": "https://api.github.com/x?page=2",
+            "last": "https://api.github.com/x?page=5",
+        }
+
+    def test_rate_limit_detection(self):
+        response = GitHubResponse(status=403, headers={
+            "x-ratelimit-remaining": "0", "x-ratelimit-reset": "1700000000"
+        })
+
+        assert response.is_rate_limited
+        assert response.rate_limit_reset == 1700000000
+        assert not GitHubResponse(status=403, text='{"message": "Forbidden"}').is_rate_limited
+
+    def test_error_message_prefers_api_message(self):
+        assert GitHubResponse(status=404, text='{"message": "Not Found"}').error_message == "Not Found"
+        assert GitHubResponse(status=500).error_message == "HTTP 500"
+
+
+class TestHTTPTransport:
+    """Test the pooled HTTP transport against the stub server."""
+
+    def test_connections_are_reused(self, server):
+        server.add_route("GET", "/rate_limit", {"resources": {}})
+        transport = HTTPTransport(token="secret", base_url=server.url)
+
+        for _ in range(5):
+            assert transport.request("GET", "/rate_limit").ok
+
+        assert transport.requests_sent == 5
+        assert transport.connections_opened == 1
+        assert server.connections == 1
+        transport.close()
+
+    def test_request_headers_and_body(self, server):
+        server.add_route("POST", "/repos/owner/repo/issues/7/comments", _comment(1), status=201)
+        transport = HTTPTransport(token="secret", base_url=server.url)
+
+        response = transport.request(
+            "POST", "/repos/owner/repo/issues/7/comments", body={"body": "hi"}
+        )
+
+        request = server.requests[0]
+        assert response.status == 201
+        assert request.headers["authorization"] == "Bearer secret"
+        assert request.headers["accept"] == "application/vnd.github+json"
+        assert request.json() == {"body": "hi"}
+
+    def test_gzip_response_decoded(self, server):
+        server.add_route(
+            "GET", "/rate_limit", gzip.compress(b'{"ok": true}'),
+            headers={"Content-Encoding": "gzip"}
+        )
+        transport = HTTPTransport(token="secret", base_url=server.url)
+
+        assert transport.request("GET", "/rate_limit").json() == {"ok": True}
+
+    def test_corrupt_gzip_response_raises_transport_error(self, server):
+        server.add_route(
+            "GET", "/rate_limit", b"not gzip at all", headers={"Content-Encoding": "gzip"}
+        )
+        server.add_route("GET", "/user", {"login": "dev"})
+        transport = HTTPTransport(token="secret", base_url=server.url)
+
+        with pytest.raises(TransportError, match="gzip"):
+            transport.request("GET", "/rate_limit")
+        with transport.stream("GET", "/rate_limit") as response:
+            with pytest.raises(TransportError, match="gzip"):
+                response.read()
+
+        # The body was read in full, so the connection stays usable
+        assert transport.request("GET", "/user").json() == {"login": "dev"}
+        assert transport.connections_opened == 1
+
+    def test_stale_connection_read_is_resent(self, server):
+        answers = iter([(None, None, {}), (200, {"resources": {}}, {})])
+        server.add_route("GET", "/rate_limit", handler=lambda request: next(answers))
+        server.add_route("GET", "/user", {"login": "dev"})
+        transport = HTTPTransport(token="secret", base_url=server.url)
+        transport.request("GET", "/user")
+
+        assert transport.request("GET", "/rate_limit").ok
+        assert len(server.requests_for("/rate_limit")) == 2
+        assert transport.connections_opened == 2
+
+    def test_dropped_post_is_not_resent(self, server):
+        path = "/repos/owner/repo/issues/7/comments"
+        server.add_route("POST", path, handler=lambda request: (None, None, {}))
+        server.add_route("GET", "/user", {"login": "dev"})
+        transport = HTTPTransport(token="secret", base_url=server.url)
+        transport.request("GET", "/user")
+
+        with pytest.raises(TransportError):
+            transport.request("POST", path, body={"body": "hi"})
+
+        assert len(server.requests_for(path)) == 1
+
+    def test_connection_refused_raises_transport_error(self, server):
+        url = server.url
+        server.stop()
+        transport = HTTPTransport(token="secret", base_url=url)
+
+        with pytest.raises(TransportError):
+            transport.request("GET", "/rate_limit", timeout=2)
+
+    def test_invalid_base_url(self):
+        with pytest.raises(ValueError):
+            HTTPTransport(token="secret", base_url="ftp://example.com")
+
+
+class TestGhCliTransport:
+    """Test the GitHub CLI fallback transport."""
+
+    @patch("subprocess.run")
+    def test_get_with_params(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+
+        response = GhCliTransport().request("GET", "/repos/o/r/pulls/1/comments", params={"per_page": 100})
+
+        mock_run.assert_called_once_with(
+            ["gh", "api", "/repos/o/r/pulls/1/comments?per_page=100"],
+            capture_output=True, text=True, timeout=30.0
+        )
+        assert response.ok and response.json() == []
+
+    @patch("subprocess.run")
+    def test_error_status_from_stderr(self, mock_run):
+        mock_run.return_value = MagicMock(
+            returncode=1, stdout="", stderr="gh: API rate limit exceeded (HTTP 403)"
+        )
+
+        response = GhCliTransport().request("GET", "/rate_limit")
+
+        assert response.status == 403
+        assert response.is_rate_limited
+
+    @patch("subprocess.run")
+    def test_timeout_and_missing_cli(self, mock_run):
+        mock_run.side_effect = subprocess.TimeoutExpired("gh", 30)
+        with pytest.raises(TransportTimeoutError):
+            GhCliTransport().request("GET", "/rate_limit")
+
+        mock_run.side_effect = FileNotFoundError()
+        with pytest.raises(TransportError, match="not installed"):
+            GhCliTransport().request("GET", "/rate_limit")
+
+
+class TestTransportFactory:
+    """Test token resolution and transport creation."""
+
+    @patch("subprocess.run")
+    def test_resolve_token(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="gho_token\n", stderr="")
+
+        assert resolve_token() == "gho_token"
+        assert mock_run.call_args[0][0] == ["gh", "auth", "token"]
+
+    @patch("subprocess.run")
+    def test_resolve_token_not_logged_in(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="not logged in")
+
+        with pytest.raises(GitHubAuthenticationError):
+            resolve_token()
+
+    def test_create_transport(self):
+        assert isinstance(create_transport("gh"), GhCliTransport)
+        assert isinstance(create_transport("http", token="t"), HTTPTransport)
+        with pytest.raises(ValueError):
+            create_transport("carrier-pigeon")
+
+
+class TestGitHubClientOverHTTP:
+    """Test GitHubClient using the HTTP transport against the stub server."""
+
+    def _client(self, server):
+        return GitHubClient(transport=HTTPTransport(token="secret", base_url=server.url), fetch_mode="rest")
+
+    def test_fetch_pr_comments(self, server):
+        server.add_route("GET", "/repos/owner/repo/pulls/7", {
+            "number": 7, "title": "Refactor", "body": "desc", "state": "open",
+            "html_url": PR_URL, "user": {"login": "dev"},
+        })
+        next_page = f'<{server.url}/repos/owner/repo/issues/7/comments?per_page=100&page=2>; rel="next"'
+        server.add_route("GET", "/repos/owner/repo/issues/7/comments", handler=lambda request: (
+            (200, [_comment(2)], {}) if request.query.get("page") == "2"
+            else (200, [_comment(1)], {"Link": next_page})
+        ))
+        server.add_route("GET", "/repos/owner/repo/pulls/7/reviews", [
+            {"id": 10, "body": "review", "user": {"login": "coderabbitai[bot]"},
+             "submitted_at": "2024-01-02T00:00:00Z"}
+        ])
+        server.add_route("GET", "/repos/owner/repo/pulls/7/comments", [
+            _comment(100, pull_request_review_id=10, path="a.py", line=3)
+        ])
+
+        client = self._client(server)
+        pr_data = client.fetch_pr_comments(PR_URL)
+
+        assert pr_data["title"] == "Refactor"
+        assert pr_data["state"] == "OPEN"
+        assert pr_data["url"] == PR_URL
+        assert [c["id"] for c in pr_data["comments"]] == [1, 2]
+        assert pr_data["reviews"][0]["created_at"] == "2024-01-02T00:00:00Z"
+        assert [c["id"] for c in pr_data["reviews"][0]["comments"]] == [100]
+        # Endpoints are fetched concurrently over pooled keep-alive connections
+        assert server.connections <= 4 < len(server.requests)
+
+    def test_pr_not_found(self, server):
+        with pytest.raises(InvalidPRUrlError):
+            self._client(server).fetch_pr_comments(PR_URL)
+
+    def test_rate_limited(self, server):
+        server.add_route(
+            "GET", "/rate_limit", {"message": "API rate limit exceeded"}, status=403,
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000000"}
+        )
+
+        with pytest.raises(APIRateLimitError):
+            self._client(server).check_rate_limit()
+
+    def test_post_comment(self, server):
+        server.add_route("POST", "/repos/owner/repo/issues/7/comments", _comment(5), status=201)
+
+        result = self._client(server).post_comment(PR_URL, "hello")
+
+        assert result["id"] == 5
+        assert result["user"] == "coderabbitai[bot]"
+        assert server.requests[0].json() == {"body": "hello"}
+
+    def test_get_latest_comments_sorted_newest_first(self, server):
+        server.add_route("GET", "/repos/owner/repo/issues/7/comments", [
+            _comment(1, created_at="2024-01-01T00:00:00Z"),
+            _comment(2, created_at="2024-01-03T00:00:00Z"),
+            _comment(3, created_at="2024-01-02T00:00:00Z"),
+        ])
+
+        result = self._client(server).get_latest_comments(PR_URL, limit=2)
+
+        assert [c["id"] for c in result] == [2, 3]
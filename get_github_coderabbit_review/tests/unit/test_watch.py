@@ -0,0 +1,173 @@
+"""
+Unit tests for watch mode.
+"""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coderabbit_fetcher.exceptions import CodeRabbitFetcherError, GitHubAuthenticationError
+from coderabbit_fetcher.models import AnalyzedComments, CommentMetadata, ThreadContext
+from coderabbit_fetcher.orchestrator import CodeRabbitOrchestrator, ExecutionConfig
+from coderabbit_fetcher.persona_manager import PersonaManager
+from coderabbit_fetcher.watch import AdaptiveInterval, content_hash, thread_events, thread_state
+
+PR_URL = "https://github.com/o/r/pull/1"
+
+
+def _thread(thread_id, body, path="a.py", line=1):
+    return ThreadContext(thread_id=thread_id, main_comment={
+        "id": thread_id, "body": body, "path": path, "line": line,
+        "user": {"login": "coderabbitai[bot]"}, "created_at": "2025-01-01T00:00:00Z",
+    })
+
+
+def _pr_data(*threads):
+    """PR data whose review comments describe (thread_id, body) threads."""
+    return {
+        "title": "PR 1", "number": 1, "url": PR_URL, "owner": "o", "repo": "r", "pr_number": "1",
+        "comments": [], "reviews": [],
+        "review_comments": [{"id": thread_id, "body": body} for thread_id, body in threads],
+    }
+
+
+def _analyze(pr_data):
+    return AnalyzedComments(
+        metadata=CommentMetadata(
+            pr_number=1, pr_title="PR 1", owner="o", repo="r",
+            total_comments=len(pr_data["review_comments"]), coderabbit_comments=0,
+            resolved_comments=0, actionable_comments=0, processing_time_seconds=0.0,
+        ),
+        unresolved_threads=[_thread(c["id"], c["body"]) for c in pr_data["review_comments"]],
+    )
+
+
+@pytest.fixture
+def components():
+    """Stub the analysis, which is not under test here."""
+    with patch("coderabbit_fetcher.orchestrator.CommentAnalyzer") as analyzer:
+        analyzer.return_value = Mock(analyze_comments=Mock(side_effect=_analyze))
+        yield analyzer.return_value
+
+
+def _watch(responses, tmp_path=None, watch_events=False, output_format="json"):
+    """Watch a PR whose successive polls answer ``responses``."""
+    config = ExecutionConfig(
+        pr_url=PR_URL, output_format=output_format, watch_interval=10, watch_events=watch_events,
+        output_file=str(tmp_path / "out.json") if tmp_path else None, use_cache=False,
+    )
+    client = Mock(fetch_pr_comments=Mock(side_effect=responses), parse_pr_url=Mock(return_value=("o", "r", 1)))
+    sleeps, events = [], io.StringIO()
+    with patch("coderabbit_fetcher.orchestrator.GitHubClient", return_value=client) as client_class:
+        orchestrator = CodeRabbitOrchestrator(config)
+        results = orchestrator.watch(max_polls=len(responses), sleep=sleeps.append, event_stream=events)
+    return results, client_class, sleeps, [json.loads(line) for line in events.getvalue().splitlines()]
+
+
+class TestAdaptiveInterval:
+    """Test the poll interval."""
+
+    def test_backs_off_while_quiet_and_resets_on_change(self):
+        interval = AdaptiveInterval(10, max_interval=30, backoff=2)
+
+        assert [interval.record(False) for _ in range(3)] == [20, 30, 30]
+        assert interval.record(True) == 10
+        assert interval.current == 10
+
+    def test_default_maximum(self):
+        interval = AdaptiveInterval(5)
+        for _ in range(20):
+            interval.record(False)
+
+        assert interval.current == 40
+
+    def test_interval_must_be_positive(self):
+        with pytest.raises(ValueError):
+            AdaptiveInterval(0)
+
+
+class TestThreadEvents:
+    """Test thread change events."""
+
+    def test_content_hash_ignores_key_order(self):
+        assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+        assert content_hash("x") != content_hash("y")
+
+    def test_new_updated_and_resolved(self):
+        before = thread_state([_thread("1", "first"), _thread("2", "second")])
+        after = thread_state([_thread("1", "first (edited)"), _thread("3", "third", path="b.py", line=7)])
+
+        events = {e["thread_id"]: e for e in thread_events(before, after, PR_URL)}
+
+        assert {k: e["event"] for k, e in events.items()} == {"1": "updated", "2": "resolved", "3": "new"}
+        assert events["3"]["path"] == "b.py"
+        assert events["3"]["line"] == 7
+        assert events["3"]["pr_url"] == PR_URL
+        assert events["3"]["observed_at"]
+
+    def test_unchanged_threads_emit_nothing(self):
+        state = thread_state([_thread("1", "first")])
+
+        assert thread_events(state, thread_state([_thread("1", "first")]), PR_URL) == []
+
+
+class TestWatch:
+    """Test the watch loop of the orchestrator."""
+
+    def test_output_is_rewritten_only_on_change(self, components, tmp_path):
+        first, second = _pr_data(("1", "first")), _pr_data(("1", "first"), ("2", "second"))
+
+        with patch.object(CodeRabbitOrchestrator, "_write_output", autospec=True,
+                          side_effect=CodeRabbitOrchestrator._write_output) as write:
+            results, _, sleeps, _ = _watch([first, first, first, second], tmp_path)
+
+        assert results["success"], results.get("error")
+        assert results["watch"] == {"polls": 4, "data_changes": 2, "writes": 2, "events": 0, "errors": 0}
+        assert write.call_count == 2
+        assert components.analyze_comments.call_count == 2
+        output = json.loads((tmp_path / "out.json").read_text())
+        assert output["persona"] == PersonaManager().load_persona()
+        # Quiet polls stretch the interval, a change resets it
+        assert sleeps == [10, 15, 22.5]
+
+    def test_polls_use_rest_without_coordination(self, components, tmp_path):
+        _, client_class, _, _ = _watch([_pr_data()], tmp_path)
+
+        kwargs = client_class.call_args.kwargs
+        assert kwargs["fetch_mode"] == "rest"
+        assert kwargs["coordinator"] is None
+
+    def test_events(self, components, tmp_path):
+        results, _, _, events = _watch([
+            _pr_data(("1", "first")),
+            _pr_data(("1", "first"), ("2", "second")),
+            _pr_data(("2", "second (edited)")),
+        ], tmp_path, watch_events=True)
+
+        assert [(e["event"], e["thread_id"]) for e in events] == [
+            ("new", "1"), ("new", "2"), ("updated", "2"), ("resolved", "1"),
+        ]
+        assert results["watch"]["events"] == 4
+
+    def test_transient_errors_are_retried(self, components, tmp_path):
+        results, _, _, _ = _watch([CodeRabbitFetcherError("Failed to fetch PR data"), _pr_data(("1", "first"))], tmp_path)
+
+        assert results["success"]
+        assert results["watch"]["errors"] == 1
+        assert results["watch"]["writes"] == 1
+
+    def test_authentication_errors_stop_watching(self, components):
+        results, _, _, _ = _watch([GitHubAuthenticationError("expired"), _pr_data()])
+
+        assert not results["success"]
+
+    def test_validation(self):
+        def issues(**kwargs):
+            return CodeRabbitOrchestrator(ExecutionConfig(pr_url=PR_URL, **kwargs)).validate_configuration()["issues"]
+
+        assert "Watch interval must be positive" in issues(watch_interval=0)
+        assert "A snapshot cannot be watched" in issues(watch_interval=5, snapshot_input="pr.json")
+        assert "Resolution requests cannot be posted in watch mode" in issues(
+            watch_interval=5, post_resolution_request=True)
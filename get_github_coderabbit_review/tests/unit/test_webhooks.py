@@ -0,0 +1,213 @@
+"""
+Unit tests for webhook payload handling and the webhook daemon.
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from coderabbit_fetcher.github.sync import SnapshotStore
+from coderabbit_fetcher.github.webhooks import (
+    apply_event,
+    compute_signature,
+    empty_snapshot,
+    parse_event,
+    verify_signature,
+)
+from coderabbit_fetcher.webhook_daemon import (
+    WebhookDaemon,
+    WebhookServer,
+    replay_payloads,
+    review_comment_roots,
+)
+
+BOT = {"login": "coderabbitai[bot]"}
+DEV = {"login": "dev"}
+MARKER = "🔒 CODERABBIT_RESOLVED 🔒"
+
+
+def _pull():
+    return {"number": 7, "title": "Add feature", "state": "open", "body": "",
+            "html_url": "https://github.com/o/r/pull/7", "user": DEV,
+            "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-02T00:00:00Z",
+            "comments": 1, "review_comments": 2}
+
+
+def review_comment(comment_id, body, user=BOT, reply_to=None, action="created", stamp="2025-01-02T00:00:00Z"):
+    comment = {"id": comment_id, "body": body, "user": user, "path": "app.py", "line": 3,
+               "created_at": stamp, "updated_at": stamp}
+    if reply_to is not None:
+        comment["in_reply_to_id"] = reply_to
+    return {"action": action, "repository": {"full_name": "o/r"}, "pull_request": _pull(), "comment": comment}
+
+
+def issue_comment(comment_id, body, action="created", pull_request=True):
+    issue = {"number": 7, "title": "Add feature", "state": "open", "user": DEV, "comments": 1,
+             "html_url": "https://github.com/o/r/pull/7"}
+    if pull_request:
+        issue["pull_request"] = {"url": "https://api.github.com/repos/o/r/pulls/7"}
+    return {"action": action, "repository": {"full_name": "o/r"}, "issue": issue,
+            "comment": {"id": comment_id, "body": body, "user": BOT,
+                        "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-01T00:00:00Z"}}
+
+
+class TestSignature:
+    """Test X-Hub-Signature-256 verification."""
+
+    def test_valid_signature(self):
+        body = b'{"zen": "hi"}'
+        assert verify_signature("s3cret", body, compute_signature("s3cret", body))
+
+    @pytest.mark.parametrize("signature", [None, "", "sha256=00", "sha1=abc"])
+    def test_invalid_signature(self, signature):
+        assert not verify_signature("s3cret", b"{}", signature)
+
+    def test_other_secret(self):
+        assert not verify_signature("s3cret", b"{}", compute_signature("other", b"{}"))
+
+
+class TestEvents:
+    """Test parsing events and applying them to snapshots."""
+
+    def test_parse_review_comment(self):
+        event = parse_event("pull_request_review_comment", review_comment(1, "Fix this"))
+
+        assert (event.owner, event.repo, event.pr_number) == ("o", "r", "7")
+        assert event.collection == "review_comments"
+        assert event.pr_url == "https://github.com/o/r/pull/7"
+        assert event.pull["review_comment_count"] == 2
+
+    def test_ignored_events(self):
+        assert parse_event("push", {"repository": {"full_name": "o/r"}}) is None
+        assert parse_event("issue_comment", issue_comment(1, "hi", pull_request=False)) is None
+
+    def test_upsert_and_delete(self):
+        created = parse_event("pull_request_review_comment", review_comment(1, "Fix this"))
+        snapshot = empty_snapshot(created)
+
+        assert apply_event(snapshot, created) == [("review_comments", 1)]
+        apply_event(snapshot, parse_event("pull_request_review_comment",
+                                          review_comment(1, "Fix that", action="edited",
+                                                         stamp="2025-01-03T00:00:00Z")))
+        assert [c["body"] for c in snapshot["review_comments"]] == ["Fix that"]
+        assert snapshot["high_water_mark"] == "2025-01-03T00:00:00Z"
+
+        apply_event(snapshot, parse_event("pull_request_review_comment",
+                                          review_comment(1, "Fix that", action="deleted")))
+        assert snapshot["review_comments"] == []
+
+    def test_reply_roots(self):
+        comments = [{"id": 1}, {"id": 2, "in_reply_to_id": 1}, {"id": 3, "in_reply_to_id": 2},
+                    {"id": 4, "in_reply_to_id": 99}]
+
+        assert review_comment_roots(comments) == {1: 1, 2: 1, 3: 1, 4: 4}
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    return WebhookDaemon(tmp_path / "reports", output_format="json",
+                         store=SnapshotStore(tmp_path / "sync"))
+
+
+class TestWebhookDaemon:
+    """Test incremental analysis of webhook events."""
+
+    def test_replay_writes_report(self, daemon, tmp_path):
+        deliveries = tmp_path / "deliveries.ndjson"
+        deliveries.write_text("\n".join(json.dumps(entry) for entry in [
+            {"event": "issue_comment",
+             "payload": issue_comment(10, "**Summary by CodeRabbit**\n\n- New feature")},
+            {"event": "pull_request_review_comment", "payload": review_comment(1, "Please fix the bug")},
+            {"event": "push", "payload": {}},
+        ]))
+
+        outcomes = replay_payloads(daemon, [deliveries])
+
+        assert [o["status"] for o in outcomes] == ["processed", "processed", "ignored"]
+        report = json.loads(daemon.report_path("o", "r", "7").read_text())
+        assert report == json.loads(daemon.report("o", "r", "7"))
+        assert daemon.stats()["processed"] == 2
+
+    def test_only_touched_threads_are_recomputed(self, daemon):
+        daemon.handle("pull_request_review_comment", review_comment(1, "Fix A"))
+        daemon.handle("pull_request_review_comment", review_comment(2, "Fix B"))
+
+        outcome = daemon.handle("pull_request_review_comment", review_comment(3, "Done", user=DEV, reply_to=2))
+
+        assert outcome["recomputed"] == 1
+        analysis = daemon._analyses[("o", "r", "7")]
+        assert len(analysis.result().unresolved_threads) == 2
+
+    def test_resolved_thread_leaves_the_report(self, daemon):
+        daemon.handle("pull_request_review_comment", review_comment(1, "Fix A"))
+        daemon.handle("pull_request_review_comment", review_comment(2, f"Fixed {MARKER}", reply_to=1))
+
+        result = daemon._analyses[("o", "r", "7")].result()
+
+        assert result.unresolved_threads == []
+        assert result.metadata.resolved_comments == 1
+
+    def test_restart_reanalyses_the_stored_snapshot(self, daemon, tmp_path):
+        daemon.handle("pull_request_review_comment", review_comment(1, "Fix A"))
+
+        restarted = WebhookDaemon(tmp_path / "reports", output_format="json", store=daemon.store)
+        restarted.handle("pull_request_review_comment", review_comment(2, "Fix B"))
+
+        assert len(restarted._analyses[("o", "r", "7")].result().unresolved_threads) == 2
+
+
+class TestWebhookServer:
+    """Test the HTTP endpoints."""
+
+    @pytest.fixture
+    def server(self, daemon):
+        server = WebhookServer(("127.0.0.1", 0), daemon, "s3cret")
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _post(server, event, body, signature):
+        request = urllib.request.Request(
+            f"{server.url}/webhook", data=body, method="POST",
+            headers={"X-GitHub-Event": event, "X-Hub-Signature-256": signature,
+                     "Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_signed_delivery_updates_the_report(self, server):
+        body = json.dumps(review_comment(1, "Fix A")).encode()
+
+        status, outcome = self._post(server, "pull_request_review_comment", body,
+                                     compute_signature("s3cret", body))
+
+        assert status == 200
+        assert outcome["status"] == "processed"
+        with urllib.request.urlopen(f"{server.url}/reports/o/r/7", timeout=5) as response:
+            assert json.loads(response.read())["metadata"]["statistics"]["thread_count"] == 1
+
+    def test_unsigned_delivery_is_rejected(self, server):
+        body = json.dumps(review_comment(1, "Fix A")).encode()
+
+        status, _ = self._post(server, "pull_request_review_comment", body, "sha256=00")
+
+        assert status == 401
+        assert server.webhooks.stats()["received"] == 0
+
+    def test_ping_and_health(self, server):
+        body = b'{"zen": "Keep it simple."}'
+        assert self._post(server, "ping", body, compute_signature("s3cret", body)) == (200, {"status": "pong"})
+
+        with urllib.request.urlopen(f"{server.url}/healthz", timeout=5) as response:
+            assert json.loads(response.read())["status"] == "ok"
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{server.url}/reports/o/r/99", timeout=5)